@@ -0,0 +1,84 @@
+"""
+Microbenchmark of the command dispatch path of the request handler.
+
+Each command is run `--runs` times through `process_commands`, the way the servers
+run a pipelined batch: the requests are already parsed (bytes, like the RESP
+parser returns them) and the replies are serialized into one buffer. Parsing and
+socket I/O are left out, so the numbers show the cost of looking the command up,
+validating its arguments, locking its keys, running it and serializing its reply.
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.dispatch_benchmark [--runs 100000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from src.handlers.request_handler import process_commands
+from src.redisDB.redis_db import REDIS_DB
+
+BATCH_SIZE = 100
+
+COMMANDS = {
+    "PING": [b"PING"],
+    "GET": [b"GET", b"string"],
+    "SET": [b"SET", b"string", b"value"],
+    "SET EX": [b"SET", b"volatile", b"value", b"EX", b"100"],
+    "INCR": [b"INCR", b"counter"],
+    "EXISTS": [b"EXISTS", b"string"],
+    "MGET 10": [b"MGET", *[b"key:%d" % i for i in range(10)]],
+    "LPUSH+RPOP": [b"LPUSH", b"list", b"element"],
+    "HSET": [b"HSET", b"hash", b"field", b"value"],
+    "HGET": [b"HGET", b"hash", b"field"],
+    "ZRANK": [b"ZRANK", b"zset", b"member"],
+    "SISMEMBER": [b"SISMEMBER", b"set", b"member"],
+}
+
+
+def populate() -> None:
+    """
+    Creates the keys the commands read.
+    """
+    REDIS_DB.clear()
+    process_commands([
+        [b"SET", b"string", b"value"],
+        [b"MSET", *[item for i in range(10) for item in (b"key:%d" % i, b"value")]],
+        [b"HSET", b"hash", b"field", b"value"],
+        [b"ZADD", b"zset", b"1", b"member"],
+        [b"SADD", b"set", b"member"],
+    ])
+
+
+def measure(request: list, runs: int, repeat: int) -> float:
+    """
+    Returns the best throughput of a command over `repeat` rounds, in ops/sec.
+    """
+    batch = [request] * BATCH_SIZE
+    if request[0] == b"LPUSH":
+        batch = [request, [b"RPOP", b"list"]] * (BATCH_SIZE // 2)
+    best = float("inf")
+    for _ in range(repeat):
+        out = bytearray()
+        start = time.perf_counter()
+        for _ in range(runs // BATCH_SIZE):
+            process_commands(batch, out)
+            out.clear()
+        best = min(best, time.perf_counter() - start)
+    return runs / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    populate()
+    print(f"{'command':<14}{'ops/sec':>12}{'µs/op':>10}")
+    for name, request in COMMANDS.items():
+        throughput = measure(request, args.runs, args.repeat)
+        print(f"{name:<14}{throughput:>12,.0f}{1e6 / throughput:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Stress test of INCR from many threads, checking that no increment is lost.
+
+Every thread drives INCR commands through the request pipeline, the way the
+threaded server runs one handler per client. Each run checks that the counters
+add up to the number of increments sent, and reports the throughput for a
+single hot key (every thread contends on one shard) and for keys spread over
+the keyspace (threads mostly lock different shards).
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.incr_stress_benchmark [--threads 16] [--increments 20000]
+        [--shards 1 16] [--switch-interval 0.0001]
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from src.handlers.request_handler import process_commands
+from src.redisDB.redis_db import REDIS_DB, RedisDB
+
+
+def run(threads: int, increments: int, keys: int, pipeline: int) -> tuple[float, int]:
+    """
+    Runs the stress test on a fresh database.
+
+    Args:
+        threads (int): Number of concurrent clients.
+        increments (int): INCR commands sent by each client.
+        keys (int): Number of distinct counters, used round-robin by every client.
+        pipeline (int): Commands per `process_commands` call.
+
+    Returns:
+        tuple[float, int]: The elapsed time and the sum of all counters.
+    """
+    REDIS_DB.clear()
+    names = [b"counter:%d" % i for i in range(keys)]
+    start_barrier = threading.Barrier(threads + 1)
+
+    def client(offset: int) -> None:
+        commands = [[b"INCR", names[(offset + i) % keys]] for i in range(increments)]
+        batches = [commands[i:i + pipeline] for i in range(0, increments, pipeline)]
+        start_barrier.wait()
+        for batch in batches:
+            process_commands(batch)
+
+    workers = [threading.Thread(target=client, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    total = sum(int(REDIS_DB.get(name.decode(), 0)) for name in names)
+    return elapsed, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--increments", type=int, default=20000,
+                        help="INCR commands per thread.")
+    parser.add_argument("--pipeline", type=int, default=1,
+                        help="Commands per batch, as sent by a pipelining client.")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 16],
+                        help="Shard counts to compare.")
+    parser.add_argument("--switch-interval", type=float, default=sys.getswitchinterval(),
+                        help="Thread switch interval; lower values make races more likely.")
+    args = parser.parse_args()
+
+    sys.setswitchinterval(args.switch_interval)
+    expected = args.threads * args.increments
+    print(f"{args.threads} threads x {args.increments:,} INCR = {expected:,} increments")
+    print(f"{'shards':>6}  {'keys':<8}{'ops/s':>12}{'total':>12}  result")
+    failed = False
+    for shards in args.shards:
+        RedisDB("incr_stress_benchmark.rdb", shards=shards)
+        for label, keys in (("hot", 1), ("spread", 1024)):
+            elapsed, total = run(args.threads, args.increments, keys, args.pipeline)
+            ok = total == expected
+            failed |= not ok
+            print(f"{shards:>6}  {label:<8}{expected / elapsed:>12,.0f}{total:>12,}  "
+                  f"{'OK' if ok else f'LOST {expected - total:,}'}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
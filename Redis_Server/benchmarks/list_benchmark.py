@@ -0,0 +1,116 @@
+"""
+Benchmark of the quicklist encoding of big lists against a `collections.deque`.
+
+A list of `--length` short elements is built with RPUSH semantics, once as the
+`deque` big lists used before and once as the `QuickList` the list commands use
+now, and each list command is timed on both with the equivalent operation:
+
+- LINDEX / LSET: read or replace the element at a random index.
+- LRANGE: read 100 elements from a random index.
+- LINSERT: insert an element at a random index.
+- LPUSH + RPOP: push at the head, pop at the tail.
+
+Memory is measured with `tracemalloc` while building each list.
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.list_benchmark [--length 1000000]
+"""
+
+import argparse
+import gc
+import itertools
+import random
+import time
+import tracemalloc
+from collections import deque
+
+from src.redisDB.quicklist import QuickList
+
+RANGE_LENGTH = 100
+
+
+def build(length: int, quicklist: bool) -> deque | QuickList:
+    """
+    Builds a list of `length` elements like "item:<i>".
+    """
+    items = (f"item:{i}" for i in range(length))
+    return QuickList(items) if quicklist else deque(items)
+
+
+def lindex(items, index: int) -> None:
+    items[index]
+
+
+def lset(items, index: int) -> None:
+    items[index] = "updated"
+
+
+def lrange(items, index: int) -> None:
+    if isinstance(items, QuickList):
+        items.slice(index, min(index + RANGE_LENGTH, len(items)))
+    else:
+        list(itertools.islice(items, index, index + RANGE_LENGTH))
+
+
+def linsert(items, index: int) -> None:
+    items.insert(index, "inserted")
+
+
+def push_pop(items, index: int) -> None:
+    items.appendleft("pushed")
+    items.pop()
+
+
+OPERATIONS = {
+    "LINDEX": (lindex, 10_000),
+    "LSET": (lset, 10_000),
+    "LRANGE 100": (lrange, 2_000),
+    "LINSERT": (linsert, 2_000),
+    "LPUSH+RPOP": (push_pop, 100_000),
+}
+
+
+def measure_memory(length: int, quicklist: bool) -> int:
+    """
+    Returns the bytes allocated to build a list.
+    """
+    gc.collect()
+    tracemalloc.start()
+    items = build(length, quicklist)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def measure_time(items, operation, runs: int) -> float:
+    """
+    Returns the mean time of an operation at random indexes, in microseconds.
+    """
+    rng = random.Random(0)
+    indexes = [rng.randrange(len(items)) for _ in range(runs)]
+    start = time.perf_counter()
+    for index in indexes:
+        operation(items, index)
+    return (time.perf_counter() - start) / runs * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--length", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    plain = measure_memory(args.length, quicklist=False)
+    compact = measure_memory(args.length, quicklist=True)
+    print(f"{'memory':<14}{plain / 2 ** 20:>10.1f} MiB{compact / 2 ** 20:>10.1f} MiB"
+          f"{1 - compact / plain:>8.0%} saved")
+
+    print(f"{'operation':<14}{'deque':>14}{'quicklist':>14}")
+    lists = {quicklist: build(args.length, quicklist) for quicklist in (False, True)}
+    for name, (operation, runs) in OPERATIONS.items():
+        timings = [measure_time(lists[quicklist], operation, runs) for quicklist in (False, True)]
+        print(f"{name:<14}{timings[0]:>11.2f} µs{timings[1]:>11.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""
+Load generator in the style of redis-benchmark, with a regression check.
+
+Starts the server in a subprocess (or targets a running one with `--server`),
+drives it over TCP with `--clients` concurrent connections, each sending batches
+of `--pipeline` commands and waiting for their replies, and reports per workload:
+
+- the throughput, in requests per second;
+- the p50, p99 and p99.9 latencies, in milliseconds. As in redis-benchmark, the
+  latency of a request is the round trip of the batch it was sent in.
+
+A workload is a single command (`--tests`) or a weighted mix of commands
+(`--mix GET=9,SET=1`). Commands use keys picked at random among `--keyspace` keys
+and values of `--data-size` bytes.
+
+Results can be saved as JSON (`--output`) and compared with a saved run
+(`--baseline`): the run fails with exit status 1 if a workload's throughput drops,
+or its p99 latency grows, by more than `--tolerance` against the baseline.
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.load_benchmark [--clients 50] [--requests 100000]
+        [--pipeline 1] [--data-size 3] [--tests PING,SET,GET,INCR,LPUSH]
+        [--mix GET=9,SET=1] [--mode threaded] [--server HOST:PORT]
+        [--output results.json] [--baseline baseline.json] [--tolerance 0.1]
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+COMMANDS = ("PING", "SET", "GET", "INCR", "LPUSH")
+DEFAULT_TESTS = ",".join(COMMANDS)
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "server.py")
+STARTUP_TIMEOUT = 10.0
+# Batches prepared per client, cycled through while the workload runs.
+BATCHES_PER_CLIENT = 64
+PERCENTILES = {"p50_ms": 50, "p99_ms": 99, "p999_ms": 99.9}
+
+
+def encode_command(*arguments: bytes) -> bytes:
+    """
+    Encodes a command as a RESP array of bulk strings.
+    """
+    parts = [b"*%d\r\n" % len(arguments)]
+    for argument in arguments:
+        parts.append(b"$%d\r\n%s\r\n" % (len(argument), argument))
+    return b"".join(parts)
+
+
+def build_command(name: str, rng: random.Random, keyspace: int, value: bytes) -> bytes:
+    """
+    Encodes one command of a workload, on a random key.
+    """
+    key = b"key:%012d" % rng.randrange(keyspace)
+    if name == "PING":
+        return encode_command(b"PING")
+    if name == "SET":
+        return encode_command(b"SET", key, value)
+    if name == "GET":
+        return encode_command(b"GET", key)
+    if name == "INCR":
+        return encode_command(b"INCR", b"counter:%012d" % rng.randrange(keyspace))
+    if name == "LPUSH":
+        return encode_command(b"LPUSH", b"mylist", value)
+    raise ValueError(f"unsupported command '{name}'")
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """
+    Parses a workload given as "COMMAND=WEIGHT,..." (a weight of 1 if omitted).
+
+    Raises:
+        argparse.ArgumentTypeError: If a command is unsupported or a weight invalid.
+    """
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip().upper()
+        if name not in COMMANDS:
+            raise argparse.ArgumentTypeError(
+                f"unsupported command '{name}': expected one of {', '.join(COMMANDS)}")
+        try:
+            mix[name] = int(weight) if weight else 1
+        except ValueError:
+            mix[name] = 0
+        if mix[name] <= 0:
+            raise argparse.ArgumentTypeError(f"invalid weight '{weight}' for {name}")
+    return mix
+
+
+def workload_name(mix: dict[str, int]) -> str:
+    """
+    Names a workload after its commands, e.g. "GET" or "GET=9,SET=1".
+    """
+    if len(mix) == 1:
+        return next(iter(mix))
+    return ",".join(f"{name}={weight}" for name, weight in mix.items())
+
+
+def count_replies(buffer: bytearray, start: int) -> tuple[int, int, int]:
+    """
+    Counts the complete replies in a buffer, from an offset.
+
+    Only the reply types of the benchmarked commands are expected: simple
+    strings, errors, integers and bulk strings.
+
+    Returns:
+        tuple[int, int, int]: The number of replies, of error replies, and the
+                              offset of the first incomplete reply.
+    """
+    replies = errors = 0
+    while True:
+        end = buffer.find(b"\r\n", start)
+        if end < 0:
+            break
+        kind = buffer[start]
+        if kind == 0x24:  # "$": bulk string, or null bulk string
+            length = int(buffer[start + 1:end])
+            if length >= 0:
+                end += length + 2
+                if end + 2 > len(buffer):
+                    break
+        elif kind == 0x2D:  # "-": error
+            errors += 1
+        replies += 1
+        start = end + 2
+    return replies, errors, start
+
+
+class Client:
+    """
+    A benchmark client: one connection sending pipelined batches.
+    """
+
+    def __init__(self, address: tuple[str, int], batches: list[bytes], pipeline: int):
+        self.address = address
+        self.batches = batches
+        self.pipeline = pipeline
+        self.latencies: list[float] = []
+        self.errors = 0
+
+    def run(self, batches: int, start: threading.Barrier) -> None:
+        """
+        Sends `batches` batches, each once the replies of the previous one arrived.
+        """
+        with socket.create_connection(self.address) as connection:
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            buffer = bytearray()
+            start.wait()
+            for index in range(batches):
+                sent = time.perf_counter()
+                connection.sendall(self.batches[index % len(self.batches)])
+                pending, offset = self.pipeline, 0
+                buffer.clear()
+                while pending:
+                    data = connection.recv(65536)
+                    if not data:
+                        raise ConnectionError("connection closed by the server")
+                    buffer += data
+                    replies, errors, offset = count_replies(buffer, offset)
+                    pending -= replies
+                    self.errors += errors
+                latency = (time.perf_counter() - sent) * 1000
+                self.latencies.extend([latency] * self.pipeline)
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """
+    Returns the value below which `rank` percent of the sorted `values` fall.
+    """
+    index = min(len(values) - 1, int(len(values) * rank / 100))
+    return values[index]
+
+
+def run_workload(address: tuple[str, int], mix: dict[str, int], args) -> dict:
+    """
+    Runs a workload and returns its throughput and latency percentiles.
+    """
+    names, weights = list(mix), list(mix.values())
+    value = b"x" * args.data_size
+    batches_per_client = max(1, args.requests // (args.clients * args.pipeline))
+    clients = []
+    for index in range(args.clients):
+        rng = random.Random(index)
+        batches = [
+            b"".join(build_command(name, rng, args.keyspace, value)
+                     for name in rng.choices(names, weights, k=args.pipeline))
+            for _ in range(min(BATCHES_PER_CLIENT, batches_per_client))
+        ]
+        clients.append(Client(address, batches, args.pipeline))
+
+    start = threading.Barrier(args.clients + 1)
+    threads = [threading.Thread(target=client.run, args=(batches_per_client, start))
+               for client in clients]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for client in clients for latency in client.latencies)
+    result = {
+        "requests": len(latencies),
+        "errors": sum(client.errors for client in clients),
+        "ops_per_sec": round(len(latencies) / elapsed, 1),
+    }
+    for name, rank in PERCENTILES.items():
+        result[name] = round(percentile(latencies, rank), 3)
+    return result
+
+
+def wait_for_server(address: tuple[str, int], process: subprocess.Popen) -> None:
+    """
+    Waits until the server answers PING.
+
+    Raises:
+        RuntimeError: If the server exits or does not answer in time.
+    """
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"the server exited with status {process.returncode}")
+        try:
+            with socket.create_connection(address, timeout=1) as connection:
+                connection.sendall(encode_command(b"PING"))
+                if connection.recv(64):
+                    return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"the server did not start within {STARTUP_TIMEOUT:.0f}s")
+
+
+def start_server(args, directory: str) -> subprocess.Popen:
+    """
+    Starts the server on a free port, without persistence, and waits until it is ready.
+    """
+    with socket.socket() as probe:
+        probe.bind((args.host, 0))
+        args.port = probe.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, SERVER_SCRIPT, "--host", args.host, "--port", str(args.port),
+         "--mode", args.mode, "--snapshot", os.path.join(directory, "benchmark.rdb"),
+         "--save", ""],
+        cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_server((args.host, args.port), process)
+    except Exception:
+        process.kill()
+        process.wait()
+        raise
+    return process
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compares results with a baseline run.
+
+    Args:
+        results (dict): The workloads of this run, by name.
+        baseline (dict): The workloads of the baseline run, by name.
+        tolerance (float): The fraction by which a workload may get slower.
+
+    Returns:
+        list[str]: A description of each regression; workloads missing from the
+                   baseline are not compared.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if result["ops_per_sec"] < reference["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:,.0f} ops/sec, baseline "
+                f"{reference['ops_per_sec']:,.0f}")
+        if result["p99_ms"] > reference["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {result['p99_ms']:.3f} ms, baseline {reference['p99_ms']:.3f} ms")
+    return regressions
+
+
+def parse_address(value: str) -> tuple[str, int]:
+    """
+    Parses a "HOST:PORT" server address.
+    """
+    host, _, port = value.rpartition(":")
+    try:
+        return host or "127.0.0.1", int(port)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid address '{value}': expected HOST:PORT")
+
+
+def positive_integer(value: str) -> int:
+    """
+    Parses an option that must be an integer of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid value '{value}': expected an integer >= 1")
+    return number
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parses the command line, and the workloads it selects into `args.workloads`.
+
+    Exits with a usage error if no workload is selected.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", "-c", type=positive_integer, default=50)
+    parser.add_argument("--requests", "-n", type=positive_integer, default=100_000,
+                        help="Requests per workload.")
+    parser.add_argument("--pipeline", "-P", type=positive_integer, default=1,
+                        help="Commands per batch.")
+    parser.add_argument("--data-size", "-d", type=int, default=3,
+                        help="Size of SET and LPUSH values, in bytes.")
+    parser.add_argument("--keyspace", "-r", type=positive_integer, default=100_000,
+                        help="Number of distinct keys used.")
+    parser.add_argument("--tests", "-t", type=str, default=DEFAULT_TESTS,
+                        help="Commands to benchmark one at a time; '' to run only --mix.")
+    parser.add_argument("--mix", type=parse_mix, action="append", default=[],
+                        help="A weighted workload, e.g. GET=9,SET=1; may be repeated.")
+    parser.add_argument("--mode", choices=("threaded", "event-loop"), default="threaded",
+                        help="Connection model of the started server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--server", type=parse_address,
+                        help="Benchmark a running server instead of starting one.")
+    parser.add_argument("--output", "-o", help="Save the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare the results with this JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Allowed slowdown against the baseline, as a fraction.")
+    args = parser.parse_args(argv)
+
+    if args.data_size < 0:
+        parser.error("argument --data-size/-d: expected an integer >= 0")
+    if args.tolerance < 0:
+        parser.error("argument --tolerance: expected a fraction >= 0")
+    try:
+        args.workloads = [parse_mix(name) for name in args.tests.split(",") if name.strip()]
+    except argparse.ArgumentTypeError as e:
+        parser.error(f"argument --tests/-t: {e}")
+    args.workloads += args.mix
+    if not args.workloads:
+        parser.error("no workload selected: give commands with --tests or --mix")
+    return args
+
+
+def main() -> None:
+    args = parse_arguments()
+
+    config = {key: getattr(args, key)
+              for key in ("clients", "requests", "pipeline", "data_size", "keyspace", "mode")}
+    with tempfile.TemporaryDirectory() as directory:
+        process = None if args.server else start_server(args, directory)
+        address = args.server or (args.host, args.port)
+        try:
+            print(f"{'workload':<20}{'ops/sec':>12}{'p50 ms':>10}{'p99 ms':>10}"
+                  f"{'p99.9 ms':>10}{'errors':>8}")
+            results = {}
+            for mix in args.workloads:
+                name = workload_name(mix)
+                result = results[name] = run_workload(address, mix, args)
+                print(f"{name:<20}{result['ops_per_sec']:>12,.0f}{result['p50_ms']:>10.3f}"
+                      f"{result['p99_ms']:>10.3f}{result['p999_ms']:>10.3f}"
+                      f"{result['errors']:>8}")
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"config": config, "results": results}, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline.get("config") != config:
+            print(f"warning: the baseline was run with {baseline.get('config')}")
+        regressions = find_regressions(results, baseline["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression against {args.baseline} (tolerance {args.tolerance:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Memory benchmark of the compact value encodings against plain Python objects.
+
+Each dataset is built twice into a dict, once with the representation values had
+before the compact encodings (every SET value a `str`, every list a `deque`, every
+hash a `dict`, every set a `set`) and once through the encodings the commands use now
+(`encode_string` for SET values, `push_values_to_list` for LPUSH/RPUSH, `create_hash`
+for HSET, `create_set` for SADD). Memory is measured with `tracemalloc`
+and reported per key, keys included.
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.memory_benchmark [--keys 1000000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections import deque
+
+from src.redisDB.encodings import create_hash, create_set, encode_string
+from src.utils.data_utils import push_values_to_list
+
+LIST_LENGTH = 10
+HASH_FIELDS = 10
+SET_MEMBERS = 10
+
+
+def counters(keys: int, compact: bool) -> dict:
+    """
+    `keys` counters holding 0..keys-1, as set by SET counter:<i> <i>.
+    """
+    encode = encode_string if compact else str
+    return {f"counter:{i}": encode(str(i)) for i in range(keys)}
+
+
+def small_counters(keys: int, compact: bool) -> dict:
+    """
+    `keys` counters holding small values (0..99), e.g. rate limiter hits.
+    """
+    encode = encode_string if compact else str
+    return {f"hits:{i}": encode(str(i % 100)) for i in range(keys)}
+
+
+def strings(keys: int, compact: bool) -> dict:
+    """
+    `keys` short strings, e.g. session tokens.
+    """
+    encode = encode_string if compact else str
+    return {f"session:{i}": encode(f"user-{i:08d}-token") for i in range(keys)}
+
+
+def lists(keys: int, compact: bool) -> dict:
+    """
+    `keys // 10` lists of `LIST_LENGTH` short elements, as built by RPUSH.
+    """
+    items = [f"item-{i}" for i in range(LIST_LENGTH)]
+    if compact:
+        return {f"list:{i}": push_values_to_list(None, items, is_left=False)
+                for i in range(keys // 10)}
+    return {f"list:{i}": deque(items) for i in range(keys // 10)}
+
+
+def hashes(keys: int, compact: bool) -> dict:
+    """
+    `keys // 10` objects of `HASH_FIELDS` short fields, as built by HSET.
+    """
+    build = create_hash if compact else dict
+    return {f"user:{i}": build((f"field-{j}", f"value-{i}-{j}") for j in range(HASH_FIELDS))
+            for i in range(keys // 10)}
+
+
+def integer_sets(keys: int, compact: bool) -> dict:
+    """
+    `keys // 10` objects of `SET_MEMBERS` integer ids, as built by SADD.
+    """
+    build = create_set if compact else set
+    return {f"followers:{i}": build([str(i * SET_MEMBERS + j) for j in range(SET_MEMBERS)])
+            for i in range(keys // 10)}
+
+
+DATASETS = {
+    "counters": counters,
+    "small counters": small_counters,
+    "short strings": strings,
+    "lists of 10": lists,
+    "hashes of 10": hashes,
+    "int sets of 10": integer_sets,
+}
+
+
+def measure(build, keys: int, compact: bool) -> tuple[int, int]:
+    """
+    Returns the bytes allocated to build a dataset and its number of keys.
+    """
+    gc.collect()
+    tracemalloc.start()
+    data = build(keys, compact)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, len(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'dataset':<16}{'keys':>10}{'plain':>14}{'compact':>14}{'saved':>8}")
+    for name, build in DATASETS.items():
+        plain, count = measure(build, args.keys, compact=False)
+        compact, _ = measure(build, args.keys, compact=True)
+        print(f"{name:<16}{count:>10,}{plain / 2 ** 20:>10.1f} MiB{compact / 2 ** 20:>10.1f} MiB"
+              f"{1 - compact / plain:>8.0%}")
+        print(f"{'':<16}{'per key':>10}{plain / count:>12.0f} B{compact / count:>12.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Microbenchmark comparing the stream-based `RespDeserializer` with the offset-based
+`RespBufferParser` on typical request shapes.
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.resp_parser_benchmark [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from src.redis_protocol.buffer_parser import RespBufferParser
+from src.redis_protocol.deserialization_handler import RespDeserializer
+
+
+def _command(*arguments: bytes) -> bytes:
+    """
+    Encodes a command as a RESP array of bulk strings.
+    """
+    parts = [b"*%d\r\n" % len(arguments)]
+    for argument in arguments:
+        parts.append(b"$%d\r\n%s\r\n" % (len(argument), argument))
+    return b"".join(parts)
+
+
+CASES = {
+    "SET key value": (_command(b"SET", b"key:000001", b"x" * 16), 1),
+    "GET x 100 pipelined": (_command(b"GET", b"key:000001") * 100, 100),
+    "SET 64KB value": (_command(b"SET", b"big", b"x" * 65536), 1),
+    "RPUSH 1000 elements": (_command(b"RPUSH", b"list", *[b"%06d" % i for i in range(1000)]), 1),
+}
+
+
+def parse_with_deserializer(data: bytes, frames: int) -> None:
+    """
+    Parses `frames` frames out of `data` with RespDeserializer.
+    """
+    deserializer = RespDeserializer(data)
+    for _ in range(frames):
+        deserializer.deserialize()
+
+
+def parse_with_buffer_parser(data: bytes, frames: int) -> None:
+    """
+    Parses `frames` frames out of `data` with RespBufferParser.
+    """
+    with RespBufferParser(data) as parser:
+        for _ in range(frames):
+            parser.parse()
+
+
+def _frames_per_second(func, data: bytes, frames: int, repeat: int) -> float:
+    """
+    Returns the best observed parse throughput, in frames per second.
+    """
+    timer = timeit.Timer(lambda: func(data, frames))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number * frames / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timing repetitions per case (best is reported).")
+    args = parser.parse_args()
+
+    print(f"{'case':<22}{'RespDeserializer':>20}{'RespBufferParser':>20}{'speedup':>10}")
+    for name, (data, frames) in CASES.items():
+        old = _frames_per_second(parse_with_deserializer, data, frames, args.repeat)
+        new = _frames_per_second(parse_with_buffer_parser, data, frames, args.repeat)
+        print(f"{name:<22}{old:>15,.0f} f/s{new:>15,.0f} f/s{new / old:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
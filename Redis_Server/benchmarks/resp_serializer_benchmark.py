@@ -0,0 +1,94 @@
+"""
+Microbenchmark for `RespSerializer` on typical reply shapes.
+
+The previous implementation, which built nested f-strings, encoded the finished
+reply and was instantiated once per request, is reproduced here as
+`fstring_serialize` so both can be compared on the same machine.
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.resp_serializer_benchmark [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from src.constants.redis_protocol import CRLF_STR
+from src.redis_protocol.serialization_handler import RESP_SERIALIZER
+
+CASES = {
+    "SET reply (OK)": "OK",
+    "GET reply (16 B)": "v" * 16,
+    "INCR reply": 4242,
+    "LRANGE 100": [f"element:{i:06d}" for i in range(100)],
+    "LRANGE 10000": [f"element:{i:06d}" for i in range(10000)],
+}
+
+
+def _fstring(data) -> str:
+    """
+    The former recursive f-string serializer (bulk strings only).
+    """
+    if data is None:
+        return f"$-1{CRLF_STR}"
+    if isinstance(data, str):
+        return f"${len(data)}{CRLF_STR}{data}{CRLF_STR}"
+    if isinstance(data, int):
+        return f":{data}{CRLF_STR}"
+    elements = [_fstring(item) for item in data]
+    return f"*{len(data)}{CRLF_STR}" + "".join(elements)
+
+
+class _FStringSerializer:
+    """
+    The former serializer class, minus its error handling.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        self.encoding = encoding
+
+    def serialize(self, data) -> bytes:
+        try:
+            return _fstring(data).encode(self.encoding)
+        except Exception as e:
+            raise ValueError(e) from e
+
+
+def fstring_serialize(data) -> bytes:
+    """
+    Serializes a reply the way the former request handler did.
+    """
+    return _FStringSerializer().serialize(data)
+
+
+def _replies_per_second(func, data, repeat: int) -> float:
+    """
+    Returns the best observed serialization throughput, in replies per second.
+    """
+    timer = timeit.Timer(lambda: func(data))
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timing repetitions per case (best is reported).")
+    args = parser.parse_args()
+
+    reusable = bytearray()
+
+    def serialize_into_reused_buffer(data) -> None:
+        RESP_SERIALIZER.serialize_into(reusable, data)
+        reusable.clear()
+
+    print(f"{'case':<18}{'f-string':>16}{'serialize':>16}{'serialize_into':>18}")
+    for name, data in CASES.items():
+        assert fstring_serialize(data) == RESP_SERIALIZER.serialize(data)
+        old = _replies_per_second(fstring_serialize, data, args.repeat)
+        new = _replies_per_second(RESP_SERIALIZER.serialize, data, args.repeat)
+        into = _replies_per_second(serialize_into_reused_buffer, data, args.repeat)
+        print(f"{name:<18}{old:>12,.0f} r/s{new:>12,.0f} r/s{into:>14,.0f} r/s")
+
+
+if __name__ == "__main__":
+    main()
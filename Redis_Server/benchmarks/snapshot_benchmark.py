@@ -0,0 +1,92 @@
+"""
+Benchmark of snapshot save and load times: the RDB format versus pickle.
+
+The dataset mimics a typical keyspace: mostly short string values, a share of
+integer counters (as stored by INCR), some lists, and expiry times on a share
+of the keys. The pickle path is the one `RedisDB` used before the RDB format.
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.snapshot_benchmark [--keys 1000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+from collections import deque
+
+from src.redisDB import rdb
+
+
+def build_dataset(keys: int) -> tuple[dict, dict]:
+    """
+    Builds `keys` keys: 90% strings, 9% integers, 1% lists of 16 items, with an
+    expiry time on every 10th key.
+    """
+    data = {}
+    for i in range(keys):
+        key = f"key:{i:08d}"
+        if i % 100 == 0:
+            data[key] = deque(f"item:{j}" for j in range(16))
+        elif i % 10 == 0:
+            data[key] = i
+        else:
+            data[key] = f"value:{i}"
+    expires = {f"key:{i:08d}": 1_900_000_000_000 + i for i in range(0, keys, 10)}
+    return data, expires
+
+
+def _pickle_dump(file, data, expires) -> None:
+    pickle.dump((data, expires), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _best_time(func, repeat: int) -> float:
+    """
+    Returns the best wall time of `repeat` runs of `func`, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=1_000_000,
+                        help="Number of keys in the dataset.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timing repetitions per case (best is reported).")
+    args = parser.parse_args()
+
+    data, expires = build_dataset(args.keys)
+    formats = {
+        "pickle": (_pickle_dump, pickle.load),
+        "rdb": (lambda f, d, e: rdb.dump(f, d, e), rdb.load),
+        "rdb+zlib": (lambda f, d, e: rdb.dump(f, d, e, compress=True), rdb.load),
+    }
+
+    print(f"{args.keys:,} keys")
+    print(f"{'format':<10}{'save':>10}{'load':>10}{'size':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "snapshot")
+        for name, (dump, load) in formats.items():
+            def save():
+                with open(path, "wb") as file:
+                    dump(file, data, expires)
+
+            def restore():
+                with open(path, "rb") as file:
+                    return load(file)
+
+            save_time = _best_time(save, args.repeat)
+            load_time = _best_time(restore, args.repeat)
+            assert restore() == (data, expires)
+            size = os.path.getsize(path) / 1024 / 1024
+            print(f"{name:<10}{save_time:>9.2f}s{load_time:>9.2f}s{size:>9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark of the `ZSet` sorted set encoding against a plain sorted list.
+
+A sorted set of `--members` members with random scores is built once as a
+`ZSet` and once as the straightforward alternative: a member to score dict plus
+a Python list of `(score, member)` tuples kept sorted with `bisect.insort`.
+Each sorted set command is then timed on both with the equivalent operation:
+
+- ZADD: give a random member a new random score.
+- ZINCRBY: add to the score of a random member.
+- ZRANK: find the rank of a random member.
+- ZRANGE 100: read 100 members from a random rank.
+- ZRANGEBYSCORE 100: read up to 100 members from a random score.
+- ZPOPMIN + ZADD: pop the lowest member and add it back with a random score.
+
+Memory is measured with `tracemalloc` while building each sorted set.
+
+Usage (from the Redis_Server directory):
+    python -m benchmarks.zset_benchmark [--members 1000000]
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from bisect import bisect_left, insort
+
+from src.redisDB.zset import ZSet
+
+RANGE_LENGTH = 100
+
+
+class SortedList:
+    """
+    The baseline: a dict of scores and one sorted list of `(score, member)`.
+    """
+
+    def __init__(self, pairs):
+        self.scores = dict(pairs)
+        self.entries = sorted(zip(self.scores.values(), self.scores.keys()))
+
+    def add(self, member: str, score: float) -> None:
+        current = self.scores.get(member)
+        if current is not None:
+            del self.entries[bisect_left(self.entries, (current, member))]
+        self.scores[member] = score
+        insort(self.entries, (score, member))
+
+    def score(self, member: str):
+        return self.scores.get(member)
+
+    def rank(self, member: str) -> int:
+        return bisect_left(self.entries, (self.scores[member], member))
+
+    def slice(self, start: int, stop: int) -> list:
+        return [(member, score) for score, member in self.entries[start:stop]]
+
+    def rank_of_score(self, score: float) -> int:
+        return bisect_left(self.entries, (score,))
+
+    def pop_min(self, count: int) -> list:
+        popped = self.slice(0, count)
+        del self.entries[:count]
+        for member, _ in popped:
+            del self.scores[member]
+        return popped
+
+
+def build(members: int, compact: bool):
+    """
+    Builds a sorted set of `members` members like "player:<i>" with random scores.
+    """
+    rng = random.Random(0)
+    pairs = [(f"player:{i}", rng.random() * members) for i in range(members)]
+    return ZSet(pairs) if compact else SortedList(pairs)
+
+
+def zadd(scores, rng, members: int) -> None:
+    scores.add(f"player:{rng.randrange(members)}", rng.random() * members)
+
+
+def zincrby(scores, rng, members: int) -> None:
+    member = f"player:{rng.randrange(members)}"
+    scores.add(member, scores.score(member) + 1.0)
+
+
+def zrank(scores, rng, members: int) -> None:
+    scores.rank(f"player:{rng.randrange(members)}")
+
+
+def zrange(scores, rng, members: int) -> None:
+    start = rng.randrange(members - RANGE_LENGTH)
+    scores.slice(start, start + RANGE_LENGTH)
+
+
+def zrangebyscore(scores, rng, members: int) -> None:
+    start = scores.rank_of_score(rng.random() * members)
+    scores.slice(start, min(start + RANGE_LENGTH, members))
+
+
+def zpopmin_zadd(scores, rng, members: int) -> None:
+    (member, _), = scores.pop_min(1)
+    scores.add(member, rng.random() * members)
+
+
+OPERATIONS = {
+    "ZADD": (zadd, 20_000),
+    "ZINCRBY": (zincrby, 20_000),
+    "ZRANK": (zrank, 20_000),
+    "ZRANGE 100": (zrange, 5_000),
+    "ZRANGEBYSCORE": (zrangebyscore, 5_000),
+    "ZPOPMIN+ZADD": (zpopmin_zadd, 2_000),
+}
+
+
+def measure_memory(members: int, compact: bool) -> tuple[int, float]:
+    """
+    Returns the bytes allocated to build a sorted set and the time it took.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    scores = build(members, compact)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del scores
+    return size, elapsed
+
+
+def measure_time(scores, operation, members: int, runs: int) -> float:
+    """
+    Returns the mean time of an operation on random members, in microseconds.
+    """
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(runs):
+        operation(scores, rng, members)
+    return (time.perf_counter() - start) / runs * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--members", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    plain, _ = measure_memory(args.members, compact=False)
+    compact, _ = measure_memory(args.members, compact=True)
+    print(f"{'memory':<16}{plain / 2 ** 20:>10.1f} MiB{compact / 2 ** 20:>10.1f} MiB")
+
+    print(f"{'operation':<16}{'sorted list':>14}{'zset':>14}")
+    sets = {compact: build(args.members, compact) for compact in (False, True)}
+    for name, (operation, runs) in OPERATIONS.items():
+        timings = [measure_time(sets[compact], operation, args.members, runs)
+                   for compact in (False, True)]
+        print(f"{name:<16}{timings[0]:>11.2f} µs{timings[1]:>11.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,22 +3,65 @@ This module implements a Redis-like TCP server that listens for client connectio
 processes requests using RESP (Redis Serialization Protocol), and sends back 
 serialized responses.
 
-The server handles multiple clients concurrently using threading.
+By default the server handles multiple clients concurrently using threading.
+With `--mode event-loop` all clients are multiplexed over a single
+selectors-based event loop instead (see `src.network.event_loop`).
+With `--workers N` the server runs as N processes sharing the port through
+SO_REUSEPORT, each owning part of the keyspace (see `src.network.workers`).
 
 Modules:
-    - arg_parser: Parses server host and port arguments.
-    - request_handler: Processes RESP-encoded requests and generates responses.
+    - arg_parser: Parses server host, port and mode arguments.
+    - request_handler: Executes parsed requests and generates responses.
+    - stream_parser: Incrementally parses (pipelined) RESP requests per connection.
+    - event_loop: Single-threaded event-loop front end.
+    - append_only_file: Optional AOF persistence (`--appendonly`).
+    - pubsub: Publish/Subscribe channels and patterns, with per-client buffers
+      bounded by `--client-output-buffer-limit-pubsub`.
+    - redis_db: The database, saved in the background at the `--save` points and
+      bounded by `--maxmemory`.
+    - workers: Multi-process mode (`--workers N`), each worker owning a
+      hash-partition of the keyspace.
 """
 
+import functools
 import logging
+import os
+import select
 import socket
 import threading
 
-from src.handlers.request_handler import process_request
+from src.constants.redis_protocol import MAX_BUFFER_SIZE
+from src.exceptions.redis_exceptions import RedisServerException
+from src.handlers.blocked_clients import BLOCKED_CLIENTS
+from src.handlers.request_handler import (
+    load_append_only_file,
+    process_commands,
+    reply_to_unblocked,
+)
+from src.handlers.pubsub import PUBSUB, Subscriber
+from src.handlers.server_cron import SERVER_CRON
+from src.handlers.server_stats import SERVER_STATS
+from src.handlers.slow_log import SLOW_LOG
+from src.handlers.transactions import Transaction
+from src.handlers.worker_router import WORKER_ROUTER
+from src.network.event_loop import start_event_loop_server
+from src.redisDB.append_only_file import APPEND_ONLY_FILE
+from src.network.workers import (
+    create_listener,
+    start_workers,
+    worker_addresses,
+    worker_filename,
+)
+from src.redisDB.redis_db import DEFAULT_SNAPSHOT_FILENAME, REDIS_DB, RedisDB
+from src.redis_protocol.serialization_handler import RESP_SERIALIZER
+from src.redis_protocol.stream_parser import RespStreamParser
 from src.utils.argument_parser import parse_arguments
 
 logger = logging.getLogger(__name__)
 
+# How often the thread of a blocked client checks that the client is still connected.
+BLOCKED_CLIENT_CHECK_INTERVAL = 0.1
+
 
 def handle_client(connection):
     """
@@ -27,64 +70,354 @@ def handle_client(connection):
     Args:
         connection (socket): The socket connection to the client.
 
-    This function continuously listens for data, processes it, and sends back responses.
+    This function continuously listens for data, feeds it to a per-connection
+    incremental RESP parser, executes every complete (possibly pipelined) command
+    and sends all of their replies back with a single `sendall` from a reply
+    buffer that is reused for the lifetime of the connection. Replies are only
+    sent once the commands they acknowledge are committed to the append-only file.
+    The MULTI/EXEC and Pub/Sub state of the client live as long as the connection.
+    While a command such as BLPOP blocks the client, the thread keeps watching
+    the connection (see `serve_requests`).
+
+    Once the client subscribes to a channel or pattern, a writer thread sends it
+    the published messages (see `write_messages`). Replies and messages are sent
+    under the same lock, and a batch holds it from the first command to the last
+    reply, so messages never come before the reply confirming a subscription.
     """
+    parser = RespStreamParser()
+    replies = bytearray()
+    transaction = Transaction()
+    subscriber = Subscriber()
+    subscriber.on_message = functools.partial(close_dropped_subscriber, connection)
+    send_lock = threading.Lock()
+    writer = None
+    try:
+        client_address = "%s:%s" % connection.getpeername()[:2]
+    except OSError:
+        client_address = ""
+    SERVER_STATS.client_connected()
     with connection:
         while True:
             try:
-                data = connection.recv(1024)
+                data = connection.recv(MAX_BUFFER_SIZE)
                 if not data:
                     break
 
-                response = process_request(data)
-                connection.sendall(response)
+                parser.feed(data)
+                requests = parser.parse_commands()
+                if requests:
+                    if not serve_requests(connection, requests, replies, send_lock, parser,
+                                          transaction, client_address, subscriber):
+                        break
+                    if writer is None and (subscriber.channels or subscriber.patterns):
+                        writer = threading.Thread(
+                            target=write_messages,
+                            args=(connection, subscriber, send_lock), daemon=True)
+                        writer.start()
 
+            except RedisServerException as e:
+                logger.warning("Closing client after protocol error: %s", e)
+                try:
+                    connection.sendall(
+                        RESP_SERIALIZER.serialize(str(e), is_error=True))
+                except OSError:
+                    pass
+                break
             except Exception as e:
                 logger.exception("Error while handling client: %s", e)
                 break
+        PUBSUB.unsubscribe_all(subscriber)
+        subscriber.close()
+        if writer is not None:
+            # Wakes the writer up if it is stuck sending to a client not reading.
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            writer.join()
+    transaction.reset()
+    SERVER_STATS.client_disconnected()
+
+
+def serve_requests(connection, requests, replies, send_lock, parser, transaction,
+                   client_address, subscriber):
+    """
+    Executes a batch of requests of a client and sends the replies.
+
+    A blocking command that finds nothing to pop ends the batch: the replies so
+    far are sent, then the thread waits for the client to be unblocked while
+    watching its connection, and goes on with the requests received after the
+    blocking command.
+
+    Args:
+        connection (socket): The socket connection to the client.
+        requests (list): The parsed requests.
+        replies (bytearray): The reply buffer of the connection, empty.
+        send_lock (threading.Lock): Serializes writes with Pub/Sub messages.
+        parser (RespStreamParser): The request parser of the connection.
+        transaction (Transaction): The MULTI/EXEC state of the client.
+        client_address (str): The "host:port" of the client.
+        subscriber (Subscriber): The Pub/Sub state of the client.
+
+    Returns:
+        bool: False if the client disconnected while blocked.
+    """
+    while True:
+        blocked = []
+        with send_lock:
+            if requests:
+                process_commands(requests, replies, lambda *block: blocked.extend(block),
+                                 transaction, client_address, subscriber)
+            APPEND_ONLY_FILE.commit()
+            connection.sendall(replies)
+        replies.clear()
+        if not blocked:
+            return True
+        client, requests = blocked
+        if not wait_unblocked(connection, client):
+            return False
+        reply_to_unblocked(client, replies)
+        requests += parser.parse_commands()
+
+
+def wait_unblocked(connection, client):
+    """
+    Parks the thread of a blocked client until it is unblocked, checking every
+    BLOCKED_CLIENT_CHECK_INTERVAL seconds whether the client is still connected.
+    A client that disconnected is removed from the blocked clients, so it does
+    not take an element it would never receive.
+
+    Args:
+        connection (socket): The socket connection to the client.
+        client (BlockedClient): The blocked client.
+
+    Returns:
+        bool: True once the client is unblocked, False if it disconnected.
+    """
+    while not client.wait_for(BLOCKED_CLIENT_CHECK_INTERVAL):
+        readable, _, _ = select.select([connection], [], [], 0)
+        if not readable:
+            continue
+        try:
+            # Requests sent meanwhile stay in the socket until the client is unblocked.
+            if connection.recv(1, socket.MSG_PEEK):
+                continue
+        except OSError:
+            pass
+        BLOCKED_CLIENTS.cancel(client)
+        return False
+    return True
 
 
-def start_server(host, port):
+def write_messages(connection, subscriber, send_lock):
+    """
+    Sends the messages published to a subscribed client until it disconnects.
+
+    Publishers only append messages to the buffer of the subscriber, so a client
+    reading slowly holds up this thread only.
+
+    Args:
+        connection (socket): The socket connection to the client.
+        subscriber (Subscriber): The Pub/Sub state of the client.
+        send_lock (threading.Lock): Serializes writes with the replies of the client.
+    """
+    while True:
+        messages = subscriber.wait()
+        if subscriber.dropped:
+            return
+        try:
+            with send_lock:
+                connection.sendall(messages)
+        except OSError:
+            return
+
+
+def close_dropped_subscriber(connection, subscriber):
+    """
+    Shuts a subscribed client's connection down once it was dropped for leaving
+    too many messages unread; its own thread then sees the connection closed.
+    Called by the publishing thread, so it must not block.
+
+    Args:
+        connection (socket): The socket connection to the client.
+        subscriber (Subscriber): The Pub/Sub state of the client.
+    """
+    if subscriber.dropped:
+        logger.warning("Closing subscriber over the Pub/Sub output buffer limit")
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def accept_clients(lsock):
+    """
+    Accepts client connections on a listening socket forever, handling each
+    client in a separate thread.
+
+    Args:
+        lsock (socket): The listening socket.
+    """
+    while True:
+        client_socket, address = lsock.accept()
+        logger.info(f"New connection from {address}")
+
+        client_handler = threading.Thread(
+            target=handle_client, args=(client_socket,)
+        )
+        client_handler.start()
+
+
+def start_server(host, port, listeners=None):
     """
     Starts the Redis-like server to listen for incoming client connections.
 
-    - Binds the server to the specified HOST and PORT.
+    - Binds the server to the specified HOST and PORT, unless already bound
+      listening sockets are given (e.g. the public and private sockets of a worker).
+    - Starts the server cron (background jobs such as active key expiration).
     - Accepts incoming client connections and handles them in separate threads.
     """
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as lsock:
-        try:
+    try:
+        if listeners is None:
+            listeners = [create_listener(host, port)]
+
+        logger.info("Server started. Listening on %s...", ", ".join(
+            "%s:%d" % lsock.getsockname()[:2] for lsock in listeners))
+
+        SERVER_CRON.start()
+
+        for lsock in listeners[1:]:
+            threading.Thread(target=accept_clients, args=(lsock,), daemon=True).start()
+        accept_clients(listeners[0])
+
+    except KeyboardInterrupt:
+        logger.info("Server stopped by user.")
+    except Exception as e:
+        logger.exception("An error occurred: %s", e)
+    finally:
+        for lsock in listeners or ():
+            lsock.close()
+
+
+def open_append_only_file(filename, fsync_policy):
+    """
+    Enables AOF persistence.
+
+    - If the append-only file exists, the database is rebuilt by replaying it
+      (instead of using the snapshot).
+    - Otherwise the AOF is created from the snapshot data, so it is complete
+      from the start.
+    """
+    exists = os.path.exists(filename)
+    if exists:
+        count = load_append_only_file(filename)
+        logger.info(f"Replayed {count} commands from {filename}")
+
+    APPEND_ONLY_FILE.open(filename, fsync_policy)
+    if not exists:
+        APPEND_ONLY_FILE.rewrite(background=False)
+
+
+def configure_maxmemory(args):
+    """
+    Applies the memory limit and eviction policy to the database. In worker mode
+    every worker gets an equal share of the limit.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    REDIS_DB.configure_maxmemory(args.maxmemory // args.workers, args.maxmemory_policy)
+
 
-            lsock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+def configure_persistence(args, appendfilename):
+    """
+    Applies the snapshot and append-only file options to the database.
 
-            lsock.bind((host, port))
-            lsock.listen()
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        appendfilename (str): Path to the append-only file.
+    """
+    REDIS_DB.save_points = args.save
+    REDIS_DB.snapshot_compression = args.rdbcompression == "yes"
 
-            logger.info(f"Server started. Listening on {host}:{port}...")
+    if args.appendonly:
+        open_append_only_file(appendfilename, args.appendfsync)
 
-            while True:
-                client_socket, address = lsock.accept()
-                logger.info(f"New connection from {address}")
 
-                client_handler = threading.Thread(
-                    target=handle_client, args=(client_socket,)
-                )
-                client_handler.start()
+def serve(args, listeners=None):
+    """
+    Serves clients with the connection model selected by `--mode`.
 
-        except KeyboardInterrupt:
-            logger.info("Server stopped by user.")
-        except Exception as e:
-            logger.exception("An error occurred: %s", e)
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        listeners (list[socket] | None): Already bound listening sockets, if any.
+    """
+    if args.mode == "event-loop":
+        start_event_loop_server(args.host, args.port, listeners)
+    else:
+        start_server(args.host, args.port, listeners)
+
+
+def migrate_pickle_snapshot(args):
+    """
+    Converts a legacy pickle snapshot to the RDB snapshot file (`--migrate-pickle-snapshot`).
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    data, expires = RedisDB.load_pickle_snapshot(args.migrate_pickle_snapshot)
+    database = RedisDB(args.snapshot, data=data, expires=expires)
+    database.snapshot_compression = args.rdbcompression == "yes"
+    database.dump_data()
+    logger.info(f"Migrated {len(data)} keys from {args.migrate_pickle_snapshot} "
+                f"to {args.snapshot}")
+
+
+def run_worker(args, worker_id):
+    """
+    Runs one worker process of the `--workers` mode.
+
+    The worker loads its own snapshot and append-only file, takes ownership of
+    its range of hash slots and serves the public port (shared with the other
+    workers through SO_REUSEPORT) as well as its private port.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        worker_id (int): Index of the worker.
+    """
+    addresses = worker_addresses(args.host, args.port, args.workers)
+    RedisDB.from_file(worker_filename(args.snapshot, worker_id))
+    configure_maxmemory(args)
+    configure_persistence(args, worker_filename(args.appendfilename, worker_id))
+    WORKER_ROUTER.configure(worker_id, addresses)
+
+    listeners = [
+        create_listener(args.host, args.port, reuse_port=True),
+        create_listener(*addresses[worker_id]),
+    ]
+    serve(args, listeners)
 
 
 if __name__ == "__main__":
     
     args = parse_arguments()
-    HOST = args.host
-    PORT = args.port
 
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s"
+        format="%(asctime)s - %(processName)s - %(levelname)s - %(message)s"
     )
 
-    start_server(HOST, PORT)
+    SERVER_STATS.latency_sample_rate = max(args.latency_tracking_sample, 0)
+    SLOW_LOG.configure(args.slowlog_log_slower_than, args.slowlog_max_len)
+    PUBSUB.output_buffer_limit = args.client_output_buffer_limit_pubsub
+
+    if args.migrate_pickle_snapshot:
+        migrate_pickle_snapshot(args)
+    elif args.workers > 1:
+        start_workers(args.workers, functools.partial(run_worker, args))
+    else:
+        if args.snapshot != DEFAULT_SNAPSHOT_FILENAME:
+            RedisDB.from_file(args.snapshot)
+        configure_maxmemory(args)
+        configure_persistence(args, args.appendfilename)
+        serve(args)
@@ -1,49 +1,230 @@
 """
-This module provides a function to resolve Redis-like commands to their corresponding
-command handler classes. It maps command strings (e.g., 'GET', 'SET') to handler classes
-that implement the respective Redis command logic.
+This module provides the command table and functions to resolve Redis-like commands
+to their corresponding command handler classes. It maps command strings (e.g., 'GET',
+'SET') to handler classes that implement the respective Redis command logic.
 
 Exports:
+    - COMMAND_SPECS: The `CommandSpec` of every command, with its arity.
+    - lookup_command: Resolves a command name, as received, to its `CommandSpec`.
     - get_command_handler: Resolves a given command string to its handler class.
 
 Raises:
     - UnknownCommandException: If the command is not supported.
 """
 
+from typing import Optional
+
 from src.commands.base_command import RedisCommand
+from src.commands.cluster_commands import ClusterCommand
+from src.commands.command_spec import CommandSpec
+from src.commands.expire_commands import (
+    ExpireAtCommand,
+    ExpireCommand,
+    PersistCommand,
+    PExpireAtCommand,
+    PExpireCommand,
+    PTTLCommand,
+    TTLCommand,
+)
+from src.commands.hash_commands import (
+    HDelCommand,
+    HGetAllCommand,
+    HGetCommand,
+    HIncrByCommand,
+    HLenCommand,
+    HMGetCommand,
+    HScanCommand,
+    HSetCommand,
+)
+from src.commands.introspection_commands import (
+    InfoCommand,
+    LatencyCommand,
+    MemoryCommand,
+    ObjectCommand,
+    SlowlogCommand,
+)
 from src.commands.key_value_commands import (
+    AppendCommand,
     DecrByCommand,
     DecrCommand,
     DeleteCommand,
     ExistsCommand,
     GetCommand,
+    GetDelCommand,
+    GetExCommand,
+    GetSetCommand,
     IncrByCommand,
     IncrCommand,
+    MGetCommand,
+    MSetCommand,
+    MSetNxCommand,
     SetCommand,
+    SetNxCommand,
+    StrLenCommand,
+)
+from src.commands.keyspace_commands import DBSizeCommand, KeysCommand, ScanCommand
+from src.commands.list_commands import (
+    BLMoveCommand,
+    BLPopCommand,
+    BRPopCommand,
+    LIndexCommand,
+    LInsertCommand,
+    LLenCommand,
+    LMoveCommand,
+    LPopCommand,
+    LPushCommand,
+    LRangeCommand,
+    LRemCommand,
+    LSetCommand,
+    LTrimCommand,
+    RPopCommand,
+    RPushCommand,
+)
+from src.commands.pubsub_commands import PublishCommand, PubsubCommand
+from src.commands.set_commands import (
+    SAddCommand,
+    SCardCommand,
+    SDiffCommand,
+    SDiffStoreCommand,
+    SInterCommand,
+    SInterStoreCommand,
+    SIsMemberCommand,
+    SMembersCommand,
+    SRemCommand,
+    SUnionCommand,
+    SUnionStoreCommand,
 )
-from src.commands.list_commands import LPushCommand, RPushCommand
 from src.commands.utility_commands import (
+    BgRewriteAofCommand,
+    BgSaveCommand,
     EchoCommand,
+    LastSaveCommand,
     PingCommand,
     SaveCommand,
 )
+from src.commands.zset_commands import (
+    ZAddCommand,
+    ZCardCommand,
+    ZIncrByCommand,
+    ZPopMinCommand,
+    ZRangeByScoreCommand,
+    ZRangeCommand,
+    ZRankCommand,
+    ZRemCommand,
+)
 from src.exceptions.redis_exceptions import UnknownCommandException
 
-COMMAND_MAP = {
-    "PING": PingCommand,
-    "ECHO": EchoCommand,
-    "GET": GetCommand,
-    "SET": SetCommand,
-    "EXISTS": ExistsCommand,
-    "DEL": DeleteCommand,
-    "INCRBY": IncrByCommand,
-    "INCR": IncrCommand,
-    "DECR": DecrCommand,
-    "DECRBY": DecrByCommand,
-    "LPUSH": LPushCommand,
-    "RPUSH": RPushCommand,
-    "SAVE": SaveCommand,
-}
+# The command table: each command with its arity, counting the command name
+# (negative for a minimum), like the Redis command table.
+COMMAND_SPECS = (
+    CommandSpec("PING", PingCommand, -1),
+    CommandSpec("ECHO", EchoCommand, 2),
+    CommandSpec("GET", GetCommand, 2),
+    CommandSpec("SET", SetCommand, -3),
+    CommandSpec("EXISTS", ExistsCommand, -2),
+    CommandSpec("DEL", DeleteCommand, -2),
+    CommandSpec("SCAN", ScanCommand, -2),
+    CommandSpec("KEYS", KeysCommand, 2),
+    CommandSpec("DBSIZE", DBSizeCommand, 1),
+    CommandSpec("INCRBY", IncrByCommand, 3),
+    CommandSpec("INCR", IncrCommand, 2),
+    CommandSpec("DECR", DecrCommand, 2),
+    CommandSpec("DECRBY", DecrByCommand, 3),
+    CommandSpec("MGET", MGetCommand, -2),
+    CommandSpec("MSET", MSetCommand, -3),
+    CommandSpec("MSETNX", MSetNxCommand, -3),
+    CommandSpec("GETSET", GetSetCommand, 3),
+    CommandSpec("GETDEL", GetDelCommand, 2),
+    CommandSpec("GETEX", GetExCommand, -2),
+    CommandSpec("SETNX", SetNxCommand, 3),
+    CommandSpec("APPEND", AppendCommand, 3),
+    CommandSpec("STRLEN", StrLenCommand, 2),
+    CommandSpec("LPUSH", LPushCommand, -3),
+    CommandSpec("RPUSH", RPushCommand, -3),
+    CommandSpec("LPOP", LPopCommand, -2),
+    CommandSpec("RPOP", RPopCommand, -2),
+    CommandSpec("LLEN", LLenCommand, 2),
+    CommandSpec("LINDEX", LIndexCommand, 3),
+    CommandSpec("LRANGE", LRangeCommand, 4),
+    CommandSpec("LSET", LSetCommand, 4),
+    CommandSpec("LTRIM", LTrimCommand, 4),
+    CommandSpec("LREM", LRemCommand, 4),
+    CommandSpec("LINSERT", LInsertCommand, 5),
+    CommandSpec("LMOVE", LMoveCommand, 5),
+    CommandSpec("BLPOP", BLPopCommand, -3),
+    CommandSpec("BRPOP", BRPopCommand, -3),
+    CommandSpec("BLMOVE", BLMoveCommand, 6),
+    CommandSpec("HSET", HSetCommand, -4),
+    CommandSpec("HGET", HGetCommand, 3),
+    CommandSpec("HMGET", HMGetCommand, -3),
+    CommandSpec("HGETALL", HGetAllCommand, 2),
+    CommandSpec("HDEL", HDelCommand, -3),
+    CommandSpec("HINCRBY", HIncrByCommand, 4),
+    CommandSpec("HLEN", HLenCommand, 2),
+    CommandSpec("HSCAN", HScanCommand, -3),
+    CommandSpec("SADD", SAddCommand, -3),
+    CommandSpec("SREM", SRemCommand, -3),
+    CommandSpec("SISMEMBER", SIsMemberCommand, 3),
+    CommandSpec("SMEMBERS", SMembersCommand, 2),
+    CommandSpec("SCARD", SCardCommand, 2),
+    CommandSpec("SINTER", SInterCommand, -2),
+    CommandSpec("SUNION", SUnionCommand, -2),
+    CommandSpec("SDIFF", SDiffCommand, -2),
+    CommandSpec("SINTERSTORE", SInterStoreCommand, -3),
+    CommandSpec("SUNIONSTORE", SUnionStoreCommand, -3),
+    CommandSpec("SDIFFSTORE", SDiffStoreCommand, -3),
+    CommandSpec("ZADD", ZAddCommand, -4),
+    CommandSpec("ZINCRBY", ZIncrByCommand, 4),
+    CommandSpec("ZRANGE", ZRangeCommand, -4),
+    CommandSpec("ZRANGEBYSCORE", ZRangeByScoreCommand, -4),
+    CommandSpec("ZRANK", ZRankCommand, -3),
+    CommandSpec("ZREM", ZRemCommand, -3),
+    CommandSpec("ZCARD", ZCardCommand, 2),
+    CommandSpec("ZPOPMIN", ZPopMinCommand, -2),
+    CommandSpec("SAVE", SaveCommand, 1),
+    CommandSpec("BGSAVE", BgSaveCommand, -1),
+    CommandSpec("LASTSAVE", LastSaveCommand, 1),
+    CommandSpec("BGREWRITEAOF", BgRewriteAofCommand, 1),
+    CommandSpec("EXPIRE", ExpireCommand, -3),
+    CommandSpec("PEXPIRE", PExpireCommand, -3),
+    CommandSpec("EXPIREAT", ExpireAtCommand, -3),
+    CommandSpec("PEXPIREAT", PExpireAtCommand, -3),
+    CommandSpec("TTL", TTLCommand, 2),
+    CommandSpec("PTTL", PTTLCommand, 2),
+    CommandSpec("PERSIST", PersistCommand, 2),
+    CommandSpec("CLUSTER", ClusterCommand, -2),
+    CommandSpec("OBJECT", ObjectCommand, -2),
+    CommandSpec("MEMORY", MemoryCommand, -2),
+    CommandSpec("INFO", InfoCommand, -1),
+    CommandSpec("LATENCY", LatencyCommand, -2),
+    CommandSpec("SLOWLOG", SlowlogCommand, -2),
+    CommandSpec("PUBLISH", PublishCommand, 3),
+    CommandSpec("PUBSUB", PubsubCommand, -2),
+)
+
+COMMAND_TABLE = {name: spec for spec in COMMAND_SPECS for name in spec.lookup_names()}
+
+
+def lookup_command(command: str | bytes) -> Optional[CommandSpec]:
+    """
+    Retrieves the entry of a command in the command table.
+
+    Names in upper or lower case, as text or bytes, are found with one dict lookup;
+    only names in mixed case are converted to upper case first.
+
+    Args:
+        command (str | bytes): The command name, as received from the client.
+
+    Returns:
+        Optional[CommandSpec]: The entry of the command, or None if it is unknown
+                               or not a name.
+    """
+    if type(command) not in (str, bytes):
+        return None
+    spec = COMMAND_TABLE.get(command)
+    if spec is None:
+        spec = COMMAND_TABLE.get(command.upper())
+    return spec
 
 
 def get_command_handler(command: str) -> RedisCommand:
@@ -73,7 +254,7 @@ def get_command_handler(command: str) -> RedisCommand:
         raise UnknownCommandException(
             "ERR Unsupported command `None` or invalid input")
 
-    command_cls = COMMAND_MAP.get(command.upper())
-    if not command_cls:
+    spec = COMMAND_TABLE.get(command.upper())
+    if not spec:
         raise UnknownCommandException(f"ERR Unsupported command `{command}`")
-    return command_cls
+    return spec.command_class
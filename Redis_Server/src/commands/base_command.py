@@ -8,7 +8,7 @@ It provides:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Tuple
+from typing import Any, List, Dict, Optional, Tuple
 
 from src.exceptions.redis_exceptions import InvalidCommandSyntaxError
 
@@ -26,50 +26,100 @@ class RedisCommand(ABC):
         - REQUIRED_ATTRIBUTES: Tuple of required argument names.
         - POSSIBLE_OPTIONS: Tuple of valid options for the command.
         - `execute` method: To implement command-specific behavior.
+
+    Commands that modify the database set IS_WRITE_COMMAND, so that they are
+    propagated (e.g. appended to the append-only file) after a successful run.
+    Those that may also use more memory set DENY_OOM, so that keys are evicted
+    before they run once the memory limit is reached, and they are refused if
+    nothing can be evicted.
+
+    Blocking commands (e.g. BLPOP) set IS_BLOCKING and a `timeout` attribute, in
+    seconds (0 to wait forever). Their `execute` returns None when they would
+    block; the client is then blocked until a write to one of its keys lets the
+    command run again successfully, or until the timeout expires.
+
+    KEY_SPEC tells which arguments are keys, like the key specs of the Redis command
+    table: the index of the first key, of the last key (negative values count from
+    the end) and the step between keys. The default is a single key as the first
+    argument; commands without keys set it to None.
+
+    A command object is created for every command a client sends, so commands use
+    `__slots__`: subclasses declare the attributes they set, or an empty tuple.
+    Arguments are parsed once, when the command is created. Required arguments
+    are not copied: `get` finds them in the argument list by their position,
+    computed once per class, and only the options given, if any, are kept in a
+    dict.
     """
 
-    REQUIRED_ATTRIBUTES: Tuple[str, ...]
-    POSSIBLE_OPTIONS: Tuple[str, ...]
+    __slots__ = ("_arguments", "_options")
+
+    REQUIRED_ATTRIBUTES: Tuple[str, ...] = ()
+    POSSIBLE_OPTIONS: Tuple[str, ...] = ()
+    IS_WRITE_COMMAND: bool = False
+    DENY_OOM: bool = False
+    IS_BLOCKING: bool = False
+    KEY_SPEC: Optional[Tuple[int, int, int]] = (0, 0, 1)
+
+    # The position of each required argument, by name; set for each subclass.
+    _ATTRIBUTE_POSITIONS: Dict[str, int] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Computes the position of each required argument of a command class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._ATTRIBUTE_POSITIONS = {
+            name: position for position, name in enumerate(cls.REQUIRED_ATTRIBUTES)}
 
     def __init__(self, arguments: List[str]):
         """
-        Initializes the RedisCommand with raw arguments.
+        Initializes the RedisCommand with raw arguments and parses them.
 
         Args:
             arguments (List[str]): List of arguments passed to the command.
         """
         self._arguments: List[str] = arguments
-        self._attributes: Dict[str, Any] = {}
+        self._options: Optional[Dict[str, str]] = None
         self._parse_arguments()
 
+    @classmethod
+    def uses_default_parser(cls) -> bool:
+        """
+        Tells whether the command is parsed by `_parse_arguments` of this class,
+        so that a request without options needs no parsing beyond its length.
+
+        Returns:
+            bool: Whether neither `__init__` nor `_parse_arguments` is overridden.
+        """
+        return (cls.__init__ is RedisCommand.__init__
+                and cls._parse_arguments is RedisCommand._parse_arguments)
+
     def _parse_arguments(self) -> None:
         """
-        Parses the arguments and options.
+        Checks the number of arguments and collects the options in a single pass.
 
         Raises:
             InvalidCommandSyntaxError: If the number of arguments or options are invalid.
         """
         arguments = self._arguments
+        count = len(self.REQUIRED_ATTRIBUTES)
 
-        if len(arguments) < len(self.REQUIRED_ATTRIBUTES):
+        if len(arguments) < count:
             raise InvalidCommandSyntaxError(
                 "ERR wrong number of arguments for command")
 
-        
-        idx = 0
-        for key in self.REQUIRED_ATTRIBUTES:
-            self._attributes[key] = arguments[idx]
-            idx += 1
-
-        if (len(arguments) - idx) % 2 != 0:
-            raise InvalidCommandSyntaxError("ERR syntax error")
-
-        for i in range(idx, len(arguments), 2):
-            option = arguments[i]
-            if option not in self.POSSIBLE_OPTIONS:
-                raise InvalidCommandSyntaxError(
-                    f"ERR invalid option: {option}")
-            self._attributes[option] = arguments[i + 1]
+        if len(arguments) > count:
+            if (len(arguments) - count) % 2 != 0:
+                raise InvalidCommandSyntaxError("ERR syntax error")
+            possible_options = self.POSSIBLE_OPTIONS
+            options = {}
+            for i in range(count, len(arguments), 2):
+                option = arguments[i]
+                if option not in possible_options:
+                    raise InvalidCommandSyntaxError(
+                        f"ERR invalid option: {option}")
+                options[option] = arguments[i + 1]
+            self._options = options
 
     def get(self, key: str) -> Any:
         """
@@ -81,7 +131,46 @@ class RedisCommand(ABC):
         Returns:
             Any: The value associated with the key, or None if the key does not exist.
         """
-        return self._attributes.get(key)
+        position = self._ATTRIBUTE_POSITIONS.get(key)
+        if position is not None and position < len(self._arguments):
+            return self._arguments[position]
+        options = self._options
+        return None if options is None else options.get(key)
+
+    def get_arguments(self) -> List[str]:
+        """
+        Returns the arguments of the command, without the command name.
+
+        Returns:
+            List[str]: The arguments, as given.
+        """
+        return self._arguments
+
+    def get_keys(self) -> List[str]:
+        """
+        Returns the keys the command operates on, as described by KEY_SPEC.
+
+        Returns:
+            List[str]: The key arguments, in the order they were given.
+        """
+        key_spec = self.KEY_SPEC
+        if key_spec is None:
+            return []
+        if key_spec == (0, 0, 1):
+            return self._arguments[:1]
+        first, last, step = key_spec
+        if last < 0:
+            last += len(self._arguments)
+        return self._arguments[first:last + 1:step]
+
+    def get_blocking_keys(self) -> List[str]:
+        """
+        Returns the keys a blocking command waits for when it blocks.
+
+        Returns:
+            List[str]: The keys; by default, every key of the command.
+        """
+        return self.get_keys()
 
     @abstractmethod
     def execute(self) -> str:
@@ -94,3 +183,16 @@ class RedisCommand(ABC):
             str: The result of executing the command.
         """
         pass
+
+    def get_propagated_command(self) -> Optional[List[str]]:
+        """
+        Returns the command to propagate in place of the one received.
+
+        Commands whose effect depends on when they run (e.g. relative expiry times)
+        override this to propagate an equivalent command that replays identically.
+
+        Returns:
+            Optional[List[str]]: The command to propagate, or None to propagate the
+                                 received command unchanged.
+        """
+        return None
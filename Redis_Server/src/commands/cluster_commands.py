@@ -0,0 +1,69 @@
+"""
+This module implements the CLUSTER command for the multi-process server mode:
+- CLUSTER KEYSLOT: Return the hash slot of a key.
+- CLUSTER SLOTS: Return the slot ranges owned by each worker and their addresses.
+
+Cluster-aware clients use these to send every command straight to the worker
+owning its keys (see `src.handlers.worker_router`).
+"""
+
+from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.handlers.worker_router import WORKER_ROUTER
+from src.utils.cluster_utils import key_hash_slot
+
+
+class ClusterCommand(RedisCommand):
+    """
+    Implements the CLUSTER command with its KEYSLOT and SLOTS subcommands.
+    """
+
+    __slots__ = ("subcommand",)
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the subcommand and its number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the subcommand is unknown or has the
+                                       wrong number of arguments.
+        """
+        arity = {"KEYSLOT": 2, "SLOTS": 1}
+        if not self._arguments:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for 'cluster' command")
+        subcommand = self._arguments[0].upper()
+        if subcommand not in arity:
+            raise InvalidCommandSyntaxError(
+                f"ERR unknown subcommand '{self._arguments[0]}'")
+        if len(self._arguments) != arity[subcommand]:
+            raise InvalidCommandSyntaxError(
+                f"ERR wrong number of arguments for 'cluster|{subcommand.lower()}' command")
+        self.subcommand = subcommand
+
+    def execute(self) -> int | list:
+        """
+        Executes the CLUSTER subcommand.
+
+        Returns:
+            int | list: The slot of the key (KEYSLOT), or the slot ranges of the
+                        workers (SLOTS).
+
+        Raises:
+            CommandProcessingException: If SLOTS is used while the server does not
+                                        run in worker mode.
+        """
+        if self.subcommand == "KEYSLOT":
+            return key_hash_slot(self._arguments[1])
+
+        if not WORKER_ROUTER.enabled:
+            raise CommandProcessingException(
+                "ERR This instance has cluster support disabled")
+        return WORKER_ROUTER.slots()
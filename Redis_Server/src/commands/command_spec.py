@@ -0,0 +1,130 @@
+"""
+This module defines `CommandSpec`, the entry of a command in the command table.
+
+Like the Redis command table, each entry declares once what the request handler
+needs to know about a command before running it:
+
+- The arity, counting the command name: a positive arity is the exact number of
+  items of the request, a negative one the minimum. Requests with a wrong number
+  of arguments are rejected before a command object is created.
+- The key specification and the flags (write, deny-oom, blocking), taken from the
+  command class so they are not declared twice.
+- The statistics of the command reported by INFO and LATENCY (see
+  `src.handlers.server_stats`).
+- The handler creating the command object from a request, `parse`, chosen once
+  per command: commands with a fixed number of arguments and no options skip
+  `__init__` and argument parsing altogether, as their arguments were counted
+  by the arity check.
+
+The table is looked up with the command name as received, bytes or text, in upper
+or lower case, so the common cases need neither decoding nor `.upper()`.
+
+Exports:
+    - CommandSpec: The entry of a command in the command table.
+"""
+
+from typing import Callable, Iterable, Optional, Tuple, Type
+
+from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import InvalidCommandSyntaxError
+from src.handlers.server_stats import SERVER_STATS, CommandStat
+
+
+class CommandSpec:
+    """
+    The entry of a command in the command table.
+
+    Attributes:
+        name (str): The command name, in upper case.
+        command_class (Type[RedisCommand]): The class implementing the command.
+        arity (int): The exact (positive) or minimum (negative) number of items of
+                     a request, the command name included.
+        key_spec (Optional[Tuple[int, int, int]]): The KEY_SPEC of the command class.
+        is_write (bool): Whether the command modifies the database.
+        deny_oom (bool): Whether the command may use more memory.
+        is_blocking (bool): Whether the command may block the client.
+        stats (CommandStat): The statistics of the command.
+        parse (Callable[[list[str]], RedisCommand]): Checks the number of
+            arguments of a request and creates the command object.
+    """
+
+    __slots__ = ("name", "command_class", "arity", "key_spec", "is_write", "deny_oom",
+                 "is_blocking", "stats", "parse")
+
+    def __init__(self, name: str, command_class: Type[RedisCommand], arity: int):
+        """
+        Initializes the entry of a command.
+
+        Args:
+            name (str): The command name.
+            command_class (Type[RedisCommand]): The class implementing the command.
+            arity (int): The exact (positive) or minimum (negative) number of items
+                         of a request, the command name included.
+        """
+        self.name = name.upper()
+        self.command_class = command_class
+        self.arity = arity
+        self.key_spec: Optional[Tuple[int, int, int]] = command_class.KEY_SPEC
+        self.is_write = command_class.IS_WRITE_COMMAND
+        self.deny_oom = command_class.DENY_OOM
+        self.is_blocking = command_class.IS_BLOCKING
+        self.stats: CommandStat = SERVER_STATS.register(self.name, command_class)
+        self.parse: Callable[[list[str]], RedisCommand] = (
+            self._create_unparsed
+            if command_class.uses_default_parser()
+            and arity == len(command_class.REQUIRED_ATTRIBUTES) + 1
+            else self._create)
+
+    def _create(self, arguments: list[str]) -> RedisCommand:
+        """
+        Checks the number of arguments and creates the command object, which parses
+        them.
+
+        Args:
+            arguments (list[str]): The arguments, without the command name.
+
+        Returns:
+            RedisCommand: The parsed command.
+
+        Raises:
+            InvalidCommandSyntaxError: If the number of arguments does not match the
+                                       arity, or the arguments are invalid.
+        """
+        arity = self.arity
+        count = len(arguments) + 1
+        if count != arity and (arity > 0 or count < -arity):
+            raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+        return self.command_class(arguments)
+
+    def _create_unparsed(self, arguments: list[str]) -> RedisCommand:
+        """
+        Checks the number of arguments and creates the command object of a command
+        whose arguments are exactly its REQUIRED_ATTRIBUTES, leaving nothing to parse.
+
+        Args:
+            arguments (list[str]): The arguments, without the command name.
+
+        Returns:
+            RedisCommand: The command.
+
+        Raises:
+            InvalidCommandSyntaxError: If the number of arguments does not match the
+                                       arity.
+        """
+        if len(arguments) + 1 != self.arity:
+            raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+        command = object.__new__(self.command_class)
+        command._arguments = arguments
+        command._options = None
+        return command
+
+    def lookup_names(self) -> Iterable:
+        """
+        Returns the names the command is looked up with: the name in upper and
+        lower case, as text and as bytes.
+
+        Returns:
+            Iterable: The names.
+        """
+        upper, lower = self.name, self.name.lower()
+        return (upper, lower, upper.encode(), lower.encode())
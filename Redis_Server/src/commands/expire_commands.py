@@ -0,0 +1,162 @@
+"""
+This module implements the key expiration commands for the Redis server:
+- EXPIRE / PEXPIRE: Set a key's time to live in seconds / milliseconds.
+- EXPIREAT / PEXPIREAT: Set a key's expiry as a UNIX timestamp in seconds / milliseconds.
+- TTL / PTTL: Get a key's remaining time to live in seconds / milliseconds.
+- PERSIST: Remove a key's expiry time.
+
+Expiry times are kept in the expiry index of `REDIS_DB`, which also drives the
+active expire cycle.
+"""
+
+from src.commands.base_command import RedisCommand
+from src.redisDB.redis_db import REDIS_DB
+from src.utils.data_utils import parse_integer
+from src.utils.time_utils import get_current_time_in_ms
+
+
+class ExpireCommand(RedisCommand):
+    """
+    Implements the EXPIRE command.
+
+    EXPIRE sets a timeout in seconds on a key. A timeout in the past deletes the key.
+    Subclasses change the unit and whether the time is relative or absolute.
+    """
+
+    __slots__ = ("_propagated_command",)
+
+    REQUIRED_ATTRIBUTES = ["key", "time"]
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    UNIT_IN_MS = 1000
+    IS_ABSOLUTE = False
+
+    def execute(self) -> int:
+        """
+        Executes the EXPIRE command.
+
+        Returns:
+            int: 1 if the timeout was set, 0 if the key does not exist.
+        """
+        key = self.get("key")
+        now = get_current_time_in_ms()
+
+        expire = parse_integer(self.get("time")) * self.UNIT_IN_MS
+        if not self.IS_ABSOLUTE:
+            expire += now
+
+        self._propagated_command = None
+        if key not in REDIS_DB:
+            return 0
+
+        if expire <= now:
+            REDIS_DB.delete(key)
+            self._propagated_command = ["DEL", key]
+        else:
+            REDIS_DB.set_expire(key, expire)
+            self._propagated_command = ["PEXPIREAT", key, str(expire)]
+        return 1
+
+    def get_propagated_command(self) -> list[str] | None:
+        """
+        Propagates every variant as PEXPIREAT with the absolute expiry time, or as
+        DEL if the key was deleted, so replaying it later has the same effect.
+
+        Returns:
+            list[str] | None: The equivalent command, or None if the key did not
+                              exist (the received command is a no-op on replay too).
+        """
+        return self._propagated_command
+
+
+class PExpireCommand(ExpireCommand):
+    """Implementation of PEXPIRE command (timeout in milliseconds)."""
+
+    __slots__ = ()
+
+    UNIT_IN_MS = 1
+
+
+class ExpireAtCommand(ExpireCommand):
+    """Implementation of EXPIREAT command (UNIX timestamp in seconds)."""
+
+    __slots__ = ()
+
+    IS_ABSOLUTE = True
+
+
+class PExpireAtCommand(ExpireCommand):
+    """Implementation of PEXPIREAT command (UNIX timestamp in milliseconds)."""
+
+    __slots__ = ()
+
+    UNIT_IN_MS = 1
+    IS_ABSOLUTE = True
+
+
+class TTLCommand(RedisCommand):
+    """
+    Implements the TTL command.
+
+    TTL returns the remaining time to live of a key, in seconds.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ["key"]
+    POSSIBLE_OPTIONS = ()
+
+    UNIT_IN_MS = 1000
+
+    def execute(self) -> int:
+        """
+        Executes the TTL command.
+
+        Returns:
+            int: The remaining time to live, -1 if the key has no expiry time,
+                 or -2 if the key does not exist.
+        """
+        key = self.get("key")
+
+        if key not in REDIS_DB:
+            return -2
+
+        expire = REDIS_DB.get_expire(key)
+        if expire is None:
+            return -1
+
+        remaining = max(0, expire - get_current_time_in_ms())
+        return (remaining + self.UNIT_IN_MS // 2) // self.UNIT_IN_MS
+
+
+class PTTLCommand(TTLCommand):
+    """Implementation of PTTL command (remaining time in milliseconds)."""
+
+    __slots__ = ()
+
+    UNIT_IN_MS = 1
+
+
+class PersistCommand(RedisCommand):
+    """
+    Implements the PERSIST command.
+
+    PERSIST removes the expiry time of a key, making it persistent.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ["key"]
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    def execute(self) -> int:
+        """
+        Executes the PERSIST command.
+
+        Returns:
+            int: 1 if the expiry time was removed, 0 if the key does not exist
+                 or has no expiry time.
+        """
+        return int(REDIS_DB.persist(self.get("key")))
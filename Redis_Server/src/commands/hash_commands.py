@@ -0,0 +1,353 @@
+"""
+This module implements Redis hash-specific commands:
+- HSet: Set fields of a hash.
+- HGet: Return the value of a field.
+- HMGet: Return the values of several fields.
+- HGetAll: Return every field and value.
+- HDel: Remove fields.
+- HIncrBy: Increment the integer value of a field.
+- HLen: Return the number of fields.
+- HScan: Iterate over the fields incrementally with a cursor.
+
+Hashes are stored as a `ListPackHash` when small and as a `dict` when big (see
+`src.redisDB.encodings`); both support the same mapping operations, so commands
+do not depend on the encoding. Like in Redis, a hash is deleted once its last
+field is removed.
+"""
+
+from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.encodings import INT64_MAX, INT64_MIN, create_hash, set_hash_field
+from src.redisDB.listpack import ListPackHash
+from src.redisDB.redis_db import REDIS_DB
+from src.utils.data_utils import get_hash, parse_integer
+from src.utils.scan_utils import DEFAULT_SCAN_COUNT, SCAN_CURSORS, compile_glob, parse_cursor
+
+
+class HSetCommand(RedisCommand):
+    """
+    Implements the Redis HSET command.
+
+    HSET key field value [field value ...] sets fields of a hash, creating it if
+    the key does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates that fields and values come in pairs.
+
+        Raises:
+            InvalidCommandSyntaxError: If a field has no value.
+        """
+        if len(self._arguments) < 3 or len(self._arguments) % 2 == 0:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> int:
+        """
+        Executes the HSET command.
+
+        Returns:
+            int: The number of fields that were added, not counting updated ones.
+        """
+        key, *pairs = self._arguments
+        value = get_hash(REDIS_DB.get(key))
+        if value is None:
+            value = create_hash()
+        added = 0
+        for index in range(0, len(pairs), 2):
+            field = pairs[index]
+            if field not in value:
+                added += 1
+            value = set_hash_field(value, field, pairs[index + 1])
+        REDIS_DB.set(key, value, keep_ttl=True)
+        return added
+
+
+class HGetCommand(RedisCommand):
+    """
+    Implements the Redis HGET command.
+
+    HGET returns the value of a field of a hash.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "field")
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> str | None:
+        """
+        Executes the HGET command.
+
+        Returns:
+            str | None: The value, or None if the field or the key does not exist.
+        """
+        value = get_hash(REDIS_DB.get(self.get("key")))
+        if value is None:
+            return None
+        return value.get(self.get("field"))
+
+
+class HMGetCommand(RedisCommand):
+    """
+    Implements the Redis HMGET command.
+
+    HMGET key field [field ...] returns the values of several fields of a hash.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If no field is given.
+        """
+        if len(self._arguments) < 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> list[str | None]:
+        """
+        Executes the HMGET command.
+
+        Returns:
+            list[str | None]: The value of each field, None for missing ones.
+        """
+        key, *fields = self._arguments
+        value = get_hash(REDIS_DB.get(key))
+        if value is None:
+            return [None] * len(fields)
+        return [value.get(field) for field in fields]
+
+
+class HGetAllCommand(RedisCommand):
+    """
+    Implements the Redis HGETALL command.
+
+    HGETALL returns every field of a hash followed by its value.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> list[str]:
+        """
+        Executes the HGETALL command.
+
+        Returns:
+            list[str]: The fields and values, interleaved; empty if the key does
+                       not exist.
+        """
+        value = get_hash(REDIS_DB.get(self.get("key")))
+        if value is None:
+            return []
+        return [item for pair in value.items() for item in pair]
+
+
+class HDelCommand(RedisCommand):
+    """
+    Implements the Redis HDEL command.
+
+    HDEL key field [field ...] removes fields of a hash.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If no field is given.
+        """
+        if len(self._arguments) < 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> int:
+        """
+        Executes the HDEL command.
+
+        Returns:
+            int: The number of fields that were removed.
+        """
+        key, *fields = self._arguments
+        value = get_hash(REDIS_DB.get(key))
+        if value is None:
+            return 0
+        removed = sum(value.pop(field, None) is not None for field in fields)
+        if not value:
+            REDIS_DB.delete(key)
+        elif removed:
+            REDIS_DB.set(key, value, keep_ttl=True)
+        return removed
+
+
+class HIncrByCommand(RedisCommand):
+    """
+    Implements the Redis HINCRBY command.
+
+    HINCRBY key field increment adds an integer to the value of a field, which
+    is set to 0 first if it does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "field", "increment")
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def execute(self) -> int:
+        """
+        Executes the HINCRBY command.
+
+        Returns:
+            int: The value of the field after the increment.
+
+        Raises:
+            CommandProcessingException: If the value of the field is not an
+                                        integer or the result would overflow.
+        """
+        key, field = self.get("key"), self.get("field")
+        increment = parse_integer(self.get("increment"))
+        value = get_hash(REDIS_DB.get(key))
+        if value is None:
+            value = create_hash()
+        current = value.get(field, "0")
+        try:
+            number = int(current)
+        except ValueError:
+            raise CommandProcessingException(
+                "ERR hash value is not an integer") from None
+        number += increment
+        if not INT64_MIN <= number <= INT64_MAX:
+            raise CommandProcessingException(
+                "ERR increment or decrement would overflow")
+        REDIS_DB.set(key, set_hash_field(value, field, str(number)), keep_ttl=True)
+        return number
+
+
+class HLenCommand(RedisCommand):
+    """
+    Implements the Redis HLEN command.
+
+    HLEN returns the number of fields of a hash, 0 if the key does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> int:
+        """
+        Executes the HLEN command.
+
+        Returns:
+            int: The number of fields.
+        """
+        value = get_hash(REDIS_DB.get(self.get("key")))
+        return len(value) if value is not None else 0
+
+
+class HScanCommand(RedisCommand):
+    """
+    Implements the Redis HSCAN command.
+
+    HSCAN key cursor [MATCH pattern] [COUNT count] [NOVALUES] returns some of the
+    fields of a hash and the cursor to pass to the next call, 0 once every field
+    was returned. Like in Redis, a listpack-encoded hash is returned whole; big
+    hashes are walked through a snapshot of their fields (see
+    `src.utils.scan_utils`), so each call costs O(COUNT).
+    """
+
+    __slots__ = ("cursor", "pattern", "count", "novalues")
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+
+    def _parse_arguments(self) -> None:
+        """
+        Parses the cursor and the options.
+
+        Raises:
+            InvalidCommandSyntaxError: If the arguments are missing or invalid.
+            CommandProcessingException: If the cursor or the count is invalid.
+        """
+        arguments = self._arguments
+        if len(arguments) < 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        self.cursor = parse_cursor(arguments[1])
+        self.pattern = None
+        self.count = DEFAULT_SCAN_COUNT
+        self.novalues = False
+        index = 2
+        while index < len(arguments):
+            option = arguments[index].upper()
+            if option == "NOVALUES":
+                self.novalues = True
+                index += 1
+                continue
+            if option not in ("MATCH", "COUNT") or index + 1 == len(arguments):
+                raise InvalidCommandSyntaxError("ERR syntax error")
+            if option == "MATCH":
+                self.pattern = arguments[index + 1]
+            else:
+                self.count = parse_integer(arguments[index + 1])
+                if self.count < 1:
+                    raise InvalidCommandSyntaxError("ERR syntax error")
+            index += 2
+
+    def execute(self) -> list:
+        """
+        Executes the HSCAN command.
+
+        Returns:
+            list: The next cursor, as a string, and the fields returned by this
+                  call, each followed by its value unless NOVALUES was given.
+        """
+        key = self._arguments[0]
+        value = get_hash(REDIS_DB.get(key))
+        if value is None:
+            return ["0", []]
+
+        if type(value) is ListPackHash:
+            cursor, fields = 0, list(value)
+        else:
+            cursor, fields = SCAN_CURSORS.scan(
+                ("HSCAN", key), self.cursor, self.count, lambda: list(value))
+
+        match = compile_glob(self.pattern) if self.pattern not in (None, "*") else None
+        items = []
+        for field in fields:
+            field_value = value.get(field)
+            if field_value is None or (match is not None and not match(field)):
+                continue
+            items.append(field)
+            if not self.novalues:
+                items.append(field_value)
+        return [str(cursor), items]
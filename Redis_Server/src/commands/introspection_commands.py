@@ -0,0 +1,421 @@
+"""
+This module implements commands inspecting how keys are stored and how the
+server is doing:
+- OBJECT ENCODING: Return the internal encoding of a value (e.g. int, listpack).
+- MEMORY USAGE: Estimate the bytes used by a key and its value.
+- MEMORY STATS: Report the memory used by the dataset, the memory limit and the
+  number of evicted keys.
+- INFO [section ...]: Report server, client, memory, persistence, keyspace and
+  per-command statistics.
+- LATENCY HISTOGRAM [command ...]: Report the latency distribution of commands.
+- SLOWLOG GET [count] / LEN / RESET: Read or clear the log of slow commands.
+
+Encodings and sizes are defined in `src.redisDB.encodings`, command statistics in
+`src.handlers.server_stats` and the slow log in `src.handlers.slow_log`.
+"""
+
+import os
+import time
+
+from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.handlers.blocked_clients import BLOCKED_CLIENTS
+from src.handlers.server_stats import SERVER_STATS
+from src.handlers.slow_log import SLOW_LOG
+from src.redisDB.append_only_file import APPEND_ONLY_FILE
+from src.redisDB.encodings import memory_usage, object_encoding
+from src.redisDB.redis_db import REDIS_DB
+from src.utils.data_utils import parse_integer
+
+# Elements of a big list measured by MEMORY USAGE when SAMPLES is not given.
+MEMORY_USAGE_DEFAULT_SAMPLES = 5
+
+# Sections reported by INFO without arguments; "all" adds the command statistics.
+INFO_DEFAULT_SECTIONS = ("server", "clients", "memory", "persistence", "stats",
+                         "keyspace")
+INFO_ALL_SECTIONS = INFO_DEFAULT_SECTIONS[:-1] + ("commandstats", "latencystats",
+                                                  "keyspace")
+
+# Percentiles reported by INFO latencystats.
+LATENCY_PERCENTILES = (50, 99, 99.9)
+
+# Entries returned by SLOWLOG GET when no count is given.
+SLOWLOG_GET_DEFAULT_COUNT = 10
+
+
+class ObjectCommand(RedisCommand):
+    """
+    Implements the OBJECT command with its ENCODING subcommand.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = (1, 1, 1)
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the subcommand and its number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the subcommand is unknown or has the
+                                       wrong number of arguments.
+        """
+        if not self._arguments:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for 'object' command")
+        if self._arguments[0].upper() != "ENCODING":
+            raise InvalidCommandSyntaxError(
+                f"ERR unknown subcommand '{self._arguments[0]}'")
+        if len(self._arguments) != 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for 'object|encoding' command")
+
+    def execute(self) -> str | None:
+        """
+        Executes the OBJECT ENCODING command.
+
+        Returns:
+            str | None: The encoding of the value, or None if the key does not exist.
+        """
+        value = REDIS_DB.get(self._arguments[1])
+        if value is None:
+            return None
+        return object_encoding(value)
+
+
+class MemoryCommand(RedisCommand):
+    """
+    Implements the MEMORY command with its USAGE and STATS subcommands.
+
+    MEMORY USAGE key [SAMPLES count] estimates the bytes used by a key, its value
+    and its hash table entry. For big lists only `count` elements are measured
+    (all of them with SAMPLES 0).
+
+    MEMORY STATS returns name/value pairs: the estimated bytes used by the dataset
+    (tracked only with a memory limit), the limit and eviction policy, and the
+    number of keys, evicted keys and expired keys.
+    """
+
+    __slots__ = ("samples",)
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = (1, 1, 1)
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the subcommand and parses the SAMPLES option.
+
+        Raises:
+            InvalidCommandSyntaxError: If the subcommand or an option is invalid.
+        """
+        if not self._arguments:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for 'memory' command")
+        subcommand = self._arguments[0].upper()
+        if subcommand == "STATS":
+            if len(self._arguments) != 1:
+                raise InvalidCommandSyntaxError(
+                    "ERR wrong number of arguments for 'memory|stats' command")
+            return
+        if subcommand != "USAGE":
+            raise InvalidCommandSyntaxError(
+                f"ERR unknown subcommand '{self._arguments[0]}'")
+        if len(self._arguments) not in (2, 4):
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for 'memory|usage' command")
+        samples = MEMORY_USAGE_DEFAULT_SAMPLES
+        if len(self._arguments) == 4:
+            if self._arguments[2].upper() != "SAMPLES":
+                raise InvalidCommandSyntaxError("ERR syntax error")
+            samples = self._arguments[3]
+        self.samples = samples
+
+    def execute(self) -> int | list | None:
+        """
+        Executes the MEMORY USAGE or MEMORY STATS command.
+
+        Returns:
+            int | list | None: The estimated bytes, or None if the key does not
+                               exist, for USAGE; the name/value pairs for STATS.
+
+        Raises:
+            CommandProcessingException: If the number of samples is not a
+                                        non-negative integer.
+        """
+        if len(self._arguments) == 1:
+            return [
+                "dataset.bytes", REDIS_DB.used_memory,
+                "maxmemory", REDIS_DB.maxmemory,
+                "maxmemory-policy", REDIS_DB.eviction_policy.NAME,
+                "keys.count", len(REDIS_DB),
+                "evicted_keys", REDIS_DB.evicted_keys,
+                "expired_keys", REDIS_DB.expired_keys,
+            ]
+        samples = parse_integer(self.samples)
+        if samples < 0:
+            raise CommandProcessingException("ERR value is out of range, must be positive")
+        key = self._arguments[1]
+        value = REDIS_DB.get(key)
+        if value is None:
+            return None
+        return memory_usage(key, value, samples)
+
+
+def _human_bytes(size: int) -> str:
+    """
+    Formats a number of bytes the way INFO reports it, e.g. '1.50M'.
+
+    Args:
+        size (int): The number of bytes.
+
+    Returns:
+        str: The formatted size.
+    """
+    if size < 1024:
+        return f"{size}B"
+    for unit in ("K", "M", "G"):
+        size /= 1024
+        if size < 1024 or unit == "G":
+            return f"{size:.2f}{unit}"
+
+
+class InfoCommand(RedisCommand):
+    """
+    Implements the INFO command.
+
+    INFO [section ...] returns "name:value" lines grouped in "# Section" blocks.
+    Without arguments the default sections are reported; "all" (or "everything")
+    adds the per-command statistics of the commandstats and latencystats sections.
+    Unknown sections are ignored. The used memory is only tracked while a memory
+    limit is set.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    KEY_SPEC = None
+
+    def _parse_arguments(self) -> None:
+        """
+        Nothing to parse: every argument is a section name.
+        """
+
+    def execute(self) -> str:
+        """
+        Executes the INFO command.
+
+        Returns:
+            str: The requested sections.
+        """
+        sections = []
+        for name in self._arguments or ("default",):
+            name = name.lower()
+            if name == "default":
+                sections.extend(INFO_DEFAULT_SECTIONS)
+            elif name in ("all", "everything"):
+                sections.extend(INFO_ALL_SECTIONS)
+            else:
+                sections.append(name)
+
+        blocks = []
+        for name in dict.fromkeys(sections):
+            section = getattr(self, f"_{name}", None)
+            if section is not None:
+                lines = [f"# {name.capitalize()}"]
+                lines.extend(f"{field}:{value}" for field, value in section())
+                blocks.append("\r\n".join(lines))
+        return "\r\n\r\n".join(blocks)
+
+    def _server(self) -> list:
+        """
+        The process, its uptime and the keyspace layout.
+        """
+        uptime = int(time.time() - SERVER_STATS.start_time)
+        return [
+            ("process_id", os.getpid()),
+            ("uptime_in_seconds", uptime),
+            ("uptime_in_days", uptime // 86400),
+            ("keyspace_shards", REDIS_DB.shards),
+            ("latency_tracking_sample", SERVER_STATS.latency_sample_rate),
+        ]
+
+    def _clients(self) -> list:
+        """
+        The connected and blocked clients.
+        """
+        return [
+            ("connected_clients", SERVER_STATS.connected_clients),
+            ("blocked_clients", BLOCKED_CLIENTS.blocked_count),
+        ]
+
+    def _memory(self) -> list:
+        """
+        The memory used by the dataset and its limit.
+        """
+        used_memory = REDIS_DB.used_memory
+        return [
+            ("used_memory", used_memory),
+            ("used_memory_human", _human_bytes(used_memory)),
+            ("maxmemory", REDIS_DB.maxmemory),
+            ("maxmemory_human", _human_bytes(REDIS_DB.maxmemory)),
+            ("maxmemory_policy", REDIS_DB.eviction_policy.NAME),
+        ]
+
+    def _persistence(self) -> list:
+        """
+        The changes since the last snapshot and the AOF state.
+        """
+        return [
+            ("rdb_changes_since_last_save", REDIS_DB.dirty),
+            ("rdb_last_save_time", REDIS_DB.last_save),
+            ("aof_enabled", int(APPEND_ONLY_FILE.enabled)),
+        ]
+
+    def _stats(self) -> list:
+        """
+        The connections, commands and keys removed since startup.
+        """
+        return [
+            ("total_connections_received", SERVER_STATS.total_connections_received),
+            ("total_commands_processed", SERVER_STATS.total_commands_processed),
+            ("expired_keys", REDIS_DB.expired_keys),
+            ("evicted_keys", REDIS_DB.evicted_keys),
+        ]
+
+    def _commandstats(self) -> list:
+        """
+        The calls, time and errors of every command that ran.
+        """
+        return [
+            (f"cmdstat_{stat.name.lower()}",
+             f"calls={stat.calls},usec={stat.nanoseconds // 1000},"
+             f"usec_per_call={stat.nanoseconds / 1000 / stat.calls if stat.calls else 0:.2f},"
+             f"rejected_calls={stat.rejected_calls},failed_calls={stat.failed_calls}")
+            for stat in SERVER_STATS.commands()
+        ]
+
+    def _latencystats(self) -> list:
+        """
+        The latency percentiles of every command that ran.
+        """
+        return [
+            (f"latency_percentiles_usec_{stat.name.lower()}",
+             ",".join(f"p{rank:g}={stat.histogram.percentile(rank):.3f}"
+                      for rank in LATENCY_PERCENTILES))
+            for stat in SERVER_STATS.commands() if stat.histogram.total
+        ]
+
+    def _keyspace(self) -> list:
+        """
+        The number of keys and of keys with an expiry time.
+        """
+        keys = len(REDIS_DB)
+        if not keys:
+            return []
+        return [("db0", f"keys={keys},expires={REDIS_DB.volatile_keys}")]
+
+
+class LatencyCommand(RedisCommand):
+    """
+    Implements the LATENCY command with its HISTOGRAM subcommand.
+
+    LATENCY HISTOGRAM [command ...] returns, for every given command that ran (all
+    of them without arguments), its number of calls and the number of sampled
+    calls that took less than 1, 2, 4, 8... microseconds:
+    [name, ["calls", calls, "histogram_usec", [1, count, 2, count, ...]], ...].
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    KEY_SPEC = None
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the subcommand.
+
+        Raises:
+            InvalidCommandSyntaxError: If the subcommand is unknown.
+        """
+        if self._arguments[0].upper() != "HISTOGRAM":
+            raise InvalidCommandSyntaxError(
+                f"ERR unknown subcommand '{self._arguments[0]}'")
+
+    def execute(self) -> list:
+        """
+        Executes the LATENCY HISTOGRAM command.
+
+        Returns:
+            list: The command names and their histograms.
+        """
+        if len(self._arguments) > 1:
+            stats = (SERVER_STATS.command(name) for name in self._arguments[1:])
+        else:
+            stats = SERVER_STATS.commands()
+        reply = []
+        for stat in dict.fromkeys(stats):
+            if stat is None or not stat.calls:
+                continue
+            histogram = [item for pair in stat.histogram.cumulative_counts()
+                         for item in pair]
+            reply.extend([stat.name.lower(),
+                          ["calls", stat.calls, "histogram_usec", histogram]])
+        return reply
+
+
+class SlowlogCommand(RedisCommand):
+    """
+    Implements the SLOWLOG command with its GET, LEN and RESET subcommands.
+
+    SLOWLOG GET [count] returns the newest `count` entries (10 by default, all of
+    them with a negative count), newest first, each as [id, timestamp, duration in
+    microseconds, [command, argument, ...], client address, client name].
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    KEY_SPEC = None
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the subcommand and its number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the subcommand is unknown or has the
+                                       wrong number of arguments.
+        """
+        subcommand = self._arguments[0].upper()
+        if subcommand not in ("GET", "LEN", "RESET"):
+            raise InvalidCommandSyntaxError(
+                f"ERR unknown subcommand '{self._arguments[0]}'")
+        if len(self._arguments) > (2 if subcommand == "GET" else 1):
+            raise InvalidCommandSyntaxError(
+                f"ERR wrong number of arguments for 'slowlog|{subcommand.lower()}' command")
+
+    def execute(self) -> list | int | str:
+        """
+        Executes the SLOWLOG command.
+
+        Returns:
+            list | int | str: The entries for GET, their number for LEN, OK for RESET.
+
+        Raises:
+            CommandProcessingException: If the count is not an integer.
+        """
+        subcommand = self._arguments[0].upper()
+        if subcommand == "LEN":
+            return len(SLOW_LOG)
+        if subcommand == "RESET":
+            SLOW_LOG.reset()
+            return "OK"
+        count = SLOWLOG_GET_DEFAULT_COUNT
+        if len(self._arguments) == 2:
+            count = parse_integer(self._arguments[1])
+        return [entry.to_reply() for entry in SLOW_LOG.get(count)]
@@ -2,6 +2,12 @@
 This module implements key-value commands for the Redis server:
 - GET: Retrieve the value of a key.
 - SET: Set a key to hold a value, with optional expiration.
+- MGET / MSET / MSETNX: Retrieve or set many keys in one command.
+- GETSET / GETDEL / GETEX: Retrieve the value of a key and replace it, delete it
+  or change its expiration.
+- SETNX: Set a key only if it does not exist.
+- APPEND: Append to the value of a key.
+- STRLEN: Return the length of the value of a key.
 - DELETE: Delete one or more keys.
 - EXISTS: Check the existence of one or more keys.
 - INCR: Increment the integer value of a key.
@@ -9,13 +15,24 @@ This module implements key-value commands for the Redis server:
 - DECR: Decrement the integer value of a key.
 - DECRBY: Decrement the integer value of a key by a specific amount.
 
-Utility functions handle expiration checks and increment operations.
+Expired keys are never returned by `REDIS_DB`, and utility functions handle
+increment operations. Values holding an integer are stored with the compact
+integer encoding (see `src.redisDB.encodings`).
+
+Multi-key commands read or write all their keys while the request handler holds
+the lock of each of their shards once, so MSET and MSETNX are atomic and MGET
+returns a consistent view in a single reply.
 """
 
 from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.encodings import encode_string
 from src.redisDB.redis_db import REDIS_DB
-from src.utils.data_utils import increment_value
-from src.utils.time_utils import get_current_time_in_ms, has_expired
+from src.utils.data_utils import get_string, increment_value, parse_integer, string_length
+from src.utils.time_utils import get_current_time_in_ms
 
 
 class GetCommand(RedisCommand):
@@ -23,8 +40,12 @@ class GetCommand(RedisCommand):
     Implements the GET command.
 
     GET retrieves the value of a key. If the key does not exist or has expired, it returns None.
+    Integer-encoded values are returned as the string they were set from, and keys
+    holding another type are rejected with a WRONGTYPE error.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ["key"]
 
     def execute(self) -> str | None:
@@ -33,17 +54,11 @@ class GetCommand(RedisCommand):
 
         Returns:
             str | None: The value of the key, or None if the key does not exist.
-        """
-        self._parse_arguments()
-        key = self.get("key")
 
-        value, expires = REDIS_DB.get(key, [None, None])
-
-        if has_expired(expires):
-            REDIS_DB.delete(key)
-            return None
-
-        return value
+        Raises:
+            CommandProcessingException: If the key holds another type.
+        """
+        return get_string(REDIS_DB.get(self._arguments[0]))
 
 
 class SetCommand(RedisCommand):
@@ -53,8 +68,12 @@ class SetCommand(RedisCommand):
     SET sets a key to hold a value and allows optional expiration times.
     """
 
+    __slots__ = ("_expire",)
+
     REQUIRED_ATTRIBUTES = ["key", "value"]
     POSSIBLE_OPTIONS = ["EX", "PX", "EXAT", "PXAT"]
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
 
     def execute(self) -> str:
         """
@@ -63,21 +82,30 @@ class SetCommand(RedisCommand):
         Returns:
             str: "OK" to confirm the operation.
         """
-        self._parse_arguments()
-
-        expire_attrs = {key.lower(): self.get(key)
-                        for key in self.POSSIBLE_OPTIONS}
-
-        key, value = self.get("key"), self.get("value")
+        key, value = self._arguments[0], self._arguments[1]
 
         expire = None
-        if any(expire_attrs.values()):
-            expire = self._calculate_expire(**expire_attrs)
+        if self._options is not None:
+            expire = self._calculate_expire(
+                **{option.lower(): value for option, value in self._options.items()})
+        self._expire = expire
 
-        REDIS_DB.set(key, (str(value), expire))
+        REDIS_DB.set(key, encode_string(str(value)), expire=expire)
 
         return "OK"
 
+    def get_propagated_command(self) -> list[str] | None:
+        """
+        Propagates relative expiry times (EX/PX) as an absolute PXAT timestamp.
+
+        Returns:
+            list[str] | None: The SET command with an absolute expiry time, or None
+                              if the key was set without one.
+        """
+        if self._expire is None:
+            return None
+        return ["SET", self.get("key"), str(self.get("value")), "PXAT", str(self._expire)]
+
     def _calculate_expire(
         self,
         ex: int | None = None,
@@ -115,8 +143,12 @@ class DeleteCommand(RedisCommand):
     DELETE removes one or more keys.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ()
     POSSIBLE_OPTIONS = ()
+    KEY_SPEC = (0, -1, 1)
+    IS_WRITE_COMMAND = True
 
     def _parse_arguments(self) -> None:
         """
@@ -146,8 +178,11 @@ class ExistsCommand(RedisCommand):
     EXISTS checks the existence of one or more keys.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ()
     POSSIBLE_OPTIONS = ()
+    KEY_SPEC = (0, -1, 1)
 
     def _parse_arguments(self) -> None:
         """
@@ -162,16 +197,7 @@ class ExistsCommand(RedisCommand):
         Returns:
             int: The number of keys that exist.
         """
-        count = 0
-        for key in self._arguments:
-            if key not in REDIS_DB:
-                continue
-            _, expires = REDIS_DB.get(key)
-            if has_expired(expires):
-                REDIS_DB.delete(key)
-            else:
-                count += 1
-        return count
+        return sum(1 for key in self._arguments if key in REDIS_DB)
 
 
 class IncrCommand(RedisCommand):
@@ -181,7 +207,11 @@ class IncrCommand(RedisCommand):
     INCR increments the integer value of a key by 1.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ["key"]
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
 
     def execute(self) -> int:
         """
@@ -190,11 +220,10 @@ class IncrCommand(RedisCommand):
         Returns:
             int: The incremented value.
         """
-        self._parse_arguments()
-        key = self.get("key")
+        key = self._arguments[0]
 
-        new_value = increment_value(REDIS_DB.get(key, [None, None])[0], 1)
-        REDIS_DB.set(key, (new_value, None))
+        new_value = increment_value(REDIS_DB.get(key), 1)
+        REDIS_DB.set(key, new_value, keep_ttl=True)
         return new_value
 
 
@@ -205,7 +234,11 @@ class DecrCommand(RedisCommand):
     DECR decrements the integer value of a key by 1.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ["key"]
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
 
     def execute(self) -> int:
         """
@@ -214,35 +247,389 @@ class DecrCommand(RedisCommand):
         Returns:
             int: The decremented value.
         """
-        self._parse_arguments()
-        key = self.get("key")
+        key = self._arguments[0]
 
-        new_value = increment_value(REDIS_DB.get(key, [None, None])[0], -1)
-        REDIS_DB.set(key, (new_value, None))
+        new_value = increment_value(REDIS_DB.get(key), -1)
+        REDIS_DB.set(key, new_value, keep_ttl=True)
         return new_value
 
 
 class IncrByCommand(RedisCommand):
     """Implementation of INCRBY command."""
+
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ["key", "increment"]
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
 
     def execute(self) -> int:
-        self._parse_arguments()
-        key, increment = self.get("key"), int(self.get("increment"))
-        new_value = increment_value(
-            REDIS_DB.get(key, [None, None])[0], increment)
-        REDIS_DB.set(key, (new_value, None))
+        key, increment = self._arguments[0], int(self._arguments[1])
+        new_value = increment_value(REDIS_DB.get(key), increment)
+        REDIS_DB.set(key, new_value, keep_ttl=True)
         return new_value
 
 
 class DecrByCommand(RedisCommand):
     """Implementation of DECRBY command."""
+
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ["key", "decrement"]
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
 
     def execute(self) -> int:
-        self._parse_arguments()
-        key, decrement = self.get("key"), int(self.get("decrement"))
-        new_value = increment_value(
-            REDIS_DB.get(key, [None, None])[0], -decrement)
-        REDIS_DB.set(key, (new_value, None))
+        key, decrement = self._arguments[0], int(self._arguments[1])
+        new_value = increment_value(REDIS_DB.get(key), -decrement)
+        REDIS_DB.set(key, new_value, keep_ttl=True)
         return new_value
+
+
+def _absolute_expire_time(option: str, value: str, command: str) -> int:
+    """
+    Converts an EX, PX, EXAT or PXAT option to an absolute expiry time.
+
+    Args:
+        option (str): The option name.
+        value (str): The option value.
+        command (str): The command name, for the error message.
+
+    Returns:
+        int: Expiration time in milliseconds.
+
+    Raises:
+        CommandProcessingException: If the value is not a positive integer.
+    """
+    amount = parse_integer(value)
+    if amount <= 0:
+        raise CommandProcessingException(f"ERR invalid expire time in '{command}' command")
+    if option == "EX":
+        return get_current_time_in_ms() + amount * 1000
+    if option == "PX":
+        return get_current_time_in_ms() + amount
+    if option == "EXAT":
+        return amount * 1000
+    return amount
+
+
+class MGetCommand(RedisCommand):
+    """
+    Implements the MGET command.
+
+    MGET key [key ...] returns the values of all the keys, with None for keys that
+    do not exist or do not hold a string.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = (0, -1, 1)
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If no key is given.
+        """
+        if not self._arguments:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> list[str | None]:
+        """
+        Executes the MGET command.
+
+        Returns:
+            list[str | None]: The value of each key, in the order given.
+        """
+        values = []
+        for key in self._arguments:
+            value = REDIS_DB.get(key)
+            value_type = type(value)
+            if value_type is int:
+                value = str(value)
+            elif value_type is not str:
+                value = None
+            values.append(value)
+        return values
+
+
+class MSetCommand(RedisCommand):
+    """
+    Implements the MSET command.
+
+    MSET key value [key value ...] sets every key to its value, discarding their
+    expiration, as a single atomic operation.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+    KEY_SPEC = (0, -2, 2)
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates that the arguments are key-value pairs.
+
+        Raises:
+            InvalidCommandSyntaxError: If no pair is given or a value is missing.
+        """
+        if not self._arguments or len(self._arguments) % 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> str:
+        """
+        Executes the MSET command.
+
+        Returns:
+            str: "OK" to confirm the operation.
+        """
+        arguments = self._arguments
+        for key, value in zip(arguments[::2], arguments[1::2]):
+            REDIS_DB.set(key, encode_string(value))
+        return "OK"
+
+
+class MSetNxCommand(MSetCommand):
+    """
+    Implements the MSETNX command.
+
+    MSETNX key value [key value ...] sets the keys like MSET, only if none of them
+    exists.
+    """
+
+    __slots__ = ()
+
+    def execute(self) -> int:
+        """
+        Executes the MSETNX command.
+
+        Returns:
+            int: 1 if the keys were set, 0 if at least one of them exists.
+        """
+        if any(key in REDIS_DB for key in self.get_keys()):
+            return 0
+        super().execute()
+        return 1
+
+
+class GetSetCommand(RedisCommand):
+    """
+    Implements the GETSET command.
+
+    GETSET key value sets a key like SET without options and returns its old value.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "value")
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def execute(self) -> str | None:
+        """
+        Executes the GETSET command.
+
+        Returns:
+            str | None: The old value, or None if the key did not exist.
+
+        Raises:
+            CommandProcessingException: If the key holds another type.
+        """
+        key = self.get("key")
+        old_value = get_string(REDIS_DB.get(key))
+        REDIS_DB.set(key, encode_string(self.get("value")))
+        return old_value
+
+
+class GetDelCommand(RedisCommand):
+    """
+    Implements the GETDEL command.
+
+    GETDEL key returns the value of a key and deletes it.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    def execute(self) -> str | None:
+        """
+        Executes the GETDEL command.
+
+        Returns:
+            str | None: The value, or None if the key did not exist.
+
+        Raises:
+            CommandProcessingException: If the key holds another type.
+        """
+        key = self.get("key")
+        value = get_string(REDIS_DB.get(key))
+        if value is not None:
+            REDIS_DB.delete(key)
+        return value
+
+
+class GetExCommand(RedisCommand):
+    """
+    Implements the GETEX command.
+
+    GETEX key [EX seconds | PX milliseconds | EXAT timestamp | PXAT timestamp | PERSIST]
+    returns the value of a key and optionally sets or removes its expiration.
+    """
+
+    __slots__ = ("_expire", "_persist")
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ("EX", "PX", "EXAT", "PXAT", "PERSIST")
+    IS_WRITE_COMMAND = True
+
+    def _parse_arguments(self) -> None:
+        """
+        Parses the key and the optional expiration option.
+
+        Raises:
+            InvalidCommandSyntaxError: If the arguments are missing or invalid.
+            CommandProcessingException: If the expiration is not a positive integer.
+        """
+        arguments = self._arguments
+        if not arguments:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        self._expire = None
+        self._persist = False
+        options = [argument.upper() for argument in arguments[1:]]
+        if options == ["PERSIST"]:
+            self._persist = True
+        elif len(options) == 2 and options[0] in self.POSSIBLE_OPTIONS[:4]:
+            self._expire = _absolute_expire_time(options[0], arguments[2], "getex")
+        elif options:
+            raise InvalidCommandSyntaxError("ERR syntax error")
+
+    def execute(self) -> str | None:
+        """
+        Executes the GETEX command.
+
+        Returns:
+            str | None: The value, or None if the key does not exist.
+
+        Raises:
+            CommandProcessingException: If the key holds another type.
+        """
+        key = self.get("key")
+        value = get_string(REDIS_DB.get(key))
+        if value is not None:
+            if self._expire is not None:
+                REDIS_DB.set_expire(key, self._expire)
+            elif self._persist:
+                REDIS_DB.persist(key)
+        return value
+
+    def get_propagated_command(self) -> list[str] | None:
+        """
+        Propagates the expiration change as PEXPIREAT or PERSIST, so that relative
+        expiry times replay identically.
+
+        Returns:
+            list[str] | None: The equivalent command, or None without an option.
+        """
+        if self._expire is not None:
+            return ["PEXPIREAT", self.get("key"), str(self._expire)]
+        if self._persist:
+            return ["PERSIST", self.get("key")]
+        return None
+
+
+class SetNxCommand(RedisCommand):
+    """
+    Implements the SETNX command.
+
+    SETNX key value sets a key only if it does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "value")
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def execute(self) -> int:
+        """
+        Executes the SETNX command.
+
+        Returns:
+            int: 1 if the key was set, 0 if it exists.
+        """
+        key = self.get("key")
+        if key in REDIS_DB:
+            return 0
+        REDIS_DB.set(key, encode_string(self.get("value")))
+        return 1
+
+
+class AppendCommand(RedisCommand):
+    """
+    Implements the APPEND command.
+
+    APPEND key value appends a value to a string, creating it if the key does not
+    exist, and keeps its expiration.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "value")
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def execute(self) -> int:
+        """
+        Executes the APPEND command.
+
+        Returns:
+            int: The length of the string after the append, in bytes.
+
+        Raises:
+            CommandProcessingException: If the key holds another type.
+        """
+        key = self.get("key")
+        value = (get_string(REDIS_DB.get(key)) or "") + self.get("value")
+        REDIS_DB.set(key, encode_string(value), keep_ttl=True)
+        return string_length(value)
+
+
+class StrLenCommand(RedisCommand):
+    """
+    Implements the STRLEN command.
+
+    STRLEN key returns the length of a string in bytes, 0 if the key does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> int:
+        """
+        Executes the STRLEN command.
+
+        Returns:
+            int: The length of the string.
+
+        Raises:
+            CommandProcessingException: If the key holds another type.
+        """
+        value = get_string(REDIS_DB.get(self.get("key")))
+        return string_length(value) if value is not None else 0
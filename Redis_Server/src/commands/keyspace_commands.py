@@ -0,0 +1,157 @@
+"""
+This module implements Redis commands enumerating the keyspace:
+- SCAN: Iterate over the keys incrementally with a cursor.
+- KEYS: Return every key matching a glob-style pattern.
+- DBSIZE: Return the number of keys.
+
+SCAN walks the keyspace one shard at a time, through the log of the keys of each
+shard in insertion order (see `RedisDB.scan_shard`). The cursor encodes the shard
+and a sequence number in its log, so nothing is kept between calls and a call
+costs O(log n + COUNT). Keys present for the whole iteration are returned, keys
+removed meanwhile are skipped, and a key removed then added again may be
+returned twice, as SCAN allows.
+"""
+
+from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.encodings import type_name
+from src.redisDB.redis_db import REDIS_DB
+from src.utils.data_utils import parse_integer
+from src.utils.scan_utils import DEFAULT_SCAN_COUNT, compile_glob, parse_cursor
+
+TYPE_NAMES = ("string", "list", "hash", "set", "zset")
+
+
+class ScanCommand(RedisCommand):
+    """
+    Implements the Redis SCAN command.
+
+    SCAN cursor [MATCH pattern] [COUNT count] [TYPE type] returns some of the keys
+    and the cursor to pass to the next call, 0 once every shard was walked. MATCH
+    and TYPE filter the keys after they are taken, so a call may return fewer
+    than COUNT keys, or none, before the iteration is over.
+    """
+
+    __slots__ = ("cursor", "pattern", "count", "type")
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
+
+    def _parse_arguments(self) -> None:
+        """
+        Parses the cursor and the options.
+
+        Raises:
+            InvalidCommandSyntaxError: If the arguments are missing or invalid.
+            CommandProcessingException: If the cursor, the count or the type is invalid.
+        """
+        arguments = self._arguments
+        if not arguments:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        self.cursor = parse_cursor(arguments[0])
+        self.pattern = None
+        self.count = DEFAULT_SCAN_COUNT
+        self.type = None
+        for index in range(1, len(arguments), 2):
+            option = arguments[index].upper()
+            if option not in ("MATCH", "COUNT", "TYPE") or index + 1 == len(arguments):
+                raise InvalidCommandSyntaxError("ERR syntax error")
+            value = arguments[index + 1]
+            if option == "MATCH":
+                self.pattern = value
+            elif option == "COUNT":
+                self.count = parse_integer(value)
+                if self.count < 1:
+                    raise InvalidCommandSyntaxError("ERR syntax error")
+            else:
+                self.type = value.lower()
+                if self.type not in TYPE_NAMES:
+                    raise CommandProcessingException(f"ERR unknown type name '{value}'")
+
+    def execute(self) -> list:
+        """
+        Executes the SCAN command.
+
+        Returns:
+            list: The next cursor, as a string, and the keys returned by this call.
+        """
+        shards = REDIS_DB.shards
+        position, index = divmod(self.cursor, shards)
+        keys: list[str] = []
+        while True:
+            position, batch = REDIS_DB.scan_shard(index, position, self.count - len(keys))
+            keys += batch
+            if position:
+                cursor = position * shards + index
+                break
+            index += 1
+            if index == shards:
+                cursor = 0
+                break
+            if len(keys) >= self.count:
+                cursor = index
+                break
+
+        if self.pattern not in (None, "*"):
+            keys = list(filter(compile_glob(self.pattern), keys))
+        if self.type is None:
+            keys = [key for key in keys if key in REDIS_DB]
+        else:
+            keys = [key for key in keys
+                    if (value := REDIS_DB.get(key)) is not None and type_name(value) == self.type]
+        return [str(cursor), keys]
+
+
+class KeysCommand(RedisCommand):
+    """
+    Implements the Redis KEYS command.
+
+    KEYS pattern returns every key matching a glob-style pattern. It walks the
+    whole keyspace, holding one shard lock at a time; the pattern is compiled
+    once and cached.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("pattern",)
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
+
+    def execute(self) -> list[str]:
+        """
+        Executes the KEYS command.
+
+        Returns:
+            list[str]: The matching keys.
+        """
+        pattern = self.get("pattern")
+        return REDIS_DB.keys(None if pattern == "*" else compile_glob(pattern))
+
+
+class DBSizeCommand(RedisCommand):
+    """
+    Implements the Redis DBSIZE command.
+
+    DBSIZE returns the number of keys from the sizes of the shards, without
+    walking the keyspace.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
+
+    def execute(self) -> int:
+        """
+        Executes the DBSIZE command.
+
+        Returns:
+            int: The number of keys, including expired keys not reclaimed yet.
+        """
+        return len(REDIS_DB)
@@ -2,14 +2,101 @@
 This module implements Redis list-specific commands:
 - LPush: Pushes values to the left of a list.
 - RPush: Pushes values to the right of a list.
+- LPop / RPop: Remove and return elements from the left or right of a list.
+- LLen: Return the length of a list.
+- LIndex: Return the element at an index.
+- LRange: Return the elements between two indexes.
+- LSet: Replace the element at an index.
+- LTrim: Keep only the elements between two indexes.
+- LRem: Remove occurrences of an element.
+- LInsert: Insert an element before or after another one.
+- LMove: Atomically move an element from one list to another.
+- BLPop / BRPop / BLMove: Blocking variants of LPop, RPop and LMove, waiting for
+  an element up to a timeout (see `src.handlers.blocked_clients`).
+
+Lists are stored as a `ListPack` when small and as a `QuickList` of listpack
+nodes when big (see `src.redisDB.encodings`); both support the same operations,
+so commands do not depend on the encoding. Like in Redis, negative indexes count
+from the tail and a list is deleted once its last element is removed.
 
 It uses utility functions for cleaner and reusable list operations.
 """
 
 from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.encodings import grow_list, shrink_list
+from src.redisDB.listpack import ListPack
+from src.redisDB.quicklist import QuickList
 from src.redisDB.redis_db import REDIS_DB
-from src.utils.data_utils import push_values_to_list
-from src.utils.time_utils import has_expired
+from src.utils.data_utils import (
+    get_list,
+    normalize_range,
+    parse_integer,
+    parse_timeout,
+    push_values_to_list,
+)
+
+LIST_ENDS = ("LEFT", "RIGHT")
+
+
+def _store_list(key: str, value: ListPack | QuickList) -> None:
+    """
+    Stores a list after elements were removed from it, deleting it once empty and
+    converting it back to a listpack once small.
+
+    Args:
+        key (str): The key of the list.
+        value (ListPack | QuickList): The list.
+    """
+    if value:
+        REDIS_DB.set(key, shrink_list(value), keep_ttl=True)
+    else:
+        REDIS_DB.delete(key)
+
+
+def _parse_list_end(argument: str) -> str:
+    """
+    Parses the LEFT or RIGHT argument of LMOVE and BLMOVE.
+
+    Raises:
+        InvalidCommandSyntaxError: If the argument is neither LEFT nor RIGHT.
+    """
+    end = argument.upper()
+    if end not in LIST_ENDS:
+        raise InvalidCommandSyntaxError("ERR syntax error")
+    return end
+
+
+def _move(source: str, destination: str, wherefrom: str, whereto: str) -> str | None:
+    """
+    Pops an element from one end of a list and pushes it to an end of another one.
+
+    Args:
+        source (str): The key of the list to pop from.
+        destination (str): The key of the list to push to, created if needed.
+        wherefrom (str): "LEFT" or "RIGHT", the end of the source to pop from.
+        whereto (str): "LEFT" or "RIGHT", the end of the destination to push to.
+
+    Returns:
+        str | None: The moved element, or None if the source does not exist.
+
+    Raises:
+        CommandProcessingException: If a key holds another type.
+    """
+    source_list = get_list(REDIS_DB.get(source))
+    if source_list is None:
+        return None
+    get_list(REDIS_DB.get(destination))
+
+    item = source_list.popleft() if wherefrom == "LEFT" else source_list.pop()
+    _store_list(source, source_list)
+    updated_list = push_values_to_list(
+        REDIS_DB.get(destination), [item], is_left=whereto == "LEFT")
+    REDIS_DB.set(destination, updated_list, keep_ttl=True)
+    return item
 
 
 class LPushCommand(RedisCommand):
@@ -20,8 +107,12 @@ class LPushCommand(RedisCommand):
     If the key does not exist, a new list is created.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ()
     POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
 
     def _parse_arguments(self) -> None:
         """
@@ -38,14 +129,11 @@ class LPushCommand(RedisCommand):
         """
         key, *values = self._arguments
 
-        current_value, expires = REDIS_DB.get(key, [None, None])
-
-        if has_expired(expires):
-            current_value = None
+        current_value = REDIS_DB.get(key)
 
         updated_list = push_values_to_list(current_value, values, is_left=True)
 
-        REDIS_DB.set(key, (updated_list, None))
+        REDIS_DB.set(key, updated_list, keep_ttl=True)
 
         return len(updated_list)
 
@@ -58,8 +146,12 @@ class RPushCommand(RedisCommand):
     If the key does not exist, a new list is created.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ()
     POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
 
     def _parse_arguments(self) -> None:
         """
@@ -77,14 +169,487 @@ class RPushCommand(RedisCommand):
 
         key, *values = self._arguments
 
-        current_value, expires = REDIS_DB.get(key, [None, None])
-
-        if has_expired(expires):
-            current_value = None
+        current_value = REDIS_DB.get(key)
 
         updated_list = push_values_to_list(
             current_value, values, is_left=False)
 
-        REDIS_DB.set(key, (updated_list, None))
+        REDIS_DB.set(key, updated_list, keep_ttl=True)
 
         return len(updated_list)
+
+
+class _PopCommand(RedisCommand):
+    """
+    Base class of LPOP and RPOP: `key [count]`.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    FROM_TAIL: bool
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the key is missing or there are extra arguments.
+        """
+        if len(self._arguments) not in (1, 2):
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> str | list[str] | None:
+        """
+        Removes elements from one end of the list.
+
+        Returns:
+            str | list[str] | None: The removed element without a count, the removed
+                                    elements with one, or None if the key does not exist.
+
+        Raises:
+            CommandProcessingException: If the count is invalid or the key holds
+                                        another type.
+        """
+        key = self._arguments[0]
+        count = None
+        if len(self._arguments) == 2:
+            count = parse_integer(self._arguments[1])
+            if count < 0:
+                raise CommandProcessingException(
+                    "ERR value is out of range, must be positive")
+
+        value = get_list(REDIS_DB.get(key))
+        if value is None:
+            return None
+
+        pop = value.pop if self.FROM_TAIL else value.popleft
+        if count is None:
+            items = pop()
+        else:
+            items = [pop() for _ in range(min(count, len(value)))]
+        _store_list(key, value)
+        return items
+
+
+class LPopCommand(_PopCommand):
+    """
+    Implements the Redis LPOP command.
+
+    LPOP removes and returns the first element of a list, or its first `count`
+    elements.
+    """
+
+    __slots__ = ()
+
+    FROM_TAIL = False
+
+
+class RPopCommand(_PopCommand):
+    """
+    Implements the Redis RPOP command.
+
+    RPOP removes and returns the last element of a list, or its last `count`
+    elements.
+    """
+
+    __slots__ = ()
+
+    FROM_TAIL = True
+
+
+class LLenCommand(RedisCommand):
+    """
+    Implements the Redis LLEN command.
+
+    LLEN returns the length of a list, 0 if the key does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> int:
+        """
+        Executes the LLEN command.
+
+        Returns:
+            int: The length of the list.
+        """
+        value = get_list(REDIS_DB.get(self.get("key")))
+        return len(value) if value is not None else 0
+
+
+class LIndexCommand(RedisCommand):
+    """
+    Implements the Redis LINDEX command.
+
+    LINDEX returns the element at an index of a list.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "index")
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> str | None:
+        """
+        Executes the LINDEX command.
+
+        Returns:
+            str | None: The element, or None if the index is out of range or the key
+                        does not exist.
+        """
+        index = parse_integer(self.get("index"))
+        value = get_list(REDIS_DB.get(self.get("key")))
+        if value is None:
+            return None
+        try:
+            return value[index]
+        except IndexError:
+            return None
+
+
+class LRangeCommand(RedisCommand):
+    """
+    Implements the Redis LRANGE command.
+
+    LRANGE returns the elements between two indexes, both included.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "start", "stop")
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> list[str]:
+        """
+        Executes the LRANGE command.
+
+        Returns:
+            list[str]: The elements in the range, empty if the key does not exist.
+        """
+        start = parse_integer(self.get("start"))
+        stop = parse_integer(self.get("stop"))
+        value = get_list(REDIS_DB.get(self.get("key")))
+        if value is None:
+            return []
+        return value.slice(*normalize_range(start, stop, len(value)))
+
+
+class LSetCommand(RedisCommand):
+    """
+    Implements the Redis LSET command.
+
+    LSET replaces the element at an index of a list.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "index", "element")
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def execute(self) -> str:
+        """
+        Executes the LSET command.
+
+        Returns:
+            str: "OK" to confirm the operation.
+
+        Raises:
+            CommandProcessingException: If the key does not exist or the index is
+                                        out of range.
+        """
+        key = self.get("key")
+        index = parse_integer(self.get("index"))
+        value = get_list(REDIS_DB.get(key))
+        if value is None:
+            raise CommandProcessingException("ERR no such key")
+        try:
+            value[index] = self.get("element")
+        except IndexError:
+            raise CommandProcessingException("ERR index out of range") from None
+        REDIS_DB.set(key, grow_list(value), keep_ttl=True)
+        return "OK"
+
+
+class LTrimCommand(RedisCommand):
+    """
+    Implements the Redis LTRIM command.
+
+    LTRIM keeps only the elements between two indexes, both included.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "start", "stop")
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    def execute(self) -> str:
+        """
+        Executes the LTRIM command.
+
+        Returns:
+            str: "OK" to confirm the operation.
+        """
+        key = self.get("key")
+        start = parse_integer(self.get("start"))
+        stop = parse_integer(self.get("stop"))
+        value = get_list(REDIS_DB.get(key))
+        if value is not None:
+            value.trim(*normalize_range(start, stop, len(value)))
+            _store_list(key, value)
+        return "OK"
+
+
+class LRemCommand(RedisCommand):
+    """
+    Implements the Redis LREM command.
+
+    LREM removes the first `count` occurrences of an element starting from the
+    head (count > 0), from the tail (count < 0), or all of them (count = 0).
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "count", "element")
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    def execute(self) -> int:
+        """
+        Executes the LREM command.
+
+        Returns:
+            int: The number of removed elements.
+        """
+        key = self.get("key")
+        count = parse_integer(self.get("count"))
+        value = get_list(REDIS_DB.get(key))
+        if value is None:
+            return 0
+        removed = value.remove(self.get("element"), count)
+        if removed:
+            _store_list(key, value)
+        return removed
+
+
+class LInsertCommand(RedisCommand):
+    """
+    Implements the Redis LINSERT command.
+
+    LINSERT key BEFORE|AFTER pivot element inserts an element next to the first
+    occurrence of the pivot.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the number of arguments is wrong or the
+                                       position is neither BEFORE nor AFTER.
+        """
+        if len(self._arguments) != 4:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        if self._arguments[1].upper() not in ("BEFORE", "AFTER"):
+            raise InvalidCommandSyntaxError("ERR syntax error")
+
+    def execute(self) -> int:
+        """
+        Executes the LINSERT command.
+
+        Returns:
+            int: The length of the list after the insertion, -1 if the pivot was
+                 not found, or 0 if the key does not exist.
+        """
+        key, position, pivot, element = self._arguments
+        value = get_list(REDIS_DB.get(key))
+        if value is None:
+            return 0
+        index = value.find(pivot)
+        if index < 0:
+            return -1
+        if position.upper() == "AFTER":
+            index += 1
+        value.insert(index, element)
+        REDIS_DB.set(key, grow_list(value), keep_ttl=True)
+        return len(value)
+
+
+class LMoveCommand(RedisCommand):
+    """
+    Implements the Redis LMOVE command.
+
+    LMOVE source destination LEFT|RIGHT LEFT|RIGHT pops an element from one end of
+    the source list and pushes it to one end of the destination list, atomically.
+    """
+
+    __slots__ = ("_wherefrom", "_whereto")
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+    KEY_SPEC = (0, 1, 1)
+    ARGUMENT_COUNT = 4
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the number of arguments is wrong or an end
+                                       is neither LEFT nor RIGHT.
+        """
+        if len(self._arguments) != self.ARGUMENT_COUNT:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        self._wherefrom = _parse_list_end(self._arguments[2])
+        self._whereto = _parse_list_end(self._arguments[3])
+
+    def execute(self) -> str | None:
+        """
+        Executes the LMOVE command.
+
+        Returns:
+            str | None: The moved element, or None if the source does not exist.
+        """
+        return _move(self._arguments[0], self._arguments[1], self._wherefrom, self._whereto)
+
+
+class BLMoveCommand(LMoveCommand):
+    """
+    Implements the Redis BLMOVE command.
+
+    BLMOVE source destination LEFT|RIGHT LEFT|RIGHT timeout is LMOVE, blocking the
+    client until the source list exists or the timeout expires. It is propagated
+    as LMOVE.
+    """
+
+    __slots__ = ("timeout",)
+
+    IS_BLOCKING = True
+    ARGUMENT_COUNT = 5
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the arguments and parses the timeout.
+
+        Raises:
+            InvalidCommandSyntaxError: If the arguments are invalid.
+            CommandProcessingException: If the timeout is invalid.
+        """
+        super()._parse_arguments()
+        self.timeout = parse_timeout(self._arguments[4])
+
+    def get_blocking_keys(self) -> list[str]:
+        """
+        Returns the source key: only a push to it can unblock the command.
+        """
+        return self._arguments[:1]
+
+    def get_propagated_command(self) -> list[str]:
+        """
+        Propagates the command as LMOVE, which replays without blocking.
+        """
+        return ["LMOVE", *self._arguments[:2], self._wherefrom, self._whereto]
+
+
+class _BlockingPopCommand(RedisCommand):
+    """
+    Base class of BLPOP and BRPOP: `key [key ...] timeout`.
+    """
+
+    __slots__ = ("timeout", "_popped_key")
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    IS_BLOCKING = True
+    KEY_SPEC = (0, -2, 1)
+    FROM_TAIL: bool
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments and parses the timeout.
+
+        Raises:
+            InvalidCommandSyntaxError: If there is no key.
+            CommandProcessingException: If the timeout is invalid.
+        """
+        if len(self._arguments) < 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        self.timeout = parse_timeout(self._arguments[-1])
+        self._popped_key = None
+
+    def execute(self) -> list[str] | None:
+        """
+        Pops an element from the first non-empty list, in the order of the keys.
+
+        Returns:
+            list[str] | None: The key of the list and the popped element, or None
+                              if every list is empty.
+
+        Raises:
+            CommandProcessingException: If a key holds another type.
+        """
+        for key in self._arguments[:-1]:
+            value = get_list(REDIS_DB.get(key))
+            if value is None:
+                continue
+            item = value.pop() if self.FROM_TAIL else value.popleft()
+            _store_list(key, value)
+            self._popped_key = key
+            return [key, item]
+        return None
+
+    def get_propagated_command(self) -> list[str]:
+        """
+        Propagates the command as RPOP or LPOP on the list it popped from.
+        """
+        return ["RPOP" if self.FROM_TAIL else "LPOP", self._popped_key]
+
+
+class BLPopCommand(_BlockingPopCommand):
+    """
+    Implements the Redis BLPOP command.
+
+    BLPOP removes and returns the first element of the first non-empty list,
+    blocking the client until one of the lists gets an element or the timeout
+    expires.
+    """
+
+    __slots__ = ()
+
+    FROM_TAIL = False
+
+
+class BRPopCommand(_BlockingPopCommand):
+    """
+    Implements the Redis BRPOP command.
+
+    BRPOP removes and returns the last element of the first non-empty list,
+    blocking the client until one of the lists gets an element or the timeout
+    expires.
+    """
+
+    __slots__ = ()
+
+    FROM_TAIL = True
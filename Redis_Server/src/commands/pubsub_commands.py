@@ -0,0 +1,85 @@
+"""
+This module implements the Redis Pub/Sub commands that do not depend on the
+subscriptions of the calling client:
+- PUBLISH: Send a message to the subscribers of a channel and matching patterns.
+- PUBSUB CHANNELS [pattern]: List the channels with subscribers.
+- PUBSUB NUMSUB [channel ...]: Count the subscribers of channels.
+- PUBSUB NUMPAT: Count the patterns with subscribers.
+
+SUBSCRIBE and the other commands changing the subscriptions of a connection are
+run by the request handler, which owns the per-connection state (see
+`src.handlers.pubsub`).
+"""
+
+from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import InvalidCommandSyntaxError
+from src.handlers.pubsub import PUBSUB
+
+
+class PublishCommand(RedisCommand):
+    """
+    Implements the Redis PUBLISH command.
+
+    PUBLISH channel message returns the number of subscriptions the message was
+    delivered to: a client subscribed to the channel and to a matching pattern
+    receives it twice.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("channel", "message")
+    KEY_SPEC = None
+
+    def execute(self) -> int:
+        """
+        Executes the PUBLISH command.
+
+        Returns:
+            int: The number of deliveries.
+        """
+        return PUBSUB.publish(self.get("channel"), self.get("message"))
+
+
+class PubsubCommand(RedisCommand):
+    """
+    Implements the Redis PUBSUB command with its CHANNELS, NUMSUB and NUMPAT
+    subcommands.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    KEY_SPEC = None
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the subcommand and its number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the subcommand is unknown or has the
+                                       wrong number of arguments.
+        """
+        subcommand = self._arguments[0].upper()
+        if subcommand not in ("CHANNELS", "NUMSUB", "NUMPAT"):
+            raise InvalidCommandSyntaxError(
+                f"ERR unknown subcommand '{self._arguments[0]}'")
+        if (subcommand == "CHANNELS" and len(self._arguments) > 2
+                or subcommand == "NUMPAT" and len(self._arguments) > 1):
+            raise InvalidCommandSyntaxError(
+                f"ERR wrong number of arguments for 'pubsub|{subcommand.lower()}' command")
+
+    def execute(self) -> list | int:
+        """
+        Executes the PUBSUB command.
+
+        Returns:
+            list | int: The channels for CHANNELS, channel/count pairs for NUMSUB,
+                        the number of patterns for NUMPAT.
+        """
+        subcommand = self._arguments[0].upper()
+        if subcommand == "CHANNELS":
+            return PUBSUB.channels(*self._arguments[1:2])
+        if subcommand == "NUMSUB":
+            return [item for channel in self._arguments[1:]
+                    for item in (channel, PUBSUB.numsub(channel))]
+        return PUBSUB.numpat()
@@ -0,0 +1,379 @@
+"""
+This module implements Redis set commands:
+- SAdd: Add members to a set.
+- SRem: Remove members from a set.
+- SIsMember: Check whether a member belongs to a set.
+- SMembers: Return every member of a set.
+- SCard: Return the number of members.
+- SInter / SUnion / SDiff: Return the intersection, union or difference of sets.
+- SInterStore / SUnionStore / SDiffStore: Store the result of those operations.
+
+Sets whose members are all integers are stored as an `IntSet` when small, and
+as a Python `set` otherwise (see `src.redisDB.encodings`); both support
+membership tests and iteration, so commands do not depend on the encoding.
+Missing keys behave like empty sets, and a set is deleted once its last member
+is removed.
+"""
+
+from typing import Callable
+
+from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import InvalidCommandSyntaxError
+from src.redisDB.encodings import add_to_set, create_set
+from src.redisDB.intset import IntSet
+from src.redisDB.redis_db import REDIS_DB
+from src.utils.data_utils import get_set
+
+SetValue = IntSet | set
+
+
+def _intersection(sets: list[SetValue | None]) -> list[str]:
+    """
+    Returns the members found in every set. The smallest set is iterated, so the
+    cost is bounded by its size times the number of sets.
+    """
+    if not sets or any(value is None for value in sets):
+        return []
+    smallest, *others = sorted(sets, key=len)
+    return [member for member in smallest if all(member in other for other in others)]
+
+
+def _union(sets: list[SetValue | None]) -> list[str]:
+    """
+    Returns the members found in any set.
+    """
+    members: set[str] = set()
+    for value in sets:
+        if value:
+            members.update(value)
+    return list(members)
+
+
+def _difference(sets: list[SetValue | None]) -> list[str]:
+    """
+    Returns the members of the first set found in none of the others, which are
+    checked from the biggest, the most likely to hold a member.
+    """
+    first, *others = sets
+    if not first:
+        return []
+    others = sorted((other for other in others if other), key=len, reverse=True)
+    return [member for member in first if not any(member in other for other in others)]
+
+
+class _SetOperationCommand(RedisCommand):
+    """
+    Base class of SINTER, SUNION and SDIFF: `key [key ...]`.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = (0, -1, 1)
+    OPERATION: Callable[[list[SetValue | None]], list[str]]
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If no key is given.
+        """
+        if not self._arguments:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> list[str]:
+        """
+        Applies the operation to the sets.
+
+        Returns:
+            list[str]: The members of the resulting set.
+
+        Raises:
+            CommandProcessingException: If a key holds another type.
+        """
+        sets = [get_set(REDIS_DB.get(key)) for key in self._arguments]
+        return type(self).OPERATION(sets)
+
+
+class _SetOperationStoreCommand(RedisCommand):
+    """
+    Base class of SINTERSTORE, SUNIONSTORE and SDIFFSTORE:
+    `destination key [key ...]`.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+    KEY_SPEC = (0, -1, 1)
+    OPERATION: Callable[[list[SetValue | None]], list[str]]
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the destination or the keys are missing.
+        """
+        if len(self._arguments) < 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> int:
+        """
+        Applies the operation to the sets and stores the result, replacing the
+        destination, which is deleted if the result is empty.
+
+        Returns:
+            int: The number of members of the resulting set.
+
+        Raises:
+            CommandProcessingException: If a key holds another type.
+        """
+        destination, *keys = self._arguments
+        sets = [get_set(REDIS_DB.get(key)) for key in keys]
+        members = type(self).OPERATION(sets)
+        if members:
+            REDIS_DB.set(destination, create_set(members))
+        elif destination in REDIS_DB:
+            REDIS_DB.delete(destination)
+        return len(members)
+
+
+class SAddCommand(RedisCommand):
+    """
+    Implements the Redis SADD command.
+
+    SADD key member [member ...] adds members to a set, creating it if the key
+    does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If no member is given.
+        """
+        if len(self._arguments) < 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> int:
+        """
+        Executes the SADD command.
+
+        Returns:
+            int: The number of members that were added.
+        """
+        key, *members = self._arguments
+        value = get_set(REDIS_DB.get(key))
+        if value is None:
+            value = create_set(members)
+            added = len(value)
+        else:
+            value, added = add_to_set(value, members)
+        REDIS_DB.set(key, value, keep_ttl=True)
+        return added
+
+
+class SRemCommand(RedisCommand):
+    """
+    Implements the Redis SREM command.
+
+    SREM key member [member ...] removes members from a set.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If no member is given.
+        """
+        if len(self._arguments) < 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> int:
+        """
+        Executes the SREM command.
+
+        Returns:
+            int: The number of members that were removed.
+        """
+        key, *members = self._arguments
+        value = get_set(REDIS_DB.get(key))
+        if value is None:
+            return 0
+        if type(value) is IntSet:
+            removed = sum(map(value.discard, members))
+        else:
+            size = len(value)
+            value.difference_update(members)
+            removed = size - len(value)
+        if not value:
+            REDIS_DB.delete(key)
+        elif removed:
+            REDIS_DB.set(key, value, keep_ttl=True)
+        return removed
+
+
+class SIsMemberCommand(RedisCommand):
+    """
+    Implements the Redis SISMEMBER command.
+
+    SISMEMBER returns whether a member belongs to a set.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "member")
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> int:
+        """
+        Executes the SISMEMBER command.
+
+        Returns:
+            int: 1 if the member belongs to the set, 0 otherwise.
+        """
+        value = get_set(REDIS_DB.get(self.get("key")))
+        return int(value is not None and self.get("member") in value)
+
+
+class SMembersCommand(RedisCommand):
+    """
+    Implements the Redis SMEMBERS command.
+
+    SMEMBERS returns every member of a set.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> list[str]:
+        """
+        Executes the SMEMBERS command.
+
+        Returns:
+            list[str]: The members, empty if the key does not exist.
+        """
+        value = get_set(REDIS_DB.get(self.get("key")))
+        return list(value) if value is not None else []
+
+
+class SCardCommand(RedisCommand):
+    """
+    Implements the Redis SCARD command.
+
+    SCARD returns the number of members of a set, 0 if the key does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> int:
+        """
+        Executes the SCARD command.
+
+        Returns:
+            int: The number of members.
+        """
+        value = get_set(REDIS_DB.get(self.get("key")))
+        return len(value) if value is not None else 0
+
+
+class SInterCommand(_SetOperationCommand):
+    """
+    Implements the Redis SINTER command.
+
+    SINTER key [key ...] returns the members found in every set.
+    """
+
+    __slots__ = ()
+
+    OPERATION = staticmethod(_intersection)
+
+
+class SUnionCommand(_SetOperationCommand):
+    """
+    Implements the Redis SUNION command.
+
+    SUNION key [key ...] returns the members found in any of the sets.
+    """
+
+    __slots__ = ()
+
+    OPERATION = staticmethod(_union)
+
+
+class SDiffCommand(_SetOperationCommand):
+    """
+    Implements the Redis SDIFF command.
+
+    SDIFF key [key ...] returns the members of the first set found in none of
+    the others.
+    """
+
+    __slots__ = ()
+
+    OPERATION = staticmethod(_difference)
+
+
+class SInterStoreCommand(_SetOperationStoreCommand):
+    """
+    Implements the Redis SINTERSTORE command.
+
+    SINTERSTORE destination key [key ...] stores the intersection of the sets.
+    """
+
+    __slots__ = ()
+
+    OPERATION = staticmethod(_intersection)
+
+
+class SUnionStoreCommand(_SetOperationStoreCommand):
+    """
+    Implements the Redis SUNIONSTORE command.
+
+    SUNIONSTORE destination key [key ...] stores the union of the sets.
+    """
+
+    __slots__ = ()
+
+    OPERATION = staticmethod(_union)
+
+
+class SDiffStoreCommand(_SetOperationStoreCommand):
+    """
+    Implements the Redis SDIFFSTORE command.
+
+    SDIFFSTORE destination key [key ...] stores the difference of the sets.
+    """
+
+    __slots__ = ()
+
+    OPERATION = staticmethod(_difference)
@@ -3,9 +3,14 @@ This module implements utility Redis commands:
 - PING: Test the connection to the server.
 - ECHO: Return the same message back to the client.
 - SAVE: Persist the in-memory database to a snapshot file.
+- BGSAVE: Persist a point-in-time copy of the database in the background.
+- LASTSAVE: Return the time of the last successful save.
+- BGREWRITEAOF: Compact the append-only file in the background.
 """
 
 from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import CommandProcessingException
+from src.redisDB.append_only_file import APPEND_ONLY_FILE
 from src.redisDB.redis_db import REDIS_DB
 
 
@@ -16,8 +21,11 @@ class PingCommand(RedisCommand):
     The PING command is used to test the connection to the Redis server.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ()
     POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
 
     def _parse_arguments(self) -> None:
         """
@@ -42,8 +50,11 @@ class EchoCommand(RedisCommand):
     The ECHO command returns the input arguments back to the client.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ()
     POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
 
     def _parse_arguments(self) -> None:
         """
@@ -67,8 +78,11 @@ class SaveCommand(RedisCommand):
     The SAVE command saves the current in-memory database to a snapshot file.
     """
 
+    __slots__ = ()
+
     REQUIRED_ATTRIBUTES = ()
     POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
 
     def _parse_arguments(self) -> None:
         """
@@ -82,6 +96,91 @@ class SaveCommand(RedisCommand):
 
         Returns:
             str: "OK" to confirm the data has been saved.
+
+        Raises:
+            CommandProcessingException: If a background save is in progress.
         """
+        if REDIS_DB.is_saving:
+            raise CommandProcessingException("ERR Background save already in progress")
         REDIS_DB.dump_data()
         return "OK"
+
+
+class BgSaveCommand(RedisCommand):
+    """
+    Implements the BGSAVE command.
+
+    BGSAVE takes a point-in-time copy of the database and writes it to the
+    snapshot file in a background thread, while clients keep being served.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
+
+    def execute(self) -> str:
+        """
+        Executes the BGSAVE command.
+
+        Returns:
+            str: A message confirming the background save has started.
+
+        Raises:
+            CommandProcessingException: If a background save is already in progress.
+        """
+        REDIS_DB.background_save()
+        return "Background saving started"
+
+
+class LastSaveCommand(RedisCommand):
+    """
+    Implements the LASTSAVE command.
+
+    LASTSAVE returns the UNIX time of the last successful save, e.g. to check
+    whether a BGSAVE has completed.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
+
+    def execute(self) -> int:
+        """
+        Executes the LASTSAVE command.
+
+        Returns:
+            int: The UNIX time, in seconds, of the last successful save.
+        """
+        return REDIS_DB.last_save
+
+
+class BgRewriteAofCommand(RedisCommand):
+    """
+    Implements the BGREWRITEAOF command.
+
+    BGREWRITEAOF rewrites the append-only file from a point-in-time copy of the
+    database in a background thread, while clients keep being served.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    KEY_SPEC = None
+
+    def execute(self) -> str:
+        """
+        Executes the BGREWRITEAOF command.
+
+        Returns:
+            str: A message confirming the rewrite has started.
+
+        Raises:
+            CommandProcessingException: If the AOF is disabled or already being rewritten.
+        """
+        APPEND_ONLY_FILE.rewrite()
+        return "Background append only file rewriting started"
@@ -0,0 +1,507 @@
+"""
+This module implements Redis sorted set commands:
+- ZAdd: Add members with scores, or update their scores.
+- ZIncrBy: Increment the score of a member.
+- ZRange: Return members by rank, or by score with BYSCORE.
+- ZRangeByScore: Return the members with scores in a range.
+- ZRank: Return the rank of a member.
+- ZRem: Remove members.
+- ZCard: Return the number of members.
+- ZPopMin: Remove and return the members with the lowest scores.
+
+Sorted sets are stored as a `ZSet` (see `src.redisDB.zset`), which finds the score
+of a member in O(1) and ranks or ranges in O(log n). Replies carry scores as
+strings formatted like Redis does, and a sorted set is deleted once its last
+member is removed.
+"""
+
+from src.commands.base_command import RedisCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.redis_db import REDIS_DB
+from src.redisDB.zset import ZSet
+from src.utils.data_utils import (
+    format_score,
+    get_zset,
+    normalize_range,
+    parse_integer,
+    parse_score,
+    parse_score_bound,
+)
+
+
+def _store_zset(key: str, value: ZSet) -> None:
+    """
+    Stores a sorted set after it was modified, deleting it once empty.
+
+    Args:
+        key (str): The key of the sorted set.
+        value (ZSet): The sorted set.
+    """
+    if value:
+        REDIS_DB.set(key, value, keep_ttl=True)
+    else:
+        REDIS_DB.delete(key)
+
+
+def _reply(pairs: list[tuple[str, float]], with_scores: bool) -> list[str]:
+    """
+    Builds the reply of a range: the members, each followed by its score if
+    `with_scores`.
+    """
+    if not with_scores:
+        return [member for member, _ in pairs]
+    return [item for member, score in pairs for item in (member, format_score(score))]
+
+
+def _range_by_rank(value: ZSet, start: int, stop: int, rev: bool) -> list[tuple[str, float]]:
+    """
+    Returns the members between two ranks, both included; negative ranks count
+    from the end. With `rev`, ranks are counted from the highest score.
+    """
+    length = len(value)
+    start, stop = normalize_range(start, stop, length)
+    if not rev:
+        return value.slice(start, stop)
+    return value.slice(length - stop, length - start)[::-1]
+
+
+def _range_by_score(value: ZSet, minimum: tuple[float, bool], maximum: tuple[float, bool],
+                    rev: bool, offset: int, count: int) -> list[tuple[str, float]]:
+    """
+    Returns the members with scores between two bounds, as parsed by
+    `parse_score_bound`, lowest first or, with `rev`, highest first, skipping
+    `offset` members and returning at most `count` (all of them if negative).
+    """
+    (min_score, min_exclusive), (max_score, max_exclusive) = minimum, maximum
+    low = value.rank_of_score(min_score, exclusive=min_exclusive)
+    high = value.rank_of_score(max_score, exclusive=not max_exclusive)
+    if offset < 0 or low >= high:
+        return []
+    if not rev:
+        start = low + offset
+        stop = high if count < 0 else min(high, start + count)
+        return value.slice(start, stop)
+    stop = high - offset
+    start = low if count < 0 else max(low, stop - count)
+    return value.slice(start, stop)[::-1]
+
+
+class _RangeCommand(RedisCommand):
+    """
+    Base class of ZRANGE and ZRANGEBYSCORE: `key start stop` followed by options.
+    """
+
+    __slots__ = ("offset", "count", "options")
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    OPTIONS: tuple[str, ...]
+
+    def _parse_arguments(self) -> None:
+        """
+        Parses the options following the range.
+
+        Raises:
+            InvalidCommandSyntaxError: If the arguments are missing or an option is
+                                       unknown or incomplete.
+        """
+        arguments = self._arguments
+        if len(arguments) < 3:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        self.options = set()
+        self.offset, self.count = 0, -1
+        index = 3
+        while index < len(arguments):
+            option = arguments[index].upper()
+            if option not in self.OPTIONS:
+                raise InvalidCommandSyntaxError("ERR syntax error")
+            if option == "LIMIT":
+                if index + 2 >= len(arguments):
+                    raise InvalidCommandSyntaxError("ERR syntax error")
+                self.offset = parse_integer(arguments[index + 1])
+                self.count = parse_integer(arguments[index + 2])
+                index += 2
+            self.options.add(option)
+            index += 1
+
+
+class ZAddCommand(RedisCommand):
+    """
+    Implements the Redis ZADD command.
+
+    ZADD key [NX|XX] [GT|LT] [CH] [INCR] score member [score member ...] adds
+    members or updates their scores. NX only adds new members and XX only updates
+    existing ones; GT and LT only update a score that would increase or decrease.
+    CH counts updated members in the reply too, and INCR increments the score of
+    a single member like ZINCRBY.
+    """
+
+    __slots__ = ("flags", "pairs")
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+    FLAGS = ("NX", "XX", "GT", "LT", "CH", "INCR")
+
+    def _parse_arguments(self) -> None:
+        """
+        Parses the flags and the score and member pairs.
+
+        Raises:
+            InvalidCommandSyntaxError: If the arguments are missing, a member has
+                                       no score or flags are incompatible.
+            CommandProcessingException: If a score is not a valid float.
+        """
+        arguments = self._arguments
+        if len(arguments) < 3:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        index = 1
+        self.flags = set()
+        while index < len(arguments) and arguments[index].upper() in self.FLAGS:
+            self.flags.add(arguments[index].upper())
+            index += 1
+        pairs = arguments[index:]
+        if not pairs or len(pairs) % 2:
+            raise InvalidCommandSyntaxError("ERR syntax error")
+        if {"NX", "XX"} <= self.flags:
+            raise InvalidCommandSyntaxError(
+                "ERR XX and NX options at the same time are not compatible")
+        if len(self.flags & {"NX", "GT", "LT"}) > 1:
+            raise InvalidCommandSyntaxError(
+                "ERR GT, LT, and/or NX options at the same time are not compatible")
+        if "INCR" in self.flags and len(pairs) > 2:
+            raise InvalidCommandSyntaxError(
+                "ERR INCR option supports a single increment-element pair")
+        self.pairs = [(pairs[i + 1], parse_score(pairs[i])) for i in range(0, len(pairs), 2)]
+
+    def execute(self) -> int | str | None:
+        """
+        Executes the ZADD command.
+
+        Returns:
+            int | str | None: The number of added members (and updated ones with
+                              CH), or with INCR the new score, None if the
+                              member was not updated.
+
+        Raises:
+            CommandProcessingException: If an increment makes a score NaN.
+        """
+        key, flags = self._arguments[0], self.flags
+        value = get_zset(REDIS_DB.get(key))
+        if value is None:
+            value = ZSet()
+        added = changed = 0
+        score = None
+        for member, score in self.pairs:
+            current = value.score(member)
+            if current is None:
+                if "XX" in flags:
+                    score = None
+                    continue
+                added += 1
+            else:
+                if "NX" in flags:
+                    score = None
+                    continue
+                if "INCR" in flags:
+                    score += current
+                    if score != score:
+                        raise CommandProcessingException(
+                            "ERR resulting score is not a number (NaN)")
+                if ("GT" in flags and score <= current) or ("LT" in flags and score >= current):
+                    score = None
+                    continue
+                if score != current:
+                    changed += 1
+            value.add(member, score)
+        if value:
+            REDIS_DB.set(key, value, keep_ttl=True)
+        if "INCR" in flags:
+            return format_score(score) if score is not None else None
+        return added + changed if "CH" in flags else added
+
+
+class ZIncrByCommand(RedisCommand):
+    """
+    Implements the Redis ZINCRBY command.
+
+    ZINCRBY key increment member adds to the score of a member, which is added
+    with the increment as its score if it does not exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key", "increment", "member")
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+    DENY_OOM = True
+
+    def execute(self) -> str:
+        """
+        Executes the ZINCRBY command.
+
+        Returns:
+            str: The new score of the member.
+
+        Raises:
+            CommandProcessingException: If the increment is not a valid float or
+                                        the new score would be NaN.
+        """
+        key, member = self.get("key"), self.get("member")
+        increment = parse_score(self.get("increment"))
+        value = get_zset(REDIS_DB.get(key))
+        if value is None:
+            value = ZSet()
+        score = (value.score(member) or 0.0) + increment
+        if score != score:
+            raise CommandProcessingException(
+                "ERR resulting score is not a number (NaN)")
+        value.add(member, score)
+        REDIS_DB.set(key, value, keep_ttl=True)
+        return format_score(score)
+
+
+class ZRangeCommand(_RangeCommand):
+    """
+    Implements the Redis ZRANGE command.
+
+    ZRANGE key start stop [BYSCORE] [REV] [LIMIT offset count] [WITHSCORES]
+    returns the members between two ranks, both included, or with BYSCORE between
+    two scores. REV orders members from the highest score; with BYSCORE and REV,
+    the maximum comes first.
+    """
+
+    __slots__ = ()
+
+    OPTIONS = ("BYSCORE", "REV", "LIMIT", "WITHSCORES")
+
+    def execute(self) -> list[str]:
+        """
+        Executes the ZRANGE command.
+
+        Returns:
+            list[str]: The members, each followed by its score with WITHSCORES.
+
+        Raises:
+            InvalidCommandSyntaxError: If LIMIT is used without BYSCORE.
+            CommandProcessingException: If the range bounds are invalid.
+        """
+        key, start, stop = self._arguments[:3]
+        options = self.options
+        rev = "REV" in options
+        if "LIMIT" in options and "BYSCORE" not in options:
+            raise InvalidCommandSyntaxError(
+                "ERR syntax error, LIMIT is only supported in combination with "
+                "either BYSCORE or BYLEX")
+        if "BYSCORE" in options:
+            minimum, maximum = map(parse_score_bound, (stop, start) if rev else (start, stop))
+        else:
+            start, stop = parse_integer(start), parse_integer(stop)
+
+        value = get_zset(REDIS_DB.get(key))
+        if value is None:
+            return []
+        if "BYSCORE" in options:
+            pairs = _range_by_score(value, minimum, maximum, rev, self.offset, self.count)
+        else:
+            pairs = _range_by_rank(value, start, stop, rev)
+        return _reply(pairs, "WITHSCORES" in options)
+
+
+class ZRangeByScoreCommand(_RangeCommand):
+    """
+    Implements the Redis ZRANGEBYSCORE command.
+
+    ZRANGEBYSCORE key min max [WITHSCORES] [LIMIT offset count] returns the
+    members with scores between two bounds, lowest first. A "(" before a bound
+    makes it exclusive, and "-inf" and "+inf" are accepted.
+    """
+
+    __slots__ = ()
+
+    OPTIONS = ("WITHSCORES", "LIMIT")
+
+    def execute(self) -> list[str]:
+        """
+        Executes the ZRANGEBYSCORE command.
+
+        Returns:
+            list[str]: The members, each followed by its score with WITHSCORES.
+
+        Raises:
+            CommandProcessingException: If a bound is not a valid score.
+        """
+        key = self._arguments[0]
+        minimum, maximum = map(parse_score_bound, self._arguments[1:3])
+        value = get_zset(REDIS_DB.get(key))
+        if value is None:
+            return []
+        pairs = _range_by_score(value, minimum, maximum, False, self.offset, self.count)
+        return _reply(pairs, "WITHSCORES" in self.options)
+
+
+class ZRankCommand(RedisCommand):
+    """
+    Implements the Redis ZRANK command.
+
+    ZRANK key member [WITHSCORE] returns the rank of a member, 0 for the lowest
+    score, along with its score with WITHSCORE.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the number of arguments is wrong or the
+                                       option is not WITHSCORE.
+        """
+        if len(self._arguments) not in (2, 3):
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+        if len(self._arguments) == 3 and self._arguments[2].upper() != "WITHSCORE":
+            raise InvalidCommandSyntaxError("ERR syntax error")
+
+    def execute(self) -> int | list | None:
+        """
+        Executes the ZRANK command.
+
+        Returns:
+            int | list | None: The rank, or the rank and the score with WITHSCORE;
+                               None if the member or the key does not exist.
+        """
+        key, member = self._arguments[:2]
+        value = get_zset(REDIS_DB.get(key))
+        if value is None:
+            return None
+        rank = value.rank(member)
+        if rank is None or len(self._arguments) == 2:
+            return rank
+        return [rank, format_score(value.score(member))]
+
+
+class ZRemCommand(RedisCommand):
+    """
+    Implements the Redis ZREM command.
+
+    ZREM key member [member ...] removes members of a sorted set.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If no member is given.
+        """
+        if len(self._arguments) < 2:
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> int:
+        """
+        Executes the ZREM command.
+
+        Returns:
+            int: The number of removed members.
+        """
+        key, *members = self._arguments
+        value = get_zset(REDIS_DB.get(key))
+        if value is None:
+            return 0
+        removed = sum(map(value.remove, members))
+        if removed:
+            _store_zset(key, value)
+        return removed
+
+
+class ZCardCommand(RedisCommand):
+    """
+    Implements the Redis ZCARD command.
+
+    ZCARD returns the number of members of a sorted set, 0 if the key does not
+    exist.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ("key",)
+    POSSIBLE_OPTIONS = ()
+
+    def execute(self) -> int:
+        """
+        Executes the ZCARD command.
+
+        Returns:
+            int: The number of members.
+        """
+        value = get_zset(REDIS_DB.get(self.get("key")))
+        return len(value) if value is not None else 0
+
+
+class ZPopMinCommand(RedisCommand):
+    """
+    Implements the Redis ZPOPMIN command.
+
+    ZPOPMIN key [count] removes and returns the member with the lowest score, or
+    the `count` members with the lowest scores.
+    """
+
+    __slots__ = ()
+
+    REQUIRED_ATTRIBUTES = ()
+    POSSIBLE_OPTIONS = ()
+    IS_WRITE_COMMAND = True
+
+    def _parse_arguments(self) -> None:
+        """
+        Validates the number of arguments.
+
+        Raises:
+            InvalidCommandSyntaxError: If the key is missing or there are extra arguments.
+        """
+        if len(self._arguments) not in (1, 2):
+            raise InvalidCommandSyntaxError(
+                "ERR wrong number of arguments for command")
+
+    def execute(self) -> list[str]:
+        """
+        Executes the ZPOPMIN command.
+
+        Returns:
+            list[str]: The removed members, each followed by its score.
+
+        Raises:
+            CommandProcessingException: If the count is negative.
+        """
+        key = self._arguments[0]
+        count = 1
+        if len(self._arguments) == 2:
+            count = parse_integer(self._arguments[1])
+            if count < 0:
+                raise CommandProcessingException(
+                    "ERR value is out of range, must be positive")
+        value = get_zset(REDIS_DB.get(key))
+        if value is None:
+            return []
+        popped = value.pop_min(count)
+        if popped:
+            _store_zset(key, value)
+        return _reply(popped, with_scores=True)
@@ -15,13 +15,23 @@ Constants:
         of CRLF, used primarily for logging or debugging when working with RESP strings.
         Example: "\r\n".
 
+    - ESCAPED_CRLF:
+        The four characters backslash, 'r', backslash, 'n'. Shells such as the Windows
+        Command Prompt pass "\r\n" through `echo` literally, so requests typed by hand
+        and piped through ncat arrive with ESCAPED_CRLF instead of CRLF.
+
     - DEFAULT_ENCODING: 
         Specifies the encoding to be used for RESP strings. Redis uses UTF-8 by default
         to support a wide range of characters and symbols.
 
     - MAX_BUFFER_SIZE: 
         The maximum size (in bytes) for reading data from a socket in one operation. 
-        This prevents excessive memory usage during communication.
+        This prevents excessive memory usage during communication while still letting
+        a single read pick up many pipelined requests.
+
+    - MAX_QUERY_BUFFER_SIZE:
+        The maximum amount of unparsed request data (in bytes) buffered for one client.
+        Clients exceeding it are disconnected with a protocol error.
 
     - DEFAULT_REDIS_PORT: 
         The default port (6379) used by Redis servers for listening to incoming connections.
@@ -32,8 +42,12 @@ CRLF = b"\r\n"
 
 CRLF_STR = "\r\n"
 
+ESCAPED_CRLF = b"\\r\\n"
+
 DEFAULT_ENCODING = "utf-8"
 
-MAX_BUFFER_SIZE = 1024
+MAX_BUFFER_SIZE = 16 * 1024
+
+MAX_QUERY_BUFFER_SIZE = 1024 * 1024 * 1024
 
 DEFAULT_REDIS_PORT = 6379
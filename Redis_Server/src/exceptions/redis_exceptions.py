@@ -43,6 +43,13 @@ class RespParsingError(RedisServerException):
     pass
 
 
+class RespIncompleteDataError(RespParsingError):
+    """
+    Raised when a RESP message is truncated, i.e. more data is needed to parse it.
+    """
+    pass
+
+
 class CommandProcessingException(RedisServerException):
     """
     Raised when an error occurs while processing a valid Redis command.
@@ -53,4 +60,42 @@ class RespSerializationError(RedisServerException):
     """
     Raised when serialization of data into RESP format fails.
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class RdbLoadError(RedisServerException):
+    """
+    Raised when a snapshot file is not a valid RDB file or is corrupted.
+    """
+    pass
+
+
+class OutOfMemoryException(RedisServerException):
+    """
+    Raised when a command may use more memory while the memory limit is reached
+    and the eviction policy cannot free any.
+    """
+    pass
+
+
+class MovedException(RedisServerException):
+    """
+    Raised when a key belongs to the hash slots of another worker; the message
+    tells the client where to resend the command (`MOVED <slot> <host>:<port>`).
+    """
+    pass
+
+
+class CrossSlotException(RedisServerException):
+    """
+    Raised when the keys of a command do not hash to the same slot.
+    """
+    pass
+
+
+class ExecAbortException(RedisServerException):
+    """
+    Raised by EXEC when a command of the transaction failed to queue, so the
+    whole transaction is discarded.
+    """
+    pass
@@ -0,0 +1,297 @@
+"""
+This module keeps track of the clients blocked by commands such as BLPOP, until an
+element is pushed to one of the lists they wait for or their timeout expires.
+
+Like in Redis, blocking commands first run as their non-blocking counterpart. If
+every list they wait for is empty, the request handler registers the client here
+while still holding the locks of its keys, so no push can slip in between:
+
+- Clients wait in one FIFO queue per key, so the client blocked first is served first.
+- Write commands signal the keys that clients wait for as ready, still under the
+  locks of those keys. Once the locks are released, the request handler serves
+  the ready keys: the command of each waiting client is run again, in queue order,
+  as long as it finds elements.
+- Deadlines are kept in a heap; `unblock_timed_out` unblocks the clients whose
+  deadline has passed with a null reply.
+
+How a client waits depends on the connection model: a client served by its own
+thread parks that thread on an event (`BlockedClient.wait_for`), waking up now
+and then to check that the client is still connected, while the event loop
+registers an `on_unblock` callback and goes on serving the other connections.
+Either way, a client that disconnects while blocked is removed with `cancel`, so
+it does not take an element it would never receive.
+
+Exports:
+    - BlockedClient: A client waiting for one of its keys to be ready.
+    - BlockedClients: The registry of blocked clients.
+    - BLOCKED_CLIENTS: The registry shared by the server.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from src.exceptions.redis_exceptions import RedisServerException
+from src.redisDB.redis_db import REDIS_DB
+
+
+class BlockedClient:
+    """
+    A client blocked by a command until one of its keys is ready.
+
+    Attributes:
+        handler (RedisCommand): The blocking command, run again when a key is ready.
+        keys (list[str]): The keys the command operates on, waited for or not.
+        deadline (Optional[float]): When to give up, on the `time.monotonic` clock,
+                                    or None to wait forever.
+        result (Any): The reply once unblocked: the result of the command, None
+                      on timeout, or the exception the command raised.
+        on_unblock (Optional[Callable]): Called with the client once it is unblocked.
+        address (str): The "host:port" of the client, empty if unknown.
+    """
+
+    __slots__ = ("handler", "keys", "deadline", "result", "unblocked", "on_unblock",
+                 "address", "_event")
+
+    def __init__(self, handler, keys: list[str], deadline: Optional[float],
+                 address: str = ""):
+        """
+        Initializes a blocked client.
+
+        Args:
+            handler (RedisCommand): The blocking command.
+            keys (list[str]): The keys of the command.
+            deadline (Optional[float]): The monotonic deadline, or None.
+            address (str): The address of the client.
+        """
+        self.handler = handler
+        self.keys = keys
+        self.deadline = deadline
+        self.address = address
+        self.result: Any = None
+        self.unblocked = False
+        self.on_unblock: Optional[Callable[["BlockedClient"], None]] = None
+        self._event = threading.Event()
+
+    def unblock(self, result: Any) -> None:
+        """
+        Delivers the reply and wakes the client up.
+
+        Args:
+            result (Any): The reply of the command.
+        """
+        self.result = result
+        self.unblocked = True
+        self._event.set()
+        if self.on_unblock is not None:
+            self.on_unblock(self)
+
+    def wait(self) -> Any:
+        """
+        Parks the calling thread until the client is unblocked.
+
+        Returns:
+            Any: The reply of the command, None if it timed out.
+
+        Raises:
+            RedisServerException: If the command failed when it was run again.
+        """
+        while not self._event.wait(self.seconds_left()):
+            BLOCKED_CLIENTS.unblock_timed_out()
+        if isinstance(self.result, RedisServerException):
+            raise self.result
+        return self.result
+
+    def wait_for(self, timeout: float) -> bool:
+        """
+        Parks the calling thread until the client is unblocked, for at most
+        `timeout` seconds, so the caller can check the connection meanwhile.
+
+        Args:
+            timeout (float): The most seconds to wait.
+
+        Returns:
+            bool: Whether the client is unblocked.
+        """
+        seconds_left = self.seconds_left()
+        if seconds_left is None or seconds_left > timeout:
+            return self._event.wait(timeout)
+        if not self._event.wait(seconds_left):
+            BLOCKED_CLIENTS.unblock_timed_out()
+        return self.unblocked
+
+    def seconds_left(self) -> Optional[float]:
+        """
+        Returns the time left until the deadline, or None without deadline.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+
+class BlockedClients:
+    """
+    The clients blocked on keys, in FIFO order per key.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        self._lock = threading.Lock()
+        self._waiting: dict[str, deque[BlockedClient]] = {}
+        # Keys signalled as ready, in signal order (a dict used as an ordered set).
+        self._ready: dict[str, None] = {}
+        self._timeouts: list[tuple[float, int, BlockedClient]] = []
+        self._sequence = itertools.count()
+        self._count = 0
+
+    @property
+    def blocked_count(self) -> int:
+        """
+        The number of blocked clients.
+        """
+        return self._count
+
+    @property
+    def has_ready_keys(self) -> bool:
+        """
+        Whether keys were signalled as ready and not served yet.
+        """
+        return bool(self._ready)
+
+    def block(self, client: BlockedClient, keys: list[str]) -> None:
+        """
+        Registers a blocked client. The caller holds the locks of its keys.
+
+        Args:
+            client (BlockedClient): The client.
+            keys (list[str]): The keys to wait for.
+        """
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                self._waiting.setdefault(key, deque()).append(client)
+            self._count += 1
+            if client.deadline is not None:
+                timeouts = self._timeouts
+                heapq.heappush(timeouts, (client.deadline, next(self._sequence), client))
+                while timeouts[0][2].unblocked:
+                    heapq.heappop(timeouts)
+
+    def signal_keys_as_ready(self, keys: list[str]) -> None:
+        """
+        Marks the keys that clients wait for as ready to be served, after a write
+        command ran on them. The caller holds the locks of the keys.
+
+        Args:
+            keys (list[str]): The keys of the write command.
+        """
+        waiting = self._waiting
+        for key in keys:
+            if key in waiting:
+                with self._lock:
+                    self._ready[key] = None
+
+    def serve_ready_keys(self, serve: Callable[[BlockedClient], Any]) -> None:
+        """
+        Runs the command of the clients waiting for the ready keys again, first
+        blocked first, until a command finds no elements, and unblocks the clients
+        whose command succeeded. Keys that become ready meanwhile are served too.
+
+        Args:
+            serve (Callable[[BlockedClient], Any]): Runs the command of a client,
+                under the locks of its keys, and returns its result or None if
+                it would still block.
+        """
+        while True:
+            with self._lock:
+                if not self._ready:
+                    return
+                key = next(iter(self._ready))
+                del self._ready[key]
+                clients = list(self._waiting.get(key, ()))
+
+            for client in clients:
+                with REDIS_DB.locked(client.keys):
+                    if client.unblocked:
+                        continue
+                    try:
+                        result = serve(client)
+                    except RedisServerException as exc:
+                        result = exc
+                    if result is None:
+                        break
+                    self._unblock(client, result)
+
+    def unblock_timed_out(self) -> None:
+        """
+        Unblocks the clients whose deadline has passed, with a null reply.
+        """
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            timeouts = self._timeouts
+            while timeouts and timeouts[0][0] <= now:
+                expired.append(heapq.heappop(timeouts)[2])
+
+        for client in expired:
+            with REDIS_DB.locked(client.keys):
+                if not client.unblocked:
+                    self._unblock(client, None)
+
+    def cancel(self, client: BlockedClient) -> None:
+        """
+        Removes a client that disconnected while blocked, without notifying it.
+
+        Args:
+            client (BlockedClient): The client.
+        """
+        client.on_unblock = None
+        with REDIS_DB.locked(client.keys):
+            if not client.unblocked:
+                self._unblock(client, None)
+
+    def seconds_until_next_timeout(self) -> Optional[float]:
+        """
+        Returns the time until the next deadline, or None if no client has one.
+        """
+        with self._lock:
+            if not self._timeouts:
+                return None
+            deadline = self._timeouts[0][0]
+        return max(0.0, deadline - time.monotonic())
+
+    def _unblock(self, client: BlockedClient, result: Any) -> None:
+        """
+        Removes a client from the queues of its keys and delivers its reply. The
+        caller holds the locks of the keys of the client.
+        """
+        with self._lock:
+            for key in dict.fromkeys(client.keys):
+                queue = self._waiting.get(key)
+                if queue is None:
+                    continue
+                try:
+                    queue.remove(client)
+                except ValueError:
+                    continue
+                if not queue:
+                    del self._waiting[key]
+            self._count -= 1
+        client.unblock(result)
+
+    def clear(self) -> None:
+        """
+        Forgets every blocked client, without notifying them.
+        """
+        with self._lock:
+            self._waiting.clear()
+            self._ready.clear()
+            self._timeouts.clear()
+            self._count = 0
+
+
+BLOCKED_CLIENTS = BlockedClients()
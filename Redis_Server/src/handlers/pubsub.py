@@ -0,0 +1,359 @@
+"""
+This module implements Publish/Subscribe messaging: the channels and patterns
+clients subscribe to, and the delivery of published messages.
+
+Like in Redis:
+
+- Each channel maps to the connections subscribed to it, so PUBLISH costs
+  O(subscribers of the channel + patterns matching it), whatever the number of
+  channels.
+- Patterns are compiled once, when they are first subscribed to, and the patterns
+  matching a channel are cached until the set of patterns changes, so publishing
+  to a channel again does not match it against every pattern.
+- A message is serialized once and appended to the output buffer of each
+  `Subscriber`; publishers never write to sockets, so a slow subscriber does not
+  hold them up. A subscriber whose buffer grows past `output_buffer_limit` (the
+  "client-output-buffer-limit pubsub" of Redis) is dropped: it is unsubscribed
+  and the connection model closes its connection.
+
+How buffered messages reach the socket depends on the connection model: the
+event loop moves them to the connection's output buffer once `on_message` tells
+it messages are waiting, the threaded server runs a writer thread per subscribed
+connection that waits for them.
+
+Exports:
+    - Subscriber: The Pub/Sub state of a client connection.
+    - PubSub: The registry of channel and pattern subscriptions.
+    - PUBSUB: The registry shared by the server.
+"""
+
+import threading
+from typing import Callable, Optional
+
+from src.redis_protocol.serialization_handler import RESP_SERIALIZER
+from src.utils.scan_utils import compile_glob
+
+# Bytes of messages a subscriber may leave unread before it is disconnected.
+DEFAULT_PUBSUB_OUTPUT_BUFFER_LIMIT = 32 * 1024 * 1024
+
+# Channels whose matching patterns are cached; the cache is cleared when full.
+PATTERN_MATCH_CACHE_SIZE = 1024
+
+
+class Subscriber:
+    """
+    The Pub/Sub state of a client connection: its subscriptions and the messages
+    not handed to its connection yet.
+
+    Attributes:
+        channels (set[str]): The channels the client is subscribed to.
+        patterns (set[str]): The patterns the client is subscribed to.
+        dropped (bool): Whether the client was dropped for reading too slowly, or
+                        its connection was closed.
+        on_message (Optional[Callable]): Called with the subscriber when messages
+                                         start waiting, or when it is dropped.
+    """
+
+    __slots__ = ("channels", "patterns", "dropped", "on_message", "_pending", "_lock",
+                 "_event")
+
+    def __init__(self):
+        """
+        Initializes the state of a connection without subscriptions.
+        """
+        self.channels: set[str] = set()
+        self.patterns: set[str] = set()
+        self.dropped = False
+        self.on_message: Optional[Callable[["Subscriber"], None]] = None
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+        # Created by the first `wait`, so connections that never wait stay small.
+        self._event: Optional[threading.Event] = None
+
+    @property
+    def subscriptions(self) -> int:
+        """
+        The number of channels and patterns the client is subscribed to.
+        """
+        return len(self.channels) + len(self.patterns)
+
+    def deliver(self, message: bytes, limit: int) -> bool:
+        """
+        Buffers a serialized message for the client.
+
+        Args:
+            message (bytes): The RESP-encoded message.
+            limit (int): The most bytes the client may leave unread.
+
+        Returns:
+            bool: False if the client was dropped because its buffer is full.
+        """
+        with self._lock:
+            if self.dropped:
+                return True
+            notify = not self._pending
+            self._pending += message
+            overflow = len(self._pending) > limit
+            if overflow:
+                self.dropped = notify = True
+                self._pending.clear()
+            if notify and self._event is not None:
+                self._event.set()
+        if notify and self.on_message is not None:
+            self.on_message(self)
+        return not overflow
+
+    def take(self) -> bytes:
+        """
+        Returns the buffered messages and empties the buffer.
+
+        Returns:
+            bytes: The RESP-encoded messages, in publication order.
+        """
+        with self._lock:
+            messages = bytes(self._pending)
+            self._pending.clear()
+            if self._event is not None:
+                self._event.clear()
+        return messages
+
+    def wait(self) -> bytes:
+        """
+        Parks the calling thread until messages are buffered or the client is
+        dropped, e.g. in the writer thread of a connection.
+
+        Returns:
+            bytes: The buffered messages; check `dropped` before sending them.
+        """
+        with self._lock:
+            if self._event is None:
+                self._event = threading.Event()
+                if self._pending or self.dropped:
+                    self._event.set()
+            event = self._event
+        event.wait()
+        return self.take()
+
+    def close(self) -> None:
+        """
+        Drops the client once its connection is closed, waking a waiting writer up.
+        """
+        with self._lock:
+            self.dropped = True
+            self._pending.clear()
+            if self._event is not None:
+                self._event.set()
+
+
+class PubSub:
+    """
+    The registry of channel and pattern subscriptions.
+
+    Attributes:
+        output_buffer_limit (int): The most bytes of messages a subscriber may leave
+                                   unread before it is dropped.
+    """
+
+    def __init__(self, output_buffer_limit: int = DEFAULT_PUBSUB_OUTPUT_BUFFER_LIMIT):
+        """
+        Initializes a registry without subscriptions.
+
+        Args:
+            output_buffer_limit (int): The most bytes of messages a subscriber may
+                                       leave unread.
+        """
+        self._lock = threading.Lock()
+        self._channels: dict[str, dict[Subscriber, None]] = {}
+        # Pattern -> (compiled pattern, subscribers).
+        self._patterns: dict[str, tuple[Callable, dict[Subscriber, None]]] = {}
+        # Channel -> patterns matching it, while the set of patterns is unchanged.
+        self._matches: dict[str, tuple[str, ...]] = {}
+        self.output_buffer_limit = output_buffer_limit
+
+    def subscribe(self, subscriber: Subscriber, channel: str) -> int:
+        """
+        Subscribes a client to a channel.
+
+        Args:
+            subscriber (Subscriber): The client.
+            channel (str): The channel.
+
+        Returns:
+            int: The number of subscriptions of the client.
+        """
+        with self._lock:
+            self._channels.setdefault(channel, {})[subscriber] = None
+            subscriber.channels.add(channel)
+            return subscriber.subscriptions
+
+    def unsubscribe(self, subscriber: Subscriber, channel: str) -> int:
+        """
+        Unsubscribes a client from a channel.
+
+        Args:
+            subscriber (Subscriber): The client.
+            channel (str): The channel.
+
+        Returns:
+            int: The number of subscriptions left to the client.
+        """
+        with self._lock:
+            subscribers = self._channels.get(channel)
+            if subscribers is not None:
+                subscribers.pop(subscriber, None)
+                if not subscribers:
+                    del self._channels[channel]
+            subscriber.channels.discard(channel)
+            return subscriber.subscriptions
+
+    def psubscribe(self, subscriber: Subscriber, pattern: str) -> int:
+        """
+        Subscribes a client to the channels matching a glob-style pattern.
+
+        Args:
+            subscriber (Subscriber): The client.
+            pattern (str): The pattern.
+
+        Returns:
+            int: The number of subscriptions of the client.
+        """
+        with self._lock:
+            entry = self._patterns.get(pattern)
+            if entry is None:
+                entry = self._patterns[pattern] = (compile_glob(pattern), {})
+                self._matches.clear()
+            entry[1][subscriber] = None
+            subscriber.patterns.add(pattern)
+            return subscriber.subscriptions
+
+    def punsubscribe(self, subscriber: Subscriber, pattern: str) -> int:
+        """
+        Unsubscribes a client from a pattern.
+
+        Args:
+            subscriber (Subscriber): The client.
+            pattern (str): The pattern.
+
+        Returns:
+            int: The number of subscriptions left to the client.
+        """
+        with self._lock:
+            entry = self._patterns.get(pattern)
+            if entry is not None:
+                entry[1].pop(subscriber, None)
+                if not entry[1]:
+                    del self._patterns[pattern]
+                    self._matches.clear()
+            subscriber.patterns.discard(pattern)
+            return subscriber.subscriptions
+
+    def unsubscribe_all(self, subscriber: Subscriber) -> None:
+        """
+        Removes every subscription of a client, e.g. once its connection closed.
+
+        Args:
+            subscriber (Subscriber): The client.
+        """
+        for channel in list(subscriber.channels):
+            self.unsubscribe(subscriber, channel)
+        for pattern in list(subscriber.patterns):
+            self.punsubscribe(subscriber, pattern)
+
+    def publish(self, channel: str, message: str) -> int:
+        """
+        Sends a message to the subscribers of a channel and of the patterns
+        matching it. Subscribers that read too slowly are dropped.
+
+        Args:
+            channel (str): The channel.
+            message (str): The message.
+
+        Returns:
+            int: The number of deliveries, one per matching subscription.
+        """
+        with self._lock:
+            deliveries = []
+            subscribers = self._channels.get(channel)
+            if subscribers:
+                deliveries.append((
+                    RESP_SERIALIZER.serialize(["message", channel, message]),
+                    list(subscribers)))
+            for pattern in self._matching_patterns(channel):
+                deliveries.append((
+                    RESP_SERIALIZER.serialize(["pmessage", pattern, channel, message]),
+                    list(self._patterns[pattern][1])))
+
+        limit = self.output_buffer_limit
+        count = 0
+        dropped = []
+        for serialized, subscribers in deliveries:
+            count += len(subscribers)
+            for subscriber in subscribers:
+                if not subscriber.deliver(serialized, limit):
+                    dropped.append(subscriber)
+        for subscriber in dropped:
+            self.unsubscribe_all(subscriber)
+        return count
+
+    def _matching_patterns(self, channel: str) -> tuple[str, ...]:
+        """
+        Returns the patterns matching a channel. The caller holds the lock.
+
+        Args:
+            channel (str): The channel.
+
+        Returns:
+            tuple[str, ...]: The patterns, in subscription order.
+        """
+        if not self._patterns:
+            return ()
+        matches = self._matches.get(channel)
+        if matches is None:
+            if len(self._matches) >= PATTERN_MATCH_CACHE_SIZE:
+                self._matches.clear()
+            matches = self._matches[channel] = tuple(
+                pattern for pattern, (match, _) in self._patterns.items()
+                if match(channel))
+        return matches
+
+    def channels(self, pattern: Optional[str] = None) -> list[str]:
+        """
+        Returns the channels with at least one subscriber.
+
+        Args:
+            pattern (Optional[str]): Only return the channels matching this pattern.
+
+        Returns:
+            list[str]: The channels.
+        """
+        with self._lock:
+            channels = list(self._channels)
+        if pattern is None:
+            return channels
+        match = compile_glob(pattern)
+        return [channel for channel in channels if match(channel)]
+
+    def numsub(self, channel: str) -> int:
+        """
+        Returns the number of subscribers of a channel, patterns not included.
+
+        Args:
+            channel (str): The channel.
+
+        Returns:
+            int: The number of subscribers.
+        """
+        with self._lock:
+            return len(self._channels.get(channel, ()))
+
+    def numpat(self) -> int:
+        """
+        Returns the number of patterns with at least one subscriber.
+
+        Returns:
+            int: The number of patterns.
+        """
+        return len(self._patterns)
+
+
+PUBSUB = PubSub()
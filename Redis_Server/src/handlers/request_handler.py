@@ -3,24 +3,109 @@ This module handles the processing of incoming Redis-like client requests. It pa
 the RESP (Redis Serialization Protocol) data, identifies the appropriate command handler, 
 and executes the command to generate a response.
 
+Requests are parsed with the offset-based `RespBufferParser`, which keeps values as
+bytes. The command name is looked up in the command table as received (see
+`src.commands.command_spec`), the arity is checked there, and the arguments are
+decoded to text once and parsed once, when the command object is created.
+
+When the server runs as several worker processes, commands on keys owned by
+another worker are redirected with a MOVED error before they run.
+
+Once the dataset outgrows `--maxmemory`, keys are evicted before running commands
+that may use more memory; evictions are logged to the append-only file as DEL.
+Those commands are refused with an OOM error if nothing can be evicted.
+
+Commands run while holding the locks of the keyspace shards of their keys, so
+read-modify-write commands are atomic when clients are served from several threads.
+Every command is timed and counted in `SERVER_STATS` (see
+`src.handlers.server_stats`), along with the calls that failed or were rejected;
+commands slower than the slow log threshold are added to `SLOW_LOG` (see
+`src.handlers.slow_log`) with the address of their client.
+Commands that modify the database are propagated to the append-only file once they
+have run successfully, still under those locks so the log records them in the order
+they were applied; callers `commit` the AOF before sending the replies.
+
+MULTI queues the following commands of a connection in its `Transaction` state
+(see `src.handlers.transactions`) until EXEC runs them while holding the shard
+locks of all their keys, unless a key watched with WATCH changed meanwhile.
+
+SUBSCRIBE and PSUBSCRIBE register the `Subscriber` state of a connection in
+`PUBSUB` (see `src.handlers.pubsub`); like in Redis, a subscribed connection may
+then only run the subscription commands and PING until it unsubscribes.
+
+Blocking commands such as BLPOP that find nothing to pop block the client (see
+`src.handlers.blocked_clients`). Write commands signal the keys blocked clients
+wait for as ready, and once their locks are released, the waiting commands are
+run again in the order the clients blocked and propagated like regular commands.
+Depending on the connection model, `process_commands` either parks the calling
+thread until the client is unblocked, or hands the blocked client and the rest
+of the batch over to the caller.
+
 It includes robust error handling for Redis-specific exceptions to ensure reliable 
 request processing.
 
 Functions:
-    - process_request: Main entry point for handling client requests.
+    - process_request: Main entry point for handling a single client request.
+    - process_commands: Executes a batch of already parsed (pipelined) commands.
+    - reply_to_unblocked: Writes the reply of a client unblocked after blocking.
+    - load_append_only_file: Rebuilds the database by replaying an append-only file.
     - _handle_request: Internal function to parse and execute the command.
+    - _decode_request: Internal function to decode a parsed command to text.
+    - _command_name: Internal function to decode a command name missing from the
+      command table.
+    - _execute_command: Internal function to dispatch and execute a parsed command.
+    - _run_command: Internal function to run a command under the locks of its keys.
+    - _timed_execute: Internal function to run a command, record its statistics
+      and log it if it was slow.
+    - _log_slow_command: Internal function to add a slow command to the slow log.
+    - _queue_command: Internal function to queue a command after MULTI.
+    - _multi / _exec / _discard / _watch / _unwatch: Internal functions running the
+      transaction commands.
+    - _subscribe / _unsubscribe / _psubscribe / _punsubscribe: Internal functions
+      running the subscription commands.
+    - _propagate: Internal function to log a successful write command.
+    - _perform_evictions: Internal function to free memory before a command runs.
+    - _propagate_eviction: Internal function to log an evicted key.
+    - _block_client: Internal function to block a client on the keys of its command.
+    - _serve_blocked_client: Internal function to run the command of a blocked client.
 """
 
 import logging
+import threading
+import time
+from time import perf_counter_ns
+from typing import Callable, Optional
 
-from src.commands import get_command_handler
-from src.exceptions.redis_exceptions import RedisServerException
-from src.redis_protocol.deserialization_handler import RespDeserializer
-from src.redis_protocol.serialization_handler import RespSerializer
+from src.commands import get_command_handler, lookup_command
+from src.commands.command_spec import CommandSpec
+from src.handlers.blocked_clients import BLOCKED_CLIENTS, BlockedClient
+from src.handlers.pubsub import PUBSUB, Subscriber
+from src.handlers.server_stats import SERVER_STATS
+from src.handlers.slow_log import SLOW_LOG
+from src.handlers.transactions import Transaction
+from src.handlers.worker_router import WORKER_ROUTER
+from src.constants.redis_protocol import CRLF, DEFAULT_ENCODING, ESCAPED_CRLF
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    ExecAbortException,
+    InvalidCommandSyntaxError,
+    OutOfMemoryException,
+    RedisServerException,
+    RespParsingError,
+    RespProtocolError,
+)
+from src.redisDB.append_only_file import APPEND_ONLY_FILE, read_commands
+from src.redisDB.redis_db import REDIS_DB
+from src.redis_protocol.buffer_parser import RespBufferParser
+from src.redis_protocol.serialization_handler import RESP_SERIALIZER, MultipleReplies
 
 
 logger = logging.getLogger(__name__)
 
+# The address of the client whose commands the current thread runs, for the slow
+# log; set by `process_commands` for each batch.
+_client = threading.local()
+
 
 def _handle_request(data: bytes) -> list:
     """
@@ -35,13 +120,507 @@ def _handle_request(data: bytes) -> list:
     Raises:
         RedisServerException: If an error occurs during command execution.
     """
-    fixed_data = data.decode('utf-8').replace('\\r\\n', '\r\n').encode('utf-8')
+    if ESCAPED_CRLF in data:
+        data = data.replace(ESCAPED_CRLF, CRLF)
+
+    with RespBufferParser(data) as parser:
+        request = parser.parse()
+
+    return _execute_command(request, transaction=Transaction())
+
+
+def _decode_request(request: list) -> list[str]:
+    """
+    Decode the raw command name or arguments of a request to text.
+
+    The RESP parser keeps every value as bytes; this is the single point where
+    they are turned into the strings the command handlers operate on.
+
+    Args:
+        request (list): Items of the request, as bytes.
+
+    Returns:
+        list[str]: The decoded items.
+
+    Raises:
+        RespParsingError: If an argument is not a string or not valid text.
+    """
+    try:
+        return [
+            item.decode(DEFAULT_ENCODING) if isinstance(item, bytes) else item
+            for item in request
+        ]
+    except UnicodeDecodeError as e:
+        raise RespParsingError(
+            f"ERR Protocol error: invalid {DEFAULT_ENCODING} argument") from e
+
+
+def _execute_command(
+    request: list,
+    can_block: bool = True,
+    transaction: Optional[Transaction] = None,
+    subscriber: Optional[Subscriber] = None,
+) -> list | BlockedClient:
+    """
+    Dispatch and execute a single deserialized Redis command.
 
-    command, *arguments = RespDeserializer(data=fixed_data).deserialize()
+    Args:
+        request (list): The command name followed by its arguments.
+        can_block (bool): Whether a blocking command may block the client; if not,
+                          it replies like its non-blocking variant (e.g. when the
+                          append-only file is replayed).
+        transaction (Optional[Transaction]): The transaction state of the client;
+                                             without it, MULTI and the related
+                                             commands are unknown.
+        subscriber (Optional[Subscriber]): The Pub/Sub state of the client;
+                                           without it, SUBSCRIBE and the related
+                                           commands are unknown.
+
+    Returns:
+        list | BlockedClient: The result of executing the Redis command, or the
+                              blocked client if the command blocked.
+
+    Raises:
+        RedisServerException: If an error occurs during command execution.
+    """
+    if not isinstance(request, list) or not request:
+        raise RespProtocolError("ERR Protocol error: expected a command array")
+
+    spec = lookup_command(request[0])
+    arguments = _decode_request(request[1:])
+
+    if subscriber is not None:
+        if spec is None:
+            pubsub_command = _PUBSUB_COMMANDS.get(_command_name(request))
+            if pubsub_command is not None:
+                return pubsub_command(subscriber, arguments)
+        if (subscriber.channels or subscriber.patterns) and (
+                spec is None or spec.name != "PING"):
+            name = spec.name if spec is not None else _command_name(request)
+            raise CommandProcessingException(
+                f"ERR Can't execute '{str(name).lower()}': only (P)SUBSCRIBE / "
+                "(P)UNSUBSCRIBE / PING are allowed in this context")
+
+    if transaction is not None:
+        if spec is None:
+            transaction_command = _TRANSACTION_COMMANDS.get(_command_name(request))
+            if transaction_command is not None:
+                return transaction_command(transaction, arguments)
+        if transaction.active:
+            return _queue_command(transaction, spec, arguments, request)
+
+    if spec is None:
+        # Raises UnknownCommandException, with the name as the client sent it.
+        get_command_handler(_decode_request(request[:1])[0])
+    try:
+        command_handler = spec.parse(arguments)
+        keys = command_handler.get_keys()
+        if WORKER_ROUTER.enabled:
+            WORKER_ROUTER.check(keys)
+        if spec.deny_oom and REDIS_DB.maxmemory:
+            _perform_evictions()
+    except RedisServerException:
+        spec.stats.rejected_calls += 1
+        raise
+
+    with REDIS_DB.locked(keys):
+        result = _run_command(command_handler, request, keys, can_block)
+
+    if BLOCKED_CLIENTS.has_ready_keys:
+        BLOCKED_CLIENTS.serve_ready_keys(_serve_blocked_client)
+    return result
+
+
+def _run_command(command_handler, request: list, keys: list[str], can_block: bool,
+                 propagated: Optional[list] = None):
+    """
+    Run a parsed command, then block its client or propagate it. The caller holds
+    the locks of the keys of the command.
+
+    Args:
+        command_handler (RedisCommand): The command.
+        request (list): The command as received from the client.
+        keys (list[str]): The keys of the command.
+        can_block (bool): Whether a blocking command may block the client.
+        propagated (Optional[list]): Collects the command to log instead of
+                                     appending it to the append-only file.
+
+    Returns:
+        The result of the command, or the blocked client if the command blocked.
+
+    Raises:
+        RedisServerException: If the command fails.
+    """
+    result = _timed_execute(command_handler)
 
-    command_handler = get_command_handler(command)
+    if result is None and command_handler.IS_BLOCKING:
+        return _block_client(command_handler, keys) if can_block else None
+    if command_handler.IS_WRITE_COMMAND:
+        _propagate(command_handler, request, propagated)
+        if BLOCKED_CLIENTS.blocked_count:
+            BLOCKED_CLIENTS.signal_keys_as_ready(keys)
+    return result
 
-    return command_handler(arguments).execute()
+
+def _command_name(request: list) -> Optional[str]:
+    """
+    Decode the command name of a request that is not in the command table and
+    convert it to upper case.
+
+    Args:
+        request (list): The command name followed by its arguments.
+
+    Returns:
+        Optional[str]: The command name in upper case, or None if it is not text.
+    """
+    command = _decode_request(request[:1])[0]
+    return command.upper() if type(command) is str else None
+
+
+def _timed_execute(command_handler, client_address: Optional[str] = None):
+    """
+    Run a command, record how long it took in the server statistics and add it
+    to the slow log if it took longer than the threshold.
+
+    Args:
+        command_handler (RedisCommand): The command.
+        client_address (Optional[str]): The address of the client of the command;
+                                        by default, the client of the batch the
+                                        current thread runs.
+
+    Returns:
+        The result of the command.
+
+    Raises:
+        RedisServerException: If the command fails.
+    """
+    started = perf_counter_ns()
+    try:
+        result = command_handler.execute()
+    except RedisServerException:
+        elapsed = perf_counter_ns() - started
+        SERVER_STATS.record(command_handler, elapsed, failed=True)
+        if elapsed > SLOW_LOG.threshold_ns:
+            _log_slow_command(command_handler, elapsed, client_address)
+        raise
+    elapsed = perf_counter_ns() - started
+    SERVER_STATS.record(command_handler, elapsed)
+    if elapsed > SLOW_LOG.threshold_ns:
+        _log_slow_command(command_handler, elapsed, client_address)
+    return result
+
+
+def _log_slow_command(command_handler, nanoseconds: int,
+                      client_address: Optional[str]) -> None:
+    """
+    Add a command that took longer than the threshold to the slow log.
+
+    Args:
+        command_handler (RedisCommand): The command.
+        nanoseconds (int): How long it took.
+        client_address (Optional[str]): The address of its client, or None for the
+                                        client of the current thread.
+    """
+    if client_address is None:
+        client_address = getattr(_client, "address", "")
+    SLOW_LOG.add(SERVER_STATS.command_name(command_handler),
+                 command_handler.get_arguments(), nanoseconds, client_address)
+
+
+def _queue_command(transaction: Transaction, spec: Optional[CommandSpec],
+                   arguments: list[str], request: list) -> str:
+    """
+    Parse a command sent after MULTI and queue it until EXEC.
+
+    Args:
+        transaction (Transaction): The transaction of the client.
+        spec (Optional[CommandSpec]): The entry of the command in the command
+                                      table, or None if it is unknown.
+        arguments (list[str]): The decoded arguments.
+        request (list): The command as received, to propagate once it runs.
+
+    Returns:
+        str: "QUEUED".
+
+    Raises:
+        RedisServerException: If the command is unknown or invalid, which also
+                              makes EXEC abort.
+    """
+    try:
+        if spec is None:
+            get_command_handler(_decode_request(request[:1])[0])
+        command_handler = spec.parse(arguments)
+        if WORKER_ROUTER.enabled:
+            WORKER_ROUTER.check(command_handler.get_keys())
+    except RedisServerException:
+        transaction.failed = True
+        if spec is not None:
+            spec.stats.rejected_calls += 1
+        raise
+    transaction.queue(command_handler, request)
+    return "QUEUED"
+
+
+def _multi(transaction: Transaction, arguments: list[str]) -> str:
+    """
+    Start a transaction (MULTI).
+    """
+    if arguments:
+        raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+    if transaction.active:
+        raise CommandProcessingException("ERR MULTI calls can not be nested")
+    transaction.begin()
+    return "OK"
+
+
+def _exec(transaction: Transaction, arguments: list[str]) -> list | None:
+    """
+    Run the queued commands of a transaction atomically (EXEC).
+
+    The locks of the shards of every queued and watched key are taken once and
+    held until the last command ran. Like in Redis, the commands are logged to
+    the append-only file between MULTI and EXEC, so replaying a log cut in the
+    middle of a transaction does not apply half of it. The block is appended in
+    one piece once the commands ran, so that no write of another client, on
+    other shards, lands inside it.
+
+    Returns:
+        list | None: The result or error of each command, or None if a watched
+                     key changed.
+
+    Raises:
+        ExecAbortException: If a command failed to queue.
+        OutOfMemoryException: If a command may use more memory and none can be freed.
+    """
+    if arguments:
+        raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+    if not transaction.active:
+        raise CommandProcessingException("ERR EXEC without MULTI")
+    try:
+        if transaction.failed:
+            raise ExecAbortException(
+                "EXECABORT Transaction discarded because of previous errors.")
+        queued = transaction.queued
+        keys = list(transaction.watched)
+        for command_handler, _ in queued:
+            keys += command_handler.get_keys()
+        if REDIS_DB.maxmemory and any(handler.DENY_OOM for handler, _ in queued):
+            _perform_evictions()
+
+        with REDIS_DB.locked(keys):
+            if transaction.is_dirty():
+                return None
+            propagated = [["MULTI"]] if APPEND_ONLY_FILE.enabled else None
+            results = []
+            try:
+                for command_handler, request in queued:
+                    try:
+                        results.append(_run_command(
+                            command_handler, request, command_handler.get_keys(), False,
+                            propagated))
+                    except RedisServerException as exc:
+                        results.append(exc)
+                    except Exception as exc:
+                        # Like Redis, one failing command does not stop the others.
+                        logger.exception("Error while executing a queued command: %s", exc)
+                        results.append(CommandProcessingException(f"ERR {exc}"))
+            finally:
+                # Log the writes that ran even if one command raised unexpectedly.
+                if propagated is not None and len(propagated) > 1:
+                    propagated.append(["EXEC"])
+                    APPEND_ONLY_FILE.append_all(propagated)
+    finally:
+        transaction.reset()
+
+    if BLOCKED_CLIENTS.has_ready_keys:
+        BLOCKED_CLIENTS.serve_ready_keys(_serve_blocked_client)
+    return results
+
+
+def _discard(transaction: Transaction, arguments: list[str]) -> str:
+    """
+    Drop the queued commands of a transaction (DISCARD).
+    """
+    if arguments:
+        raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+    if not transaction.active:
+        raise CommandProcessingException("ERR DISCARD without MULTI")
+    transaction.reset()
+    return "OK"
+
+
+def _watch(transaction: Transaction, arguments: list[str]) -> str:
+    """
+    Watch keys, so that the next EXEC aborts if one of them changes (WATCH).
+    """
+    if not arguments:
+        raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+    if transaction.active:
+        raise CommandProcessingException("ERR WATCH inside MULTI is not allowed")
+    if WORKER_ROUTER.enabled:
+        WORKER_ROUTER.check(arguments)
+    transaction.watch(arguments)
+    return "OK"
+
+
+def _unwatch(transaction: Transaction, arguments: list[str]) -> str:
+    """
+    Forget the watched keys (UNWATCH).
+    """
+    if arguments:
+        raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+    transaction.unwatch()
+    return "OK"
+
+
+# Commands acting on the transaction state of the client rather than on the
+# database; they are never queued.
+_TRANSACTION_COMMANDS = {
+    "MULTI": _multi,
+    "EXEC": _exec,
+    "DISCARD": _discard,
+    "WATCH": _watch,
+    "UNWATCH": _unwatch,
+}
+
+
+def _subscribe(subscriber: Subscriber, arguments: list[str]) -> MultipleReplies:
+    """
+    Subscribe the client to channels (SUBSCRIBE), confirming each of them.
+    """
+    if not arguments:
+        raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+    return MultipleReplies(["subscribe", channel, PUBSUB.subscribe(subscriber, channel)]
+                           for channel in arguments)
+
+
+def _unsubscribe(subscriber: Subscriber, arguments: list[str]) -> MultipleReplies:
+    """
+    Unsubscribe the client from channels, all of them without arguments
+    (UNSUBSCRIBE), confirming each of them.
+    """
+    channels = arguments or sorted(subscriber.channels)
+    if not channels:
+        return MultipleReplies([["unsubscribe", None, subscriber.subscriptions]])
+    return MultipleReplies(["unsubscribe", channel, PUBSUB.unsubscribe(subscriber, channel)]
+                           for channel in channels)
+
+
+def _psubscribe(subscriber: Subscriber, arguments: list[str]) -> MultipleReplies:
+    """
+    Subscribe the client to the channels matching patterns (PSUBSCRIBE),
+    confirming each of them.
+    """
+    if not arguments:
+        raise InvalidCommandSyntaxError("ERR wrong number of arguments for command")
+    return MultipleReplies(["psubscribe", pattern, PUBSUB.psubscribe(subscriber, pattern)]
+                           for pattern in arguments)
+
+
+def _punsubscribe(subscriber: Subscriber, arguments: list[str]) -> MultipleReplies:
+    """
+    Unsubscribe the client from patterns, all of them without arguments
+    (PUNSUBSCRIBE), confirming each of them.
+    """
+    patterns = arguments or sorted(subscriber.patterns)
+    if not patterns:
+        return MultipleReplies([["punsubscribe", None, subscriber.subscriptions]])
+    return MultipleReplies(
+        ["punsubscribe", pattern, PUBSUB.punsubscribe(subscriber, pattern)]
+        for pattern in patterns)
+
+
+# Commands acting on the subscriptions of the client rather than on the database.
+_PUBSUB_COMMANDS = {
+    "SUBSCRIBE": _subscribe,
+    "UNSUBSCRIBE": _unsubscribe,
+    "PSUBSCRIBE": _psubscribe,
+    "PUNSUBSCRIBE": _punsubscribe,
+}
+
+
+def _block_client(command_handler, keys: list[str]) -> BlockedClient:
+    """
+    Block the client of a blocking command that found nothing to do. The caller
+    holds the locks of the keys, so no write can be missed.
+
+    Args:
+        command_handler (RedisCommand): The blocking command.
+        keys (list[str]): The keys of the command.
+
+    Returns:
+        BlockedClient: The blocked client.
+    """
+    timeout = command_handler.timeout
+    deadline = time.monotonic() + timeout if timeout else None
+    client = BlockedClient(command_handler, keys, deadline,
+                           getattr(_client, "address", ""))
+    BLOCKED_CLIENTS.block(client, command_handler.get_blocking_keys())
+    return client
+
+
+def _serve_blocked_client(client: BlockedClient) -> list | None:
+    """
+    Run the command of a blocked client again, after one of its keys was signalled
+    as ready. The caller holds the locks of the keys of the command.
+
+    Args:
+        client (BlockedClient): The blocked client.
+
+    Returns:
+        list | None: The result of the command, or None if it would still block.
+
+    Raises:
+        RedisServerException: If the command fails.
+    """
+    command_handler = client.handler
+    result = _timed_execute(command_handler, client.address)
+    if result is not None:
+        _propagate(command_handler, None)
+        BLOCKED_CLIENTS.signal_keys_as_ready(client.keys)
+    return result
+
+
+def _propagate(command_handler, request: list, propagated: Optional[list] = None) -> None:
+    """
+    Log a successfully executed write command to the append-only file.
+
+    Args:
+        command_handler (RedisCommand): The executed command.
+        request (list): The command as received from the client.
+        propagated (Optional[list]): Collects the command to log, e.g. for a
+                                     transaction, instead of appending it.
+    """
+    if APPEND_ONLY_FILE.enabled:
+        command = command_handler.get_propagated_command() or request
+        if propagated is None:
+            APPEND_ONLY_FILE.append(command)
+        else:
+            propagated.append(command)
+
+
+def _propagate_eviction(key: str) -> None:
+    """
+    Log the eviction of a key to the append-only file as a DEL command.
+
+    Args:
+        key (str): The evicted key.
+    """
+    if APPEND_ONLY_FILE.enabled:
+        APPEND_ONLY_FILE.append(["DEL", key])
+
+
+def _perform_evictions() -> None:
+    """
+    Evict keys until the dataset fits in the memory limit.
+
+    Raises:
+        OutOfMemoryException: If the limit is exceeded and the eviction policy
+                              cannot free memory.
+    """
+    if not REDIS_DB.perform_evictions(_propagate_eviction):
+        raise OutOfMemoryException(
+            "OOM command not allowed when used memory > 'maxmemory'.")
 
 
 def process_request(request: bytes) -> bytes:
@@ -56,7 +635,113 @@ def process_request(request: bytes) -> bytes:
     """
     try:
         response = _handle_request(request)
-        return RespSerializer().serialize(response, use_bulk=True)
+        if type(response) is BlockedClient:
+            response = response.wait()
+        APPEND_ONLY_FILE.commit()
+        return RESP_SERIALIZER.serialize(response, use_bulk=True)
     except RedisServerException as exc:
         logger.exception("Redis exception - %s", exc)
-        return RespSerializer().serialize(str(exc), is_error=True)
+        return RESP_SERIALIZER.serialize(str(exc), is_error=True)
+
+
+def process_commands(
+    requests: list,
+    out: bytearray | None = None,
+    on_block: Optional[Callable[[BlockedClient, list], None]] = None,
+    transaction: Optional[Transaction] = None,
+    client_address: str = "",
+    subscriber: Optional[Subscriber] = None,
+) -> bytearray:
+    """
+    Execute a batch of deserialized commands and write all replies to one buffer.
+
+    Pipelined clients send many commands before reading any reply; answering the
+    whole batch with a single buffer lets the server reply with one `sendall`.
+    The caller must `APPEND_ONLY_FILE.commit()` before sending the replies.
+
+    When a command blocks the client, the following commands must not run before
+    it is unblocked. Without `on_block`, the calling thread waits for it; with
+    `on_block`, the batch stops there and the callback gets the blocked client
+    and the commands left, to reply with `reply_to_unblocked` and resume later.
+
+    Args:
+        requests (list): Deserialized commands, each a command name followed by
+                         its arguments, in the order they were received.
+        out (bytearray | None): Buffer to append the replies to, typically the
+                                connection's reusable output buffer. A new buffer
+                                is created when omitted.
+        on_block (Optional[Callable[[BlockedClient, list], None]]): Called when a
+                                command blocks instead of waiting for it.
+        transaction (Optional[Transaction]): The MULTI/EXEC state of the connection,
+                                             kept across batches; a new one lives
+                                             for this batch only when omitted.
+        client_address (str): The "host:port" of the client, for the slow log.
+        subscriber (Optional[Subscriber]): The Pub/Sub state of the connection;
+                                           without it, SUBSCRIBE and the related
+                                           commands are unknown.
+
+    Returns:
+        bytearray: The buffer holding the RESP-encoded replies, in request order.
+    """
+    if out is None:
+        out = bytearray()
+    if transaction is None:
+        transaction = Transaction()
+    _client.address = client_address
+    for index, request in enumerate(requests):
+        try:
+            result = _execute_command(request, transaction=transaction,
+                                      subscriber=subscriber)
+            if type(result) is BlockedClient:
+                if on_block is not None:
+                    on_block(result, requests[index + 1:])
+                    break
+                result = result.wait()
+            RESP_SERIALIZER.serialize_into(out, result, use_bulk=True)
+        except RedisServerException as exc:
+            logger.exception("Redis exception - %s", exc)
+            RESP_SERIALIZER.serialize_into(out, str(exc), is_error=True)
+    return out
+
+
+def reply_to_unblocked(client: BlockedClient, out: bytearray) -> None:
+    """
+    Write the reply of a client that was unblocked to its output buffer.
+
+    Args:
+        client (BlockedClient): The unblocked client.
+        out (bytearray): The output buffer of the client.
+    """
+    if isinstance(client.result, RedisServerException):
+        RESP_SERIALIZER.serialize_into(out, str(client.result), is_error=True)
+    else:
+        RESP_SERIALIZER.serialize_into(out, client.result, use_bulk=True)
+
+
+def load_append_only_file(filename: str) -> int:
+    """
+    Rebuild the database by replaying the commands of an append-only file.
+
+    The current content of the database is discarded first. Call this before
+    opening the AOF for writing, so replayed commands are not logged again.
+
+    Args:
+        filename (str): Path to the append-only file.
+
+    Returns:
+        int: The number of commands replayed.
+    """
+    REDIS_DB.clear()
+    count = 0
+    transaction = Transaction()
+    for request in read_commands(filename):
+        try:
+            _execute_command(request, can_block=False, transaction=transaction)
+        except RedisServerException as exc:
+            logger.warning("Skipping invalid command in append only file: %s", exc)
+        count += 1
+    if transaction.active:
+        logger.warning("Discarding the unfinished transaction at the end of the append only file")
+        transaction.reset()
+    REDIS_DB.reset_dirty()
+    return count
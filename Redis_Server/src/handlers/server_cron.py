@@ -0,0 +1,148 @@
+"""
+This module implements the server cron: a scheduler for periodic background jobs
+such as the active expire cycle.
+
+Jobs are plain callables registered with an interval. A job may return a number of
+seconds to override the delay before its next run (e.g. to run again sooner while it
+still has a backlog of work), or None to keep its regular interval.
+
+The cron can be driven in two ways:
+    - `run_due` runs every job whose time has come; the event-loop server calls it
+      between two `select` calls and uses `seconds_until_next_job` as its timeout.
+    - `start` runs the cron in a daemon thread, for the threaded server.
+
+Exports:
+    - ServerCron: The scheduler class.
+    - SERVER_CRON: The scheduler shared by the server, with the default jobs registered
+      (active key expiration, save points and automatic append-only file rewrites).
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from src.redisDB.append_only_file import APPEND_ONLY_FILE
+from src.redisDB.redis_db import REDIS_DB
+
+logger = logging.getLogger(__name__)
+
+# The active expire cycle runs this many times per second...
+ACTIVE_EXPIRE_CYCLE_HZ = 10
+
+# ...spending at most this share of each period expiring keys (25% of a core, as Redis).
+ACTIVE_EXPIRE_CYCLE_CPU_SHARE = 0.25
+
+# Delay before the next cycle when the previous one ran out of time with expired keys
+# left, so a backlog of expired keys is drained at up to 50% of a core.
+ACTIVE_EXPIRE_CYCLE_FAST_DELAY = 0.025
+
+
+class ServerCron:
+    """
+    Runs registered jobs periodically.
+    """
+
+    def __init__(self):
+        """
+        Initializes a cron with no jobs.
+        """
+        self._jobs: dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, interval: float, job: Callable[[], Optional[float]]) -> None:
+        """
+        Registers (or replaces) a periodic job.
+
+        Args:
+            name (str): Unique name of the job.
+            interval (float): Regular delay between two runs, in seconds.
+            job (Callable): The callable to run; may return an overriding delay.
+        """
+        with self._lock:
+            self._jobs[name] = [job, interval, time.monotonic() + interval]
+
+    def unregister(self, name: str) -> None:
+        """
+        Removes a job.
+
+        Args:
+            name (str): Name of the job to remove.
+        """
+        with self._lock:
+            self._jobs.pop(name, None)
+
+    def seconds_until_next_job(self) -> float:
+        """
+        Returns the time until the next job is due (0 if one is already due).
+        """
+        with self._lock:
+            if not self._jobs:
+                return 1.0
+            next_run = min(entry[2] for entry in self._jobs.values())
+        return max(0.0, next_run - time.monotonic())
+
+    def run_due(self) -> None:
+        """
+        Runs every job whose scheduled time has passed.
+
+        If another thread is already running jobs, this call returns immediately,
+        so a job never runs concurrently with itself.
+        """
+        if not self._run_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.monotonic()
+            with self._lock:
+                due = [(name, entry) for name, entry in self._jobs.items() if entry[2] <= now]
+
+            for name, entry in due:
+                job, interval, _ = entry
+                try:
+                    delay = job()
+                except Exception as e:
+                    logger.exception("Server cron job %s failed: %s", name, e)
+                    delay = None
+                entry[2] = time.monotonic() + (interval if delay is None else delay)
+        finally:
+            self._run_lock.release()
+
+    def start(self) -> None:
+        """
+        Runs the cron in a daemon thread (idempotent).
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run_forever, name="server-cron", daemon=True)
+        self._thread.start()
+
+    def _run_forever(self) -> None:
+        """
+        Thread target: runs due jobs, then sleeps until the next one is due.
+        """
+        while True:
+            self.run_due()
+            time.sleep(self.seconds_until_next_job())
+
+
+def active_expire_cycle() -> Optional[float]:
+    """
+    Cron job deleting expired keys, bounded to a share of each cron period.
+
+    Returns:
+        Optional[float]: A short delay if expired keys remain after the time budget
+                         ran out, otherwise None to keep the regular interval.
+    """
+    time_budget_ms = 1000 / ACTIVE_EXPIRE_CYCLE_HZ * ACTIVE_EXPIRE_CYCLE_CPU_SHARE
+    if REDIS_DB.active_expire_cycle(time_budget_ms):
+        return ACTIVE_EXPIRE_CYCLE_FAST_DELAY
+    return None
+
+
+SERVER_CRON = ServerCron()
+SERVER_CRON.register("active-expire", 1 / ACTIVE_EXPIRE_CYCLE_HZ, active_expire_cycle)
+SERVER_CRON.register("auto-save", 1.0, REDIS_DB.background_save_if_needed)
+SERVER_CRON.register("aof-auto-rewrite", 1.0, APPEND_ONLY_FILE.rewrite_if_grown)
@@ -0,0 +1,198 @@
+"""
+This module defines `ServerStats`, the statistics reported by INFO and LATENCY.
+
+- Per command, like the `commandstats` section of Redis: the number of calls,
+  the time spent running them, calls that failed with an error, calls rejected
+  before they ran (wrong arguments, MOVED, OOM), and a histogram of their latencies
+  (see `src.utils.latency_histogram`).
+- Per server: connected clients and connections received since startup.
+
+The request handler times the `execute` of every command with `perf_counter_ns`
+and records it in the entry of the command, found by command class. Calls, time
+and errors are always counted; with `latency_sample_rate` set to N, only one call
+in N is added to the latency histogram (0 turns histograms off), which trims the
+cost of recording on servers running very cheap commands. Counters are updated
+without a lock, so the threaded server may rarely lose an update when two threads
+run the same command at once; statistics do not need to be exact, and taking a
+lock on every command would serialize unrelated commands.
+
+Exports:
+    - CommandStat: The statistics of one command.
+    - ServerStats: The statistics of the server.
+    - SERVER_STATS: The statistics shared by the server.
+"""
+
+import threading
+import time
+
+from src.utils.latency_histogram import LatencyHistogram
+
+
+class CommandStat:
+    """
+    The statistics of one command.
+
+    Attributes:
+        name (str): The command name, in upper case.
+        calls (int): The number of times the command ran.
+        nanoseconds (int): The total time spent running it.
+        failed_calls (int): Calls that ran and failed with an error.
+        rejected_calls (int): Calls refused before running.
+        histogram (LatencyHistogram): The latencies of the calls, in microseconds.
+    """
+
+    __slots__ = ("name", "calls", "nanoseconds", "failed_calls", "rejected_calls",
+                 "histogram")
+
+    def __init__(self, name: str):
+        """
+        Initializes the statistics of a command that never ran.
+
+        Args:
+            name (str): The command name.
+        """
+        self.name = name
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forgets every call.
+        """
+        self.calls = 0
+        self.nanoseconds = 0
+        self.failed_calls = 0
+        self.rejected_calls = 0
+        self.histogram = LatencyHistogram()
+
+
+class ServerStats:
+    """
+    The statistics of the server.
+
+    Attributes:
+        start_time (float): When the server started, as a UNIX timestamp.
+        connected_clients (int): The number of open client connections.
+        total_connections_received (int): Connections accepted since startup.
+        latency_sample_rate (int): Add one call in this many to the latency
+                                   histograms, 0 to keep no histograms.
+    """
+
+    def __init__(self, latency_sample_rate: int = 1):
+        """
+        Initializes the statistics of a server without clients.
+
+        Args:
+            latency_sample_rate (int): Add one call in this many to the latency
+                                       histograms, 0 to keep no histograms.
+        """
+        self._lock = threading.Lock()
+        self._commands: dict[type, CommandStat] = {}
+        self.start_time = time.time()
+        self.connected_clients = 0
+        self.total_connections_received = 0
+        self.latency_sample_rate = latency_sample_rate
+
+    def register(self, name: str, command_class: type) -> CommandStat:
+        """
+        Creates the statistics of a command.
+
+        Args:
+            name (str): The command name.
+            command_class (type): The class implementing the command.
+
+        Returns:
+            CommandStat: The statistics of the command.
+        """
+        stat = self._commands[command_class] = CommandStat(name)
+        return stat
+
+    def record(self, command_handler, nanoseconds: int, failed: bool = False) -> None:
+        """
+        Counts a call of a command.
+
+        Args:
+            command_handler (RedisCommand): The command that ran.
+            nanoseconds (int): How long it took.
+            failed (bool): Whether it failed with an error.
+        """
+        stat = self._commands.get(type(command_handler))
+        if stat is None:
+            return
+        stat.calls += 1
+        stat.nanoseconds += nanoseconds
+        if failed:
+            stat.failed_calls += 1
+        rate = self.latency_sample_rate
+        if rate and not stat.calls % rate:
+            stat.histogram.record(nanoseconds // 1000)
+
+    def commands(self) -> list[CommandStat]:
+        """
+        Returns the statistics of the commands that were called, by name.
+
+        Returns:
+            list[CommandStat]: The statistics.
+        """
+        return sorted((stat for stat in self._commands.values()
+                       if stat.calls or stat.rejected_calls),
+                      key=lambda stat: stat.name)
+
+    def command(self, name: str) -> CommandStat | None:
+        """
+        Returns the statistics of a command.
+
+        Args:
+            name (str): The command name, in any case.
+
+        Returns:
+            CommandStat | None: The statistics, or None if the command is unknown.
+        """
+        name = name.upper()
+        return next((stat for stat in self._commands.values() if stat.name == name), None)
+
+    def command_name(self, command_handler) -> str:
+        """
+        Returns the name of a command.
+
+        Args:
+            command_handler (RedisCommand): The command.
+
+        Returns:
+            str: The command name, in upper case.
+        """
+        stat = self._commands.get(type(command_handler))
+        return stat.name if stat is not None else type(command_handler).__name__
+
+    @property
+    def total_commands_processed(self) -> int:
+        """
+        The number of commands run since startup.
+        """
+        return sum(stat.calls for stat in self._commands.values())
+
+    def client_connected(self) -> None:
+        """
+        Counts a new client connection.
+        """
+        with self._lock:
+            self.connected_clients += 1
+            self.total_connections_received += 1
+
+    def client_disconnected(self) -> None:
+        """
+        Counts a closed client connection.
+        """
+        with self._lock:
+            self.connected_clients -= 1
+
+    def reset(self) -> None:
+        """
+        Forgets the statistics of every command and the connections received.
+        """
+        for stat in self._commands.values():
+            stat.reset()
+        with self._lock:
+            self.total_connections_received = self.connected_clients
+
+
+SERVER_STATS = ServerStats()
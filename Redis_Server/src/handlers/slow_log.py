@@ -0,0 +1,189 @@
+"""
+This module defines `SlowLog`, the log of commands that took longer than a
+threshold, read with SLOWLOG GET.
+
+Like in Redis:
+
+- The request handler times the `execute` of every command (see
+  `src.handlers.server_stats`); commands slower than `threshold_us` microseconds
+  are added with their arguments, the address of the client and their duration.
+  A threshold of 0 logs every command, a negative one turns the log off.
+- Entries are kept in a ring buffer of `max_len` entries: once it is full, each
+  new entry pushes out the oldest one, so the log uses bounded memory however
+  many slow commands run. Entries get increasing ids, so a client polling the
+  log can tell which entries it has seen.
+- Long argument lists and long arguments are truncated, so a huge DEL or MSET
+  does not keep its whole request alive in the log.
+
+The slowness check is one comparison, done for every command; entries are only
+built for the rare slow ones.
+
+Exports:
+    - SlowLogEntry: A command logged as slow.
+    - SlowLog: The ring buffer of slow commands.
+    - SLOW_LOG: The slow log shared by the server.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+
+# Default threshold and length, as in redis.conf.
+DEFAULT_SLOWLOG_THRESHOLD_US = 10000
+DEFAULT_SLOWLOG_MAX_LEN = 128
+
+# Arguments kept per entry, and characters kept per argument.
+SLOWLOG_ENTRY_MAX_ARGC = 32
+SLOWLOG_ENTRY_MAX_STRING = 128
+
+
+class SlowLogEntry:
+    """
+    A command logged as slow.
+
+    Attributes:
+        id (int): The unique, increasing id of the entry.
+        timestamp (int): When the command ran, as a UNIX timestamp.
+        duration_us (int): How long it took, in microseconds.
+        arguments (list[str]): The command name and its (truncated) arguments.
+        client_address (str): The "host:port" of the client, empty if unknown.
+    """
+
+    __slots__ = ("id", "timestamp", "duration_us", "arguments", "client_address")
+
+    def __init__(self, entry_id: int, duration_us: int, arguments: list[str],
+                 client_address: str):
+        """
+        Initializes an entry for a command that just ran.
+
+        Args:
+            entry_id (int): The id of the entry.
+            duration_us (int): How long the command took, in microseconds.
+            arguments (list[str]): The command name and its truncated arguments.
+            client_address (str): The address of the client.
+        """
+        self.id = entry_id
+        self.timestamp = int(time.time())
+        self.duration_us = duration_us
+        self.arguments = arguments
+        self.client_address = client_address
+
+    def to_reply(self) -> list:
+        """
+        Returns the entry the way SLOWLOG GET replies it.
+
+        Returns:
+            list: The id, timestamp, duration, arguments, client address and
+                  client name (always empty).
+        """
+        return [self.id, self.timestamp, self.duration_us, self.arguments,
+                self.client_address, ""]
+
+
+def truncate_arguments(name: str, arguments: list[str]) -> list[str]:
+    """
+    Returns the command name and arguments as a slow log entry keeps them.
+
+    Args:
+        name (str): The command name.
+        arguments (list[str]): The arguments of the command.
+
+    Returns:
+        list[str]: At most SLOWLOG_ENTRY_MAX_ARGC items of at most
+                   SLOWLOG_ENTRY_MAX_STRING characters, the last item telling how
+                   many arguments were left out.
+    """
+    items = [name, *arguments[:SLOWLOG_ENTRY_MAX_ARGC - 1]]
+    if len(arguments) >= SLOWLOG_ENTRY_MAX_ARGC:
+        items[-1] = f"... ({len(arguments) - SLOWLOG_ENTRY_MAX_ARGC + 2} more arguments)"
+    for index, item in enumerate(items):
+        if len(item) > SLOWLOG_ENTRY_MAX_STRING:
+            items[index] = (f"{item[:SLOWLOG_ENTRY_MAX_STRING]}... "
+                            f"({len(item) - SLOWLOG_ENTRY_MAX_STRING} more bytes)")
+    return items
+
+
+class SlowLog:
+    """
+    The ring buffer of slow commands.
+
+    Attributes:
+        threshold_ns (float): Commands taking longer than this are logged, in
+                              nanoseconds; infinite when the log is off.
+    """
+
+    def __init__(self, threshold_us: int = DEFAULT_SLOWLOG_THRESHOLD_US,
+                 max_len: int = DEFAULT_SLOWLOG_MAX_LEN):
+        """
+        Initializes an empty slow log.
+
+        Args:
+            threshold_us (int): Log commands slower than this, in microseconds; 0
+                                logs every command, a negative value none.
+            max_len (int): The number of entries kept.
+        """
+        self._entries: deque[SlowLogEntry] = deque(maxlen=max_len)
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self.threshold_ns: float = float("inf")
+        self.configure(threshold_us, max_len)
+
+    def configure(self, threshold_us: int, max_len: int) -> None:
+        """
+        Sets the threshold and the length of the log, keeping the newest entries.
+
+        Args:
+            threshold_us (int): Log commands slower than this, in microseconds; 0
+                                logs every command, a negative value none.
+            max_len (int): The number of entries kept.
+        """
+        self.threshold_ns = threshold_us * 1000 if threshold_us >= 0 else float("inf")
+        with self._lock:
+            self._entries = deque(self._entries, maxlen=max_len)
+
+    def add(self, name: str, arguments: list[str], nanoseconds: int,
+            client_address: str = "") -> None:
+        """
+        Logs a slow command.
+
+        Args:
+            name (str): The command name.
+            arguments (list[str]): The arguments of the command.
+            nanoseconds (int): How long it took.
+            client_address (str): The address of the client, if known.
+        """
+        arguments = truncate_arguments(name, arguments)
+        with self._lock:
+            self._entries.append(SlowLogEntry(
+                next(self._ids), nanoseconds // 1000, arguments, client_address))
+
+    def get(self, count: int = 10) -> list[SlowLogEntry]:
+        """
+        Returns the newest entries, newest first.
+
+        Args:
+            count (int): The number of entries, or a negative number for all.
+
+        Returns:
+            list[SlowLogEntry]: The entries.
+        """
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries if count < 0 else entries[:count]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries in the log.
+        """
+        return len(self._entries)
+
+    def reset(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+SLOW_LOG = SlowLog()
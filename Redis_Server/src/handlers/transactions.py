@@ -0,0 +1,103 @@
+"""
+This module defines `Transaction`, the MULTI/EXEC state of a client connection.
+
+Like in Redis:
+
+- After MULTI, commands are parsed (so syntax errors are reported right away)
+  and queued instead of being run; the client gets QUEUED for each of them.
+- EXEC runs the queued commands one after the other while holding the locks of
+  the shards of all their keys, so no other client sees or changes their keys
+  in between. A command failing at run time does not stop the others: its error
+  is part of the EXEC reply. A command that failed to queue discards the whole
+  transaction (EXECABORT).
+- WATCH implements optimistic locking: each watched key has a version counter in
+  `RedisDB`, bumped by every change (including expiration and eviction), and
+  EXEC aborts with a null reply if any watched key changed since it was watched.
+
+The request handler owns the logic; this class only keeps the state of one
+connection. It uses `__slots__` like the other per-connection state.
+
+Exports:
+    - Transaction: The transaction state of a client connection.
+"""
+
+from src.redisDB.redis_db import REDIS_DB
+
+
+class Transaction:
+    """
+    The MULTI/EXEC state of a client connection.
+
+    Attributes:
+        active (bool): Whether MULTI was called and commands are being queued.
+        queued (list): The queued commands, each a `(command handler, request)` pair.
+        failed (bool): Whether a command failed to queue, so EXEC must abort.
+        watched (dict[str, int]): The version of each watched key when it was watched.
+    """
+
+    __slots__ = ("active", "queued", "failed", "watched")
+
+    def __init__(self):
+        """
+        Initializes the state of a connection outside of any transaction.
+        """
+        self.active = False
+        self.queued: list = []
+        self.failed = False
+        self.watched: dict[str, int] = {}
+
+    def begin(self) -> None:
+        """
+        Starts queueing commands (MULTI).
+        """
+        self.active = True
+
+    def queue(self, command_handler, request: list) -> None:
+        """
+        Queues a parsed command until EXEC.
+
+        Args:
+            command_handler (RedisCommand): The parsed command.
+            request (list): The command as received, to propagate once it runs.
+        """
+        self.queued.append((command_handler, request))
+
+    def watch(self, keys: list[str]) -> None:
+        """
+        Watches keys; keys watched already keep their first version.
+
+        Args:
+            keys (list[str]): The keys to watch.
+        """
+        for key in keys:
+            if key not in self.watched:
+                self.watched[key] = REDIS_DB.watch(key)
+
+    def unwatch(self) -> None:
+        """
+        Stops watching every key.
+        """
+        for key in self.watched:
+            REDIS_DB.unwatch(key)
+        self.watched.clear()
+
+    def is_dirty(self) -> bool:
+        """
+        Checks whether a watched key changed since it was watched. The caller holds
+        the locks of the watched keys.
+
+        Returns:
+            bool: True if EXEC must abort.
+        """
+        return any(REDIS_DB.key_version(key) != version
+                   for key, version in self.watched.items())
+
+    def reset(self) -> None:
+        """
+        Ends the transaction (EXEC or DISCARD): drops the queued commands and
+        unwatches every key.
+        """
+        self.active = False
+        self.queued = []
+        self.failed = False
+        self.unwatch()
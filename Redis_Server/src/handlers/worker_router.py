@@ -0,0 +1,109 @@
+"""
+This module routes commands between the worker processes of a multi-process
+server (`--workers N`).
+
+Every worker owns a contiguous range of the 16384 hash slots (see
+`src.utils.cluster_utils`). A command whose keys hash to a slot owned by another
+worker is answered with a Redis Cluster style redirection,
+`MOVED <slot> <host>:<port>`, naming the address only that worker listens on,
+so cluster-aware clients resend it there and cache the slot owner. The keys of
+a command must all hash to the same slot, otherwise it fails with CROSSSLOT.
+
+Exports:
+    - WorkerRouter: The slot ownership table of one worker.
+    - WORKER_ROUTER: The router of the current process, disabled unless the
+                     process is a worker.
+"""
+
+from typing import Optional
+
+from src.exceptions.redis_exceptions import CrossSlotException, MovedException
+from src.utils.cluster_utils import CLUSTER_SLOTS, key_hash_slot, slot_ranges
+
+
+class WorkerRouter:
+    """
+    Maps hash slots to the worker owning them and checks commands against it.
+    """
+
+    def __init__(self):
+        """
+        Initializes a disabled router; call `configure` to enable it.
+        """
+        self.worker_id: Optional[int] = None
+        self._addresses: list[tuple[str, int]] = []
+        self._ranges: list[tuple[int, int]] = []
+        self._owners: bytes = b""
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the keyspace is partitioned between workers.
+        """
+        return self.worker_id is not None
+
+    def configure(self, worker_id: int, addresses: list[tuple[str, int]]) -> None:
+        """
+        Enables routing for a worker.
+
+        Args:
+            worker_id (int): Index of the current worker in `addresses`.
+            addresses (list[tuple[str, int]]): The redirection address of every worker.
+
+        Raises:
+            ValueError: If the worker index or the number of workers is invalid.
+        """
+        if not 0 <= worker_id < len(addresses) <= 256:
+            raise ValueError("Invalid worker index or number of workers")
+        self._addresses = list(addresses)
+        self._ranges = slot_ranges(len(addresses))
+        owners = bytearray(CLUSTER_SLOTS)
+        for worker, (first, last) in enumerate(self._ranges):
+            owners[first:last + 1] = bytes([worker]) * (last - first + 1)
+        self._owners = bytes(owners)
+        self.worker_id = worker_id
+
+    def disable(self) -> None:
+        """
+        Disables routing, so every key is served locally.
+        """
+        self.worker_id = None
+
+    def check(self, keys: list[str]) -> None:
+        """
+        Checks that the current worker owns the keys of a command.
+
+        Args:
+            keys (list[str]): The keys of the command.
+
+        Raises:
+            CrossSlotException: If the keys hash to different slots.
+            MovedException: If the slot of the keys is owned by another worker.
+        """
+        if not keys:
+            return
+        slot = key_hash_slot(keys[0])
+        for key in keys[1:]:
+            if key_hash_slot(key) != slot:
+                raise CrossSlotException(
+                    "CROSSSLOT Keys in request don't hash to the same slot")
+        owner = self._owners[slot]
+        if owner != self.worker_id:
+            host, port = self._addresses[owner]
+            raise MovedException(f"MOVED {slot} {host}:{port}")
+
+    def slots(self) -> list:
+        """
+        Describes the slot ranges of every worker, like Redis CLUSTER SLOTS.
+
+        Returns:
+            list: `[first slot, last slot, [host, port, node id]]` for each worker.
+        """
+        return [
+            [first, last, [host, port, f"worker-{worker}"]]
+            for worker, ((first, last), (host, port))
+            in enumerate(zip(self._ranges, self._addresses))
+        ]
+
+
+WORKER_ROUTER = WorkerRouter()
@@ -0,0 +1,107 @@
+"""
+This module defines `ClientConnection`, the per-client state kept by the
+event-loop server.
+
+Each connection owns its socket, the peer address, an incremental RESP parser
+holding partially received requests, and an output buffer of replies that could
+not be written to the socket yet. While a blocking command (e.g. BLPOP) blocks the
+client, the connection also keeps the blocked client and the pipelined requests
+received after the command, which run once it is unblocked, and the MULTI/EXEC
+and Pub/Sub state of the client. The class uses `__slots__` so that tens of thousands
+of idle connections cost only a few hundred bytes each.
+"""
+
+import socket
+from typing import Optional
+
+from src.constants.redis_protocol import MAX_BUFFER_SIZE
+from src.handlers.blocked_clients import BlockedClient
+from src.handlers.pubsub import Subscriber
+from src.handlers.transactions import Transaction
+from src.redis_protocol.stream_parser import RespStreamParser
+
+
+class ClientConnection:
+    """
+    State for a single client connection served by the event loop.
+
+    Attributes:
+        sock (socket.socket): The non-blocking client socket.
+        address (tuple): The peer address returned by `accept()`.
+        client_address (str): The peer address as "host:port", e.g. for the slow log.
+        parser (RespStreamParser): Accumulates request bytes across reads.
+        outbuf (bytearray): Serialized replies waiting to be sent.
+        blocked (Optional[BlockedClient]): The blocked client, while a command blocks.
+        pending (list): Requests received after the blocking command.
+        transaction (Transaction): The queued commands and watched keys of the client.
+        subscriber (Subscriber): The channels and patterns the client subscribed to.
+    """
+
+    __slots__ = ("sock", "address", "client_address", "parser", "outbuf", "blocked",
+                 "pending", "transaction", "subscriber")
+
+    def __init__(self, sock: socket.socket, address: tuple):
+        """
+        Initializes the connection state.
+
+        Args:
+            sock (socket.socket): The accepted client socket.
+            address (tuple): The peer address of the client.
+        """
+        self.sock = sock
+        self.address = address
+        self.client_address = "%s:%s" % address[:2]
+        self.parser = RespStreamParser()
+        self.outbuf = bytearray()
+        self.blocked: Optional[BlockedClient] = None
+        self.pending: list = []
+        self.transaction = Transaction()
+        self.subscriber = Subscriber()
+
+    def fileno(self) -> int:
+        """
+        Returns the file descriptor of the underlying socket.
+        """
+        return self.sock.fileno()
+
+    def read(self) -> bytes:
+        """
+        Reads the data currently available on the socket.
+
+        Returns:
+            bytes: The received data, or b"" when the peer closed the connection.
+
+        Raises:
+            BlockingIOError: If no data is available yet.
+        """
+        return self.sock.recv(MAX_BUFFER_SIZE)
+
+    def write(self, data: bytes) -> None:
+        """
+        Queues data to be sent to the client.
+
+        Args:
+            data (bytes): The serialized reply.
+        """
+        self.outbuf += data
+
+    def flush(self) -> bool:
+        """
+        Sends as much of the output buffer as the socket accepts without blocking.
+
+        Returns:
+            bool: True if the output buffer is now empty, False otherwise.
+        """
+        while self.outbuf:
+            try:
+                sent = self.sock.send(self.outbuf)
+            except BlockingIOError:
+                return False
+            del self.outbuf[:sent]
+        return True
+
+    def close(self) -> None:
+        """
+        Closes the underlying socket.
+        """
+        self.sock.close()
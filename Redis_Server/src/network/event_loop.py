@@ -0,0 +1,380 @@
+"""
+This module implements a single-threaded, `selectors`-based front end for the
+Redis-like server.
+
+Instead of spawning one thread per client, all client sockets are put in
+non-blocking mode and multiplexed over a single selector (epoll/kqueue where
+available). Data read from a socket is fed to the connection's incremental RESP
+parser, every complete (possibly pipelined) command is driven through the
+regular request pipeline, and the batched replies are written back without
+blocking; replies the socket cannot take yet stay in the connection's output
+buffer until the socket becomes writable again. Periodic background jobs (see
+`src.handlers.server_cron`) run on the same thread between two `select` calls.
+
+Each loop iteration first executes the commands of every ready connection, then
+commits the append-only file once for all of them, and only then writes the
+replies, so a single write (and fsync) covers every client served in the round.
+
+A client blocked by a command such as BLPOP does not hold up the loop: its
+connection is parked with the requests pipelined after the command, and is
+resumed in the iteration it is unblocked, either by a push from another client
+or by its timeout, which also bounds the `select` timeout.
+
+Messages published to a subscribed connection wait in its `Subscriber` buffer
+until the end of the round, then move to its output buffer; a subscriber whose
+output buffer grows past the Pub/Sub limit because it reads too slowly is closed.
+
+Functions:
+    - start_event_loop_server: Binds the server and runs the event loop forever.
+"""
+
+import contextlib
+import functools
+import logging
+import selectors
+import socket
+from typing import Optional
+
+from src.exceptions.redis_exceptions import RedisServerException
+from src.handlers.blocked_clients import BLOCKED_CLIENTS, BlockedClient
+from src.handlers.pubsub import PUBSUB
+from src.handlers.request_handler import process_commands, reply_to_unblocked
+from src.handlers.server_cron import SERVER_CRON
+from src.handlers.server_stats import SERVER_STATS
+from src.network.client_connection import ClientConnection
+from src.network.workers import LISTEN_BACKLOG, create_listener
+from src.redisDB.append_only_file import APPEND_ONLY_FILE
+from src.redis_protocol.serialization_handler import RESP_SERIALIZER
+
+logger = logging.getLogger(__name__)
+
+SELECT_TIMEOUT = 1.0
+
+
+def _raise_open_file_limit() -> None:
+    """
+    Raises the soft limit on open file descriptors to the hard limit, so the
+    loop can hold more than the default 1024 client sockets. This is a no-op
+    on platforms without the `resource` module.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            logger.warning("Could not raise the open file limit above %s", soft)
+
+
+class EventLoopServer:
+    """
+    A single-threaded server multiplexing every client connection over one selector.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        backlog: int = LISTEN_BACKLOG,
+        listeners: Optional[list[socket.socket]] = None,
+    ):
+        """
+        Initializes the server.
+
+        Args:
+            host (str): Host address to bind.
+            port (int): Port number to bind.
+            backlog (int): Size of the kernel accept queue.
+            listeners (Optional[list[socket.socket]]): Already bound listening
+                sockets to serve instead of binding `host`:`port`.
+        """
+        self._host = host
+        self._port = port
+        self._backlog = backlog
+        self._listeners = listeners
+        self._selector = selectors.DefaultSelector()
+        self._unblocked: list[ClientConnection] = []
+        self._published: list[ClientConnection] = []
+
+    def serve_forever(self) -> None:
+        """
+        Binds the listening socket and runs the event loop until interrupted.
+        """
+        _raise_open_file_limit()
+
+        listeners = self._listeners or [
+            create_listener(self._host, self._port, backlog=self._backlog)]
+        with contextlib.ExitStack() as stack:
+            for lsock in listeners:
+                stack.enter_context(lsock)
+                lsock.setblocking(False)
+                self._selector.register(lsock, selectors.EVENT_READ, data=None)
+            logger.info("Server started (event loop). Listening on %s...", ", ".join(
+                "%s:%d" % lsock.getsockname()[:2] for lsock in listeners))
+
+            try:
+                while True:
+                    timeout = min(SELECT_TIMEOUT, SERVER_CRON.seconds_until_next_job())
+                    blocked_timeout = BLOCKED_CLIENTS.seconds_until_next_timeout()
+                    if blocked_timeout is not None:
+                        timeout = min(timeout, blocked_timeout)
+                    ready = []
+                    for key, mask in self._selector.select(timeout=timeout):
+                        if key.data is None:
+                            self._accept(key.fileobj)
+                        elif self._service(key.data, mask):
+                            ready.append(key.data)
+
+                    BLOCKED_CLIENTS.unblock_timed_out()
+                    while self._unblocked:
+                        connection = self._unblocked.pop(0)
+                        if self._resume(connection):
+                            ready.append(connection)
+
+                    while self._published:
+                        connection = self._published.pop()
+                        if self._deliver_messages(connection):
+                            ready.append(connection)
+
+                    if ready:
+                        APPEND_ONLY_FILE.commit()
+                        for connection in ready:
+                            self._send(connection)
+                    SERVER_CRON.run_due()
+            finally:
+                self._close_all()
+
+    def _accept(self, lsock: socket.socket) -> None:
+        """
+        Accepts every pending connection on the listening socket.
+
+        Args:
+            lsock (socket.socket): The listening socket.
+        """
+        while True:
+            try:
+                client_socket, address = lsock.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                logger.warning("Failed to accept connection: %s", e)
+                return
+
+            client_socket.setblocking(False)
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = ClientConnection(client_socket, address)
+            connection.subscriber.on_message = (
+                lambda _, connection=connection: self._published.append(connection))
+            self._selector.register(
+                client_socket, selectors.EVENT_READ, data=connection)
+            SERVER_STATS.client_connected()
+
+    def _service(self, connection: ClientConnection, mask: int) -> bool:
+        """
+        Handles a readiness event for a client connection: reads pending data and
+        executes the complete commands, appending their replies to the output buffer.
+
+        Args:
+            connection (ClientConnection): The ready connection.
+            mask (int): The selector events that fired.
+
+        Returns:
+            bool: True if the connection is still open and may have replies to send.
+        """
+        try:
+            if mask & selectors.EVENT_READ:
+                data = connection.read()
+                if not data:
+                    self._disconnect(connection)
+                    return False
+                connection.parser.feed(data)
+                if connection.blocked is not None:
+                    return False
+                requests = connection.parser.parse_commands()
+                if requests:
+                    self._process(connection, requests)
+            return True
+
+        except (BlockingIOError, InterruptedError):
+            return True
+        except RedisServerException as e:
+            logger.warning("Closing client after protocol error: %s", e)
+            APPEND_ONLY_FILE.commit()
+            RESP_SERIALIZER.serialize_into(connection.outbuf, str(e), is_error=True)
+            try:
+                connection.flush()
+            except OSError:
+                pass
+            self._disconnect(connection)
+        except OSError as e:
+            logger.info("Connection %s closed: %s", connection.address, e)
+            self._disconnect(connection)
+        except Exception as e:
+            logger.exception("Error while handling client: %s", e)
+            self._disconnect(connection)
+        return False
+
+    def _process(self, connection: ClientConnection, requests: list) -> None:
+        """
+        Executes requests of a connection, parking it if a command blocks.
+
+        Args:
+            connection (ClientConnection): The connection.
+            requests (list): The parsed requests to execute, in order.
+        """
+        process_commands(requests, connection.outbuf,
+                         functools.partial(self._block, connection), connection.transaction,
+                         connection.client_address, connection.subscriber)
+
+    def _block(self, connection: ClientConnection, client: BlockedClient,
+               pending: list) -> None:
+        """
+        Parks a connection whose command blocked until the client is unblocked.
+
+        Args:
+            connection (ClientConnection): The connection.
+            client (BlockedClient): The blocked client.
+            pending (list): The requests received after the blocking command.
+        """
+        connection.blocked = client
+        connection.pending = pending
+        client.on_unblock = lambda _: self._unblocked.append(connection)
+
+    def _resume(self, connection: ClientConnection) -> bool:
+        """
+        Replies to an unblocked connection and executes the requests it sent
+        while blocked.
+
+        Args:
+            connection (ClientConnection): The unblocked connection.
+
+        Returns:
+            bool: True if the connection is still open and may have replies to send.
+        """
+        reply_to_unblocked(connection.blocked, connection.outbuf)
+        connection.blocked = None
+        pending, connection.pending = connection.pending, []
+        try:
+            requests = pending + connection.parser.parse_commands()
+            if requests:
+                self._process(connection, requests)
+            return True
+        except RedisServerException as e:
+            logger.warning("Closing client after protocol error: %s", e)
+            APPEND_ONLY_FILE.commit()
+            RESP_SERIALIZER.serialize_into(connection.outbuf, str(e), is_error=True)
+            try:
+                connection.flush()
+            except OSError:
+                pass
+            self._disconnect(connection)
+        return False
+
+    def _deliver_messages(self, connection: ClientConnection) -> bool:
+        """
+        Moves the messages published to a subscribed connection to its output
+        buffer, and closes it if it left more than the Pub/Sub output buffer
+        limit unread.
+
+        Args:
+            connection (ClientConnection): The subscribed connection.
+
+        Returns:
+            bool: True if the connection is still open and has replies to send.
+        """
+        if connection.sock.fileno() == -1:
+            return False
+        subscriber = connection.subscriber
+        if not subscriber.dropped:
+            connection.outbuf += subscriber.take()
+            if len(connection.outbuf) <= PUBSUB.output_buffer_limit:
+                return True
+        logger.warning("Closing subscriber %s over the Pub/Sub output buffer limit",
+                       connection.address)
+        self._disconnect(connection)
+        return False
+
+    def _send(self, connection: ClientConnection) -> None:
+        """
+        Writes as much of the pending replies as the socket accepts.
+
+        Args:
+            connection (ClientConnection): The connection to write to.
+        """
+        try:
+            self._update_interest(connection, connection.flush())
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            logger.info("Connection %s closed: %s", connection.address, e)
+            self._disconnect(connection)
+
+    def _update_interest(self, connection: ClientConnection, flushed: bool) -> None:
+        """
+        Watches the socket for writability only while replies are pending.
+
+        Args:
+            connection (ClientConnection): The connection to update.
+            flushed (bool): Whether the output buffer has been fully sent.
+        """
+        events = selectors.EVENT_READ
+        if not flushed:
+            events |= selectors.EVENT_WRITE
+        if self._selector.get_key(connection.sock).events != events:
+            self._selector.modify(connection.sock, events, data=connection)
+
+    def _disconnect(self, connection: ClientConnection) -> None:
+        """
+        Unregisters and closes a client connection.
+
+        Args:
+            connection (ClientConnection): The connection to close.
+        """
+        if connection.blocked is not None:
+            BLOCKED_CLIENTS.cancel(connection.blocked)
+            connection.blocked = None
+        connection.transaction.reset()
+        PUBSUB.unsubscribe_all(connection.subscriber)
+        connection.subscriber.close()
+        try:
+            self._selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        else:
+            SERVER_STATS.client_disconnected()
+        connection.close()
+
+    def _close_all(self) -> None:
+        """
+        Closes every client connection still registered with the selector.
+        """
+        for key in list(self._selector.get_map().values()):
+            if key.data is not None:
+                self._disconnect(key.data)
+        self._selector.close()
+
+
+def start_event_loop_server(
+    host: str,
+    port: int,
+    listeners: Optional[list[socket.socket]] = None,
+) -> None:
+    """
+    Starts the Redis-like server in single-threaded event-loop mode.
+
+    Args:
+        host (str): Host address to bind.
+        port (int): Port number to bind.
+        listeners (Optional[list[socket.socket]]): Already bound listening sockets
+            to serve instead (e.g. the public and private sockets of a worker).
+    """
+    try:
+        EventLoopServer(host, port, listeners=listeners).serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Server stopped by user.")
+    except Exception as e:
+        logger.exception("An error occurred: %s", e)
@@ -0,0 +1,141 @@
+"""
+This module runs the server as several worker processes (`--workers N`), so
+commands execute on more than one core despite the GIL.
+
+Every worker binds the public port with `SO_REUSEPORT`, so the kernel spreads
+incoming connections over the workers, and a private port (`port + 1 + index`)
+that only it listens on. Each worker owns a hash-partition of the keyspace (see
+`src.handlers.worker_router`) with its own snapshot and append-only file, and
+redirects commands on other keys to the private port of their owner with a
+MOVED error.
+
+Functions:
+    - create_listener: Binds a listening TCP socket.
+    - worker_addresses: The private address of every worker.
+    - worker_filename: The per-worker name of a persistence file.
+    - start_workers: Starts the worker processes and waits for them.
+"""
+
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import socket
+import sys
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+LISTEN_BACKLOG = 4096
+
+
+def create_listener(
+    host: str,
+    port: int,
+    reuse_port: bool = False,
+    backlog: int = LISTEN_BACKLOG,
+) -> socket.socket:
+    """
+    Binds a listening TCP socket.
+
+    Args:
+        host (str): Host address to bind.
+        port (int): Port number to bind.
+        reuse_port (bool): Set `SO_REUSEPORT`, so several processes can bind the port.
+        backlog (int): Size of the kernel accept queue.
+
+    Returns:
+        socket.socket: The listening socket.
+    """
+    lsock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        lsock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            lsock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        lsock.bind((host, port))
+        lsock.listen(backlog)
+    except BaseException:
+        lsock.close()
+        raise
+    return lsock
+
+
+def worker_addresses(host: str, port: int, workers: int) -> list[tuple[str, int]]:
+    """
+    Returns the private address of every worker, used in MOVED redirections.
+
+    Args:
+        host (str): Host address of the server.
+        port (int): Public port of the server.
+        workers (int): Number of workers.
+
+    Returns:
+        list[tuple[str, int]]: `(host, port + 1 + index)` for each worker.
+    """
+    return [(host, port + 1 + index) for index in range(workers)]
+
+
+def worker_filename(filename: str, worker_id: int) -> str:
+    """
+    Returns the name of a persistence file for one worker, e.g.
+    `appendonly.aof` -> `appendonly-2.aof`.
+
+    Args:
+        filename (str): The file name configured for the server.
+        worker_id (int): Index of the worker.
+
+    Returns:
+        str: The file name of the worker.
+    """
+    root, extension = os.path.splitext(filename)
+    return f"{root}-{worker_id}{extension}"
+
+
+def start_workers(workers: int, target: Callable[[int], None]) -> None:
+    """
+    Starts the worker processes and waits until they exit.
+
+    The workers are forked, so they inherit the configuration of the parent.
+    If one worker dies, the others are stopped too: the keys it owns would
+    otherwise be unreachable. Workers are also stopped when the supervisor is
+    interrupted or receives SIGTERM.
+
+    Args:
+        workers (int): Number of worker processes.
+        target (Callable[[int], None]): Function run by each worker, given its index.
+
+    Raises:
+        RuntimeError: If the platform does not support `SO_REUSEPORT` or fork.
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("Worker mode requires SO_REUSEPORT support")
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise RuntimeError("Worker mode requires fork support")
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=target, args=(worker_id,), name=f"worker-{worker_id}")
+        for worker_id in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    # Stop the workers too when the supervisor is asked to terminate.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    logger.info("Started %d workers: %s", workers,
+                ", ".join(str(process.pid) for process in processes))
+
+    try:
+        multiprocessing.connection.wait([process.sentinel for process in processes])
+        for process in processes:
+            if process.exitcode is not None:
+                logger.error("Worker %s exited with code %s; stopping all workers",
+                             process.name, process.exitcode)
+    except KeyboardInterrupt:
+        logger.info("Stopping workers.")
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
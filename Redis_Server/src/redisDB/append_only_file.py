@@ -0,0 +1,451 @@
+"""
+This module implements append-only file (AOF) persistence for the Redis-like server.
+
+Every command that modifies the database is appended to a log as a RESP array, the
+same way a client would send it. Replaying the log on startup rebuilds the dataset.
+
+Features:
+- Fsync policies, as in Redis:
+    - `always`: replies are only sent once the commands they acknowledge are on disk.
+    - `everysec`: commands are written before replying and fsynced once per second by
+      a background thread, so at most about one second of writes can be lost.
+    - `no`: commands are written before replying; flushing is left to the OS.
+- Group commit: commands are first appended to an in-memory buffer. A client that
+  needs its commands on disk becomes the leader: it writes the whole buffer, including
+  the commands of every other client that queued up meanwhile, with one write and one
+  fsync. Clients whose commands were covered by that fsync return without any I/O.
+- Streaming load (`read_commands`): the log is parsed in chunks, so replaying it does
+  not need memory proportional to the file. A truncated last command (e.g. after a
+  crash in the middle of a write) is dropped and cut from the file with a warning.
+- Background rewrite (`rewrite`): a point-in-time copy of the database is written as
+  the shortest list of commands rebuilding it to a temporary file by a background
+  thread. Commands executed meanwhile are collected in a rewrite buffer and appended
+  to it at the end, then the temporary file atomically replaces the log.
+
+Exports:
+    - AppendOnlyFile: The AOF writer.
+    - APPEND_ONLY_FILE: The AOF shared by the server; disabled until `open` is called.
+    - read_commands: Streams the commands stored in an AOF.
+    - FSYNC_POLICIES: The supported fsync policies.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    RespIncompleteDataError,
+)
+from src.redisDB.encodings import is_hash, is_list, is_set, is_zset
+from src.redisDB.redis_db import REDIS_DB
+from src.redis_protocol.buffer_parser import RespBufferParser
+from src.redis_protocol.serialization_handler import RESP_SERIALIZER
+from src.utils.time_utils import has_expired
+
+logger = logging.getLogger(__name__)
+
+FSYNC_ALWAYS = "always"
+FSYNC_EVERYSEC = "everysec"
+FSYNC_NO = "no"
+
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_EVERYSEC, FSYNC_NO)
+
+# Size of the chunks the log is read in when it is loaded.
+LOAD_CHUNK_SIZE = 1024 * 1024
+
+# The rewrite writes its output in chunks of this size.
+REWRITE_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of list elements, hash fields or set members per command
+# emitted by a rewrite.
+REWRITE_ITEMS_PER_COMMAND = 64
+
+# A rewrite is triggered automatically once the log grew by this percentage since
+# the last rewrite, and is at least this large.
+AUTO_REWRITE_PERCENTAGE = 100
+AUTO_REWRITE_MIN_SIZE = 64 * 1024 * 1024
+
+
+def read_commands(filename: str) -> Iterator[list]:
+    """
+    Streams the commands stored in an append-only file.
+
+    A truncated command at the end of the file is dropped and cut from the file, so
+    new commands are appended after the last complete one.
+
+    Args:
+        filename (str): Path to the append-only file.
+
+    Yields:
+        list: Each command, as a list of bytes.
+
+    Raises:
+        RespParsingError: If the file contains a malformed command.
+    """
+    buffer = bytearray()
+    valid_size = 0
+
+    with open(filename, "rb") as file:
+        while True:
+            chunk = file.read(LOAD_CHUNK_SIZE)
+            buffer += chunk
+
+            commands = []
+            with RespBufferParser(buffer) as parser:
+                while parser.position < len(buffer):
+                    try:
+                        commands.append(parser.parse())
+                    except RespIncompleteDataError:
+                        break
+                consumed = parser.position
+            del buffer[:consumed]
+            valid_size += consumed
+
+            yield from commands
+            if not chunk:
+                break
+
+    if buffer:
+        logger.warning(
+            "Append only file %s ends with a truncated command (%d bytes); "
+            "truncating it to the last complete command", filename, len(buffer))
+        os.truncate(filename, valid_size)
+
+
+def _rewrite_commands(key: str, value: Any) -> Iterator[list]:
+    """
+    Returns the commands recreating a single key.
+
+    Args:
+        key (str): The key.
+        value (Any): Its value.
+
+    Yields:
+        list: Commands recreating the key.
+
+    Raises:
+        TypeError: If the value type cannot be rewritten.
+    """
+    if isinstance(value, (str, int)):
+        yield ["SET", key, str(value)]
+    elif is_list(value):
+        items = list(value)
+        for start in range(0, len(items), REWRITE_ITEMS_PER_COMMAND):
+            yield ["RPUSH", key, *items[start:start + REWRITE_ITEMS_PER_COMMAND]]
+    elif is_hash(value):
+        pairs = list(value.items())
+        for start in range(0, len(pairs), REWRITE_ITEMS_PER_COMMAND):
+            batch = pairs[start:start + REWRITE_ITEMS_PER_COMMAND]
+            yield ["HSET", key, *(item for pair in batch for item in pair)]
+    elif is_set(value):
+        members = list(value)
+        for start in range(0, len(members), REWRITE_ITEMS_PER_COMMAND):
+            yield ["SADD", key, *members[start:start + REWRITE_ITEMS_PER_COMMAND]]
+    elif is_zset(value):
+        pairs = list(value)
+        for start in range(0, len(pairs), REWRITE_ITEMS_PER_COMMAND):
+            batch = pairs[start:start + REWRITE_ITEMS_PER_COMMAND]
+            yield ["ZADD", key, *(item for member, score in batch for item in (repr(score), member))]
+    else:
+        raise TypeError(f"Cannot rewrite value of type {type(value).__name__}")
+
+
+class AppendOnlyFile:
+    """
+    Appends write commands to a log file with a configurable fsync policy.
+
+    Offsets count every byte ever appended; comparing the offset of the last
+    appended byte with the offsets written and fsynced so far tells a client
+    whether its commands are durable yet.
+    """
+
+    def __init__(self):
+        """
+        Initializes a disabled AOF; call `open` to enable it.
+        """
+        self.filename: Optional[str] = None
+        self.fsync_policy: str = FSYNC_EVERYSEC
+        self._file = None
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._buffer = bytearray()
+        self._rewrite_buffer: Optional[bytearray] = None
+        self._appended_offset = 0
+        self._written_offset = 0
+        self._synced_offset = 0
+        self._size = 0
+        self._base_size = 0
+        self._fsync_thread: Optional[threading.Thread] = None
+        self.rewrites = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the AOF is open and commands are being logged.
+        """
+        return self._file is not None
+
+    @property
+    def is_rewriting(self) -> bool:
+        """
+        Whether a rewrite is in progress.
+        """
+        return self._rewrite_buffer is not None
+
+    def open(self, filename: str, fsync_policy: str = FSYNC_EVERYSEC) -> None:
+        """
+        Opens the log for appending and starts logging commands.
+
+        Args:
+            filename (str): Path to the append-only file.
+            fsync_policy (str): One of `FSYNC_POLICIES`.
+
+        Raises:
+            ValueError: If the fsync policy is unknown.
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+
+        self.filename = filename
+        self.fsync_policy = fsync_policy
+        self._file = open(filename, "ab")
+        self._size = self._base_size = os.path.getsize(filename)
+
+        if fsync_policy == FSYNC_EVERYSEC:
+            self._fsync_thread = threading.Thread(
+                target=self._fsync_every_second, name="aof-fsync", daemon=True)
+            self._fsync_thread.start()
+
+    def close(self) -> None:
+        """
+        Writes and fsyncs every pending command, then closes the log.
+        """
+        with self._io_lock:
+            if self._file is None:
+                return
+            self._write_pending()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    def append(self, command: list) -> None:
+        """
+        Appends a command to the in-memory AOF buffer.
+
+        The command reaches the file on the next `commit`.
+
+        Args:
+            command (list): The command name followed by its arguments.
+        """
+        with self._lock:
+            start = len(self._buffer)
+            RESP_SERIALIZER.serialize_into(self._buffer, command)
+            if self._rewrite_buffer is not None:
+                self._rewrite_buffer += self._buffer[start:]
+            self._appended_offset += len(self._buffer) - start
+
+    def append_all(self, commands: list[list]) -> None:
+        """
+        Appends several commands to the in-memory AOF buffer as one block, which no
+        command of another client can be appended into, e.g. a MULTI/EXEC block.
+
+        Args:
+            commands (list[list]): The commands, each its name followed by its arguments.
+        """
+        with self._lock:
+            start = len(self._buffer)
+            for command in commands:
+                RESP_SERIALIZER.serialize_into(self._buffer, command)
+            if self._rewrite_buffer is not None:
+                self._rewrite_buffer += self._buffer[start:]
+            self._appended_offset += len(self._buffer) - start
+
+    def commit(self) -> None:
+        """
+        Makes every command appended so far as durable as the fsync policy requires.
+
+        Call this before replying to clients: with `always` it returns once the
+        commands are fsynced, otherwise once they are written to the OS.
+        """
+        if self._file is None:
+            return
+        target = self._appended_offset
+        always = self.fsync_policy == FSYNC_ALWAYS
+        if (self._synced_offset if always else self._written_offset) >= target:
+            return
+
+        with self._io_lock:
+            if self._file is None:
+                return
+            self._write_pending()
+            if always and self._synced_offset < target:
+                os.fsync(self._file.fileno())
+                self._synced_offset = self._written_offset
+
+    def _write_pending(self) -> None:
+        """
+        Writes the AOF buffer to the file. Must be called with `_io_lock` held.
+        """
+        with self._lock:
+            if not self._buffer:
+                return
+            data, self._buffer = self._buffer, bytearray()
+            end = self._appended_offset
+
+        self._file.write(data)
+        self._file.flush()
+        self._written_offset = end
+        self._size += len(data)
+
+    def fsync(self) -> None:
+        """
+        Writes pending commands and fsyncs the log.
+
+        The fsync itself runs on a duplicate of the file descriptor outside of the
+        I/O lock, so clients can keep writing while the disk catches up.
+        """
+        with self._io_lock:
+            if self._file is None:
+                return
+            self._write_pending()
+            if self._synced_offset >= self._written_offset:
+                return
+            target = self._written_offset
+            fd = os.dup(self._file.fileno())
+
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        with self._io_lock:
+            self._synced_offset = max(self._synced_offset, target)
+
+    def _fsync_every_second(self) -> None:
+        """
+        Thread target for the `everysec` policy.
+        """
+        while self._file is not None:
+            time.sleep(1)
+            try:
+                self.fsync()
+            except OSError as e:
+                logger.error("Failed to fsync the append only file: %s", e)
+
+    def rewrite(self, background: bool = True) -> None:
+        """
+        Compacts the log into the shortest list of commands rebuilding the database.
+
+        Args:
+            background (bool): Run the rewrite in a background thread.
+
+        Raises:
+            CommandProcessingException: If the AOF is disabled or a rewrite is
+                                        already in progress.
+        """
+        # Shard locks before the buffer lock: the order commands propagate in.
+        with REDIS_DB.locked_all(), self._lock:
+            if self._file is None:
+                raise CommandProcessingException("ERR Append only file is not enabled")
+            if self._rewrite_buffer is not None:
+                raise CommandProcessingException(
+                    "ERR Background append only file rewriting already in progress")
+            data, expires = REDIS_DB.snapshot()
+            self._rewrite_buffer = bytearray()
+
+        if background:
+            threading.Thread(
+                target=self._rewrite, args=(data, expires),
+                name="aof-rewrite", daemon=True).start()
+        else:
+            self._rewrite(data, expires)
+
+    def rewrite_if_grown(self) -> None:
+        """
+        Starts a background rewrite once the log has doubled since the last one.
+        """
+        if self._file is None or self._rewrite_buffer is not None:
+            return
+        if self._size < AUTO_REWRITE_MIN_SIZE:
+            return
+        if self._size * 100 >= self._base_size * (100 + AUTO_REWRITE_PERCENTAGE):
+            logger.info("Starting automatic append only file rewrite")
+            try:
+                self.rewrite()
+            except CommandProcessingException:
+                pass
+
+    def _rewrite(self, data: dict, expires: dict) -> None:
+        """
+        Writes the snapshot to a temporary file and swaps it in for the log.
+
+        Args:
+            data (dict): Point-in-time copy of the data.
+            expires (dict): Point-in-time copy of the expiry times.
+        """
+        temp_filename = f"{self.filename}.rewrite.tmp"
+        try:
+            with open(temp_filename, "wb") as file:
+                self._write_snapshot(file, data, expires)
+                file.flush()
+                os.fsync(file.fileno())
+
+            with self._io_lock:
+                with self._lock:
+                    tail = self._rewrite_buffer
+                    self._rewrite_buffer = None
+                    # Everything still buffered for the old file is also in the tail.
+                    self._buffer.clear()
+                    end = self._appended_offset
+
+                with open(temp_filename, "ab") as file:
+                    file.write(tail)
+                    file.flush()
+                    os.fsync(file.fileno())
+
+                os.replace(temp_filename, self.filename)
+                self._file.close()
+                self._file = open(self.filename, "ab")
+                self._written_offset = self._synced_offset = end
+                self._size = self._base_size = os.path.getsize(self.filename)
+                self.rewrites += 1
+
+            logger.info("Append only file rewritten (%d bytes)", self._size)
+        except Exception as e:
+            logger.exception("Append only file rewrite failed: %s", e)
+            with self._lock:
+                self._rewrite_buffer = None
+            try:
+                os.remove(temp_filename)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _write_snapshot(file, data: dict, expires: dict) -> None:
+        """
+        Writes the commands rebuilding the given data to a file.
+
+        Args:
+            file: The binary file to write to.
+            data (dict): The keys and values to write.
+            expires (dict): The expiry times of the keys.
+        """
+        out = bytearray()
+        for key, value in data.items():
+            expire = expires.get(key)
+            if has_expired(expire):
+                continue
+            for command in _rewrite_commands(key, value):
+                RESP_SERIALIZER.serialize_into(out, command)
+            if expire is not None:
+                RESP_SERIALIZER.serialize_into(out, ["PEXPIREAT", key, str(expire)])
+            if len(out) >= REWRITE_CHUNK_SIZE:
+                file.write(out)
+                out.clear()
+        file.write(out)
+
+
+APPEND_ONLY_FILE = AppendOnlyFile()
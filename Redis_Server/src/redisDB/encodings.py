@@ -0,0 +1,422 @@
+"""
+This module defines how values are represented in `RedisDB`, using compact
+type-specific encodings like Redis does:
+
+- `int`: strings holding a canonical 64-bit integer (e.g. set by SET or INCR)
+  are stored as Python ints. Values between 0 and `SHARED_INTEGERS_COUNT` - 1
+  point to shared, preallocated int objects, so a counter costs no allocation.
+- `embstr` / `raw`: other strings are stored as `str`. A Python `str` already
+  keeps its characters in the same allocation as its header, like Redis' embstr;
+  strings longer than `EMBSTR_SIZE_LIMIT` bytes are reported as `raw`.
+- `listpack`: lists of at most `LIST_MAX_LISTPACK_ENTRIES` elements and
+  `LIST_MAX_LISTPACK_BYTES` bytes are packed into a single buffer (`ListPack`).
+- `quicklist`: bigger lists are converted to a `QuickList` of listpack nodes once
+  a push exceeds those limits, and back to a listpack once they shrink to half
+  of them.
+- `listpack` / `hashtable`: hashes of at most `HASH_MAX_LISTPACK_ENTRIES` fields,
+  whose fields and values are at most `HASH_MAX_LISTPACK_VALUE` bytes long, are
+  packed into a single buffer (`ListPackHash`); a hash exceeding those limits is
+  converted to a `dict` and stays one.
+- `intset` / `hashtable`: sets of at most `SET_MAX_INTSET_ENTRIES` members that
+  are all integers are stored as a sorted array of integers (`IntSet`); a set
+  getting a non-integer member or too many members is converted to a `set`.
+- `skiplist`: sorted sets are stored as a `ZSet`, a member to score dict paired
+  with an ordered index of the members.
+
+Expiry times are not part of the value: they live in a separate dict of `RedisDB`.
+
+Exports:
+    - encode_string: Returns the compact representation of a string value.
+    - shared_integer: Returns the shared object for small integers.
+    - create_list: Creates a list with the encoding suiting its size.
+    - push_to_list: Pushes elements, converting the list encoding when needed.
+    - grow_list: Converts a listpack that became too big to a quicklist.
+    - shrink_list: Converts a list that became small back to a listpack.
+    - is_list: Checks whether a value is a list of any encoding.
+    - create_hash: Creates a hash with the encoding suiting its size.
+    - set_hash_field: Sets a field, converting the hash encoding when needed.
+    - is_hash: Checks whether a value is a hash of any encoding.
+    - is_zset: Checks whether a value is a sorted set.
+    - create_set: Creates a set with the encoding suiting its members.
+    - add_to_set: Adds members, converting the set encoding when needed.
+    - is_set: Checks whether a value is a set of any encoding.
+    - type_name: The name of the type of a value (SCAN TYPE).
+    - object_encoding: The name of the encoding of a value (OBJECT ENCODING).
+    - memory_usage: The bytes used by a key and its value (MEMORY USAGE).
+"""
+
+import itertools
+import sys
+from typing import Any, Iterable
+
+from src.constants.redis_protocol import DEFAULT_ENCODING
+from src.redisDB.intset import INT64_MAX, INT64_MIN, IntSet, as_integer
+from src.redisDB.listpack import ListPack, ListPackHash
+from src.redisDB.quicklist import QuickList
+from src.redisDB.zset import ZSet
+
+SHARED_INTEGERS_COUNT = 10000
+
+SHARED_INTEGERS: tuple[int, ...] = tuple(range(SHARED_INTEGERS_COUNT))
+
+# Longest string, in bytes, that Redis stores with the embstr encoding.
+EMBSTR_SIZE_LIMIT = 44
+
+LIST_MAX_LISTPACK_ENTRIES = 128
+LIST_MAX_LISTPACK_BYTES = 8192
+
+HASH_MAX_LISTPACK_ENTRIES = 128
+HASH_MAX_LISTPACK_VALUE = 64
+
+SET_MAX_INTSET_ENTRIES = 512
+
+# Bytes of a hash table entry (hash, key and value pointers) in a dict.
+DICT_ENTRY_SIZE = 24
+
+_INTEGER_START = frozenset("-0123456789")
+
+
+def shared_integer(value: int) -> int:
+    """
+    Returns the shared object for integers below `SHARED_INTEGERS_COUNT`.
+
+    Args:
+        value (int): The integer.
+
+    Returns:
+        int: An equal integer, shared between keys when it is small.
+    """
+    if 0 <= value < SHARED_INTEGERS_COUNT:
+        return SHARED_INTEGERS[value]
+    return value
+
+
+def encode_string(value: str) -> str | int:
+    """
+    Returns the compact representation of a string value.
+
+    A string is stored as an integer only if converting it back gives the same
+    string (no sign, spaces, leading zeros or underscores) and it fits in 64 bits,
+    so GET always returns exactly what was SET.
+
+    Args:
+        value (str): The string value.
+
+    Returns:
+        str | int: The integer encoding of the string, or the string itself.
+    """
+    if not value or len(value) > 20 or value[0] not in _INTEGER_START:
+        return value
+    try:
+        number = int(value)
+    except ValueError:
+        return value
+    if not INT64_MIN <= number <= INT64_MAX or str(number) != value:
+        return value
+    return shared_integer(number)
+
+
+def is_list(value: Any) -> bool:
+    """
+    Checks whether a value is a list, whatever its encoding.
+    """
+    return type(value) is ListPack or type(value) is QuickList
+
+
+def create_list(items: Iterable[str] = ()) -> ListPack | QuickList:
+    """
+    Creates a list with the most compact encoding suiting its elements.
+
+    Args:
+        items (Iterable[str]): The elements, head first.
+
+    Returns:
+        ListPack | QuickList: A listpack for small lists, a quicklist otherwise.
+    """
+    items = list(items)
+    listpack = ListPack(items) if len(items) <= LIST_MAX_LISTPACK_ENTRIES else None
+    if listpack is not None and listpack.nbytes <= LIST_MAX_LISTPACK_BYTES:
+        return listpack
+    return QuickList(items)
+
+
+def push_to_list(
+    current_value: ListPack | QuickList, values: list[str], is_left: bool
+) -> ListPack | QuickList:
+    """
+    Pushes elements to a list, converting a listpack that grows too big to a quicklist.
+
+    Args:
+        current_value (ListPack | QuickList): The list.
+        values (list[str]): The elements to push, one after the other.
+        is_left (bool): Push to the head instead of the tail.
+
+    Returns:
+        ListPack | QuickList: The list holding the elements, which may be a new object.
+    """
+    if type(current_value) is ListPack and (
+            len(current_value) + len(values) > LIST_MAX_LISTPACK_ENTRIES
+            or current_value.nbytes + sum(map(len, values)) > LIST_MAX_LISTPACK_BYTES):
+        current_value = QuickList(current_value)
+
+    push = current_value.appendleft if is_left else current_value.append
+    for value in values:
+        push(value)
+
+    return grow_list(current_value)
+
+
+def grow_list(current_value: ListPack | QuickList) -> ListPack | QuickList:
+    """
+    Converts a listpack to a quicklist once it exceeds the listpack limits, e.g.
+    after an element was inserted or replaced by a longer one.
+
+    Args:
+        current_value (ListPack | QuickList): The list, after elements were added.
+
+    Returns:
+        ListPack | QuickList: The list, which may be a new object.
+    """
+    if type(current_value) is ListPack and (
+            len(current_value) > LIST_MAX_LISTPACK_ENTRIES
+            or current_value.nbytes > LIST_MAX_LISTPACK_BYTES):
+        return QuickList(current_value)
+    return current_value
+
+
+def shrink_list(current_value: ListPack | QuickList) -> ListPack | QuickList:
+    """
+    Converts a quicklist back to a listpack once it holds at most half of the
+    listpack limits, so that lists going back and forth around the limits are
+    not converted on every push and pop.
+
+    Args:
+        current_value (ListPack | QuickList): The list, after elements were removed.
+
+    Returns:
+        ListPack | QuickList: The list, which may be a new object.
+    """
+    if (type(current_value) is QuickList
+            and len(current_value) <= LIST_MAX_LISTPACK_ENTRIES // 2
+            and current_value.nbytes <= LIST_MAX_LISTPACK_BYTES // 2):
+        return ListPack(current_value)
+    return current_value
+
+
+def _fits_hash_listpack(string: str) -> bool:
+    """
+    Checks whether a field or value is short enough for a listpack-encoded hash.
+    """
+    return len(string) <= HASH_MAX_LISTPACK_VALUE and (
+        string.isascii() or len(string.encode(DEFAULT_ENCODING)) <= HASH_MAX_LISTPACK_VALUE)
+
+
+def is_hash(value: Any) -> bool:
+    """
+    Checks whether a value is a hash, whatever its encoding.
+    """
+    return type(value) is ListPackHash or type(value) is dict
+
+
+def is_zset(value: Any) -> bool:
+    """
+    Checks whether a value is a sorted set.
+    """
+    return type(value) is ZSet
+
+
+def is_set(value: Any) -> bool:
+    """
+    Checks whether a value is a set, whatever its encoding.
+    """
+    return type(value) is IntSet or type(value) is set
+
+
+def create_set(members: Iterable[str]) -> IntSet | set:
+    """
+    Creates a set with the most compact encoding suiting its members.
+
+    Args:
+        members (Iterable[str]): The members; duplicates are ignored.
+
+    Returns:
+        IntSet | set: An intset if every member is an integer and there are few
+                      enough of them, a set otherwise.
+    """
+    members = set(members)
+    if len(members) <= SET_MAX_INTSET_ENTRIES:
+        integers = list(map(as_integer, members))
+        if None not in integers:
+            return IntSet(integers)
+    return members
+
+
+def add_to_set(current_value: IntSet | set, members: Iterable[str]) -> tuple[IntSet | set, int]:
+    """
+    Adds members to a set, converting an intset to a set when a member is not an
+    integer or the intset grows too big.
+
+    Args:
+        current_value (IntSet | set): The set.
+        members (Iterable[str]): The members to add.
+
+    Returns:
+        tuple[IntSet | set, int]: The set holding the members, which may be a new
+                                  object, and the number of members added.
+    """
+    added = 0
+    members = iter(members)
+    if type(current_value) is IntSet:
+        for member in members:
+            number = as_integer(member)
+            if number is None or (len(current_value) >= SET_MAX_INTSET_ENTRIES
+                                  and member not in current_value):
+                current_value = set(current_value)
+                if member not in current_value:
+                    current_value.add(member)
+                    added += 1
+                break
+            added += current_value.add(number)
+    for member in members:
+        if member not in current_value:
+            current_value.add(member)
+            added += 1
+    return current_value, added
+
+
+def create_hash(pairs: Iterable[tuple[str, str]] = ()) -> ListPackHash | dict:
+    """
+    Creates a hash with the most compact encoding suiting its fields.
+
+    Args:
+        pairs (Iterable[tuple[str, str]]): The fields and their values.
+
+    Returns:
+        ListPackHash | dict: A listpack for small hashes, a dict otherwise.
+    """
+    fields = dict(pairs)
+    if len(fields) <= HASH_MAX_LISTPACK_ENTRIES and all(
+            map(_fits_hash_listpack, itertools.chain.from_iterable(fields.items()))):
+        return ListPackHash(fields.items())
+    return fields
+
+
+def set_hash_field(current_value: ListPackHash | dict, field: str, value: str) -> ListPackHash | dict:
+    """
+    Sets the value of a field, converting a listpack that grows too big to a dict.
+
+    Args:
+        current_value (ListPackHash | dict): The hash.
+        field (str): The field.
+        value (str): Its new value.
+
+    Returns:
+        ListPackHash | dict: The hash holding the field, which may be a new object.
+    """
+    if type(current_value) is ListPackHash:
+        if not (_fits_hash_listpack(field) and _fits_hash_listpack(value)):
+            current_value = dict(current_value.items())
+        current_value[field] = value
+        if len(current_value) > HASH_MAX_LISTPACK_ENTRIES:
+            current_value = dict(current_value.items())
+        return current_value
+    current_value[field] = value
+    return current_value
+
+
+def type_name(value: Any) -> str:
+    """
+    Returns the name Redis gives to the type of a value, whatever its encoding.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: "string", "list", "hash", "set" or "zset".
+
+    Raises:
+        TypeError: If the value has an unknown type.
+    """
+    value_type = type(value)
+    if value_type is str or value_type is int:
+        return "string"
+    if is_list(value):
+        return "list"
+    if is_hash(value):
+        return "hash"
+    if is_set(value):
+        return "set"
+    if value_type is ZSet:
+        return "zset"
+    raise TypeError(f"Unknown value type {value_type.__name__}")
+
+
+def object_encoding(value: Any) -> str:
+    """
+    Returns the name Redis gives to the encoding of a value.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: "int", "embstr", "raw", "listpack", "quicklist", "hashtable",
+             "intset" or "skiplist".
+
+    Raises:
+        TypeError: If the value has an unknown type.
+    """
+    value_type = type(value)
+    if value_type is int:
+        return "int"
+    if value_type is str:
+        if len(value) <= EMBSTR_SIZE_LIMIT and len(value.encode()) <= EMBSTR_SIZE_LIMIT:
+            return "embstr"
+        return "raw"
+    if value_type is ListPack or value_type is ListPackHash:
+        return "listpack"
+    if value_type is QuickList:
+        return "quicklist"
+    if value_type is dict or value_type is set:
+        return "hashtable"
+    if value_type is IntSet:
+        return "intset"
+    if value_type is ZSet:
+        return "skiplist"
+    raise TypeError(f"Unknown value type {value_type.__name__}")
+
+
+def memory_usage(key: str, value: Any, samples: int = 0) -> int:
+    """
+    Estimates the bytes used by a key, its value and its hash table entry.
+
+    Shared integers count as free, as they are allocated once for every key.
+
+    Args:
+        key (str): The key.
+        value (Any): Its value.
+        samples (int): Number of fields of a hashtable-encoded hash, or members
+                       of a hashtable-encoded set or of a sorted set, to measure,
+                       the others being assumed of the same average size, or 0
+                       to measure all of them. Other encodings know their size
+                       without sampling elements.
+
+    Returns:
+        int: The estimated number of bytes.
+    """
+    size = DICT_ENTRY_SIZE + sys.getsizeof(key)
+    value_type = type(value)
+    if value_type is int:
+        if not (0 <= value < SHARED_INTEGERS_COUNT and value is SHARED_INTEGERS[value]):
+            size += sys.getsizeof(value)
+    else:
+        size += sys.getsizeof(value)
+    if value_type is dict and value:
+        sampled = list(itertools.islice(value.items(), samples or None))
+        fields_size = sum(sys.getsizeof(field) + sys.getsizeof(field_value)
+                          for field, field_value in sampled)
+        size += fields_size * len(value) // len(sampled)
+    elif (value_type is ZSet or value_type is set) and value:
+        members = value.members() if value_type is ZSet else iter(value)
+        sampled = list(itertools.islice(members, samples or None))
+        size += sum(map(sys.getsizeof, sampled)) * len(value) // len(sampled)
+    return size
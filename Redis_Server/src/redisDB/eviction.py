@@ -0,0 +1,242 @@
+"""
+This module defines the eviction policies applied once the dataset grows past
+`--maxmemory`, approximating those of Redis:
+
+- `noeviction`: Nothing is evicted; commands that may use more memory fail with OOM.
+- `allkeys-lru`: Evict the least recently used keys.
+- `allkeys-lfu`: Evict the least frequently used keys.
+- `volatile-ttl`: Evict the keys with an expiry time closest to now.
+
+Like Redis, policies do not keep keys ordered by access. Every key carries 24 bits
+of access metadata, packed next to its estimated size in a single int (see
+`pack_metadata`):
+
+- LRU: a clock in seconds (`lru_clock`), wrapping every ~194 days.
+- LFU: the minute of the last decrement (16 bits) and a logarithmic access
+  counter (8 bits) that is incremented with a decreasing probability and
+  decremented as time passes, so the frequency reflects recent accesses.
+
+To pick a victim, the database samples `MAXMEMORY_SAMPLES` random keys (for
+volatile-ttl, the soonest deadlines of a few shards) and keeps the best candidates
+of successive samples in a pool of `EVICTION_POOL_SIZE` entries, ranked by
+`EvictionPolicy.score`.
+
+Exports:
+    - EvictionPolicy: Base class of the policies.
+    - EVICTION_POLICIES: The policy class of every policy name.
+    - create_eviction_policy: Creates a policy from its name.
+    - pack_metadata / metadata_size / metadata_access: Per-key metadata helpers.
+"""
+
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+# Keys sampled to find an eviction candidate, like Redis' maxmemory-samples.
+MAXMEMORY_SAMPLES = 5
+
+# Best candidates kept between samples.
+EVICTION_POOL_SIZE = 16
+
+ACCESS_BITS = 24
+ACCESS_MASK = (1 << ACCESS_BITS) - 1
+
+LRU_CLOCK_RESOLUTION_MS = 1000
+LRU_CLOCK_MAX = ACCESS_MASK
+
+LFU_INIT_VAL = 5
+LFU_LOG_FACTOR = 10
+LFU_DECAY_TIME_MINUTES = 1
+LFU_COUNTER_MAX = 255
+
+
+def pack_metadata(size: int, access: int) -> int:
+    """
+    Packs the estimated size of a key and its access metadata in one int.
+
+    Args:
+        size (int): Estimated bytes used by the key and its value.
+        access (int): The 24-bit access metadata of the eviction policy.
+
+    Returns:
+        int: The packed metadata.
+    """
+    return (size << ACCESS_BITS) | access
+
+
+def metadata_size(metadata: int) -> int:
+    """
+    Returns the estimated size stored in packed metadata.
+    """
+    return metadata >> ACCESS_BITS
+
+
+def metadata_access(metadata: int) -> int:
+    """
+    Returns the access metadata stored in packed metadata.
+    """
+    return metadata & ACCESS_MASK
+
+
+def lru_clock() -> int:
+    """
+    Returns the current LRU clock: seconds, on 24 bits.
+    """
+    return (time.monotonic_ns() // (LRU_CLOCK_RESOLUTION_MS * 1_000_000)) & LRU_CLOCK_MAX
+
+
+def lfu_time_in_minutes() -> int:
+    """
+    Returns the current time in minutes, on 16 bits.
+    """
+    return (time.monotonic_ns() // 60_000_000_000) & 0xFFFF
+
+
+def lfu_log_increment(counter: int) -> int:
+    """
+    Increments an LFU counter with a probability decreasing as it grows, so 8 bits
+    can tell apart keys accessed a few times from keys accessed millions of times.
+    """
+    if counter == LFU_COUNTER_MAX:
+        return counter
+    base = max(counter - LFU_INIT_VAL, 0)
+    if random.random() < 1.0 / (base * LFU_LOG_FACTOR + 1):
+        return counter + 1
+    return counter
+
+
+def lfu_decremented_counter(access: int) -> int:
+    """
+    Returns the counter of LFU access metadata, decremented by one for every
+    `LFU_DECAY_TIME_MINUTES` elapsed since its last decrement.
+    """
+    elapsed = (lfu_time_in_minutes() - (access >> 8)) & 0xFFFF
+    return max((access & 0xFF) - elapsed // LFU_DECAY_TIME_MINUTES, 0)
+
+
+class EvictionPolicy(ABC):
+    """
+    Base class of the eviction policies.
+
+    Subclasses define NAME, whether only keys with an expiry time are candidates
+    (VOLATILE), how access metadata evolves (`new_access`, `touch`) and how good
+    a candidate a key is (`score`).
+    """
+
+    NAME: str
+    VOLATILE: bool = False
+    EVICTS: bool = True
+
+    def new_access(self) -> int:
+        """
+        Returns the access metadata of a key that was just created.
+        """
+        return 0
+
+    def touch(self, access: int) -> int:
+        """
+        Returns the access metadata of a key after it was accessed.
+
+        Args:
+            access (int): The current access metadata of the key.
+        """
+        return access
+
+    @abstractmethod
+    def score(self, access: int, expire: Optional[int]) -> float:
+        """
+        Ranks a key as an eviction candidate; keys with higher scores go first.
+
+        Args:
+            access (int): The access metadata of the key.
+            expire (Optional[int]): The expiry time of the key, in milliseconds.
+        """
+        pass
+
+
+class NoEvictionPolicy(EvictionPolicy):
+    """
+    Never evicts; writes that may need memory are refused over the limit.
+    """
+
+    NAME = "noeviction"
+    EVICTS = False
+
+    def score(self, access: int, expire: Optional[int]) -> float:
+        return 0
+
+
+class AllKeysLRUPolicy(EvictionPolicy):
+    """
+    Evicts the keys that were not accessed for the longest time.
+    """
+
+    NAME = "allkeys-lru"
+
+    def new_access(self) -> int:
+        return lru_clock()
+
+    def touch(self, access: int) -> int:
+        return lru_clock()
+
+    def score(self, access: int, expire: Optional[int]) -> float:
+        """
+        Returns the idle time of the key in seconds, accounting for clock wraps.
+        """
+        return (lru_clock() - access) & LRU_CLOCK_MAX
+
+
+class AllKeysLFUPolicy(EvictionPolicy):
+    """
+    Evicts the keys accessed the least often recently.
+    """
+
+    NAME = "allkeys-lfu"
+
+    def new_access(self) -> int:
+        return (lfu_time_in_minutes() << 8) | LFU_INIT_VAL
+
+    def touch(self, access: int) -> int:
+        counter = lfu_log_increment(lfu_decremented_counter(access))
+        return (lfu_time_in_minutes() << 8) | counter
+
+    def score(self, access: int, expire: Optional[int]) -> float:
+        return LFU_COUNTER_MAX - lfu_decremented_counter(access)
+
+
+class VolatileTTLPolicy(EvictionPolicy):
+    """
+    Evicts the keys with an expiry time, soonest to expire first.
+    """
+
+    NAME = "volatile-ttl"
+    VOLATILE = True
+
+    def score(self, access: int, expire: Optional[int]) -> float:
+        return -expire
+
+
+EVICTION_POLICIES: dict[str, type[EvictionPolicy]] = {
+    policy.NAME: policy
+    for policy in (NoEvictionPolicy, AllKeysLRUPolicy, AllKeysLFUPolicy, VolatileTTLPolicy)
+}
+
+
+def create_eviction_policy(name: str) -> EvictionPolicy:
+    """
+    Creates an eviction policy from its name.
+
+    Args:
+        name (str): e.g. "allkeys-lru".
+
+    Returns:
+        EvictionPolicy: The policy.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    try:
+        return EVICTION_POLICIES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown eviction policy '{name}'") from None
@@ -0,0 +1,176 @@
+"""
+This module implements `IntSet`, the compact encoding of sets whose members are
+all integers, modelled on Redis' intset: the members are kept sorted in a
+typed `array`, so a member costs 2, 4 or 8 bytes instead of a `str` object and
+a hash table slot, and membership is a binary search.
+
+- The array starts with the narrowest item type fitting every member (16, 32 or
+  64-bit) and is upgraded to a wider one when a bigger member is added.
+- Members are given and returned as strings, like those of every other set;
+  only strings holding a canonical 64-bit integer (no sign, leading zeros or
+  spaces that would change the text) can be stored.
+
+Exports:
+    - IntSet: A set of integers stored in a sorted array.
+    - as_integer: Converts a member to the integer an intset stores, if any.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, Optional
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+# Array item types by increasing width, with the range of integers they hold.
+_TYPECODES = tuple(
+    (typecode, -(2 ** (8 * size - 1)), 2 ** (8 * size - 1) - 1)
+    for typecode, size in (("h", 2), ("i", 4), ("q", 8)))
+
+
+def as_integer(member: str) -> Optional[int]:
+    """
+    Converts a member to an integer if it is the canonical text of a 64-bit integer.
+
+    Args:
+        member (str): The member.
+
+    Returns:
+        Optional[int]: The integer, or None if the member cannot be stored in an
+                       intset.
+    """
+    if not member or len(member) > 20:
+        return None
+    try:
+        number = int(member)
+    except ValueError:
+        return None
+    if not INT64_MIN <= number <= INT64_MAX or str(number) != member:
+        return None
+    return number
+
+
+def _typecode(minimum: int, maximum: int) -> str:
+    """
+    Returns the narrowest array item type holding integers in a range.
+    """
+    for typecode, low, high in _TYPECODES:
+        if low <= minimum and maximum <= high:
+            return typecode
+    raise OverflowError("integer out of the 64-bit range")
+
+
+class IntSet:
+    """
+    A set of 64-bit integers kept sorted in an array.
+    """
+
+    __slots__ = ("_array",)
+
+    def __init__(self, integers: Iterable[int] = ()):
+        """
+        Initializes the intset.
+
+        Args:
+            integers (Iterable[int]): The initial members; duplicates are ignored.
+        """
+        values = sorted(set(integers))
+        typecode = _typecode(values[0], values[-1]) if values else _TYPECODES[0][0]
+        self._array = array(typecode, values)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of members.
+        """
+        return len(self._array)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the members, in increasing order.
+        """
+        return map(str, self._array)
+
+    def __contains__(self, member: str) -> bool:
+        """
+        Checks whether a member exists.
+        """
+        number = as_integer(member)
+        return number is not None and self._find(number) >= 0
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares the members with those of another set of any encoding.
+        """
+        if isinstance(other, IntSet):
+            return self._array.tolist() == other._array.tolist()
+        if isinstance(other, (set, frozenset)):
+            return len(self) == len(other) and all(member in other for member in self)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IntSet({self._array.tolist()!r})"
+
+    def __copy__(self) -> "IntSet":
+        """
+        Returns an independent copy, e.g. for point-in-time snapshots.
+        """
+        clone = IntSet.__new__(IntSet)
+        clone._array = array(self._array.typecode, self._array)
+        return clone
+
+    def __sizeof__(self) -> int:
+        """
+        Returns the size of the intset and its array, for `sys.getsizeof`.
+        """
+        return object.__sizeof__(self) + self._array.__sizeof__()
+
+    @property
+    def itemsize(self) -> int:
+        """
+        The size in bytes of each member in the array: 2, 4 or 8.
+        """
+        return self._array.itemsize
+
+    def _find(self, number: int) -> int:
+        """
+        Returns the position of an integer in the array, or -1 if it is missing.
+        """
+        values = self._array
+        position = bisect_left(values, number)
+        if position < len(values) and values[position] == number:
+            return position
+        return -1
+
+    def add(self, number: int) -> bool:
+        """
+        Adds an integer, upgrading the array item type if it does not fit.
+
+        Returns:
+            bool: Whether the integer was added, False if it was a member already.
+        """
+        values = self._array
+        position = bisect_left(values, number)
+        if position < len(values) and values[position] == number:
+            return False
+        try:
+            values.insert(position, number)
+        except OverflowError:
+            minimum = min(values[0], number) if values else number
+            maximum = max(values[-1], number) if values else number
+            values = self._array = array(_typecode(minimum, maximum), values)
+            values.insert(position, number)
+        return True
+
+    def discard(self, member: str) -> bool:
+        """
+        Removes a member.
+
+        Returns:
+            bool: Whether the member existed.
+        """
+        number = as_integer(member)
+        position = self._find(number) if number is not None else -1
+        if position < 0:
+            return False
+        del self._array[position]
+        return True
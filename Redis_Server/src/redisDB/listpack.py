@@ -0,0 +1,538 @@
+"""
+This module implements `ListPack`, a compact list of strings stored in a single
+buffer, modelled on Redis' listpack encoding for small lists.
+
+A `collections.deque` costs a 600+ byte block plus a full `str` object (49+ bytes
+of header) per element. A listpack instead keeps every element as its UTF-8 bytes
+in one `bytearray`, so a small list costs little more than the bytes of its
+elements. Each entry is laid out as:
+
+    <length varint> <UTF-8 bytes> <backlen>
+
+where the length is an unsigned LEB128 varint and `backlen`, the size of the two
+first parts written as a varint with its bytes reversed, lets the buffer be
+walked from the tail as well, like in Redis. Locating an element scans the
+entries from the nearest end and is O(n) in their number, which is why only small
+lists, or the nodes of a `QuickList`, use this encoding (see `src.redisDB.encodings`).
+
+Small hashes use the same layout, each field followed by its value (`ListPackHash`).
+
+Exports:
+    - ListPack: The packed list.
+    - ListPackHash: A small hash packed as a listpack of fields and values.
+"""
+
+import itertools
+import sys
+from typing import Any, Iterable, Iterator
+
+from src.constants.redis_protocol import DEFAULT_ENCODING
+
+
+def _encode_varint(value: int) -> bytes:
+    """
+    Encodes a non-negative integer as an unsigned LEB128 varint.
+    """
+    if value < 0x80:
+        return bytes((value,))
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _encode_entry(item: str) -> bytes:
+    """
+    Encodes an element as its varint byte length, its UTF-8 bytes and its backlen.
+    """
+    data = item.encode(DEFAULT_ENCODING)
+    length = len(data)
+    if length < 0x7F:
+        return bytes((length,)) + data + bytes((length + 1,))
+    entry = _encode_varint(length) + data
+    return entry + _encode_varint(len(entry))[::-1]
+
+
+class ListPack:
+    """
+    A list of strings packed into a single length-prefixed byte buffer.
+    """
+
+    __slots__ = ("_buffer", "_count")
+
+    def __init__(self, items: Iterable[str] = ()):
+        """
+        Initializes the listpack.
+
+        Args:
+            items (Iterable[str]): The initial elements, head first.
+        """
+        entries = [_encode_entry(item) for item in items]
+        self._buffer = bytearray(b"".join(entries))
+        self._count = len(entries)
+
+    def _next(self, pos: int) -> tuple[int, int, int]:
+        """
+        Parses the entry starting at a byte offset.
+
+        Returns:
+            tuple[int, int, int]: The offsets of the first and past the last byte
+                                  of its data, and the offset of the next entry.
+        """
+        buffer = self._buffer
+        entry_start = pos
+        length, shift = 0, 0
+        while True:
+            byte = buffer[pos]
+            pos += 1
+            length |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        end = pos + length
+        size = end - entry_start
+        backlen = 1
+        while size >= 0x80:
+            size >>= 7
+            backlen += 1
+        return pos, end, end + backlen
+
+    def _previous(self, pos: int) -> int:
+        """
+        Returns the offset of the entry ending right before a byte offset.
+        """
+        buffer = self._buffer
+        size, shift = 0, 0
+        while True:
+            pos -= 1
+            byte = buffer[pos]
+            size |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        return pos - size
+
+    def _offset(self, index: int) -> int:
+        """
+        Returns the offset of the entry at an index between 0 and the number of
+        elements (the end of the buffer), scanning from the nearest end.
+        """
+        buffer = self._buffer
+        # Elements shorter than 127 bytes have one-byte lengths and backlens, so
+        # the scans skip them inline instead of calling `_next` / `_previous`.
+        if index <= self._count // 2:
+            pos = 0
+            for _ in range(index):
+                length = buffer[pos]
+                if length < 0x7F:
+                    pos += length + 2
+                else:
+                    pos = self._next(pos)[2]
+        else:
+            pos = len(buffer)
+            for _ in range(self._count - index):
+                size = buffer[pos - 1]
+                if size < 0x80:
+                    pos -= size + 1
+                else:
+                    pos = self._previous(pos)
+        return pos
+
+    def _normalize(self, index: int) -> int:
+        """
+        Converts a possibly negative index to a position in the list.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("listpack index out of range")
+        return index
+
+    def _decode(self, pos: int) -> str:
+        """
+        Decodes the element of the entry starting at a byte offset.
+        """
+        start, end, _ = self._next(pos)
+        return self._buffer[start:end].decode(DEFAULT_ENCODING)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements.
+        """
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the elements, head first.
+        """
+        return iter(self.slice(0, self._count))
+
+    def __reversed__(self) -> Iterator[str]:
+        """
+        Iterates over the elements, tail first.
+        """
+        pos = len(self._buffer)
+        for _ in range(self._count):
+            pos = self._previous(pos)
+            yield self._decode(pos)
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Returns the element at an index; negative indexes count from the tail.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        return self._decode(self._offset(self._normalize(index)))
+
+    def __setitem__(self, index: int, item: str) -> None:
+        """
+        Replaces the element at an index; negative indexes count from the tail.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        pos = self._offset(self._normalize(index))
+        self._buffer[pos:self._next(pos)[2]] = _encode_entry(item)
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares the elements with those of another listpack or sequence.
+        """
+        if isinstance(other, ListPack):
+            return self._buffer == other._buffer
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ListPack({list(self)!r})"
+
+    def __copy__(self) -> "ListPack":
+        """
+        Returns an independent copy, e.g. for point-in-time snapshots.
+        """
+        clone = type(self).__new__(type(self))
+        clone._buffer = bytearray(self._buffer)
+        clone._count = self._count
+        return clone
+
+    def __sizeof__(self) -> int:
+        """
+        Returns the size of the object including its buffer, for `sys.getsizeof`.
+        """
+        return object.__sizeof__(self) + sys.getsizeof(self._buffer)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the packed buffer, in bytes.
+        """
+        return len(self._buffer)
+
+    def slice(self, start: int, stop: int) -> list[str]:
+        """
+        Returns the elements from index `start` up to, excluding, index `stop`.
+
+        Args:
+            start (int): Index of the first element, between 0 and the length.
+            stop (int): Index past the last element, between `start` and the length.
+        """
+        buffer, encoding = self._buffer, DEFAULT_ENCODING
+        pos = self._offset(start)
+        items = []
+        for _ in range(stop - start):
+            data_start, data_end, pos = self._next(pos)
+            items.append(buffer[data_start:data_end].decode(encoding))
+        return items
+
+    def append(self, item: str) -> None:
+        """
+        Adds an element at the tail.
+        """
+        self._buffer += _encode_entry(item)
+        self._count += 1
+
+    def appendleft(self, item: str) -> None:
+        """
+        Adds an element at the head.
+        """
+        self._buffer[0:0] = _encode_entry(item)
+        self._count += 1
+
+    def insert(self, index: int, item: str) -> None:
+        """
+        Inserts an element before the one at an index between 0 and the length.
+        """
+        pos = self._offset(index)
+        self._buffer[pos:pos] = _encode_entry(item)
+        self._count += 1
+
+    def pop(self) -> str:
+        """
+        Removes and returns the element at the tail.
+
+        Raises:
+            IndexError: If the listpack is empty.
+        """
+        if not self._count:
+            raise IndexError("pop from an empty listpack")
+        pos = self._previous(len(self._buffer))
+        item = self._decode(pos)
+        del self._buffer[pos:]
+        self._count -= 1
+        return item
+
+    def popleft(self) -> str:
+        """
+        Removes and returns the element at the head.
+
+        Raises:
+            IndexError: If the listpack is empty.
+        """
+        if not self._count:
+            raise IndexError("pop from an empty listpack")
+        start, end, pos = self._next(0)
+        item = self._buffer[start:end].decode(DEFAULT_ENCODING)
+        del self._buffer[:pos]
+        self._count -= 1
+        return item
+
+    def delete(self, start: int, stop: int) -> None:
+        """
+        Removes the elements from index `start` up to, excluding, index `stop`.
+
+        Args:
+            start (int): Index of the first element, between 0 and the length.
+            stop (int): Index past the last element, between `start` and the length.
+        """
+        first = self._offset(start)
+        last = first
+        for _ in range(stop - start):
+            last = self._next(last)[2]
+        del self._buffer[first:last]
+        self._count -= stop - start
+
+    def split(self, index: int) -> "ListPack":
+        """
+        Moves the elements from an index on to a new listpack.
+
+        Args:
+            index (int): Index of the first element to move, between 0 and the length.
+
+        Returns:
+            ListPack: The listpack holding the moved elements.
+        """
+        pos = self._offset(index)
+        tail = ListPack.__new__(ListPack)
+        tail._buffer = self._buffer[pos:]
+        tail._count = self._count - index
+        del self._buffer[pos:]
+        self._count = index
+        return tail
+
+    def extend(self, other: "ListPack") -> None:
+        """
+        Appends the elements of another listpack.
+        """
+        self._buffer += other._buffer
+        self._count += other._count
+
+    def find(self, item: str) -> int:
+        """
+        Returns the index of the first occurrence of an element, or -1.
+        """
+        data = item.encode(DEFAULT_ENCODING)
+        buffer = self._buffer
+        pos = 0
+        for index in range(self._count):
+            start, end, pos = self._next(pos)
+            if buffer[start:end] == data:
+                return index
+        return -1
+
+    def trim(self, start: int, stop: int) -> None:
+        """
+        Keeps only the elements from index `start` up to, excluding, index `stop`.
+
+        Args:
+            start (int): Index of the first element, between 0 and the length.
+            stop (int): Index past the last element, between `start` and the length.
+        """
+        self.delete(stop, self._count)
+        self.delete(0, start)
+
+    def remove(self, item: str, count: int = 0) -> int:
+        """
+        Removes occurrences of an element, like Redis LREM.
+
+        Args:
+            item (str): The element to remove.
+            count (int): Remove at most `count` occurrences starting from the head
+                         if positive, from the tail if negative, or all of them if 0.
+
+        Returns:
+            int: The number of removed occurrences.
+        """
+        limit, from_tail = abs(count), count < 0
+        data = item.encode(DEFAULT_ENCODING)
+        buffer = self._buffer
+        matches = []
+        pos = 0
+        for _ in range(self._count):
+            start, end, next_pos = self._next(pos)
+            if buffer[start:end] == data:
+                matches.append((pos, next_pos))
+            pos = next_pos
+        if limit and len(matches) > limit:
+            matches = matches[-limit:] if from_tail else matches[:limit]
+        for first, last in reversed(matches):
+            del buffer[first:last]
+        self._count -= len(matches)
+        return len(matches)
+
+
+_MISSING = object()
+
+
+class ListPackHash(ListPack):
+    """
+    A small hash packed into a listpack, every field followed by its value.
+
+    It supports the part of the mapping protocol the hash commands use (`get`,
+    item assignment, `pop`, `items`, ...), so they handle it like the `dict` big
+    hashes are stored in. Fields are found by scanning the entries, which is
+    O(n) like in Redis; a missing field is usually ruled out by a single search
+    of the buffer.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, pairs: Iterable[tuple[str, str]] = ()):
+        """
+        Initializes the hash.
+
+        Args:
+            pairs (Iterable[tuple[str, str]]): The initial fields and values, with
+                                               distinct fields.
+        """
+        super().__init__(itertools.chain.from_iterable(pairs))
+
+    def _find(self, field: str) -> int:
+        """
+        Returns the offset of the entry of a field, or -1 if it is missing.
+        """
+        data = field.encode(DEFAULT_ENCODING)
+        buffer = self._buffer
+        if buffer.find(data) < 0:
+            return -1
+        size = len(data)
+        pos, end = 0, len(buffer)
+        while pos < end:
+            length = buffer[pos]
+            if length < 0x7F:
+                if length == size and buffer[pos + 1:pos + 1 + length] == data:
+                    return pos
+                value_pos = pos + length + 2
+            else:
+                start, stop, value_pos = self._next(pos)
+                if buffer[start:stop] == data:
+                    return pos
+            length = buffer[value_pos]
+            pos = value_pos + length + 2 if length < 0x7F else self._next(value_pos)[2]
+        return -1
+
+    def __len__(self) -> int:
+        """
+        Returns the number of fields.
+        """
+        return self._count // 2
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the fields.
+        """
+        return iter(self.slice(0, self._count)[::2])
+
+    def __contains__(self, field: str) -> bool:
+        """
+        Checks whether a field exists.
+        """
+        return self._find(field) >= 0
+
+    def __getitem__(self, field: str) -> str:
+        """
+        Returns the value of a field.
+
+        Raises:
+            KeyError: If the field does not exist.
+        """
+        value = self.get(field, _MISSING)
+        if value is _MISSING:
+            raise KeyError(field)
+        return value
+
+    def __setitem__(self, field: str, value: str) -> None:
+        """
+        Sets the value of a field, adding the field if needed.
+        """
+        pos = self._find(field)
+        if pos < 0:
+            self._buffer += _encode_entry(field) + _encode_entry(value)
+            self._count += 2
+            return
+        value_pos = self._next(pos)[2]
+        self._buffer[value_pos:self._next(value_pos)[2]] = _encode_entry(value)
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares the fields and values with those of another hash of any encoding.
+        """
+        try:
+            return dict(self.items()) == dict(other.items())
+        except AttributeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ListPackHash({dict(self.items())!r})"
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """
+        Returns the value of a field, or a default value if it does not exist.
+        """
+        pos = self._find(field)
+        if pos < 0:
+            return default
+        return self._decode(self._next(pos)[2])
+
+    def pop(self, field: str, default: Any = _MISSING) -> Any:
+        """
+        Removes a field and returns its value.
+
+        Raises:
+            KeyError: If the field does not exist and no default value is given.
+        """
+        pos = self._find(field)
+        if pos < 0:
+            if default is _MISSING:
+                raise KeyError(field)
+            return default
+        value_pos = self._next(pos)[2]
+        start, stop, end = self._next(value_pos)
+        value = self._buffer[start:stop].decode(DEFAULT_ENCODING)
+        del self._buffer[pos:end]
+        self._count -= 2
+        return value
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """
+        Returns the fields and their values.
+        """
+        entries = iter(self.slice(0, self._count))
+        return zip(entries, entries)
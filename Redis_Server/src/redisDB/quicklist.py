@@ -0,0 +1,407 @@
+"""
+This module implements `QuickList`, the encoding of big lists, modelled on Redis'
+quicklist: a sequence of `ListPack` nodes, each holding at most
+`NODE_MAX_ENTRIES` elements and about `NODE_MAX_BYTES` bytes.
+
+Compared to a `collections.deque` of `str` objects, elements cost little more
+than their bytes, and finding an element only decodes the node holding it:
+
+- The nodes are kept in a Python list (an array of node pointers rather than a
+  linked list, which gives the same O(1) pushes and pops at both ends).
+- The cumulative number of elements at the end of each node is cached, so an
+  index is located with a binary search and then an O(node) scan. Pushes, pops
+  and insertions keep the cache valid; other changes rebuild it on the next
+  lookup.
+- Nodes are split when an insertion makes them too big, and merged with their
+  neighbours when removals leave them small, which bounds the per-node overhead.
+
+Exports:
+    - QuickList: The list of listpack nodes.
+"""
+
+import itertools
+import sys
+from bisect import bisect_right
+from typing import Iterable, Iterator, Optional
+
+from src.redisDB.listpack import ListPack
+
+# Limits of a node, like Redis' default list-max-listpack-size of -2 (8 KB).
+NODE_MAX_ENTRIES = 128
+NODE_MAX_BYTES = 8192
+
+# Estimated size of a node object and its buffer header, excluding the packed bytes.
+NODE_OVERHEAD = sys.getsizeof(ListPack())
+
+
+class QuickList:
+    """
+    A list of strings stored in a sequence of bounded listpack nodes.
+    """
+
+    __slots__ = ("_nodes", "_count", "_nbytes", "_ends", "_shift")
+
+    def __init__(self, items: Iterable[str] = ()):
+        """
+        Initializes the quicklist.
+
+        Args:
+            items (Iterable[str]): The initial elements, head first.
+        """
+        self._nodes: list[ListPack] = []
+        self._count = 0
+        self._nbytes = 0
+        # Cumulative element counts at the end of each node, valid up to `_shift`
+        # elements pushed (positive) or popped (negative) at the head since.
+        self._ends: Optional[list[int]] = None
+        self._shift = 0
+        for item in items:
+            self.append(item)
+
+    def _invalidate(self) -> None:
+        """
+        Drops the cached node positions after a change in the middle of the list.
+        """
+        self._ends = None
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """
+        Finds the node holding the element at an index.
+
+        Args:
+            index (int): A position between 0 and the length (excluded).
+
+        Returns:
+            tuple[int, int]: The index of the node and the position in the node.
+        """
+        ends = self._ends
+        if ends is None:
+            ends = self._ends = list(itertools.accumulate(map(len, self._nodes)))
+            self._shift = 0
+        position = index - self._shift
+        node_index = bisect_right(ends, position)
+        if node_index == 0:
+            return 0, index
+        return node_index, position - ends[node_index - 1]
+
+    def _normalize(self, index: int) -> int:
+        """
+        Converts a possibly negative index to a position in the list.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("quicklist index out of range")
+        return index
+
+    @staticmethod
+    def _is_full(node: ListPack) -> bool:
+        """
+        Whether a node cannot take another element.
+        """
+        return len(node) >= NODE_MAX_ENTRIES or node.nbytes >= NODE_MAX_BYTES
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements.
+        """
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the elements, head first.
+        """
+        for node in self._nodes:
+            yield from node
+
+    def __reversed__(self) -> Iterator[str]:
+        """
+        Iterates over the elements, tail first.
+        """
+        for node in reversed(self._nodes):
+            yield from reversed(node)
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Returns the element at an index; negative indexes count from the tail.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        node_index, position = self._locate(self._normalize(index))
+        return self._nodes[node_index][position]
+
+    def __setitem__(self, index: int, item: str) -> None:
+        """
+        Replaces the element at an index; negative indexes count from the tail.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        node_index, position = self._locate(self._normalize(index))
+        node = self._nodes[node_index]
+        nbytes = node.nbytes
+        node[position] = item
+        self._nbytes += node.nbytes - nbytes
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares the elements with those of another list of any encoding.
+        """
+        try:
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"QuickList({list(self)!r})"
+
+    def __copy__(self) -> "QuickList":
+        """
+        Returns an independent copy, e.g. for point-in-time snapshots.
+        """
+        clone = QuickList()
+        clone._nodes = [node.__copy__() for node in self._nodes]
+        clone._count = self._count
+        clone._nbytes = self._nbytes
+        return clone
+
+    def __sizeof__(self) -> int:
+        """
+        Returns the estimated size of the quicklist and its nodes, in O(1), for
+        `sys.getsizeof`.
+        """
+        return (object.__sizeof__(self) + sys.getsizeof(self._nodes)
+                + len(self._nodes) * NODE_OVERHEAD + self._nbytes)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The total size of the packed buffers of the nodes, in bytes.
+        """
+        return self._nbytes
+
+    @property
+    def node_count(self) -> int:
+        """
+        The number of nodes.
+        """
+        return len(self._nodes)
+
+    def append(self, item: str) -> None:
+        """
+        Adds an element at the tail.
+        """
+        nodes = self._nodes
+        if nodes and not self._is_full(nodes[-1]):
+            node = nodes[-1]
+            nbytes = node.nbytes
+            node.append(item)
+            if self._ends is not None:
+                self._ends[-1] += 1
+        else:
+            node, nbytes = ListPack([item]), 0
+            nodes.append(node)
+            if self._ends is not None:
+                self._ends.append((self._ends[-1] if self._ends else 0) + 1)
+        self._nbytes += node.nbytes - nbytes
+        self._count += 1
+
+    def appendleft(self, item: str) -> None:
+        """
+        Adds an element at the head.
+        """
+        nodes = self._nodes
+        if nodes and not self._is_full(nodes[0]):
+            node = nodes[0]
+            nbytes = node.nbytes
+            node.appendleft(item)
+            self._shift += 1
+        else:
+            node, nbytes = ListPack([item]), 0
+            nodes.insert(0, node)
+            if self._ends is not None:
+                self._shift += 1
+                self._ends.insert(0, 1 - self._shift)
+        self._nbytes += node.nbytes - nbytes
+        self._count += 1
+
+    def pop(self) -> str:
+        """
+        Removes and returns the element at the tail.
+
+        Raises:
+            IndexError: If the quicklist is empty.
+        """
+        if not self._count:
+            raise IndexError("pop from an empty quicklist")
+        node = self._nodes[-1]
+        nbytes = node.nbytes
+        item = node.pop()
+        self._nbytes -= nbytes - node.nbytes
+        self._count -= 1
+        if not node:
+            self._nodes.pop()
+            if self._ends is not None:
+                self._ends.pop()
+            if not self._nodes:
+                self._invalidate()
+        elif self._ends is not None:
+            self._ends[-1] -= 1
+        return item
+
+    def popleft(self) -> str:
+        """
+        Removes and returns the element at the head.
+
+        Raises:
+            IndexError: If the quicklist is empty.
+        """
+        if not self._count:
+            raise IndexError("pop from an empty quicklist")
+        node = self._nodes[0]
+        nbytes = node.nbytes
+        item = node.popleft()
+        self._nbytes -= nbytes - node.nbytes
+        self._count -= 1
+        self._shift -= 1
+        if not node:
+            del self._nodes[0]
+            if self._ends is not None:
+                del self._ends[0]
+            if not self._nodes:
+                self._invalidate()
+        return item
+
+    def slice(self, start: int, stop: int) -> list[str]:
+        """
+        Returns the elements from index `start` up to, excluding, index `stop`.
+
+        Args:
+            start (int): Index of the first element, between 0 and the length.
+            stop (int): Index past the last element, between `start` and the length.
+        """
+        if start >= stop:
+            return []
+        node_index, position = self._locate(start)
+        items: list[str] = []
+        remaining = stop - start
+        for node in itertools.islice(self._nodes, node_index, None):
+            end = min(len(node), position + remaining)
+            items += node.slice(position, end)
+            remaining -= end - position
+            if not remaining:
+                break
+            position = 0
+        return items
+
+    def trim(self, start: int, stop: int) -> None:
+        """
+        Keeps only the elements from index `start` up to, excluding, index `stop`.
+
+        Args:
+            start (int): Index of the first element, between 0 and the length.
+            stop (int): Index past the last element, between `start` and the length.
+        """
+        if start >= stop:
+            self._nodes, self._count, self._nbytes = [], 0, 0
+            self._invalidate()
+            return
+        last_index, last_position = self._locate(stop - 1)
+        first_index, first_position = self._locate(start)
+        nodes = self._nodes[first_index:last_index + 1]
+        nodes[-1].delete(last_position + 1, len(nodes[-1]))
+        nodes[0].delete(0, first_position)
+        self._nodes = nodes
+        self._count = stop - start
+        self._compact()
+
+    def insert(self, index: int, item: str) -> None:
+        """
+        Inserts an element before the one at an index between 0 and the length,
+        splitting the node holding it if it gets too big.
+        """
+        if index == self._count:
+            self.append(item)
+            return
+        if index == 0:
+            self.appendleft(item)
+            return
+        node_index, position = self._locate(index)
+        node = self._nodes[node_index]
+        nbytes = node.nbytes
+        node.insert(position, item)
+        self._nbytes += node.nbytes - nbytes
+        self._count += 1
+        ends = self._ends
+        shifted = node_index
+        if len(node) > NODE_MAX_ENTRIES or node.nbytes > NODE_MAX_BYTES:
+            tail = node.split(len(node) // 2)
+            self._nodes.insert(node_index + 1, tail)
+            end = ends[node_index] + 1
+            ends[node_index:node_index + 1] = [end - len(tail), end]
+            shifted += 2
+        # The following nodes now end one element later; `map` keeps this loop in C.
+        ends[shifted:] = map((1).__add__, ends[shifted:])
+
+    def find(self, item: str) -> int:
+        """
+        Returns the index of the first occurrence of an element, or -1.
+        """
+        offset = 0
+        for node in self._nodes:
+            position = node.find(item)
+            if position >= 0:
+                return offset + position
+            offset += len(node)
+        return -1
+
+    def remove(self, item: str, count: int = 0) -> int:
+        """
+        Removes occurrences of an element, like Redis LREM.
+
+        Args:
+            item (str): The element to remove.
+            count (int): Remove at most `count` occurrences starting from the head
+                         if positive, from the tail if negative, or all of them if 0.
+
+        Returns:
+            int: The number of removed occurrences.
+        """
+        from_tail = count < 0
+        limit = abs(count)
+        removed = 0
+        nodes = reversed(self._nodes) if from_tail else self._nodes
+        for node in nodes:
+            if not limit:
+                removed += node.remove(item)
+                continue
+            remaining = limit - removed
+            removed += node.remove(item, -remaining if from_tail else remaining)
+            if removed == limit:
+                break
+        if removed:
+            self._count -= removed
+            self._compact()
+        return removed
+
+    def _compact(self) -> None:
+        """
+        Drops empty nodes and merges adjacent nodes that fit in one.
+        """
+        merged: list[ListPack] = []
+        for node in self._nodes:
+            if not node:
+                continue
+            if merged and (len(merged[-1]) + len(node) <= NODE_MAX_ENTRIES
+                           and merged[-1].nbytes + node.nbytes <= NODE_MAX_BYTES):
+                merged[-1].extend(node)
+            else:
+                merged.append(node)
+        self._nodes = merged
+        self._nbytes = sum(node.nbytes for node in merged)
+        self._invalidate()
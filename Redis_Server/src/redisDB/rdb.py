@@ -0,0 +1,459 @@
+"""
+This module implements the binary snapshot format used by `RedisDB`, modelled on
+Redis' RDB files. It replaces pickle, which is slow to load, unsafe to load from
+an untrusted file, and stores every value with full Python object overhead.
+
+File layout:
+    - Header: the magic string "REDIS", a 4-digit format version and a flags byte
+      (bit 0: the record stream is zlib-compressed).
+    - Record stream (compressed as a whole when the flag is set). Each record is a
+      type tag, the varint length of its body, then the body:
+        - `TYPE_STRING`: a batch of string keys, as the string array
+          `[key1, value1, key2, value2, ...]`.
+        - `TYPE_INTEGER`: a batch of integer keys (e.g. set by INCR), as a string
+          array of keys and decimal values, so they load back as integers.
+        - `TYPE_LIST`: one list, as the string array `[key, item1, item2, ...]`.
+        - `TYPE_HASH`: one hash, as the string array
+          `[key, field1, value1, field2, value2, ...]`.
+        - `TYPE_ZSET`: one sorted set, as the string array
+          `[key, member1, score1, member2, score2, ...]`, lowest score first,
+          with scores in their shortest round-tripping decimal form.
+        - `TYPE_SET`: one set, as the string array `[key, member1, member2, ...]`.
+        - `OPCODE_EXPIRETIME_MS`: a batch of expiry times, as a string array of
+          keys followed by one little-endian int64 UNIX time in ms per key.
+        - `OPCODE_EOF` (no body length), then the CRC-32 (4 bytes, little endian)
+          of every record byte before it, including the EOF opcode.
+    - A string array is the varint string count, a width byte, the varint byte
+      size of the UTF-8 encoded strings and that encoding:
+        - width 0: the strings are joined with NUL characters (used whenever no
+          string contains one, i.e. nearly always),
+        - width 1, 2 or 4: the strings are concatenated, and the width byte is
+          followed by one little-endian length per string, in characters, of
+          that many bytes.
+
+All varints are unsigned LEB128. Keys are written in batches so that loading does
+not run Python code per key: a batch is decoded with a single `decode`, split with
+`str.split` (or at the character lengths) and turned into dict entries with C-level
+iterators.
+
+Loading is streaming: the file is read (and decompressed) in chunks, and records
+are decoded as soon as they are complete, so memory use is bounded by the chunk
+size, the size of one record and the decoded data rather than by the file size.
+
+Exports:
+    - dump: Writes data and expiry times to a file object.
+    - load: Reads data and expiry times from a file object.
+    - is_rdb_file: Checks whether a file starts with the RDB magic string.
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+from typing import Any, BinaryIO
+
+from src.exceptions.redis_exceptions import RdbLoadError
+from src.redisDB.encodings import (
+    create_hash,
+    create_list,
+    create_set,
+    is_hash,
+    is_list,
+    is_set,
+    is_zset,
+    shared_integer,
+)
+from src.redisDB.zset import ZSet
+
+RDB_MAGIC = b"REDIS"
+RDB_VERSION = 1
+
+FLAG_COMPRESSED = 0x01
+
+TYPE_STRING = 0
+TYPE_LIST = 1
+TYPE_INTEGER = 2
+TYPE_HASH = 3
+TYPE_ZSET = 4
+TYPE_SET = 5
+OPCODE_EXPIRETIME_MS = 0xFC
+OPCODE_EOF = 0xFF
+
+HEADER_SIZE = len(RDB_MAGIC) + 4 + 1
+
+# Size of the chunks written to and read from the file.
+CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of keys per batch record.
+BATCH_SIZE = 4096
+
+_CRC = struct.Struct("<I")
+
+_LENGTH_TYPECODES = {1: "B", 2: "H", 4: "I"}
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class _IncompleteRecord(Exception):
+    """
+    Raised internally when a record continues past the data read so far.
+    """
+
+
+def _encode_varint(value: int) -> bytes:
+    """
+    Encodes a non-negative integer as an unsigned LEB128 varint.
+    """
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(buffer, pos: int) -> tuple[int, int]:
+    """
+    Decodes an unsigned LEB128 varint at `pos`.
+
+    Returns:
+        tuple[int, int]: The value and the offset just past it.
+
+    Raises:
+        _IncompleteRecord: If the buffer ends inside the varint.
+    """
+    value = 0
+    shift = 0
+    size = len(buffer)
+    while pos < size:
+        byte = buffer[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+    raise _IncompleteRecord
+
+
+def _to_little_endian(values: array) -> bytes:
+    """
+    Returns the bytes of an array in little-endian order.
+    """
+    if not _LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data) -> array:
+    """
+    Builds an array from little-endian bytes.
+    """
+    values = array(typecode)
+    values.frombytes(data)
+    if not _LITTLE_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def _encode_strings(strings: list[str]) -> bytes:
+    """
+    Encodes a list of strings as a string array.
+    """
+    joined = "\0".join(strings)
+    if joined.count("\0") == len(strings) - 1 or not strings:
+        lengths = b""
+        width = 0
+    else:
+        character_lengths = list(map(len, strings))
+        longest = max(character_lengths)
+        width = 1 if longest < 0x100 else 2 if longest < 0x10000 else 4
+        lengths = _to_little_endian(array(_LENGTH_TYPECODES[width], character_lengths))
+        joined = "".join(strings)
+
+    encoded = joined.encode()
+    return b"".join((
+        _encode_varint(len(strings)),
+        bytes((width,)),
+        lengths,
+        _encode_varint(len(encoded)),
+        encoded,
+    ))
+
+
+def _decode_strings(body: memoryview, pos: int = 0) -> tuple[list[str], int]:
+    """
+    Decodes a string array at `pos` of a record body.
+
+    Returns:
+        tuple[list[str], int]: The strings and the offset just past the array.
+
+    Raises:
+        RdbLoadError: If the array is malformed.
+    """
+    try:
+        count, pos = _read_varint(body, pos)
+        width = body[pos]
+        pos += 1
+        lengths = None
+        if width:
+            typecode = _LENGTH_TYPECODES.get(width)
+            if typecode is None:
+                raise RdbLoadError(f"ERR Invalid string length width {width}")
+            lengths = _from_little_endian(typecode, body[pos:pos + count * width])
+            pos += count * width
+        size, pos = _read_varint(body, pos)
+    except (_IncompleteRecord, IndexError) as e:
+        raise RdbLoadError("ERR Corrupted string array in RDB file") from e
+
+    text = str(body[pos:pos + size], "utf-8")
+    pos += size
+
+    if lengths is None:
+        strings = text.split("\0") if count else []
+    else:
+        offsets = list(accumulate(lengths, initial=0))
+        if offsets[-1] != len(text):
+            raise RdbLoadError("ERR Corrupted string array in RDB file")
+        strings = list(map(text.__getitem__, map(slice, offsets, offsets[1:])))
+
+    if len(strings) != count:
+        raise RdbLoadError("ERR Corrupted string array in RDB file")
+    return strings, pos
+
+
+def _write_record(out: bytearray, record_type: int, body: bytes) -> None:
+    """
+    Appends a record (type tag, body length, body) to `out`.
+    """
+    out.append(record_type)
+    out += _encode_varint(len(body))
+    out += body
+
+
+def is_rdb_file(file: BinaryIO) -> bool:
+    """
+    Checks whether a file starts with the RDB magic string, and rewinds it.
+
+    Args:
+        file (BinaryIO): A binary file opened for reading.
+
+    Returns:
+        bool: True if the file is in the RDB format.
+    """
+    magic = file.read(len(RDB_MAGIC))
+    file.seek(0)
+    return magic == RDB_MAGIC
+
+
+def dump(
+    file: BinaryIO,
+    data: dict[str, Any],
+    expires: dict[str, int],
+    compress: bool = False,
+) -> None:
+    """
+    Writes data and expiry times to a file in the RDB format.
+
+    Args:
+        file (BinaryIO): A binary file opened for writing.
+        data (dict): The keys and values to write.
+        expires (dict): The expiry times, in milliseconds, of the keys in `data`.
+        compress (bool): Compress the record stream with zlib.
+
+    Raises:
+        TypeError: If a value has a type the format cannot store.
+    """
+    file.write(b"%s%04d" % (RDB_MAGIC, RDB_VERSION))
+    file.write(bytes((FLAG_COMPRESSED if compress else 0,)))
+
+    compressor = zlib.compressobj(1) if compress else None
+    crc = 0
+    out = bytearray()
+
+    def flush() -> None:
+        nonlocal crc
+        crc = zlib.crc32(out, crc)
+        file.write(compressor.compress(out) if compressor else out)
+        out.clear()
+
+    strings: list[str] = []
+    integers: list[str] = []
+    for key, value in data.items():
+        value_type = type(value)
+        if value_type is str:
+            strings.append(key)
+            strings.append(value)
+            if len(strings) >= 2 * BATCH_SIZE:
+                _write_record(out, TYPE_STRING, _encode_strings(strings))
+                strings.clear()
+        elif value_type is int:
+            integers.append(key)
+            integers.append(str(value))
+            if len(integers) >= 2 * BATCH_SIZE:
+                _write_record(out, TYPE_INTEGER, _encode_strings(integers))
+                integers.clear()
+        elif is_list(value):
+            _write_record(out, TYPE_LIST, _encode_strings([key, *value]))
+        elif is_hash(value):
+            _write_record(out, TYPE_HASH, _encode_strings(
+                [key, *(item for pair in value.items() for item in pair)]))
+        elif is_set(value):
+            _write_record(out, TYPE_SET, _encode_strings([key, *value]))
+        elif is_zset(value):
+            _write_record(out, TYPE_ZSET, _encode_strings(
+                [key, *(item for member, score in value for item in (member, repr(score)))]))
+        else:
+            raise TypeError(f"Cannot save value of type {value_type.__name__}")
+
+        if len(out) >= CHUNK_SIZE:
+            flush()
+
+    if strings:
+        _write_record(out, TYPE_STRING, _encode_strings(strings))
+    if integers:
+        _write_record(out, TYPE_INTEGER, _encode_strings(integers))
+
+    keys = [key for key in expires if key in data]
+    for start in range(0, len(keys), BATCH_SIZE):
+        batch = keys[start:start + BATCH_SIZE]
+        times = array("q", map(expires.__getitem__, batch))
+        _write_record(
+            out, OPCODE_EXPIRETIME_MS, _encode_strings(batch) + _to_little_endian(times))
+        if len(out) >= CHUNK_SIZE:
+            flush()
+
+    out.append(OPCODE_EOF)
+    crc = zlib.crc32(out, crc)
+    out += _CRC.pack(crc)
+    file.write(compressor.compress(out) if compressor else out)
+    if compressor:
+        file.write(compressor.flush())
+
+
+def load(file: BinaryIO) -> tuple[dict[str, Any], dict[str, int]]:
+    """
+    Reads data and expiry times from a file in the RDB format, chunk by chunk.
+
+    Args:
+        file (BinaryIO): A binary file opened for reading, positioned at its start.
+
+    Returns:
+        tuple[dict, dict]: The data and the expiry times of its keys.
+
+    Raises:
+        RdbLoadError: If the file is not a valid RDB file, is truncated, or its
+                      checksum does not match.
+    """
+    header = file.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE or not header.startswith(RDB_MAGIC):
+        raise RdbLoadError("ERR Wrong signature trying to load DB from file")
+    try:
+        version = int(header[len(RDB_MAGIC):-1])
+    except ValueError as e:
+        raise RdbLoadError("ERR Invalid RDB version") from e
+    if version > RDB_VERSION:
+        raise RdbLoadError(f"ERR Can't handle RDB format version {version}")
+
+    decompressor = zlib.decompressobj() if header[-1] & FLAG_COMPRESSED else None
+
+    data: dict[str, Any] = {}
+    expires: dict[str, int] = {}
+    buffer = bytearray()
+    crc = 0
+
+    def read_chunk() -> bool:
+        """Appends the next chunk of records to the buffer; False at end of file."""
+        chunk = file.read(CHUNK_SIZE)
+        try:
+            if decompressor is None:
+                buffer.extend(chunk)
+            elif chunk:
+                buffer.extend(decompressor.decompress(chunk))
+            else:
+                buffer.extend(decompressor.flush())
+        except zlib.error as e:
+            raise RdbLoadError(f"ERR Corrupted RDB file: {e}") from e
+        return bool(chunk)
+
+    more = True
+    while True:
+        more = more and read_chunk()
+        try:
+            pos, finished = _load_records(buffer, data, expires)
+        except (UnicodeDecodeError, ValueError) as e:
+            raise RdbLoadError(f"ERR Corrupted RDB file: {e}") from e
+        crc = zlib.crc32(memoryview(buffer)[:pos], crc)
+
+        if finished:
+            while more and len(buffer) < pos + _CRC.size:
+                more = read_chunk()
+            if len(buffer) < pos + _CRC.size:
+                raise RdbLoadError("ERR Unexpected end of RDB file")
+            if _CRC.unpack_from(buffer, pos)[0] != crc:
+                raise RdbLoadError("ERR Wrong RDB checksum")
+            return data, expires
+
+        if not more:
+            raise RdbLoadError("ERR Unexpected end of RDB file")
+        del buffer[:pos]
+
+
+def _load_records(
+    buffer: bytearray, data: dict[str, Any], expires: dict[str, int]
+) -> tuple[int, bool]:
+    """
+    Decodes every complete record in `buffer`.
+
+    Returns:
+        tuple[int, bool]: The offset just past the last complete record (or past the
+                          EOF opcode), and whether the EOF opcode was reached.
+    """
+    pos = 0
+    size = len(buffer)
+
+    with memoryview(buffer) as view:
+        while pos < size:
+            record_type = buffer[pos]
+            if record_type == OPCODE_EOF:
+                return pos + 1, True
+            try:
+                length, start = _read_varint(buffer, pos + 1)
+            except _IncompleteRecord:
+                break
+            end = start + length
+            if end > size:
+                break
+
+            with view[start:end] as body:
+                if record_type == TYPE_STRING:
+                    strings, _ = _decode_strings(body)
+                    pairs = iter(strings)
+                    data.update(zip(pairs, pairs))
+                elif record_type == TYPE_INTEGER:
+                    strings, _ = _decode_strings(body)
+                    data.update(zip(strings[::2], map(shared_integer, map(int, strings[1::2]))))
+                elif record_type == TYPE_LIST:
+                    strings, _ = _decode_strings(body)
+                    data[strings[0]] = create_list(strings[1:])
+                elif record_type == TYPE_HASH:
+                    strings, _ = _decode_strings(body)
+                    data[strings[0]] = create_hash(zip(strings[1::2], strings[2::2]))
+                elif record_type == TYPE_SET:
+                    strings, _ = _decode_strings(body)
+                    data[strings[0]] = create_set(strings[1:])
+                elif record_type == TYPE_ZSET:
+                    strings, _ = _decode_strings(body)
+                    data[strings[0]] = ZSet(zip(strings[1::2], map(float, strings[2::2])))
+                elif record_type == OPCODE_EXPIRETIME_MS:
+                    keys, offset = _decode_strings(body)
+                    times = _from_little_endian("q", body[offset:])
+                    if len(times) != len(keys):
+                        raise RdbLoadError("ERR Corrupted expiry record in RDB file")
+                    expires.update(zip(keys, times))
+                else:
+                    raise RdbLoadError(f"ERR Unknown RDB record type {record_type}")
+            pos = end
+
+    return pos, False
@@ -1,25 +1,212 @@
 """
 This module implements a lightweight in-memory key-value database with:
 - Singleton Pattern to ensure only one instance exists.
-- Snapshot Persistence: Data is saved to and loaded from a file using pickle.
+- Snapshot Persistence: Data is saved to and loaded from a binary RDB file (see `rdb`).
 - Factory Method: `from_file` for initializing the database from a snapshot.
+- Key Expiration: Expiry times live in a separate index next to the data.
+- Sharded Keyspace: Keys are spread over `shards` by hash, each with its own lock.
+- Memory Limit: Keys are evicted according to an eviction policy once the dataset
+  grows past `maxmemory` (see `eviction`).
 
 Features:
-- `set`: Add or update a key-value pair.
+- `set`: Add or update a key-value pair, optionally with an expiry time.
 - `get`: Retrieve a value with optional default.
 - `delete`: Remove a key-value pair.
+- `set_expire` / `get_expire` / `persist`: Manage the expiry time of a key.
+- `active_expire_cycle`: Remove expired keys in the background within a time budget.
+- `snapshot`: Take a point-in-time copy of the data for background persistence.
+- `clear`: Remove every key.
+- `keys`: List the keys (KEYS).
+- `scan_shard`: Walk the keys of a shard with a stateless cursor (SCAN).
+- `locked` / `locked_all`: Hold the locks of the shards of some keys, or of every shard.
+- `watch` / `unwatch` / `key_version`: Track the changes of keys watched by clients.
+- `configure_maxmemory`: Set the memory limit and the eviction policy.
+- `perform_evictions`: Evict keys until the dataset fits in the memory limit.
 - `dump_data`: Save the current state to a file.
+- `background_save`: Save a point-in-time copy of the data from a background thread.
+- `background_save_if_needed`: Trigger a background save from the `save_points`.
+
+Expiration works like in Redis:
+- Lazily: every lookup (`get`, `in`, `[]`) first removes the key if it has expired,
+  so an expired key is never returned.
+- Actively: keys nobody touches again are reclaimed by `active_expire_cycle`, which
+  pops the soonest deadlines from a min-heap keyed by expiry time. Heap entries are
+  not removed when a TTL changes; stale entries are skipped when popped and the heap
+  is rebuilt once they outnumber the live ones.
+
+Concurrency:
+- The server runs client handlers in parallel threads, so the keyspace is split into
+  shards by key hash, each holding its own data, expiry times, expiry heap, counters
+  and re-entrant lock. Every method locks the shard of the key it operates on.
+- Read-modify-write commands (e.g. INCR, LPUSH) hold the locks of all their keys
+  with `locked` while they run, so they are atomic, while commands on keys in other
+  shards proceed without waiting. Locks are always taken in shard order, so commands
+  on several keys cannot deadlock.
+- Operations on the whole keyspace (`snapshot`, `clear`) hold every shard lock.
+
+Memory limit:
+- With a `maxmemory` limit, every key has packed metadata holding an estimate of
+  the bytes it uses (`encodings.memory_usage`) and its access time or frequency,
+  updated by every write and lookup. The estimates add up to `used_memory`.
+- Commands that may use more memory call `perform_evictions` first. It samples a
+  few keys of one shard at a time (at random from a list of keys that is pruned
+  lazily, or the soonest deadline of the expiry heap for volatile-ttl), keeps the
+  best candidates in an eviction pool and evicts the best one until `used_memory`
+  fits the limit.
+- Without a limit no metadata is kept, so the limit costs nothing unless used.
+  `used_memory` is then estimated when asked for, e.g. by INFO, from the sizes of
+  up to `USED_MEMORY_SAMPLES` keys of each shard, picked at random from the SCAN
+  key log.
+
+SCAN cursors are stateless:
+- Each shard logs its keys in insertion order, each entry with an increasing
+  sequence number. Deleting a key leaves its entry behind; the log is compacted
+  on insertion once dead entries outnumber the keys, keeping the sequence numbers
+  of the live entries.
+- A cursor is a sequence number: `scan_shard` resumes at the first entry at or
+  after it with a binary search, so a call costs O(log n + COUNT), nothing is
+  kept between calls, and every key present for the whole iteration is returned.
+
+Snapshots are written like in Redis:
+- In the binary RDB format (`src.redisDB.rdb`), optionally zlib-compressed
+  (`snapshot_compression`). Any other file is refused; snapshots written with
+  pickle by earlier versions are only loaded by an explicit, one-time migration
+  (`load_pickle_snapshot`), as unpickling can run arbitrary code.
+- To a temporary file that atomically replaces the snapshot file once it is complete
+  and fsynced, so a crash never leaves a half-written snapshot behind.
+- `dirty` counts the changes made since the last successful save. A save point
+  `(seconds, changes)` triggers a background save once at least `changes` changes
+  were made and `seconds` seconds passed since the last save.
 """
 
+import contextlib
+import copy
+import heapq
+import itertools
+import logging
+import os
+import random
 import threading
 import pickle
-from typing import Any, Optional
+import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable, Optional, Sequence
+
+from src.exceptions.redis_exceptions import CommandProcessingException
+from src.redisDB import rdb
+from src.redisDB.encodings import create_list, memory_usage
+from src.redisDB.eviction import (
+    EVICTION_POOL_SIZE,
+    MAXMEMORY_SAMPLES,
+    EvictionPolicy,
+    create_eviction_policy,
+    metadata_access,
+    metadata_size,
+    pack_metadata,
+)
+from src.utils.time_utils import get_current_time_in_ms, has_expired
+
+logger = logging.getLogger(__name__)
+
+# Number of keys expired between two checks of the time budget.
+ACTIVE_EXPIRE_CYCLE_CHECK_EVERY = 16
+
+# The heap is rebuilt once it holds this many times more entries than volatile keys.
+EXPIRY_HEAP_COMPACTION_FACTOR = 2
+
+# Keys of each shard measured to estimate the memory used without a memory limit.
+USED_MEMORY_SAMPLES = 64
+
+# The snapshot file loaded at startup unless `--snapshot` names another one.
+DEFAULT_SNAPSHOT_FILENAME = "dump.rdb"
+
+# Number of keyspace shards, each with its own lock.
+DEFAULT_SHARDS = 16
+
+# Default eviction policy once the memory limit is reached.
+DEFAULT_EVICTION_POLICY = "noeviction"
+
+# The list of keys sampled for eviction is rebuilt once it holds this many times
+# more entries than keys.
+SAMPLE_KEYS_COMPACTION_FACTOR = 2
+
+# The SCAN log of a shard is compacted once it holds this many times more entries
+# than keys.
+SCAN_LOG_COMPACTION_FACTOR = 2
+
+# After a failed background save, save points wait this many seconds before retrying.
+BGSAVE_RETRY_DELAY = 5
+
+
+class Shard:
+    """
+    A slice of the keyspace: data, expiry times and counters guarded by one lock.
+
+    With a memory limit, `metadata` holds the packed size and access metadata of
+    every key (see `eviction.pack_metadata`), `sample_keys` the keys to sample
+    eviction candidates from (including deleted keys not pruned yet) and
+    `used_memory` the sum of the sizes.
+
+    `watched` maps each key watched by a client (WATCH) to its version and the
+    number of clients watching it; the version is bumped whenever the key changes.
+
+    `scan_keys` logs the keys in insertion order (including deleted keys not
+    pruned yet) for SCAN, and `scan_seqs` the increasing sequence number of each
+    entry; `scan_seq` is the last sequence number given out.
+    """
+
+    __slots__ = ("data", "expires", "expiry_heap", "lock", "dirty", "expired_keys",
+                 "metadata", "sample_keys", "used_memory", "evicted_keys", "watched",
+                 "scan_keys", "scan_seqs", "scan_seq")
+
+    def __init__(self):
+        """
+        Initializes an empty shard.
+        """
+        self.data: dict[str, Any] = {}
+        self.expires: dict[str, int] = {}
+        self.expiry_heap: list[tuple[int, str]] = []
+        self.lock = threading.RLock()
+        self.dirty: int = 0
+        self.expired_keys: int = 0
+        self.metadata: dict[str, int] = {}
+        self.sample_keys: list[str] = []
+        self.used_memory: int = 0
+        self.evicted_keys: int = 0
+        self.watched: dict[str, list[int]] = {}
+        self.scan_keys: list[str] = []
+        self.scan_seqs = array("q")
+        self.scan_seq: int = 0
+
+
+class _ShardLocks:
+    """
+    Context manager holding several shard locks, acquired in shard order.
+    """
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, locks: list):
+        self._locks = locks
+
+    def __enter__(self) -> None:
+        for lock in self._locks:
+            lock.acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        for lock in reversed(self._locks):
+            lock.release()
+
+
+_NO_LOCKS = contextlib.nullcontext()
 
 
 class RedisDB:
     """
-    A lightweight in-memory key-value database with singleton behavior
-    and snapshot persistence.
+    A lightweight in-memory key-value database with singleton behavior,
+    a sharded keyspace, key expiration and snapshot persistence.
     """
 
     _instance_lock: threading.Lock = threading.Lock()
@@ -30,60 +217,683 @@ class RedisDB:
         Implements the singleton pattern to ensure only one instance of RedisDB exists.
         """
         with cls._instance_lock:
-            if not cls._instance:
+            if cls._instance is None:
                 cls._instance = super().__new__(cls)
             return cls._instance
 
-    def __init__(self, snapshot_filename: str, data: Optional[dict[str, Any]] = None):
+    def __init__(
+        self,
+        snapshot_filename: str,
+        data: Optional[dict[str, Any]] = None,
+        expires: Optional[dict[str, int]] = None,
+        shards: int = DEFAULT_SHARDS,
+    ):
         """
         Initializes the RedisDB instance.
 
         Args:
             snapshot_filename (str): Path to the file for saving/loading the snapshot.
             data (Optional[dict]): Initial data for the database. Defaults to an empty dictionary.
+            expires (Optional[dict]): Expiry times (in milliseconds) of keys in `data`.
+            shards (int): Number of shards the keyspace is split into.
+
+        Raises:
+            ValueError: If the number of shards is not positive.
         """
+        if shards < 1:
+            raise ValueError("The keyspace needs at least one shard")
         self._snapshot_filename: str = snapshot_filename
-        self._data: dict[str, Any] = data or {}
+        self._shards: list[Shard] = [Shard() for _ in range(shards)]
+        self._shard_count: int = shards
+        self._all_locks = _ShardLocks([shard.lock for shard in self._shards])
+        self._expire_cursor: int = 0
+
+        for key, value in (data or {}).items():
+            shard = self._shard(key)
+            shard.data[key] = value
+            self._log_new_key(shard, key)
+        for key, expire in (expires or {}).items():
+            self._shard(key).expires[key] = expire
+        for shard in self._shards:
+            shard.expiry_heap = [(expire, key) for key, expire in shard.expires.items()]
+            heapq.heapify(shard.expiry_heap)
+
+        self.snapshot_compression: bool = True
+        self.save_points: list[tuple[int, int]] = []
+        self.last_save: int = int(time.time())
+        self.last_bgsave_ok: bool = True
+        self._last_bgsave_try: float = 0.0
+        self._save_lock = threading.Lock()
+        self._bgsave_thread: Optional[threading.Thread] = None
+
+        self.maxmemory: int = 0
+        self.eviction_policy: EvictionPolicy = create_eviction_policy(DEFAULT_EVICTION_POLICY)
+        self._track_memory: bool = False
+        self._eviction_lock = threading.Lock()
+        self._eviction_pool: list[tuple[float, int, str]] = []
+        self._eviction_cursor: int = 0
+
+    def _shard(self, key: Any) -> Shard:
+        """
+        Returns the shard holding a key.
+        """
+        return self._shards[hash(key) % self._shard_count]
+
+    def locked(self, keys: Sequence[Any]):
+        """
+        Returns a context manager holding the locks of the shards of the given keys.
+
+        Commands hold it while they run, so that reading and updating their keys is
+        atomic. Locks are re-entrant and taken in shard order, so nested and
+        concurrent callers cannot deadlock.
+
+        Args:
+            keys (Sequence[Any]): The keys the caller is about to access.
+
+        Returns:
+            A context manager acquiring the shard locks on entry.
+        """
+        if len(keys) == 1:
+            return self._shards[hash(keys[0]) % self._shard_count].lock
+        indexes = {hash(key) % self._shard_count for key in keys}
+        if not indexes:
+            return _NO_LOCKS
+        if len(indexes) == 1:
+            return self._shards[indexes.pop()].lock
+        return _ShardLocks([self._shards[index].lock for index in sorted(indexes)])
+
+    def watch(self, key: str) -> int:
+        """
+        Starts tracking the changes of a key for a client (WATCH).
+
+        Args:
+            key (str): The key to watch.
+
+        Returns:
+            int: The current version of the key, to compare with `key_version`.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            self._expire_if_needed(shard, key)
+            entry = shard.watched.get(key)
+            if entry is None:
+                entry = shard.watched[key] = [0, 0]
+            entry[1] += 1
+            return entry[0]
+
+    def unwatch(self, key: str) -> None:
+        """
+        Stops tracking the changes of a key for a client, once per `watch` call.
+
+        Args:
+            key (str): The watched key.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.watched[key]
+            entry[1] -= 1
+            if not entry[1]:
+                del shard.watched[key]
+
+    def key_version(self, key: str) -> int:
+        """
+        Returns the version of a watched key, expiring it first if its time passed.
+
+        Args:
+            key (str): A key being watched.
+
+        Returns:
+            int: The version, bumped by every change of the key since it is watched.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            self._expire_if_needed(shard, key)
+            return shard.watched[key][0]
+
+    @staticmethod
+    def _signal_modified(shard: Shard, key: str) -> None:
+        """
+        Bumps the version of a key if clients watch it. Must be called with the
+        shard lock held.
+        """
+        entry = shard.watched.get(key)
+        if entry is not None:
+            entry[0] += 1
+
+    def locked_all(self) -> _ShardLocks:
+        """
+        Returns a context manager holding the lock of every shard.
+        """
+        return self._all_locks
+
+    @property
+    def shards(self) -> int:
+        """
+        The number of shards the keyspace is split into.
+        """
+        return self._shard_count
+
+    @property
+    def dirty(self) -> int:
+        """
+        The number of changes made since the last successful save.
+        """
+        return sum(shard.dirty for shard in self._shards)
+
+    def reset_dirty(self) -> None:
+        """
+        Forgets the changes made so far, e.g. once the database was loaded from disk.
+        """
+        for shard in self._shards:
+            with shard.lock:
+                shard.dirty = 0
+
+    def _discount_dirty(self, counts: list[int]) -> None:
+        """
+        Subtracts the changes covered by a save from the dirty counters.
+
+        Args:
+            counts (list[int]): Per-shard dirty counters when the saved copy was taken.
+        """
+        for shard, count in zip(self._shards, counts):
+            with shard.lock:
+                shard.dirty -= count
+
+    @property
+    def expired_keys(self) -> int:
+        """
+        The number of keys removed because their expiry time passed.
+        """
+        return sum(shard.expired_keys for shard in self._shards)
+
+    @property
+    def evicted_keys(self) -> int:
+        """
+        The number of keys removed to stay within the memory limit.
+        """
+        return sum(shard.evicted_keys for shard in self._shards)
+
+    @property
+    def used_memory(self) -> int:
+        """
+        The estimated bytes used by the keys and values: tracked with a memory limit,
+        and estimated from a sample of the keys of each shard otherwise.
+        """
+        if self._track_memory:
+            return sum(shard.used_memory for shard in self._shards)
+        return sum(self._estimate_used_memory(shard) for shard in self._shards)
+
+    @staticmethod
+    def _estimate_used_memory(shard: Shard) -> int:
+        """
+        Estimates the bytes used by the keys of a shard without metadata: every key
+        is measured if there are at most `USED_MEMORY_SAMPLES`, otherwise a random
+        sample of them, the others being assumed of the same average size.
+        """
+        with shard.lock:
+            data = shard.data
+            if len(data) <= USED_MEMORY_SAMPLES:
+                return sum(memory_usage(key, value, MAXMEMORY_SAMPLES)
+                           for key, value in data.items())
+            # Every key is in the SCAN log, which compaction keeps mostly live.
+            sampled = [key for key in random.sample(shard.scan_keys, USED_MEMORY_SAMPLES)
+                       if key in data]
+            if not sampled:
+                sampled = list(itertools.islice(data, USED_MEMORY_SAMPLES))
+            size = sum(memory_usage(key, data[key], MAXMEMORY_SAMPLES) for key in sampled)
+            return size * len(data) // len(sampled)
+
+    @property
+    def volatile_keys(self) -> int:
+        """
+        The number of keys with an expiry time, including expired keys not reclaimed yet.
+        """
+        return sum(len(shard.expires) for shard in self._shards)
+
+    def configure_maxmemory(
+        self, maxmemory: int, policy: str = DEFAULT_EVICTION_POLICY
+    ) -> None:
+        """
+        Sets the memory limit and the eviction policy applied once it is reached.
+
+        The metadata of the keys already in the database is rebuilt.
+
+        Args:
+            maxmemory (int): The limit in bytes; 0 disables it.
+            policy (str): The name of the eviction policy, e.g. "allkeys-lru".
+
+        Raises:
+            ValueError: If the limit is negative or the policy is unknown.
+        """
+        if maxmemory < 0:
+            raise ValueError("The memory limit cannot be negative")
+        eviction_policy = create_eviction_policy(policy)
+        with self._eviction_lock, self._all_locks:
+            self.maxmemory = maxmemory
+            self.eviction_policy = eviction_policy
+            self._track_memory = maxmemory > 0
+            self._eviction_pool.clear()
+            for shard in self._shards:
+                shard.metadata.clear()
+                shard.sample_keys = []
+                shard.used_memory = 0
+                if self._track_memory:
+                    for key, value in shard.data.items():
+                        self._track_write(shard, key, value)
+
+    def _track_write(self, shard: Shard, key: Any, value: Any) -> None:
+        """
+        Updates the size and access metadata of a key that was written. Must be
+        called with the shard lock held.
+        """
+        size = memory_usage(key, value, MAXMEMORY_SAMPLES)
+        metadata = shard.metadata.get(key)
+        if metadata is None:
+            access = self.eviction_policy.new_access()
+            shard.sample_keys.append(key)
+            if len(shard.sample_keys) > (
+                    SAMPLE_KEYS_COMPACTION_FACTOR * len(shard.data) + 64):
+                shard.sample_keys = list(shard.data)
+        else:
+            access = self.eviction_policy.touch(metadata_access(metadata))
+            shard.used_memory -= metadata_size(metadata)
+        shard.metadata[key] = pack_metadata(size, access)
+        shard.used_memory += size
+
+    def _track_read(self, shard: Shard, key: Any) -> None:
+        """
+        Updates the access metadata of a key that was looked up.
+        """
+        metadata = shard.metadata.get(key)
+        if metadata is not None:
+            shard.metadata[key] = pack_metadata(
+                metadata_size(metadata),
+                self.eviction_policy.touch(metadata_access(metadata)))
+
+    @staticmethod
+    def _track_delete(shard: Shard, key: Any) -> None:
+        """
+        Forgets the metadata of a key that was removed. Must be called with the
+        shard lock held.
+        """
+        metadata = shard.metadata.pop(key, None)
+        if metadata is not None:
+            shard.used_memory -= metadata_size(metadata)
+
+    def perform_evictions(self, on_evict: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Evicts keys until the dataset fits in the memory limit.
+
+        Args:
+            on_evict (Optional[Callable[[str], None]]): Called with every evicted
+                key while its shard is still locked, e.g. to log a DEL.
+
+        Returns:
+            bool: True if the dataset fits in the limit, False if it does not and
+                  the policy allows no (more) evictions.
+        """
+        if not self._track_memory or self.used_memory <= self.maxmemory:
+            return True
+        if not self.eviction_policy.EVICTS:
+            return False
+        with self._eviction_lock:
+            used_memory = self.used_memory
+            while used_memory > self.maxmemory:
+                freed = self._evict_one(on_evict)
+                if freed is None:
+                    return False
+                used_memory -= freed
+        return True
+
+    def _evict_one(self, on_evict: Optional[Callable[[str], None]]) -> Optional[int]:
+        """
+        Evicts the best candidate of the eviction pool, refilling it from samples.
+        Must be called with the eviction lock held.
+
+        Returns:
+            Optional[int]: The estimated bytes freed, or None if there are no candidates.
+        """
+        pool = self._eviction_pool
+        volatile = self.eviction_policy.VOLATILE
+        for _ in range(self._shard_count):
+            self._populate_eviction_pool()
+            while pool:
+                _, index, key = pool.pop()
+                shard = self._shards[index]
+                with shard.lock:
+                    if key not in shard.data or (volatile and key not in shard.expires):
+                        continue
+                    freed = shard.used_memory
+                    del shard.data[key]
+                    shard.expires.pop(key, None)
+                    self._track_delete(shard, key)
+                    shard.evicted_keys += 1
+                    shard.dirty += 1
+                    if shard.watched:
+                        self._signal_modified(shard, key)
+                    if on_evict is not None:
+                        on_evict(key)
+                    return freed - shard.used_memory
+        return None
+
+    def _populate_eviction_pool(self) -> None:
+        """
+        Samples `MAXMEMORY_SAMPLES` keys, from the next shard or the next few if it
+        holds fewer candidates, and merges them into the eviction pool, which keeps
+        the `EVICTION_POOL_SIZE` best candidates by score.
+
+        As keys are spread evenly over shards, the keys of one shard are as good a
+        sample as keys of the whole keyspace, for a single lock acquisition.
+        """
+        policy = self.eviction_policy
+        sample = self._sample_volatile_keys if policy.VOLATILE else self._sample_keys
+        pool = self._eviction_pool
+        pooled = {key for _, _, key in pool}
+        needed = MAXMEMORY_SAMPLES
+        for _ in range(self._shard_count):
+            index = self._eviction_cursor
+            self._eviction_cursor = (index + 1) % self._shard_count
+            shard = self._shards[index]
+            with shard.lock:
+                metadata, expires = shard.metadata, shard.expires
+                for key in sample(shard, needed):
+                    if key not in pooled:
+                        pooled.add(key)
+                        pool.append((policy.score(metadata_access(metadata[key]),
+                                                  expires.get(key)), index, key))
+                        needed -= 1
+            if needed <= 0:
+                break
+
+        pool.sort(key=lambda candidate: candidate[0])
+        del pool[:-EVICTION_POOL_SIZE]
+
+    @staticmethod
+    def _sample_keys(shard: Shard, count: int) -> list[str]:
+        """
+        Picks up to `count` random keys of a shard, pruning deleted keys from its
+        sample list on the way. Must be called with the shard lock held.
+        """
+        sample_keys, metadata = shard.sample_keys, shard.metadata
+        samples = []
+        for _ in range(min(count, len(metadata))):
+            while sample_keys:
+                position = int(random.random() * len(sample_keys))
+                key = sample_keys[position]
+                if key in metadata:
+                    samples.append(key)
+                    break
+                sample_keys[position] = sample_keys[-1]
+                sample_keys.pop()
+        return samples
+
+    @staticmethod
+    def _sample_volatile_keys(shard: Shard, count: int) -> list[str]:
+        """
+        Returns the key of a shard expiring soonest, the best volatile candidate,
+        popping stale entries off its expiry heap. Must be called with the shard
+        lock held.
+        """
+        heap = shard.expiry_heap
+        while heap:
+            expire, key = heap[0]
+            if shard.expires.get(key) == expire and key in shard.metadata:
+                return [key]
+            heapq.heappop(heap)
+        return []
 
     @classmethod
     def from_file(cls, snapshot_filename: str) -> "RedisDB":
         """
         Factory method to create a RedisDB instance from a snapshot file.
 
+        Keys whose expiry time passed while the server was down are dropped.
+
         Args:
             snapshot_filename (str): Path to the snapshot file.
 
         Returns:
             RedisDB: An instance of RedisDB initialized with data from the file.
         """
-        return cls(
-            snapshot_filename=snapshot_filename,
-            data=cls.load_snapshot(snapshot_filename),
-        )
+        data, expires = cls.load_snapshot(snapshot_filename)
+        for key in [key for key, expire in expires.items() if has_expired(expire)]:
+            data.pop(key, None)
+            del expires[key]
+
+        return cls(snapshot_filename=snapshot_filename, data=data, expires=expires)
 
     @staticmethod
-    def load_snapshot(snapshot_filename: str) -> dict[str, Any]:
+    def load_snapshot(snapshot_filename: str) -> tuple[dict[str, Any], dict[str, int]]:
         """
-        Loads a snapshot from the specified file.
+        Loads an RDB snapshot from the specified file, streaming it in.
 
         Args:
             snapshot_filename (str): Path to the snapshot file.
 
         Returns:
-            dict: A dictionary representing the loaded data.
+            tuple[dict, dict]: The loaded data and the expiry times of its keys.
+
+        Raises:
+            RdbLoadError: If the file is not an RDB file or is corrupted.
         """
         try:
             with open(snapshot_filename, "rb") as file:
-                return pickle.load(file)
+                return rdb.load(file)
         except FileNotFoundError:
-            return {}
+            return {}, {}
+
+    @staticmethod
+    def load_pickle_snapshot(
+        pickle_filename: str,
+    ) -> tuple[dict[str, Any], dict[str, int]]:
+        """
+        Loads a snapshot written with pickle by an earlier version, to migrate it
+        to RDB (`--migrate-pickle-snapshot`). Unpickling can run arbitrary code, so
+        this is only done on explicit request, for a trusted file.
+
+        Snapshots written before expiry times were stored separately hold
+        `(value, expire)` tuples, which are split into data and expiry times.
+        Their lists, pickled as deques, are converted to the current encodings.
+
+        Args:
+            pickle_filename (str): Path to the pickle snapshot.
+
+        Returns:
+            tuple[dict, dict]: The loaded data and the expiry times of its keys.
+        """
+        with open(pickle_filename, "rb") as file:
+            snapshot = pickle.load(file)
+
+        if isinstance(snapshot, tuple):
+            data, expires = snapshot
+        else:
+            data, expires = {}, {}
+            for key, entry in snapshot.items():
+                if isinstance(entry, tuple) and len(entry) == 2:
+                    data[key] = entry[0]
+                    if entry[1] is not None:
+                        expires[key] = entry[1]
+                else:
+                    data[key] = entry
+        for key, value in data.items():
+            if isinstance(value, deque):
+                data[key] = create_list(value)
+        return data, expires
 
     def dump_data(self) -> None:
         """
-        Saves the current state of the database to the snapshot file.
+        Saves the current state of the database to the snapshot file (SAVE).
+
+        The data is copied first, so the save is consistent even if other threads
+        modify the database while it is being written.
+        """
+        data, expires, dirty = self._snapshot_with_dirty()
+        self._write_snapshot(data, expires)
+        self._discount_dirty(dirty)
+        self.last_save = int(time.time())
+
+    @property
+    def is_saving(self) -> bool:
+        """
+        Whether a background save is in progress.
+        """
+        return self._bgsave_thread is not None
+
+    def background_save(self) -> None:
+        """
+        Saves a point-in-time copy of the database from a background thread (BGSAVE).
+
+        Raises:
+            CommandProcessingException: If a background save is already in progress.
+        """
+        with self._save_lock:
+            if self._bgsave_thread is not None:
+                raise CommandProcessingException("ERR Background save already in progress")
+            data, expires, dirty = self._snapshot_with_dirty()
+            self._last_bgsave_try = time.monotonic()
+            self._bgsave_thread = threading.Thread(
+                target=self._background_save, args=(data, expires, dirty),
+                name="bgsave", daemon=True)
+            self._bgsave_thread.start()
+
+    def _background_save(self, data: dict, expires: dict, dirty: list[int]) -> None:
+        """
+        Thread target of `background_save`.
+
+        Args:
+            data (dict): Point-in-time copy of the data.
+            expires (dict): Point-in-time copy of the expiry times.
+            dirty (list[int]): Per-shard dirty counters when the copy was taken.
+        """
+        try:
+            self._write_snapshot(data, expires)
+        except Exception as e:
+            logger.exception("Background save failed: %s", e)
+            self.last_bgsave_ok = False
+        else:
+            self._discount_dirty(dirty)
+            self.last_save = int(time.time())
+            self.last_bgsave_ok = True
+            logger.info("Background saving terminated with success")
+        finally:
+            self._bgsave_thread = None
+
+    def background_save_if_needed(self) -> None:
+        """
+        Starts a background save if one of the `save_points` is reached.
+        """
+        if self._bgsave_thread is not None or not self.dirty:
+            return
+        if (not self.last_bgsave_ok
+                and time.monotonic() - self._last_bgsave_try < BGSAVE_RETRY_DELAY):
+            return
+
+        elapsed = time.time() - self.last_save
+        for seconds, changes in self.save_points:
+            if self.dirty >= changes and elapsed >= seconds:
+                logger.info(
+                    "%d changes in %d seconds. Saving...", changes, seconds)
+                try:
+                    self.background_save()
+                except CommandProcessingException:
+                    pass
+                return
+
+    def _write_snapshot(self, data: dict, expires: dict) -> None:
+        """
+        Writes a snapshot to a temporary file, then atomically renames it over
+        the snapshot file.
+
+        Args:
+            data (dict): The data to save.
+            expires (dict): The expiry times of the keys.
+        """
+        temp_filename = f"{self._snapshot_filename}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_filename, "wb") as file:
+                rdb.dump(file, data, expires, compress=self.snapshot_compression)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_filename, self._snapshot_filename)
+        except BaseException:
+            try:
+                os.remove(temp_filename)
+            except OSError:
+                pass
+            raise
+
+    def snapshot(self) -> tuple[dict[str, Any], dict[str, int]]:
+        """
+        Takes a point-in-time copy of the data and expiry times.
+
+        This is the analogue of Redis forking a child for BGSAVE/BGREWRITEAOF: the copy
+        is made while every shard is locked, so it can then be written out by a
+        background thread while clients keep modifying the database. Mutable values
+        (e.g. lists) are copied too, as they are modified in place.
+
+        Returns:
+            tuple[dict, dict]: Copies of the data and of the expiry times.
+        """
+        data, expires = {}, {}
+        with self._all_locks:
+            for shard in self._shards:
+                data.update(shard.data)
+                expires.update(shard.expires)
+            for key, value in data.items():
+                if type(value) is not str and type(value) is not int:
+                    data[key] = copy.copy(value)
+        return data, expires
+
+    def _snapshot_with_dirty(self) -> tuple[dict, dict, list[int]]:
+        """
+        Takes a `snapshot` along with the per-shard dirty counters it covers.
+        """
+        with self._all_locks:
+            dirty = [shard.dirty for shard in self._shards]
+            data, expires = self.snapshot()
+        return data, expires, dirty
+
+    def clear(self) -> None:
+        """
+        Removes every key and expiry time.
+        """
+        with self._all_locks:
+            for shard in self._shards:
+                for entry in shard.watched.values():
+                    entry[0] += 1
+                shard.data.clear()
+                shard.expires.clear()
+                shard.expiry_heap.clear()
+                shard.metadata.clear()
+                shard.sample_keys.clear()
+                shard.used_memory = 0
+                shard.scan_keys.clear()
+                del shard.scan_seqs[:]
+            self._eviction_pool.clear()
+
+    @staticmethod
+    def _expire_if_needed(shard: Shard, key: str) -> bool:
+        """
+        Deletes the key if its expiry time has passed. Must be called with the
+        shard lock held.
+
+        Args:
+            shard (Shard): The shard holding the key.
+            key (str): The key to check.
+
+        Returns:
+            bool: True if the key was expired and removed, False otherwise.
         """
-        with open(self._snapshot_filename, "wb") as file:
-            pickle.dump(self._data, file)
+        if not has_expired(shard.expires.get(key)):
+            return False
+        shard.data.pop(key, None)
+        shard.expires.pop(key, None)
+        RedisDB._track_delete(shard, key)
+        shard.expired_keys += 1
+        shard.dirty += 1
+        if shard.watched:
+            RedisDB._signal_modified(shard, key)
+        return True
 
     def __contains__(self, key: str) -> bool:
         """
@@ -93,9 +903,15 @@ class RedisDB:
             key (str): The key to check.
 
         Returns:
-            bool: True if the key exists, False otherwise.
+            bool: True if the key exists and has not expired, False otherwise.
         """
-        return key in self._data
+        shard = self._shard(key)
+        if key not in shard.data:
+            return False
+        if key not in shard.expires:
+            return True
+        with shard.lock:
+            return not self._expire_if_needed(shard, key) and key in shard.data
 
     def __getitem__(self, item: str) -> Any:
         """
@@ -106,18 +922,129 @@ class RedisDB:
 
         Returns:
             Any: The value associated with the key.
+
+        Raises:
+            KeyError: If the key does not exist or has expired.
+        """
+        shard = self._shard(item)
+        if item in shard.expires:
+            with shard.lock:
+                self._expire_if_needed(shard, item)
+        value = shard.data[item]
+        if self._track_memory:
+            self._track_read(shard, item)
+        return value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys, including expired keys not reclaimed yet.
+        """
+        return sum(len(shard.data) for shard in self._shards)
+
+    def scan_shard(self, index: int, cursor: int, count: int) -> tuple[int, list[str]]:
+        """
+        Walks the keys of one shard in insertion order, e.g. for SCAN to walk the
+        keyspace a shard at a time without keeping any state between calls.
+
+        The keys returned may include keys deleted since they were logged, or a
+        key twice if it was deleted and added again; callers check them.
+
+        Args:
+            index (int): The index of the shard, below `shards`.
+            cursor (int): The sequence number to resume at, 0 to start.
+            count (int): The number of log entries to walk.
+
+        Returns:
+            tuple[int, list[str]]: The sequence number to resume at, 0 once the
+                                   shard was walked, and the keys.
+        """
+        shard = self._shards[index]
+        with shard.lock:
+            seqs = shard.scan_seqs
+            start = bisect_left(seqs, cursor)
+            end = start + count
+            keys = shard.scan_keys[start:end]
+            return (seqs[end] if end < len(seqs) else 0), keys
+
+    @staticmethod
+    def _log_new_key(shard: Shard, key: Any) -> None:
+        """
+        Logs a key just added to a shard for SCAN, compacting the log once dead entries
+        outnumber the keys. Must be called with the shard lock held.
         """
-        return self._data[item]
+        shard.scan_seq += 1
+        shard.scan_seqs.append(shard.scan_seq)
+        shard.scan_keys.append(key)
+        if len(shard.scan_keys) > SCAN_LOG_COMPACTION_FACTOR * len(shard.data) + 64:
+            data = shard.data
+            keys, seqs = shard.scan_keys, shard.scan_seqs
+            # A key logged twice keeps its latest entry.
+            latest = {key: position for position, key in enumerate(keys)}
+            kept = [position for position, key in enumerate(keys)
+                    if latest[key] == position and key in data]
+            shard.scan_keys = [keys[position] for position in kept]
+            shard.scan_seqs = array("q", (seqs[position] for position in kept))
 
-    def set(self, key: Any, value: Any) -> None:
+    def keys(self, match: Optional[Callable[[str], Any]] = None) -> list[str]:
+        """
+        Returns the keys that have not expired, holding one shard lock at a time.
+
+        Args:
+            match (Optional[Callable[[str], Any]]): Returns whether a key should be
+                                                    included; all keys if None.
+
+        Returns:
+            list[str]: The keys.
+        """
+        keys = []
+        for shard in self._shards:
+            with shard.lock:
+                candidates = shard.data if match is None else filter(match, shard.data)
+                expires = shard.expires
+                if not expires:
+                    keys += candidates
+                    continue
+                now = get_current_time_in_ms()
+                keys += [key for key in candidates
+                         if (expire := expires.get(key)) is None or expire >= now]
+        return keys
+
+    def set(
+        self,
+        key: Any,
+        value: Any,
+        expire: Optional[int] = None,
+        keep_ttl: bool = False,
+    ) -> None:
         """
         Adds or updates a key-value pair in the database.
 
+        Like the Redis SET command, this discards any previous expiry time of the
+        key unless `expire` or `keep_ttl` is given.
+
         Args:
             key (Any): The key to store.
             value (Any): The value to associate with the key.
+            expire (Optional[int]): Absolute expiry time in milliseconds.
+            keep_ttl (bool): Keep the current expiry time of the key.
         """
-        self._data[key] = value
+        shard = self._shard(key)
+        with shard.lock:
+            if keep_ttl:
+                self._expire_if_needed(shard, key)
+            is_new = key not in shard.data
+            shard.data[key] = value
+            if is_new:
+                self._log_new_key(shard, key)
+            shard.dirty += 1
+            if shard.watched:
+                self._signal_modified(shard, key)
+            if self._track_memory:
+                self._track_write(shard, key, value)
+            if expire is not None:
+                self._add_expire(shard, key, expire)
+            elif not keep_ttl:
+                shard.expires.pop(key, None)
 
     def get(self, key: Any, default: Optional[Any] = None) -> Any:
         """
@@ -130,7 +1057,13 @@ class RedisDB:
         Returns:
             Any: The value associated with the key or the default.
         """
-        return self._data.get(key, default)
+        shard = self._shard(key)
+        if key in shard.expires:
+            with shard.lock:
+                self._expire_if_needed(shard, key)
+        if self._track_memory and key in shard.data:
+            self._track_read(shard, key)
+        return shard.data.get(key, default)
 
     def delete(self, key: Any) -> None:
         """
@@ -138,9 +1071,129 @@ class RedisDB:
 
         Args:
             key (Any): The key to delete.
+
+        Raises:
+            KeyError: If the key does not exist.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            del shard.data[key]
+            shard.expires.pop(key, None)
+            self._track_delete(shard, key)
+            shard.dirty += 1
+            if shard.watched:
+                self._signal_modified(shard, key)
+
+    def set_expire(self, key: Any, expire: int) -> bool:
         """
-        del self._data[key]
+        Sets the absolute expiry time of an existing key.
+
+        Args:
+            key (Any): The key to expire.
+            expire (int): Absolute expiry time in milliseconds.
+
+        Returns:
+            bool: True if the expiry time was set, False if the key does not exist.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            if key not in self:
+                return False
+            self._add_expire(shard, key, expire)
+            shard.dirty += 1
+            if shard.watched:
+                self._signal_modified(shard, key)
+            return True
+
+    @staticmethod
+    def _add_expire(shard: Shard, key: Any, expire: int) -> None:
+        """
+        Records the expiry time of a key in the expiry dict and the expiry heap of
+        its shard. Must be called with the shard lock held.
+        """
+        shard.expires[key] = expire
+        heapq.heappush(shard.expiry_heap, (expire, key))
+        if len(shard.expiry_heap) > EXPIRY_HEAP_COMPACTION_FACTOR * len(shard.expires) + 64:
+            shard.expiry_heap = [(expire, key) for key, expire in shard.expires.items()]
+            heapq.heapify(shard.expiry_heap)
+
+    def get_expire(self, key: Any) -> Optional[int]:
+        """
+        Returns the absolute expiry time of a key.
+
+        Args:
+            key (Any): The key to look up.
+
+        Returns:
+            Optional[int]: Expiry time in milliseconds, or None if the key does not
+                           exist or has no expiry time.
+        """
+        if key not in self:
+            return None
+        return self._shard(key).expires.get(key)
+
+    def persist(self, key: Any) -> bool:
+        """
+        Removes the expiry time of a key.
+
+        Args:
+            key (Any): The key to persist.
+
+        Returns:
+            bool: True if an expiry time was removed, False otherwise.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            if key not in self:
+                return False
+            if shard.expires.pop(key, None) is None:
+                return False
+            shard.dirty += 1
+            if shard.watched:
+                self._signal_modified(shard, key)
+            return True
+
+    def active_expire_cycle(self, time_budget_ms: float) -> bool:
+        """
+        Deletes expired keys in order of their expiry time, within a time budget.
+
+        Shards are visited one after the other, each under its own lock, starting
+        with the shard where the previous cycle ran out of time.
+
+        Args:
+            time_budget_ms (float): The maximum time to spend, in milliseconds.
+
+        Returns:
+            bool: True if the budget ran out while expired keys may remain, so the
+                  caller should run another cycle soon; False otherwise.
+        """
+        deadline = time.perf_counter() + time_budget_ms / 1000
+        now = get_current_time_in_ms()
+        processed = 0
+
+        for step in range(self._shard_count):
+            index = (self._expire_cursor + step) % self._shard_count
+            shard = self._shards[index]
+            with shard.lock:
+                heap = shard.expiry_heap
+                while heap and heap[0][0] < now:
+                    expire, key = heapq.heappop(heap)
+                    if shard.expires.get(key) == expire:
+                        shard.data.pop(key, None)
+                        del shard.expires[key]
+                        self._track_delete(shard, key)
+                        shard.expired_keys += 1
+                        shard.dirty += 1
+                        if shard.watched:
+                            self._signal_modified(shard, key)
+
+                    processed += 1
+                    if processed % ACTIVE_EXPIRE_CYCLE_CHECK_EVERY == 0:
+                        if time.perf_counter() > deadline:
+                            self._expire_cursor = index
+                            return True
+        return False
 
 
 # Initialize the RedisDB singleton instance with a snapshot file
-REDIS_DB: RedisDB = RedisDB.from_file("redis_snapshot.pkl")
+REDIS_DB: RedisDB = RedisDB.from_file(DEFAULT_SNAPSHOT_FILENAME)
@@ -0,0 +1,320 @@
+"""
+This module implements `ZSet`, the encoding of sorted sets. Like Redis' skiplist
+encoding, it pairs a dict from member to score, for O(1) score lookups, with an
+ordered index of `(score, member)` entries for ranks and ranges.
+
+A skiplist written in Python would pay an interpreted loop per level and per
+node; the ordered index is instead a sorted list split into chunks of at most
+`CHUNK_MAX_ENTRIES` entries, where C code does most of the work:
+
+- The last entry of each chunk is kept in `_maxes`, so the chunk holding an
+  entry is found with a binary search, then the position in the chunk with
+  another one. Inserting or removing moves at most one chunk's pointers.
+- The number of entries per chunk is indexed by a Fenwick (binary indexed)
+  tree, so converting between an entry and its rank takes O(log n) too. The
+  tree is updated in place by insertions and removals, and rebuilt on the next
+  lookup after a chunk was split or merged.
+
+Entries compare as tuples, so members with the same score are ordered
+lexicographically, like in Redis.
+
+Exports:
+    - ZSet: A sorted set of members with float scores.
+"""
+
+import sys
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Iterable, Iterator, Optional
+
+# Chunks are split once they exceed this many entries and merged with a
+# neighbour when they drop below a quarter of it.
+CHUNK_MAX_ENTRIES = 1024
+
+_score = itemgetter(0)
+
+# Estimated size of an index entry: the (score, member) tuple, the float and the
+# pointer to the tuple in its chunk. Members are shared with the dict.
+ENTRY_SIZE = sys.getsizeof((0.0, "")) + sys.getsizeof(0.0) + 8
+
+
+class ZSet:
+    """
+    A sorted set: members ordered by score, then lexicographically.
+    """
+
+    __slots__ = ("_scores", "_chunks", "_maxes", "_tree")
+
+    def __init__(self, pairs: Iterable[tuple[str, float]] = ()):
+        """
+        Initializes the sorted set.
+
+        Args:
+            pairs (Iterable[tuple[str, float]]): The members and their scores; a
+                member given twice keeps its last score.
+        """
+        self._scores: dict[str, float] = dict(pairs)
+        entries = sorted(zip(self._scores.values(), self._scores.keys()))
+        half = CHUNK_MAX_ENTRIES // 2
+        self._chunks: list[list[tuple[float, str]]] = [
+            entries[start:start + half] for start in range(0, len(entries), half)]
+        self._maxes: list[tuple[float, str]] = [chunk[-1] for chunk in self._chunks]
+        # Fenwick tree of the chunk lengths, 1-indexed, or None once stale.
+        self._tree: Optional[list[int]] = None
+
+    def _index(self) -> list[int]:
+        """
+        Returns the Fenwick tree of the chunk lengths, rebuilding it if needed.
+        """
+        tree = self._tree
+        if tree is None:
+            tree = [0]
+            tree += map(len, self._chunks)
+            size = len(tree)
+            for i in range(1, size):
+                parent = i + (i & -i)
+                if parent < size:
+                    tree[parent] += tree[i]
+            self._tree = tree
+        return tree
+
+    def _update(self, chunk_index: int, delta: int) -> None:
+        """
+        Adds `delta` to the length of a chunk in the Fenwick tree, if it is valid.
+        """
+        tree = self._tree
+        if tree is None:
+            return
+        i, size = chunk_index + 1, len(tree)
+        while i < size:
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, chunk_index: int) -> int:
+        """
+        Returns the number of entries in the chunks before a chunk.
+        """
+        tree = self._index()
+        offset, i = 0, chunk_index
+        while i:
+            offset += tree[i]
+            i -= i & -i
+        return offset
+
+    def _locate(self, rank: int) -> tuple[int, int]:
+        """
+        Finds the chunk holding the entry at a rank.
+
+        Args:
+            rank (int): A rank between 0 and the length (excluded).
+
+        Returns:
+            tuple[int, int]: The index of the chunk and the position in the chunk.
+        """
+        tree = self._index()
+        size = len(tree)
+        chunk_index, step = 0, 1 << (size - 1).bit_length()
+        while step:
+            following = chunk_index + step
+            if following < size and tree[following] <= rank:
+                chunk_index = following
+                rank -= tree[following]
+            step >>= 1
+        return chunk_index, rank
+
+    def __len__(self) -> int:
+        """
+        Returns the number of members.
+        """
+        return len(self._scores)
+
+    def __contains__(self, member: str) -> bool:
+        """
+        Checks whether a member exists.
+        """
+        return member in self._scores
+
+    def __iter__(self) -> Iterator[tuple[str, float]]:
+        """
+        Iterates over the members and their scores, lowest score first.
+        """
+        for chunk in self._chunks:
+            for score, member in chunk:
+                yield member, score
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares the members and scores with those of another sorted set.
+        """
+        if not isinstance(other, ZSet):
+            return NotImplemented
+        return self._scores == other._scores
+
+    def __repr__(self) -> str:
+        return f"ZSet({list(self)!r})"
+
+    def __copy__(self) -> "ZSet":
+        """
+        Returns an independent copy, e.g. for point-in-time snapshots.
+        """
+        clone = ZSet.__new__(ZSet)
+        clone._scores = self._scores.copy()
+        clone._chunks = [chunk.copy() for chunk in self._chunks]
+        clone._maxes = self._maxes.copy()
+        clone._tree = None
+        return clone
+
+    def __sizeof__(self) -> int:
+        """
+        Returns the estimated size of the sorted set, excluding the member strings,
+        in O(1), for `sys.getsizeof`.
+        """
+        return (object.__sizeof__(self) + sys.getsizeof(self._scores)
+                + sys.getsizeof(self._maxes) * 2 + len(self._scores) * ENTRY_SIZE
+                + len(self._chunks) * sys.getsizeof([]))
+
+    def members(self) -> Iterator[str]:
+        """
+        Iterates over the members, in no particular order, without sorting them.
+        """
+        return iter(self._scores)
+
+    def score(self, member: str) -> Optional[float]:
+        """
+        Returns the score of a member, or None if it does not exist.
+        """
+        return self._scores.get(member)
+
+    def add(self, member: str, score: float) -> None:
+        """
+        Adds a member, or updates its score.
+        """
+        current = self._scores.get(member)
+        if current is not None:
+            if current == score:
+                return
+            self._remove_entry((current, member))
+        self._scores[member] = score
+        self._insert_entry((score, member))
+
+    def remove(self, member: str) -> bool:
+        """
+        Removes a member.
+
+        Returns:
+            bool: Whether the member existed.
+        """
+        score = self._scores.pop(member, None)
+        if score is None:
+            return False
+        self._remove_entry((score, member))
+        return True
+
+    def rank(self, member: str) -> Optional[int]:
+        """
+        Returns the rank of a member, 0 for the lowest score, or None if it does
+        not exist.
+        """
+        score = self._scores.get(member)
+        if score is None:
+            return None
+        entry = (score, member)
+        chunk_index = bisect_left(self._maxes, entry)
+        return self._offset(chunk_index) + bisect_left(self._chunks[chunk_index], entry)
+
+    def rank_of_score(self, score: float, exclusive: bool = False) -> int:
+        """
+        Returns the rank of the first member whose score is at least `score`, or
+        strictly above it if `exclusive`; the length if there is none.
+        """
+        bisect = bisect_right if exclusive else bisect_left
+        chunk_index = bisect(self._maxes, score, key=_score)
+        if chunk_index == len(self._chunks):
+            return len(self._scores)
+        return self._offset(chunk_index) + bisect(self._chunks[chunk_index], score, key=_score)
+
+    def slice(self, start: int, stop: int) -> list[tuple[str, float]]:
+        """
+        Returns the members from rank `start` up to, excluding, rank `stop`, with
+        their scores.
+
+        Args:
+            start (int): Rank of the first member, between 0 and the length.
+            stop (int): Rank past the last member, between `start` and the length.
+        """
+        if start >= stop:
+            return []
+        chunk_index, position = self._locate(start)
+        entries: list[tuple[float, str]] = []
+        remaining = stop - start
+        for chunk in self._chunks[chunk_index:]:
+            end = min(len(chunk), position + remaining)
+            entries += chunk[position:end]
+            remaining -= end - position
+            if not remaining:
+                break
+            position = 0
+        return [(member, score) for score, member in entries]
+
+    def pop_min(self, count: int) -> list[tuple[str, float]]:
+        """
+        Removes and returns the `count` members with the lowest scores.
+        """
+        popped = self.slice(0, min(count, len(self._scores)))
+        for member, _ in popped:
+            self.remove(member)
+        return popped
+
+    def _insert_entry(self, entry: tuple[float, str]) -> None:
+        """
+        Inserts an entry in the ordered index, splitting its chunk if too big.
+        """
+        chunks, maxes = self._chunks, self._maxes
+        if not chunks:
+            chunks.append([entry])
+            maxes.append(entry)
+            self._tree = None
+            return
+        chunk_index = bisect_left(maxes, entry)
+        if chunk_index == len(chunks):
+            chunk_index -= 1
+        chunk = chunks[chunk_index]
+        insort(chunk, entry)
+        maxes[chunk_index] = chunk[-1]
+        if len(chunk) > CHUNK_MAX_ENTRIES:
+            half = len(chunk) // 2
+            chunks.insert(chunk_index + 1, chunk[half:])
+            del chunk[half:]
+            maxes[chunk_index:chunk_index + 1] = [chunk[-1], chunks[chunk_index + 1][-1]]
+            self._tree = None
+        else:
+            self._update(chunk_index, 1)
+
+    def _remove_entry(self, entry: tuple[float, str]) -> None:
+        """
+        Removes an entry from the ordered index, merging its chunk if too small.
+        """
+        chunks, maxes = self._chunks, self._maxes
+        chunk_index = bisect_left(maxes, entry)
+        chunk = chunks[chunk_index]
+        del chunk[bisect_left(chunk, entry)]
+        if not chunk:
+            del chunks[chunk_index]
+            del maxes[chunk_index]
+            self._tree = None
+            return
+        maxes[chunk_index] = chunk[-1]
+        if len(chunk) < CHUNK_MAX_ENTRIES // 4 and len(chunks) > 1:
+            if chunk_index == len(chunks) - 1:
+                chunk_index -= 1
+            merged = chunks[chunk_index] + chunks[chunk_index + 1]
+            chunks[chunk_index:chunk_index + 2] = [merged]
+            maxes[chunk_index:chunk_index + 2] = [merged[-1]]
+            if len(merged) > CHUNK_MAX_ENTRIES:
+                half = len(merged) // 2
+                chunks.insert(chunk_index + 1, merged[half:])
+                del merged[half:]
+                maxes[chunk_index:chunk_index + 1] = [merged[-1], chunks[chunk_index + 1][-1]]
+            self._tree = None
+        else:
+            self._update(chunk_index, -1)
@@ -0,0 +1,220 @@
+"""
+This module provides the `RespBufferParser` class, an offset-based RESP parser that
+works directly on a `bytes`/`bytearray` buffer.
+
+Compared to `RespDeserializer`, which wraps the input in `io.BytesIO`, reads it line
+by line and decodes every token to `str`, this parser:
+    - walks the buffer by offset and locates CRLF terminators with `find`,
+    - slices bulk strings by their declared length through a `memoryview`, so each
+      value is copied exactly once and no intermediate lines are created,
+    - keeps bulk and simple strings as `bytes`; decoding to text is left to the
+      caller, at the point where a command actually needs it.
+
+Truncated input raises `RespIncompleteDataError` and leaves `position` at the start
+of the incomplete frame, so the same buffer can be parsed again once more data has
+been appended to it.
+"""
+
+from typing import Any
+
+from src.exceptions.redis_exceptions import (
+    RespIncompleteDataError,
+    RespParsingError,
+    RespProtocolError,
+)
+
+_CRLF = b"\r\n"
+
+_SIMPLE_STRING = ord("+")
+_ERROR = ord("-")
+_INTEGER = ord(":")
+_BULK_STRING = ord("$")
+_ARRAY = ord("*")
+
+
+class RespBufferParser:
+    """
+    Parses RESP frames out of a buffer by offset.
+
+    Attributes:
+        - position (int): Offset of the first byte that has not been parsed yet.
+
+    The parser holds a `memoryview` on the buffer; a `bytearray` cannot be resized
+    while it is exported, so use the parser as a context manager (or call `release`)
+    before modifying the buffer.
+    """
+
+    __slots__ = ("_buffer", "_view", "position")
+
+    def __init__(self, buffer: bytes | bytearray, position: int = 0):
+        """
+        Initializes the parser over the given buffer.
+
+        Args:
+            buffer (bytes | bytearray): The RESP data to parse.
+            position (int): The offset to start parsing from.
+        """
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self.position = position
+
+    def __enter__(self) -> "RespBufferParser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def release(self) -> None:
+        """
+        Releases the memoryview held on the buffer.
+        """
+        self._view.release()
+
+    def parse(self) -> Any:
+        """
+        Parses the next complete frame and advances `position` past it.
+
+        Returns:
+            Any: `bytes` for simple strings, errors and bulk strings, `int` for
+                 integers, `list` for arrays and None for null bulk strings/arrays.
+
+        Raises:
+            RespIncompleteDataError: If the buffer ends before the frame does.
+            RespParsingError: If a length or integer field is malformed.
+            RespProtocolError: If the frame uses an unsupported RESP type.
+        """
+        value, self.position = self._parse_frame(self.position)
+        return value
+
+    def parse_array_header(self) -> int:
+        """
+        Parses the header of the array at `position` and advances `position` to its
+        first element, so that the elements can be parsed one at a time.
+
+        Returns:
+            int: The number of elements of the array.
+
+        Raises:
+            RespIncompleteDataError: If the buffer ends before the header does.
+            RespParsingError: If the frame is not an array or its length is malformed.
+        """
+        pos = self.position
+        if pos >= len(self._buffer):
+            raise RespIncompleteDataError("Unexpected end of input")
+        if self._buffer[pos] != _ARRAY:
+            raise RespParsingError(
+                f"Expected an array: {bytes(self._buffer[pos:pos + 1])!r}")
+        length, self.position = self._read_header(pos)
+        return length
+
+    def _read_header(self, pos: int) -> tuple[int, int]:
+        """
+        Reads the integer that follows a type prefix at `pos`.
+
+        Returns:
+            tuple[int, int]: The integer and the offset just past its CRLF.
+        """
+        crlf = self._buffer.find(_CRLF, pos + 1)
+        if crlf == -1:
+            raise RespIncompleteDataError("Incomplete RESP header")
+        try:
+            return int(self._buffer[pos + 1:crlf]), crlf + 2
+        except ValueError as e:
+            raise RespParsingError(
+                f"Invalid RESP length or integer: {bytes(self._buffer[pos:crlf])!r}"
+            ) from e
+
+    def _parse_bulk_string(self, pos: int) -> tuple[bytes | None, int]:
+        """
+        Parses a bulk string whose `$` prefix is at `pos`.
+        """
+        length, start = self._read_header(pos)
+        if length == -1:
+            return None, start
+        if length < 0:
+            raise RespParsingError(f"Invalid bulk string length: {length}")
+
+        stop = start + length
+        if stop + 2 > len(self._buffer):
+            raise RespIncompleteDataError("Incomplete bulk string")
+        if self._buffer[stop:stop + 2] != _CRLF:
+            raise RespParsingError("Bulk string is not terminated by CRLF")
+        return self._view[start:stop].tobytes(), stop + 2
+
+    def _parse_array_items(self, length: int, pos: int) -> tuple[list, int]:
+        """
+        Parses `length` array elements starting at `pos`.
+
+        Bulk strings, which make up nearly every client request, are parsed inline;
+        any other element type falls back to `_parse_frame`.
+        """
+        buffer = self._buffer
+        view = self._view
+        find = buffer.find
+        buffer_length = len(buffer)
+        items = []
+        append = items.append
+
+        for _ in range(length):
+            if pos >= buffer_length or buffer[pos] != _BULK_STRING:
+                item, pos = self._parse_frame(pos)
+                append(item)
+                continue
+
+            crlf = find(_CRLF, pos + 1)
+            if crlf == -1:
+                raise RespIncompleteDataError("Incomplete RESP header")
+            try:
+                size = int(buffer[pos + 1:crlf])
+            except ValueError as e:
+                raise RespParsingError(
+                    f"Invalid bulk string length: {bytes(buffer[pos:crlf])!r}"
+                ) from e
+            if size < 0:
+                item, pos = self._parse_bulk_string(pos)
+                append(item)
+                continue
+
+            start = crlf + 2
+            stop = start + size
+            if stop + 2 > buffer_length:
+                raise RespIncompleteDataError("Incomplete bulk string")
+            if buffer[stop] != 13 or buffer[stop + 1] != 10:
+                raise RespParsingError("Bulk string is not terminated by CRLF")
+            append(view[start:stop].tobytes())
+            pos = stop + 2
+
+        return items, pos
+
+    def _parse_frame(self, pos: int) -> tuple[Any, int]:
+        """
+        Parses the frame starting at `pos`.
+
+        Returns:
+            tuple[Any, int]: The parsed value and the offset just past it.
+        """
+        if pos >= len(self._buffer):
+            raise RespIncompleteDataError("Unexpected end of input")
+
+        resp_type = self._buffer[pos]
+
+        if resp_type == _ARRAY:
+            length, pos = self._read_header(pos)
+            if length == -1:
+                return None, pos
+            return self._parse_array_items(length, pos)
+
+        if resp_type == _BULK_STRING:
+            return self._parse_bulk_string(pos)
+
+        if resp_type in (_SIMPLE_STRING, _ERROR):
+            crlf = self._buffer.find(_CRLF, pos + 1)
+            if crlf == -1:
+                raise RespIncompleteDataError("Incomplete simple string")
+            return self._view[pos + 1:crlf].tobytes(), crlf + 2
+
+        if resp_type == _INTEGER:
+            return self._read_header(pos)
+
+        raise RespProtocolError(
+            f"Unsupported RESP type: {bytes(self._buffer[pos:pos + 1])!r}")
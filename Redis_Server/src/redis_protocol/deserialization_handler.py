@@ -8,12 +8,19 @@ The deserialization process supports:
     - Integers
     - Bulk Strings (including null bulk strings)
     - Arrays (including nested arrays)
+
+Truncated input raises `RespIncompleteDataError`, and `bytes_consumed` reports how far
+parsing got, so callers reading from a socket can tell a partial frame from a bad one.
 """
 
 import io
 from typing import Any
 from src.constants.redis_protocol import CRLF, DEFAULT_ENCODING
-from src.exceptions.redis_exceptions import RespParsingError, RespProtocolError
+from src.exceptions.redis_exceptions import (
+    RespIncompleteDataError,
+    RespParsingError,
+    RespProtocolError,
+)
 
 
 class RespDeserializer:
@@ -33,20 +40,29 @@ class RespDeserializer:
         """
         Reads a single RESP line from the buffer, ensuring it ends with CRLF.
         Raises:
-            RespParsingError: If incomplete RESP data is detected.
+            RespIncompleteDataError: If incomplete RESP data is detected.
         """
         data = self._buffer.readline()
         if not data:
-            raise RespParsingError(
+            raise RespIncompleteDataError(
                 "Unexpected end of input while reading line")
 
         if not data.endswith(CRLF):
             remaining_data = self._buffer.readline()
             if not remaining_data:
-                raise RespParsingError("Incomplete RESP data")
+                raise RespIncompleteDataError("Incomplete RESP data")
             data += remaining_data
         return data
 
+    def bytes_consumed(self) -> int:
+        """
+        Returns the number of bytes parsed so far.
+
+        Returns:
+            int: The offset of the first byte that has not been parsed yet.
+        """
+        return self._buffer.tell()
+
     def _decode(self, data: bytes) -> str:
         """
         Decodes RESP data by stripping CRLF and converting to a string.
@@ -77,7 +93,10 @@ class RespDeserializer:
             length = int(self._decode(self._readline()))
             if length == -1:
                 return None
-            return self._decode(self._buffer.read(length + len(CRLF)))
+            data = self._buffer.read(length + len(CRLF))
+            if len(data) < length + len(CRLF):
+                raise RespIncompleteDataError("Incomplete bulk string")
+            return self._decode(data)
 
         def parse_array() -> list[Any]:
             length_line = self._readline()
@@ -91,6 +110,8 @@ class RespDeserializer:
             return [self.deserialize() for _ in range(length)]
 
         resp_type = self._buffer.read(1)
+        if not resp_type:
+            raise RespIncompleteDataError("Unexpected end of input")
         try:
             if resp_type == b"+":
                 return parse_simple_string()
@@ -102,6 +123,8 @@ class RespDeserializer:
                 return parse_bulk_string()
             if resp_type == b"*":
                 return parse_array()
+        except RespIncompleteDataError:
+            raise
         except Exception as e:
             raise RespParsingError(
                 f"Failed to parse RESP data starting with: {resp_type} - {e}"
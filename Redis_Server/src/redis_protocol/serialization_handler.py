@@ -6,6 +6,14 @@ Redis to encode messages between the client and server for communication.
 Features:
     - Serialization of Simple Strings, Errors, Integers, Bulk Strings, and Arrays.
     - Supports flexible options for custom encoding and error handling.
+    - Writes directly into a caller-supplied `bytearray` (`serialize_into`), so a
+      connection can reuse one output buffer for all of its replies.
+    - Pre-encoded shared replies for hot values (`OK`, `PONG`, null, integers
+      0..9999), which are appended as-is instead of being formatted each time.
+    - Exceptions nested in arrays are serialized as errors, e.g. the replies of
+      the commands of a transaction that failed.
+    - `MultipleReplies` for commands answering with several replies in a row, e.g.
+      SUBSCRIBE confirming each channel.
 
 RESP Format:
     - Simple Strings: Prefix with '+' (e.g., "+OK\r\n")
@@ -19,14 +27,42 @@ This implementation uses constants for protocol-specific terminators (CRLF) and
 supports exceptions for custom error handling.
 """
 
-from src.constants.redis_protocol import CRLF_STR, DEFAULT_ENCODING
+from src.constants.redis_protocol import CRLF, DEFAULT_ENCODING
 from src.exceptions.redis_exceptions import RespSerializationError
 
+SHARED_INTEGERS_COUNT = 10000
+
+NULL_BULK_STRING = b"$-1" + CRLF
+
+SHARED_INTEGERS: tuple[bytes, ...] = tuple(
+    b":%d%s" % (i, CRLF) for i in range(SHARED_INTEGERS_COUNT)
+)
+
+SHARED_SIMPLE_STRINGS: dict[str, bytes] = {
+    reply: b"+%s%s" % (reply.encode(), CRLF) for reply in ("OK", "PONG")
+}
+
+SHARED_BULK_STRINGS: dict[str, bytes] = {
+    reply: b"$%d%s%s%s" % (len(reply), CRLF, reply.encode(), CRLF)
+    for reply in ("OK", "PONG")
+}
+
+
+class MultipleReplies(list):
+    """
+    Replies sent one after the other for a single command, instead of as one array.
+    """
+
+    __slots__ = ()
+
 
 class RespSerializer:
     """
     A class to serialize Python objects into RESP-compliant byte strings.
 
+    The serializer is stateless, so a single instance can be shared by every
+    connection and thread.
+
     Attributes:
         - encoding (str): Encoding used for string serialization (default: 'utf-8').
     """
@@ -56,37 +92,121 @@ class RespSerializer:
         Raises:
             RespSerializationError: If serialization fails due to unsupported data types.
         """
+        out = bytearray()
+        self.serialize_into(out, data, use_bulk, is_error)
+        return bytes(out)
+
+    def serialize_into(
+        self, out: bytearray, data, use_bulk: bool = True, is_error: bool = False
+    ) -> None:
+        """
+        Serializes Python data and appends the RESP bytes to `out`.
+
+        If serialization fails, `out` is restored to its previous length, so a
+        half-written reply never reaches the client.
+
+        Args:
+            out (bytearray): The buffer to append the serialized reply to.
+            data: The Python object to serialize (e.g., str, int, list, None).
+            use_bulk (bool): Whether to serialize strings as Bulk Strings (default: True).
+            is_error (bool): Whether to serialize the response as an error (default: False).
+
+        Raises:
+            RespSerializationError: If serialization fails due to unsupported data types.
+        """
+        if is_error:
+            out += b"-%s\r\n" % str(data).encode(self.encoding)
+            return
+
+        # Fast paths for the most common replies: shared constants and plain strings.
+        data_type = type(data)
+        if data_type is str:
+            shared = (SHARED_BULK_STRINGS if use_bulk else SHARED_SIMPLE_STRINGS).get(data)
+            if shared is not None:
+                out += shared
+                return
+            if use_bulk and data.isascii():
+                out += f"${len(data)}\r\n{data}\r\n".encode(self.encoding)
+                return
+        elif data_type is int and 0 <= data < SHARED_INTEGERS_COUNT:
+            out += SHARED_INTEGERS[data]
+            return
+
+        start = len(out)
         try:
-            serialized_data = self._serialize(data, use_bulk, is_error)
-            return serialized_data.encode(self.encoding)
+            self._serialize(out, data, use_bulk)
         except Exception as e:
+            del out[start:]
+            if isinstance(e, RespSerializationError):
+                raise
             raise RespSerializationError(f"Serialization failed: {e}") from e
 
-    def _serialize(self, data, use_bulk: bool, is_error: bool) -> str:
+    def _serialize(self, out: bytearray, data, use_bulk: bool) -> None:
         """
-        Internal helper to generate RESP strings without encoding into bytes.
+        Internal helper appending the RESP encoding of `data` to `out`.
 
         Args:
+            out (bytearray): The buffer to append to.
             data: The Python object to serialize (e.g., str, int, list, None).
             use_bulk (bool): Whether to serialize strings as Bulk Strings.
-            is_error (bool): Whether to serialize the response as an error.
-
-        Returns:
-            str: The RESP-compliant string representation of the data.
 
         Raises:
             RespSerializationError: If the data type is unsupported.
         """
-        if is_error:
-            return f"-{data}{CRLF_STR}"
-        if data is None:
-            return f"$-1{CRLF_STR}"
-        if isinstance(data, str):
-            return f"+{data}{CRLF_STR}" if not use_bulk else f"${len(data)}{CRLF_STR}{data}{CRLF_STR}"
-        if isinstance(data, int):
-            return f":{data}{CRLF_STR}"
-        if isinstance(data, (list, tuple)):
-            elements = [self._serialize(item, use_bulk, False) for item in data]
-            return f"*{len(data)}{CRLF_STR}" + "".join(elements)
-        raise RespSerializationError(f"Unsupported RESP type: {type(data)}, {data}")
+        data_type = type(data)
+        if data_type is str:
+            if not use_bulk:
+                out += f"+{data}\r\n".encode(self.encoding)
+            elif data.isascii():
+                out += f"${len(data)}\r\n{data}\r\n".encode(self.encoding)
+            else:
+                encoded = data.encode(self.encoding)
+                out += b"$%d\r\n%s\r\n" % (len(encoded), encoded)
+        elif data is None:
+            out += NULL_BULK_STRING
+        elif data_type is int:
+            if 0 <= data < SHARED_INTEGERS_COUNT:
+                out += SHARED_INTEGERS[data]
+            else:
+                out += b":%d\r\n" % data
+        elif data_type is list or data_type is tuple:
+            self._serialize_array(out, data, use_bulk)
+        elif data_type is MultipleReplies:
+            for item in data:
+                self._serialize(out, item, use_bulk)
+        elif isinstance(data, (bytes, bytearray)):
+            out += b"$%d\r\n%s\r\n" % (len(data), data)
+        elif isinstance(data, int):
+            out += b":%d\r\n" % data
+        elif isinstance(data, (list, tuple)):
+            self._serialize_array(out, data, use_bulk)
+        elif isinstance(data, Exception):
+            out += b"-%s\r\n" % str(data).encode(self.encoding)
+        else:
+            raise RespSerializationError(
+                f"Unsupported RESP type: {type(data)}, {data}")
+
+    def _serialize_array(self, out: bytearray, data, use_bulk: bool) -> None:
+        """
+        Appends an Array to `out`.
+
+        Arrays made only of strings (e.g. LRANGE replies) are formatted into a list
+        and joined once, so the cost stays linear in the reply size; when every
+        element is ASCII the character count is also the byte count, which saves
+        encoding the elements one by one.
+        """
+        out += b"*%d\r\n" % len(data)
+        if all(type(item) is str for item in data):
+            if not use_bulk:
+                out += "".join([f"+{item}\r\n" for item in data]).encode(self.encoding)
+                return
+            joined = "".join([f"${len(item)}\r\n{item}\r\n" for item in data])
+            if joined.isascii():
+                out += joined.encode(self.encoding)
+                return
+
+        for item in data:
+            self._serialize(out, item, use_bulk)
+
 
+RESP_SERIALIZER = RespSerializer()
@@ -0,0 +1,159 @@
+"""
+This module provides the `RespStreamParser` class, a stateful per-connection parser
+for RESP requests arriving over a stream socket.
+
+A single `recv()` may carry a fraction of a request, exactly one request, or many
+pipelined requests (e.g. `redis-benchmark -P 16`). The stream parser accumulates the
+received bytes across reads and hands back every complete command in the buffer,
+keeping any trailing partial frame until the rest of it arrives.
+
+A large request, e.g. an MSET with thousands of keys, may take many reads to
+arrive. Rather than parsing it again from its first byte on every read, the parser
+keeps the header and the elements of a partial array already received, removes
+them from the buffer, and resumes with the next element, so every byte is parsed
+about once.
+
+Frames are parsed in place by `RespBufferParser`, so string values are returned as
+`bytes`; decoding them is left to the command dispatcher.
+
+Example:
+    >>> parser = RespStreamParser()
+    >>> parser.feed(b"*1\\r\\n$4\\r\\nPING\\r\\n*1\\r\\n$4\\r\\nPI")
+    >>> parser.parse_commands()
+    [[b'PING']]
+    >>> parser.feed(b"NG\\r\\n")
+    >>> parser.parse_commands()
+    [[b'PING']]
+"""
+
+from typing import Any
+
+from src.constants.redis_protocol import CRLF, ESCAPED_CRLF, MAX_QUERY_BUFFER_SIZE
+from src.exceptions.redis_exceptions import RespIncompleteDataError, RespProtocolError
+from src.redis_protocol.buffer_parser import RespBufferParser
+
+_ARRAY = ord("*")
+
+
+class RespStreamParser:
+    """
+    Incremental RESP parser that accumulates partial frames across reads.
+
+    Attributes:
+        - _pending (list | None): The elements received so far of a partial array,
+          or None if the buffer does not start in the middle of an array.
+        - _pending_length (int): The number of elements of that array.
+        - _pending_size (int): The number of bytes of that array already parsed and
+          removed from the buffer, counted against the buffer limit.
+    """
+
+    __slots__ = ("_max_buffer_size", "_buffer", "_pending", "_pending_length",
+                 "_pending_size")
+
+    def __init__(self, max_buffer_size: int = MAX_QUERY_BUFFER_SIZE):
+        """
+        Initializes an empty stream parser.
+
+        Args:
+            max_buffer_size (int): The largest amount of unparsed data tolerated
+                                   before the client is considered misbehaving.
+        """
+        self._max_buffer_size = max_buffer_size
+        self._buffer = bytearray()
+        self._pending: list | None = None
+        self._pending_length = 0
+        self._pending_size = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of buffered bytes that have not been parsed yet.
+        """
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> None:
+        """
+        Appends newly received data to the parse buffer.
+
+        Literal "\\r\\n" sequences (as typed into a shell and piped through ncat)
+        are translated to real CRLF terminators, matching `process_request`.
+
+        Args:
+            data (bytes): The bytes received from the socket.
+
+        Raises:
+            RespProtocolError: If the unparsed data exceeds the buffer limit.
+        """
+        if ESCAPED_CRLF in data:
+            data = data.replace(ESCAPED_CRLF, CRLF)
+        self._buffer += data
+        if len(self._buffer) + self._pending_size > self._max_buffer_size:
+            self._buffer.clear()
+            self._pending = None
+            self._pending_size = 0
+            raise RespProtocolError("ERR Protocol error: too big query buffer")
+
+    def parse_commands(self) -> list[Any]:
+        """
+        Parses every complete frame currently in the buffer.
+
+        Complete frames are removed from the buffer; a trailing partial frame is
+        kept so that the next `feed` can complete it. Of a partial array, only the
+        element being received is kept in the buffer.
+
+        Returns:
+            list: The deserialized frames, in the order they were received.
+
+        Raises:
+            RespParsingError: If the buffered data is not valid RESP.
+            RespProtocolError: If the buffered data uses an unsupported RESP type.
+        """
+        buffer = self._buffer
+        if not buffer:
+            return []
+
+        commands = []
+        pending_start = 0
+        with RespBufferParser(buffer) as parser:
+            try:
+                if self._pending is not None:
+                    commands.append(self._parse_pending(parser))
+                while parser.position < len(buffer):
+                    pending_start = parser.position
+                    try:
+                        commands.append(parser.parse())
+                    except RespIncompleteDataError:
+                        if buffer[pending_start] != _ARRAY:
+                            raise
+                        self._pending_length = parser.parse_array_header()
+                        self._pending = []
+                        commands.append(self._parse_pending(parser))
+            except RespIncompleteDataError:
+                pass
+            consumed = parser.position
+
+        if self._pending is not None:
+            self._pending_size += consumed - pending_start
+        del buffer[:consumed]
+        return commands
+
+    def _parse_pending(self, parser: RespBufferParser) -> list:
+        """
+        Parses the remaining elements of a partial array, one at a time, so that
+        the elements parsed before the end of the buffer are kept.
+
+        Args:
+            parser (RespBufferParser): The parser, positioned at the next element.
+
+        Returns:
+            list: The complete array.
+
+        Raises:
+            RespIncompleteDataError: If the buffer ends before the array does.
+        """
+        pending = self._pending
+        length = self._pending_length
+        while len(pending) < length:
+            pending.append(parser.parse())
+        self._pending = None
+        self._pending_size = 0
+        return pending
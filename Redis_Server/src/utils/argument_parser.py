@@ -8,12 +8,106 @@ Usage:
 
 Features:
 - Default values for host and port (127.0.0.1, 65432).
+- Selection of the connection model (thread per client or single-threaded event loop).
+- Number of worker processes, each owning a hash-partition of the keyspace.
+- Memory limit (`--maxmemory 100mb`) and eviction policy (`--maxmemory-policy`).
+- Append-only file persistence and its fsync policy.
+- One-time migration of a legacy pickle snapshot to RDB (`--migrate-pickle-snapshot`).
+- Automatic snapshot save points (`--save "<seconds> <changes> ..."`) and snapshot
+  compression.
+- Sampling of the per-command latency histograms (`--latency-tracking-sample`).
+- Slow log threshold and length (`--slowlog-log-slower-than`, `--slowlog-max-len`).
+- Output buffer limit of Pub/Sub clients (`--client-output-buffer-limit-pubsub`).
 - Customizable descriptions and help text.
 - Easy-to-extend structure for additional arguments.
 """
 
 import argparse
 
+from src.handlers.pubsub import DEFAULT_PUBSUB_OUTPUT_BUFFER_LIMIT
+from src.handlers.slow_log import DEFAULT_SLOWLOG_MAX_LEN, DEFAULT_SLOWLOG_THRESHOLD_US
+from src.redisDB.append_only_file import FSYNC_EVERYSEC, FSYNC_POLICIES
+from src.redisDB.eviction import EVICTION_POLICIES
+from src.redisDB.redis_db import DEFAULT_EVICTION_POLICY, DEFAULT_SNAPSHOT_FILENAME
+
+SERVER_MODES = ("threaded", "event-loop")
+
+DEFAULT_SAVE_POINTS = "3600 1 300 100 60 10000"
+
+MEMORY_UNITS = {
+    "b": 1,
+    "k": 1000, "kb": 1024,
+    "m": 1000 ** 2, "mb": 1024 ** 2,
+    "g": 1000 ** 3, "gb": 1024 ** 3,
+}
+
+
+def parse_save_points(value: str) -> list[tuple[int, int]]:
+    """
+    Parses save points given as pairs of "<seconds> <changes>".
+
+    Args:
+        value (str): e.g. "3600 1 300 100"; an empty string disables automatic saves.
+
+    Returns:
+        list[tuple[int, int]]: The (seconds, changes) pairs.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a list of positive integer pairs.
+    """
+    fields = value.split()
+    try:
+        numbers = [int(field) for field in fields]
+    except ValueError:
+        numbers = None
+    if numbers is None or len(numbers) % 2 or any(number <= 0 for number in numbers):
+        raise argparse.ArgumentTypeError(
+            f"invalid save points '{value}': expected '<seconds> <changes>' pairs")
+    return list(zip(numbers[::2], numbers[1::2]))
+
+
+def parse_memory_size(value: str) -> int:
+    """
+    Parses a memory size like Redis does, e.g. "1048576", "100mb" or "1g".
+
+    Args:
+        value (str): A number of bytes with an optional unit (b, k, kb, m, mb, g, gb).
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a valid size.
+    """
+    number = value.lower().rstrip("bkmg")
+    unit = value.lower()[len(number):] or "b"
+    if not number.isdigit() or unit not in MEMORY_UNITS:
+        raise argparse.ArgumentTypeError(
+            f"invalid memory size '{value}': expected e.g. '1048576', '100mb' or '1gb'")
+    return int(number) * MEMORY_UNITS[unit]
+
+
+def positive_integer(value: str) -> int:
+    """
+    Parses a strictly positive integer argument.
+
+    Args:
+        value (str): The raw argument.
+
+    Returns:
+        int: The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"invalid value '{value}': expected a positive integer")
+    return number
+
 
 def parse_arguments(default_host: str = "127.0.0.1", default_port: int = 65432):
     """
@@ -57,9 +151,144 @@ def parse_arguments(default_host: str = "127.0.0.1", default_port: int = 65432):
         "--snapshot",
         "-s",
         type=str,
-        default="redis_snapshot.pkl",
+        default=DEFAULT_SNAPSHOT_FILENAME,
         metavar="SNAPSHOT_FILE",
-        help="Path to the snapshot file for persistence. Defaults to 'redis_snapshot.pkl'."
+        help="Path to the RDB snapshot file for persistence. Defaults to "
+             f"'{DEFAULT_SNAPSHOT_FILENAME}'."
+    )
+
+    parser.add_argument(
+        "--migrate-pickle-snapshot",
+        type=str,
+        metavar="PICKLE_FILE",
+        help="Convert a snapshot saved with pickle by an earlier version to the RDB "
+             "file given by --snapshot, then exit. Loading pickle can run arbitrary "
+             "code: only migrate files from a trusted source."
+    )
+
+    parser.add_argument(
+        "--mode",
+        "-m",
+        type=str,
+        choices=SERVER_MODES,
+        default="threaded",
+        help="Connection model: one thread per client ('threaded') or a single "
+             "selectors-based loop multiplexing all clients ('event-loop'). "
+             "Defaults to 'threaded'."
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=positive_integer,
+        default=1,
+        metavar="N",
+        help="Run N worker processes sharing the port through SO_REUSEPORT. Each "
+             "owns a range of hash slots, listens on its own port PORT+1+index, and "
+             "answers commands on keys of other workers with a MOVED redirection. "
+             "Defaults to 1."
+    )
+
+    parser.add_argument(
+        "--maxmemory",
+        type=parse_memory_size,
+        default=0,
+        metavar="BYTES",
+        help="Evict keys according to --maxmemory-policy once the dataset uses more "
+             "than this much memory, e.g. '100mb'. With --workers the limit is "
+             "shared equally between workers. Defaults to 0 (no limit)."
+    )
+
+    parser.add_argument(
+        "--maxmemory-policy",
+        type=str,
+        choices=tuple(EVICTION_POLICIES),
+        default=DEFAULT_EVICTION_POLICY,
+        help="Which keys are evicted once --maxmemory is reached: the least recently "
+             "used ('allkeys-lru'), the least frequently used ('allkeys-lfu'), those "
+             "expiring soonest ('volatile-ttl'), or none, refusing writes with an OOM "
+             f"error ('noeviction'). Defaults to '{DEFAULT_EVICTION_POLICY}'."
+    )
+
+    parser.add_argument(
+        "--save",
+        type=parse_save_points,
+        default=DEFAULT_SAVE_POINTS,
+        metavar="'SECONDS CHANGES ...'",
+        help="Save a snapshot in the background after SECONDS seconds if at least "
+             "CHANGES changes were made; several pairs may be given, '' disables "
+             f"automatic saves. Defaults to '{DEFAULT_SAVE_POINTS}'."
+    )
+
+    parser.add_argument(
+        "--rdbcompression",
+        type=str,
+        choices=("yes", "no"),
+        default="yes",
+        help="Compress snapshot files with zlib. Defaults to 'yes'."
+    )
+
+    parser.add_argument(
+        "--appendonly",
+        action="store_true",
+        help="Log every write command to an append-only file and replay it on startup."
+    )
+
+    parser.add_argument(
+        "--appendfilename",
+        type=str,
+        default="appendonly.aof",
+        metavar="AOF_FILE",
+        help="Path to the append-only file. Defaults to 'appendonly.aof'."
+    )
+
+    parser.add_argument(
+        "--appendfsync",
+        type=str,
+        choices=FSYNC_POLICIES,
+        default=FSYNC_EVERYSEC,
+        help="When the append-only file is fsynced: after every write ('always'), "
+             "once per second ('everysec') or never, leaving it to the OS ('no'). "
+             f"Defaults to '{FSYNC_EVERYSEC}'."
+    )
+
+    parser.add_argument(
+        "--latency-tracking-sample",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Add one call in N to the per-command latency histograms reported by "
+             "INFO latencystats and LATENCY HISTOGRAM; 0 keeps no histograms. "
+             "Calls and their total time are always counted. Defaults to 1."
+    )
+
+    parser.add_argument(
+        "--slowlog-log-slower-than",
+        type=int,
+        default=DEFAULT_SLOWLOG_THRESHOLD_US,
+        metavar="MICROSECONDS",
+        help="Log commands taking longer than this to the slow log read with SLOWLOG "
+             "GET; 0 logs every command, a negative value none. "
+             f"Defaults to {DEFAULT_SLOWLOG_THRESHOLD_US}."
+    )
+
+    parser.add_argument(
+        "--slowlog-max-len",
+        type=positive_integer,
+        default=DEFAULT_SLOWLOG_MAX_LEN,
+        metavar="N",
+        help="Keep the N newest entries of the slow log. "
+             f"Defaults to {DEFAULT_SLOWLOG_MAX_LEN}."
+    )
+
+    parser.add_argument(
+        "--client-output-buffer-limit-pubsub",
+        type=parse_memory_size,
+        default=DEFAULT_PUBSUB_OUTPUT_BUFFER_LIMIT,
+        metavar="BYTES",
+        help="Disconnect a subscribed client once it leaves more than this much "
+             "published messages unread, e.g. '8mb', so that slow subscribers do "
+             f"not hold up publishers. Defaults to {DEFAULT_PUBSUB_OUTPUT_BUFFER_LIMIT}."
     )
 
     parser.add_argument(
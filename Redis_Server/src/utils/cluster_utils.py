@@ -0,0 +1,47 @@
+"""
+Provides the mapping of keys to hash slots used to partition the keyspace,
+compatible with Redis Cluster.
+
+A key is mapped to one of `CLUSTER_SLOTS` slots with the CRC16 (XMODEM) of the
+key, modulo 16384. When the key contains a hash tag (a non-empty substring
+between the first `{` and the next `}`), only the tag is hashed, so related
+keys such as `{user:1}:name` and `{user:1}:email` land in the same slot.
+"""
+
+from binascii import crc_hqx
+
+from src.constants.redis_protocol import DEFAULT_ENCODING
+
+CLUSTER_SLOTS = 16384
+
+
+def key_hash_slot(key: str) -> int:
+    """
+    Returns the hash slot of a key.
+
+    Args:
+        key (str): The key.
+
+    Returns:
+        int: The slot, between 0 and `CLUSTER_SLOTS` - 1.
+    """
+    start = key.find("{")
+    if start != -1:
+        end = key.find("}", start + 1)
+        if end > start + 1:
+            key = key[start + 1:end]
+    return crc_hqx(key.encode(DEFAULT_ENCODING), 0) & (CLUSTER_SLOTS - 1)
+
+
+def slot_ranges(workers: int) -> list[tuple[int, int]]:
+    """
+    Splits the hash slots into contiguous, nearly equal ranges, one per worker.
+
+    Args:
+        workers (int): The number of workers.
+
+    Returns:
+        list[tuple[int, int]]: The first and last slot of each worker.
+    """
+    bounds = [CLUSTER_SLOTS * i // workers for i in range(workers + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(workers)]
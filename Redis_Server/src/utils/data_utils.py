@@ -2,63 +2,330 @@
 Provides utility functions for manipulating and validating data.
 """
 
-from collections import deque
+import math
 
+from src.constants.redis_protocol import DEFAULT_ENCODING
 from src.exceptions.redis_exceptions import CommandProcessingException
+from src.redisDB.encodings import (
+    create_list,
+    is_hash,
+    is_list,
+    is_set,
+    is_zset,
+    push_to_list,
+    shared_integer,
+)
+from src.redisDB.intset import IntSet
+from src.redisDB.listpack import ListPack, ListPackHash
+from src.redisDB.quicklist import QuickList
+from src.redisDB.zset import ZSet
 
 
-def increment_value(current_value: str | None, increment: int) -> int:
+def parse_integer(value: str) -> int:
+    """
+    Parses a command argument that must be an integer.
+
+    Args:
+        value (str): The raw argument.
+
+    Returns:
+        int: The parsed integer.
+
+    Raises:
+        CommandProcessingException: If the argument is not an integer.
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError) as e:
+        raise CommandProcessingException(
+            "ERR value is not an integer or out of range") from e
+
+
+def parse_timeout(value: str) -> float:
+    """
+    Parses the timeout of a blocking command.
+
+    Args:
+        value (str): The raw argument, in seconds; decimals are accepted.
+
+    Returns:
+        float: The timeout in seconds, 0 meaning no timeout.
+
+    Raises:
+        CommandProcessingException: If the timeout is not a finite number or is negative.
+    """
+    try:
+        timeout = float(value)
+    except (TypeError, ValueError) as e:
+        raise CommandProcessingException(
+            "ERR timeout is not a float or out of range") from e
+    if not math.isfinite(timeout):
+        raise CommandProcessingException("ERR timeout is not a float or out of range")
+    if timeout < 0:
+        raise CommandProcessingException("ERR timeout is negative")
+    return timeout
+
+
+def increment_value(current_value: object, increment: int) -> int:
     """
     Safely increments or decrements an integer value.
 
     Args:
-        current_value (str | None): The current value stored in the database.
+        current_value (object): The current value stored in the database, if any.
         increment (int): The amount to increment (can be negative).
 
     Returns:
         int: The updated integer value.
 
     Raises:
-        CommandProcessingException: If the current value is not an integer.
+        CommandProcessingException: If the current value is not a string, or is
+                                    not an integer.
     """
+    value_type = type(current_value)
+    if value_type is int:
+        return shared_integer(current_value + increment)
     if current_value is None:
-        return increment
+        return shared_integer(increment)
+    if value_type is not str:
+        raise CommandProcessingException(
+            "WRONGTYPE Operation against a key holding the wrong kind of value"
+        )
     try:
-        return int(current_value) + increment
+        return shared_integer(int(current_value) + increment)
     except ValueError as e:
         raise CommandProcessingException(
             "ERR value is not an integer or out of range") from e
 
 
+def get_string(current_value: object) -> str | None:
+    """
+    Checks that a stored value is a string, decoding integer-encoded values.
+
+    Args:
+        current_value (object): The value stored in the database, if any.
+
+    Returns:
+        str | None: The string, or None if the key does not exist.
+
+    Raises:
+        CommandProcessingException: If the value is not a string.
+    """
+    value_type = type(current_value)
+    if value_type is str or current_value is None:
+        return current_value
+    if value_type is int:
+        return str(current_value)
+    raise CommandProcessingException(
+        "WRONGTYPE Operation against a key holding the wrong kind of value"
+    )
+
+
+def string_length(value: str) -> int:
+    """
+    Returns the length of a string in bytes, as Redis reports it.
+
+    Args:
+        value (str): The string.
+
+    Returns:
+        int: The length of its UTF-8 encoding, computed only for non-ASCII strings.
+    """
+    return len(value) if value.isascii() else len(value.encode(DEFAULT_ENCODING))
+
+
+def get_list(current_value: object) -> ListPack | QuickList | None:
+    """
+    Checks that a stored value is a list.
+
+    Args:
+        current_value (object): The value stored in the database, if any.
+
+    Returns:
+        ListPack | QuickList | None: The list, or None if the key does not exist.
+
+    Raises:
+        CommandProcessingException: If the value is not a list.
+    """
+    if current_value is not None and not is_list(current_value):
+        raise CommandProcessingException(
+            "WRONGTYPE Operation against a key holding the wrong kind of value"
+        )
+    return current_value
+
+
+def normalize_range(start: int, stop: int, length: int) -> tuple[int, int]:
+    """
+    Converts an inclusive Redis range, where negative indexes count from the end,
+    to a half-open range of positions clamped to a sequence.
+
+    Args:
+        start (int): Index of the first element.
+        stop (int): Index of the last element, included.
+        length (int): The length of the sequence.
+
+    Returns:
+        tuple[int, int]: The first position and the position past the last one,
+                         equal when the range is empty.
+    """
+    if start < 0:
+        start = max(start + length, 0)
+    if stop < 0:
+        stop += length
+    stop = min(stop + 1, length)
+    if start >= stop:
+        return 0, 0
+    return start, stop
+
+
 def push_values_to_list(
-    current_value: deque | None, values: list[str], is_left: bool
-) -> deque:
+    current_value: ListPack | QuickList | None, values: list[str], is_left: bool
+) -> ListPack | QuickList:
     """
-    Adds values to a list (deque) either to the left or right.
+    Adds values to a list either to the left or right.
+
+    New lists start with the compact listpack encoding and are converted to a
+    quicklist once they grow past the listpack limits (see `src.redisDB.encodings`).
 
     Args:
-        current_value (deque | None): The current deque value, if it exists.
+        current_value (ListPack | QuickList | None): The current list, if it exists.
         values (list[str]): The values to push into the list.
         is_left (bool): If True, push values to the left; otherwise, to the right.
 
     Returns:
-        deque: The updated deque with the new values.
+        ListPack | QuickList: The updated list with the new values, which may be a
+                          new object when its encoding changed.
 
     Raises:
-        CommandProcessingException: If the current value is not a deque.
+        CommandProcessingException: If the current value is not a list.
     """
 
     if current_value is None:
-        current_value=  deque([])
-    
-    if not isinstance(current_value, deque):
+        current_value = create_list()
+
+    if not is_list(current_value):
+        raise CommandProcessingException(
+            "WRONGTYPE Operation against a key holding the wrong kind of value"
+        )
+
+    return push_to_list(current_value, values, is_left)
+
+
+def get_hash(current_value: object) -> ListPackHash | dict | None:
+    """
+    Checks that a stored value is a hash.
+
+    Args:
+        current_value (object): The value stored in the database, if any.
+
+    Returns:
+        ListPackHash | dict | None: The hash, or None if the key does not exist.
+
+    Raises:
+        CommandProcessingException: If the value is not a hash.
+    """
+    if current_value is not None and not is_hash(current_value):
+        raise CommandProcessingException(
+            "WRONGTYPE Operation against a key holding the wrong kind of value"
+        )
+    return current_value
+
+
+def get_set(current_value: object) -> IntSet | set | None:
+    """
+    Checks that a stored value is a set.
+
+    Args:
+        current_value (object): The value stored in the database, if any.
+
+    Returns:
+        IntSet | set | None: The set, or None if the key does not exist.
+
+    Raises:
+        CommandProcessingException: If the value is not a set.
+    """
+    if current_value is not None and not is_set(current_value):
+        raise CommandProcessingException(
+            "WRONGTYPE Operation against a key holding the wrong kind of value"
+        )
+    return current_value
+
+
+def get_zset(current_value: object) -> ZSet | None:
+    """
+    Checks that a stored value is a sorted set.
+
+    Args:
+        current_value (object): The value stored in the database, if any.
+
+    Returns:
+        ZSet | None: The sorted set, or None if the key does not exist.
+
+    Raises:
+        CommandProcessingException: If the value is not a sorted set.
+    """
+    if current_value is not None and not is_zset(current_value):
         raise CommandProcessingException(
             "WRONGTYPE Operation against a key holding the wrong kind of value"
         )
-    
-    for val in values:
-        if is_left:
-            current_value.appendleft(val)
-        else:
-            current_value.append(val)
     return current_value
+
+
+def parse_score(value: str, error: str = "ERR value is not a valid float") -> float:
+    """
+    Parses a sorted set score. Like Redis, "inf", "+inf" and "-inf" are accepted
+    but not NaN.
+
+    Args:
+        value (str): The raw argument.
+        error (str): The error message if the argument is not a valid score.
+
+    Returns:
+        float: The score.
+
+    Raises:
+        CommandProcessingException: If the argument is not a valid score.
+    """
+    try:
+        if "_" in value or value != value.strip():
+            raise ValueError(value)
+        score = float(value)
+    except (TypeError, ValueError) as e:
+        raise CommandProcessingException(error) from e
+    if math.isnan(score):
+        raise CommandProcessingException(error)
+    return score
+
+
+def parse_score_bound(value: str) -> tuple[float, bool]:
+    """
+    Parses the minimum or maximum score of a range, e.g. for ZRANGEBYSCORE, where
+    a "(" prefix makes the bound exclusive.
+
+    Args:
+        value (str): The raw argument.
+
+    Returns:
+        tuple[float, bool]: The score and whether the bound is exclusive.
+
+    Raises:
+        CommandProcessingException: If the argument is not a valid bound.
+    """
+    exclusive = value.startswith("(")
+    if exclusive:
+        value = value[1:]
+    return parse_score(value, "ERR min or max is not a float"), exclusive
+
+
+def format_score(score: float) -> str:
+    """
+    Formats a sorted set score for a reply, like Redis: "1", "1.5", "inf" or
+    "1e+20".
+
+    Args:
+        score (float): The score.
+
+    Returns:
+        str: The shortest representation of the score.
+    """
+    text = repr(score)
+    return text[:-2] if text.endswith(".0") else text
@@ -0,0 +1,138 @@
+"""
+Provides `LatencyHistogram`, an HDR-style histogram of latencies in microseconds.
+
+Like an HdrHistogram, values are counted in log-linear buckets: every power of two
+is split into 2 ** SUB_BUCKET_BITS buckets of equal width, so a value is known to
+within 1 / 2 ** SUB_BUCKET_BITS (12.5%) whatever its magnitude, and small values
+are counted exactly. Recording a value is a few integer operations and an index
+into a list, so it can be done for every command.
+
+Exports:
+    - LatencyHistogram: The histogram.
+"""
+
+# Buckets per power of two, as a number of bits.
+SUB_BUCKET_BITS = 3
+
+# Values below this are counted exactly, one bucket each.
+EXACT_VALUES = 1 << (SUB_BUCKET_BITS + 1)
+
+
+def bucket_index(value: int) -> int:
+    """
+    Returns the index of the bucket counting a value.
+
+    Args:
+        value (int): A non-negative value.
+
+    Returns:
+        int: The index of its bucket.
+    """
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return value
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """
+    Returns the lowest and highest values counted by a bucket.
+
+    Args:
+        index (int): The index of the bucket.
+
+    Returns:
+        tuple[int, int]: The bounds, both included.
+    """
+    if index < EXACT_VALUES:
+        return index, index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = index - (shift << SUB_BUCKET_BITS)
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    A histogram of latencies in microseconds.
+
+    Attributes:
+        counts (list[int]): The number of values in each bucket, grown on demand.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        """
+        Initializes an empty histogram.
+        """
+        self.counts: list[int] = []
+
+    @property
+    def total(self) -> int:
+        """
+        The number of values recorded.
+        """
+        return sum(self.counts)
+
+    def record(self, value: int) -> None:
+        """
+        Counts a value.
+
+        Args:
+            value (int): The latency, in microseconds.
+        """
+        # bucket_index, inlined: this runs for every command.
+        shift = value.bit_length() - SUB_BUCKET_BITS - 1
+        index = value if shift <= 0 else (shift << SUB_BUCKET_BITS) + (value >> shift)
+        try:
+            self.counts[index] += 1
+        except IndexError:
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+            self.counts[index] += 1
+
+    def percentile(self, rank: float) -> int:
+        """
+        Returns the value below which `rank` percent of the values fall.
+
+        Args:
+            rank (float): The percentile, e.g. 99.9.
+
+        Returns:
+            int: The highest value of the bucket holding the percentile, or 0 if
+                 nothing was recorded.
+        """
+        total = self.total
+        threshold = total * rank / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= threshold:
+                return bucket_bounds(index)[1]
+        return 0
+
+    def cumulative_counts(self) -> list[tuple[int, int]]:
+        """
+        Returns the number of values below each power of two, from 1 to the first
+        power of two above the highest value, like the buckets of the Redis
+        LATENCY HISTOGRAM command. Bucket bounds fall on powers of two, so the
+        counts are exact.
+
+        Returns:
+            list[tuple[int, int]]: (power of two, number of values below it) pairs.
+        """
+        total = self.total
+        pairs = []
+        seen = 0
+        limit = 1
+        for index, count in enumerate(self.counts):
+            if seen == total:
+                break
+            low = bucket_bounds(index)[0]
+            while low >= limit:
+                pairs.append((limit, seen))
+                limit <<= 1
+            seen += count
+        while not pairs or pairs[-1][1] < total:
+            pairs.append((limit, seen))
+            limit <<= 1
+        return pairs
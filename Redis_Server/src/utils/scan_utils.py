@@ -0,0 +1,189 @@
+"""
+Provides the building blocks of the cursor-based SCAN family of commands.
+
+Redis walks its hash tables bucket by bucket and encodes the position in the
+cursor. Python dicts cannot be resumed at a position without skipping every
+entry before it, which would make a full iteration quadratic. SCAN resumes in
+the per-shard key log of the database instead (see `RedisDB.scan_shard`); HSCAN
+on hashes too big for a listpack takes a snapshot of the fields on its first
+call, and the cursor encodes the snapshot and the position in it:
+
+- Snapshots are kept in a bounded LRU registry. A cursor whose snapshot was
+  evicted, or that is used on another key, is refused rather than resumed in
+  another snapshot, where it could skip fields.
+- Fields that were removed since the snapshot was taken are skipped by the
+  command; fields added meanwhile may be missed, which HSCAN allows.
+
+MATCH patterns use Redis glob-style syntax and are compiled to regular
+expressions once, then cached.
+
+Exports:
+    - ScanCursors: The registry of snapshots behind the cursors.
+    - SCAN_CURSORS: The registry shared by the server.
+    - compile_glob: Compiles a glob-style pattern to a matching function.
+    - parse_cursor: Parses the cursor argument of a SCAN command.
+"""
+
+import itertools
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Hashable, Optional
+
+from src.exceptions.redis_exceptions import CommandProcessingException
+
+# Number of HSCAN iterations that can be in progress at the same time.
+SCAN_CURSORS_CAPACITY = 64
+
+# Number of elements SCAN commands return by default.
+DEFAULT_SCAN_COUNT = 10
+
+POSITION_BITS = 32
+POSITION_MASK = (1 << POSITION_BITS) - 1
+
+
+def parse_cursor(value: str) -> int:
+    """
+    Parses the cursor argument of a SCAN command.
+
+    Args:
+        value (str): The raw argument.
+
+    Returns:
+        int: The cursor, 0 to start a new iteration.
+
+    Raises:
+        CommandProcessingException: If the cursor is not an unsigned integer.
+    """
+    if not (value.isascii() and value.isdigit()):
+        raise CommandProcessingException("ERR invalid cursor")
+    return int(value)
+
+
+@lru_cache(maxsize=256)
+def compile_glob(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """
+    Compiles a Redis glob-style pattern.
+
+    Supports `*` (any string), `?` (any character), `[abc]`, `[^abc]` and `[a-z]`
+    (character classes) and `\\` to escape special characters.
+
+    Args:
+        pattern (str): The pattern.
+
+    Returns:
+        Callable[[str], Optional[re.Match]]: A function matching a whole string
+                                             against the pattern.
+    """
+    regex = []
+    index, length = 0, len(pattern)
+    while index < length:
+        char = pattern[index]
+        index += 1
+        if char == "*":
+            regex.append(".*")
+        elif char == "?":
+            regex.append(".")
+        elif char == "\\" and index < length:
+            regex.append(re.escape(pattern[index]))
+            index += 1
+        elif char == "[":
+            negated = index < length and pattern[index] == "^"
+            if negated:
+                index += 1
+            members = []
+            while index < length and pattern[index] != "]":
+                if pattern[index] == "\\" and index + 1 < length:
+                    index += 1
+                    members.append(re.escape(pattern[index]))
+                elif pattern[index + 1:index + 2] == "-" and index + 2 < length \
+                        and pattern[index + 2] != "]":
+                    low, high = sorted((pattern[index], pattern[index + 2]))
+                    members.append(f"{re.escape(low)}-{re.escape(high)}")
+                    index += 2
+                else:
+                    members.append(re.escape(pattern[index]))
+                index += 1
+            index += 1
+            if members:
+                regex.append(f"[{'^' if negated else ''}{''.join(members)}]")
+            else:
+                regex.append("[^\\s\\S]" if not negated else "[\\s\\S]")
+        else:
+            regex.append(re.escape(char))
+    return re.compile("".join(regex), re.DOTALL).fullmatch
+
+
+class ScanCursors:
+    """
+    Snapshots of the elements walked by SCAN iterations, by cursor.
+    """
+
+    def __init__(self, capacity: int = SCAN_CURSORS_CAPACITY):
+        """
+        Initializes an empty registry.
+
+        Args:
+            capacity (int): The number of snapshots to keep.
+        """
+        self._lock = threading.Lock()
+        self._capacity = capacity
+        self._snapshots: OrderedDict[int, tuple[Hashable, list]] = OrderedDict()
+        self._ids = itertools.count(1)
+
+    def scan(self, owner: Hashable, cursor: int, count: int,
+             take_snapshot: Callable[[], list]) -> tuple[int, list]:
+        """
+        Returns the next elements of an iteration.
+
+        Args:
+            owner (Hashable): What is walked, e.g. the key of a hash, so that a
+                              cursor is not resumed on something else.
+            cursor (int): The cursor returned by the previous call, or 0.
+            count (int): The number of elements to return.
+            take_snapshot (Callable[[], list]): Returns the elements to walk.
+
+        Returns:
+            tuple[int, list]: The cursor of the next call, 0 once the iteration
+                              is over, and the elements.
+
+        Raises:
+            CommandProcessingException: If the snapshot of the cursor is unknown,
+                                        evicted or taken of something else.
+        """
+        snapshot_id, position = cursor >> POSITION_BITS, cursor & POSITION_MASK
+        snapshot = None
+        if cursor:
+            with self._lock:
+                entry = self._snapshots.get(snapshot_id)
+                if entry is None or entry[0] != owner:
+                    raise CommandProcessingException("ERR invalid cursor")
+                self._snapshots.move_to_end(snapshot_id)
+                snapshot = entry[1]
+
+        if snapshot is None:
+            snapshot = take_snapshot()
+            with self._lock:
+                snapshot_id = next(self._ids)
+                self._snapshots[snapshot_id] = (owner, snapshot)
+                if len(self._snapshots) > self._capacity:
+                    self._snapshots.popitem(last=False)
+
+        end = position + count
+        elements = snapshot[position:end]
+        if end >= len(snapshot):
+            with self._lock:
+                self._snapshots.pop(snapshot_id, None)
+            return 0, elements
+        return (snapshot_id << POSITION_BITS) | end, elements
+
+    def clear(self) -> None:
+        """
+        Forgets every iteration in progress.
+        """
+        with self._lock:
+            self._snapshots.clear()
+
+
+SCAN_CURSORS = ScanCursors()
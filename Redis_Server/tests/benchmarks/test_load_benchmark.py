@@ -0,0 +1,70 @@
+"""
+Unit tests for the command line and the regression check of the load benchmark,
+which need no server.
+"""
+
+import contextlib
+import io
+import unittest
+
+from benchmarks.load_benchmark import find_regressions, parse_arguments
+
+
+class TestFindRegressions(unittest.TestCase):
+    """Unit tests for find_regressions."""
+
+    BASELINE = {
+        "GET": {"ops_per_sec": 10_000.0, "p99_ms": 2.0},
+        "SET": {"ops_per_sec": 8_000.0, "p99_ms": 3.0},
+    }
+
+    def test_within_tolerance(self):
+        """Test that changes within the tolerance are not regressions."""
+        results = {
+            "GET": {"ops_per_sec": 9_100.0, "p99_ms": 2.19},
+            "SET": {"ops_per_sec": 12_000.0, "p99_ms": 1.0},
+        }
+        self.assertEqual(find_regressions(results, self.BASELINE, 0.1), [])
+
+    def test_throughput_and_latency_regressions(self):
+        """Test that a throughput drop and a p99 growth beyond the tolerance are reported."""
+        results = {
+            "GET": {"ops_per_sec": 8_900.0, "p99_ms": 2.0},
+            "SET": {"ops_per_sec": 8_000.0, "p99_ms": 3.4},
+        }
+        regressions = find_regressions(results, self.BASELINE, 0.1)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("GET: 8,900 ops/sec"))
+        self.assertTrue(regressions[1].startswith("SET: p99 3.400 ms"))
+        self.assertEqual(find_regressions(results, self.BASELINE, 0.2), [])
+
+    def test_workloads_missing_from_baseline(self):
+        """Test that workloads the baseline did not run are not compared."""
+        results = {"INCR": {"ops_per_sec": 1.0, "p99_ms": 100.0}}
+        self.assertEqual(find_regressions(results, self.BASELINE, 0.0), [])
+
+
+class TestParseArguments(unittest.TestCase):
+    """Unit tests for parse_arguments."""
+
+    def test_workloads(self):
+        """Test that --tests and --mix select the workloads."""
+        args = parse_arguments(["-t", "get,SET", "--mix", "GET=9,SET=1"])
+        self.assertEqual(args.workloads, [{"GET": 1}, {"SET": 1}, {"GET": 9, "SET": 1}])
+        self.assertEqual(parse_arguments(["-t", "", "--mix", "PING"]).workloads,
+                         [{"PING": 1}])
+
+    def test_invalid_arguments(self):
+        """Test that invalid counts and an empty workload are usage errors."""
+        for argv in (["--pipeline", "0"], ["--clients", "0"], ["-n", "-1"],
+                     ["--keyspace", "0"], ["-c", "x"], ["-d", "-1"],
+                     ["--tolerance", "-0.1"], ["-t", ""], ["-t", "FLUSHALL"]):
+            with self.subTest(argv=argv):
+                with contextlib.redirect_stderr(io.StringIO()):
+                    with self.assertRaises(SystemExit) as context:
+                        parse_arguments(argv)
+                self.assertEqual(context.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,9 @@
 import unittest
-from src.commands import get_command_handler
+from src.commands import COMMAND_SPECS, get_command_handler, lookup_command
 from src.commands.utility_commands import PingCommand, EchoCommand, SaveCommand
 from src.commands.key_value_commands import GetCommand, SetCommand, IncrCommand, DecrByCommand
 from src.commands.list_commands import LPushCommand, RPushCommand
-from src.exceptions.redis_exceptions import UnknownCommandException
+from src.exceptions.redis_exceptions import InvalidCommandSyntaxError, UnknownCommandException
 
 
 class TestCommandHandler(unittest.TestCase):
@@ -46,6 +46,50 @@ class TestCommandHandler(unittest.TestCase):
         with self.assertRaises(UnknownCommandException):
             get_command_handler("")
 
+    def test_lookup_command(self):
+        """Test that lookup_command finds commands by name as text or bytes, in any case."""
+        for name in ("GET", "get", b"GET", b"get", "Get", b"gEt"):
+            self.assertIs(lookup_command(name).command_class, GetCommand)
+        self.assertIsNone(lookup_command("UNKNOWN"))
+        self.assertIsNone(lookup_command(b"MULTI"))
+        self.assertIsNone(lookup_command(None))
+        self.assertIsNone(lookup_command(["GET"]))
+
+    def test_arity(self):
+        """Test that the arity of a command is checked before the command is created."""
+        get, set_, ping = (lookup_command(name) for name in ("GET", "SET", "PING"))
+        self.assertIsInstance(get.parse(["key"]), GetCommand)
+        for spec, arguments in ((get, []), (get, ["key", "extra"]), (set_, ["key"]),
+                                (lookup_command("DEL"), [])):
+            with self.assertRaises(InvalidCommandSyntaxError) as context:
+                spec.parse(arguments)
+            self.assertEqual(str(context.exception),
+                             "ERR wrong number of arguments for command")
+        self.assertIsInstance(set_.parse(["key", "value", "EX", "10"]), SetCommand)
+        self.assertIsInstance(ping.parse([]), PingCommand)
+
+    def test_parse_handler(self):
+        """Test that commands without options are created without parsing, and others are parsed."""
+        get, set_ = lookup_command("GET"), lookup_command("SET")
+        self.assertEqual(get.parse, get._create_unparsed)
+        self.assertEqual(set_.parse, set_._create)
+        command = get.parse(["key"])
+        self.assertEqual(command.get("key"), "key")
+        self.assertIsNone(command.get("EX"))
+        command = set_.parse(["key", "value", "EX", "10"])
+        self.assertEqual((command.get("key"), command.get("value"), command.get("EX")),
+                         ("key", "value", "10"))
+        self.assertIsNone(set_.parse(["key", "value"]).get("EX"))
+
+    def test_command_table(self):
+        """Test that the command table has one entry per command, without instance dicts."""
+        names = [spec.name for spec in COMMAND_SPECS]
+        self.assertEqual(len(names), len(set(names)))
+        for spec in COMMAND_SPECS:
+            self.assertNotEqual(spec.arity, 0)
+            self.assertFalse(hasattr(spec.command_class.__new__(spec.command_class), "__dict__"),
+                             spec.name)
+
     def test_edge_cases(self):
         """Test edge cases like None or invalid inputs."""
         with self.assertRaises(UnknownCommandException):
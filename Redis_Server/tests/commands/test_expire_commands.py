@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import patch
+from src.commands.expire_commands import (
+    ExpireAtCommand,
+    ExpireCommand,
+    PersistCommand,
+    PExpireCommand,
+    PTTLCommand,
+    TTLCommand,
+)
+from src.commands.key_value_commands import IncrCommand, SetCommand
+from src.exceptions.redis_exceptions import CommandProcessingException
+from src.redisDB.redis_db import RedisDB
+from src.utils.time_utils import get_current_time_in_ms
+
+
+class TestExpireCommands(unittest.TestCase):
+    """
+    Unit tests for the key expiration commands.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh RedisDB instance for each test.
+        """
+        self.mock_db = RedisDB("test_snapshot.pkl")
+
+        for module in ("expire_commands", "key_value_commands"):
+            patcher = patch(f"src.commands.{module}.REDIS_DB", self.mock_db)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+
+    def test_expire_and_ttl(self):
+        """Test EXPIRE sets a timeout that TTL and PTTL report."""
+        self.mock_db.set("mykey", "value")
+
+        self.assertEqual(ExpireCommand(["mykey", "100"]).execute(), 1)
+        self.assertEqual(TTLCommand(["mykey"]).execute(), 100)
+        self.assertTrue(99_000 <= PTTLCommand(["mykey"]).execute() <= 100_000)
+
+    def test_pexpire(self):
+        """Test PEXPIRE sets a timeout in milliseconds."""
+        self.mock_db.set("mykey", "value")
+
+        self.assertEqual(PExpireCommand(["mykey", "1800"]).execute(), 1)
+        self.assertEqual(TTLCommand(["mykey"]).execute(), 2)
+
+    def test_expire_in_the_past_deletes_key(self):
+        """Test EXPIREAT with a past timestamp deletes the key."""
+        self.mock_db.set("mykey", "value")
+
+        self.assertEqual(ExpireAtCommand(["mykey", "1"]).execute(), 1)
+        self.assertNotIn("mykey", self.mock_db)
+
+    def test_expire_missing_key(self):
+        """Test EXPIRE on a missing key returns 0."""
+        self.assertEqual(ExpireCommand(["missing", "10"]).execute(), 0)
+
+    def test_expire_invalid_time(self):
+        """Test EXPIRE rejects a non-integer timeout."""
+        self.mock_db.set("mykey", "value")
+        with self.assertRaises(CommandProcessingException):
+            ExpireCommand(["mykey", "soon"]).execute()
+
+    def test_ttl_special_values(self):
+        """Test TTL returns -2 for missing keys and -1 for persistent keys."""
+        self.mock_db.set("persistent", "value")
+
+        self.assertEqual(TTLCommand(["missing"]).execute(), -2)
+        self.assertEqual(TTLCommand(["persistent"]).execute(), -1)
+
+    def test_persist(self):
+        """Test PERSIST removes the timeout of a key."""
+        self.mock_db.set("mykey", "value", expire=get_current_time_in_ms() + 10_000)
+
+        self.assertEqual(PersistCommand(["mykey"]).execute(), 1)
+        self.assertEqual(TTLCommand(["mykey"]).execute(), -1)
+        self.assertEqual(PersistCommand(["mykey"]).execute(), 0)
+
+    def test_set_clears_and_incr_keeps_ttl(self):
+        """Test SET discards a previous timeout while INCR keeps it."""
+        SetCommand(["counter", "1", "EX", "100"]).execute()
+        IncrCommand(["counter"]).execute()
+        self.assertEqual(TTLCommand(["counter"]).execute(), 100)
+
+        SetCommand(["counter", "1"]).execute()
+        self.assertEqual(TTLCommand(["counter"]).execute(), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
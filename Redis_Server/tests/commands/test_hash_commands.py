@@ -0,0 +1,173 @@
+import unittest
+from unittest.mock import patch
+from src.commands.hash_commands import (
+    HDelCommand,
+    HGetAllCommand,
+    HGetCommand,
+    HIncrByCommand,
+    HLenCommand,
+    HMGetCommand,
+    HScanCommand,
+    HSetCommand,
+)
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.listpack import ListPack, ListPackHash
+from src.redisDB.redis_db import RedisDB
+from src.utils.scan_utils import SCAN_CURSORS
+
+
+class TestHashCommands(unittest.TestCase):
+    """
+    Unit tests for the hash commands.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh RedisDB instance for each test.
+        """
+        self.mock_db = RedisDB("test_snapshot.pkl")
+        self.mock_db._data = {}  # Clear in-memory data
+        self.mock_db.clear()
+        self.addCleanup(SCAN_CURSORS.clear)
+
+        # Patch REDIS_DB in hash_commands.py
+        patcher = patch("src.commands.hash_commands.REDIS_DB", self.mock_db)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def hset(self, key, *pairs):
+        """Run HSET with the given fields and values."""
+        return HSetCommand([key, *pairs]).execute()
+
+    def test_hset_and_hget(self):
+        """Test HSET counts new fields only and HGET reads them back."""
+        self.assertEqual(self.hset("user", "name", "Ada", "age", "36"), 2)
+        self.assertEqual(self.hset("user", "age", "37", "city", "London"), 1)
+
+        self.assertIsInstance(self.mock_db.get("user"), ListPackHash)
+        self.assertEqual(HGetCommand(["user", "age"]).execute(), "37")
+        self.assertIsNone(HGetCommand(["user", "missing"]).execute())
+        self.assertIsNone(HGetCommand(["nokey", "age"]).execute())
+
+    def test_hset_wrong_arguments(self):
+        """Test HSET refuses a field without value."""
+        for arguments in (["user"], ["user", "name"], ["user", "a", "1", "b"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    HSetCommand(arguments)
+
+    def test_big_hash_becomes_hashtable(self):
+        """Test that a hash with many fields or long values is converted to a dict."""
+        self.hset("many", *[str(i) for i in range(300)])
+        self.assertIs(type(self.mock_db.get("many")), dict)
+        self.assertEqual(HLenCommand(["many"]).execute(), 150)
+
+        self.hset("long", "field", "x" * 100)
+        self.assertIs(type(self.mock_db.get("long")), dict)
+        self.assertEqual(HGetCommand(["long", "field"]).execute(), "x" * 100)
+
+    def test_hmget_and_hgetall(self):
+        """Test HMGET and HGETALL, with missing fields and keys."""
+        self.hset("user", "name", "Ada", "age", "36")
+
+        self.assertEqual(HMGetCommand(["user", "age", "missing", "name"]).execute(),
+                         ["36", None, "Ada"])
+        self.assertEqual(HMGetCommand(["nokey", "a", "b"]).execute(), [None, None])
+        self.assertEqual(HGetAllCommand(["user"]).execute(), ["name", "Ada", "age", "36"])
+        self.assertEqual(HGetAllCommand(["nokey"]).execute(), [])
+
+    def test_hdel(self):
+        """Test HDEL counts removed fields and deletes the emptied hash."""
+        self.hset("user", "name", "Ada", "age", "36")
+
+        self.assertEqual(HDelCommand(["user", "age", "missing"]).execute(), 1)
+        self.assertEqual(HLenCommand(["user"]).execute(), 1)
+        self.assertEqual(HDelCommand(["user", "name"]).execute(), 1)
+        self.assertNotIn("user", self.mock_db)
+        self.assertEqual(HDelCommand(["user", "name"]).execute(), 0)
+
+    def test_hdel_keeps_ttl(self):
+        """Test that removing a field does not clear the expiry time."""
+        self.hset("user", "a", "1", "b", "2")
+        self.mock_db.set_expire("user", 1_900_000_000_000)
+        HDelCommand(["user", "a"]).execute()
+        self.assertEqual(self.mock_db.get_expire("user"), 1_900_000_000_000)
+
+    def test_hincrby(self):
+        """Test HINCRBY on new and existing fields."""
+        self.assertEqual(HIncrByCommand(["counters", "hits", "5"]).execute(), 5)
+        self.assertEqual(HIncrByCommand(["counters", "hits", "-7"]).execute(), -2)
+        self.assertEqual(HGetCommand(["counters", "hits"]).execute(), "-2")
+
+    def test_hincrby_errors(self):
+        """Test HINCRBY refuses non-integer values and overflows."""
+        self.hset("h", "name", "Ada", "max", str(2 ** 63 - 1))
+        with self.assertRaisesRegex(CommandProcessingException, "hash value is not an integer"):
+            HIncrByCommand(["h", "name", "1"]).execute()
+        with self.assertRaisesRegex(CommandProcessingException, "would overflow"):
+            HIncrByCommand(["h", "max", "1"]).execute()
+        with self.assertRaisesRegex(CommandProcessingException, "not an integer"):
+            HIncrByCommand(["h", "max", "one"]).execute()
+        self.assertEqual(HGetCommand(["h", "max"]).execute(), str(2 ** 63 - 1))
+
+    def test_wrong_type(self):
+        """Test that hash commands refuse keys holding other types."""
+        self.mock_db.set("list", ListPack(["a"]))
+        for command in (HSetCommand(["list", "a", "1"]), HGetCommand(["list", "a"]),
+                        HLenCommand(["list"]), HScanCommand(["list", "0"])):
+            with self.subTest(command=type(command).__name__):
+                with self.assertRaisesRegex(CommandProcessingException, "WRONGTYPE"):
+                    command.execute()
+
+    def test_hscan_small_hash(self):
+        """Test that HSCAN returns a listpack-encoded hash at once."""
+        self.hset("user", "name", "Ada", "nick", "ada", "age", "36")
+
+        self.assertEqual(HScanCommand(["user", "0"]).execute(),
+                         ["0", ["name", "Ada", "nick", "ada", "age", "36"]])
+        self.assertEqual(HScanCommand(["user", "0", "MATCH", "n*", "NOVALUES"]).execute(),
+                         ["0", ["name", "nick"]])
+        self.assertEqual(HScanCommand(["nokey", "0"]).execute(), ["0", []])
+
+    def test_hscan_big_hash(self):
+        """Test a full HSCAN iteration over a hashtable-encoded hash."""
+        self.hset("big", *[item for i in range(500) for item in (f"f{i}", str(i))])
+
+        cursor, seen, calls = "0", {}, 0
+        while True:
+            cursor, items = HScanCommand(["big", cursor, "COUNT", "50"]).execute()
+            seen.update(zip(items[::2], items[1::2]))
+            calls += 1
+            if cursor == "0":
+                break
+            if calls == 1:
+                HDelCommand(["big", "f499"]).execute()
+
+        self.assertEqual(calls, 10)
+        self.assertEqual(len(seen), 499)
+        self.assertEqual(seen["f7"], "7")
+
+    def test_hscan_unknown_cursor_is_refused(self):
+        """Test that a cursor whose snapshot is gone is refused rather than resumed."""
+        self.hset("big", *[str(i) for i in range(400)])
+        cursor, _ = HScanCommand(["big", "0", "COUNT", "150"]).execute()
+        SCAN_CURSORS.clear()
+
+        with self.assertRaisesRegex(CommandProcessingException, "invalid cursor"):
+            HScanCommand(["big", cursor, "COUNT", "150"]).execute()
+
+    def test_hscan_invalid_arguments(self):
+        """Test HSCAN refuses invalid cursors and options."""
+        with self.assertRaisesRegex(CommandProcessingException, "invalid cursor"):
+            HScanCommand(["h", "-1"])
+        for arguments in (["h", "0", "COUNT", "0"], ["h", "0", "MATCH"], ["h", "0", "FOO", "1"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    HScanCommand(arguments)
+
+
+if __name__ == "__main__":
+    unittest.main()
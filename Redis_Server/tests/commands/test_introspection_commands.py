@@ -0,0 +1,191 @@
+import unittest
+from unittest.mock import patch
+
+from src.commands.introspection_commands import (
+    InfoCommand,
+    LatencyCommand,
+    MemoryCommand,
+    ObjectCommand,
+    SlowlogCommand,
+)
+from src.commands.key_value_commands import GetCommand, SetCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.handlers.server_stats import ServerStats
+from src.handlers.slow_log import SlowLog
+from src.redisDB.encodings import create_list
+from src.redisDB.redis_db import RedisDB
+
+
+class TestIntrospectionCommands(unittest.TestCase):
+    """
+    Unit tests for the OBJECT, MEMORY, INFO, LATENCY and SLOWLOG commands.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh RedisDB instance and fresh statistics for each test.
+        """
+        self.mock_db = RedisDB("test_snapshot.pkl")
+        self.stats = ServerStats()
+        self.stats.register("GET", GetCommand)
+        self.stats.register("SET", SetCommand)
+        self.slow_log = SlowLog(threshold_us=0)
+
+        for target, value in [("REDIS_DB", self.mock_db), ("SERVER_STATS", self.stats),
+                              ("SLOW_LOG", self.slow_log)]:
+            patcher = patch(f"src.commands.introspection_commands.{target}", value)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+
+    def info(self, *sections) -> dict:
+        """Run INFO and return its fields by section."""
+        reply = {}
+        for block in InfoCommand(list(sections)).execute().split("\r\n\r\n"):
+            title, *lines = block.split("\r\n")
+            reply[title[2:]] = dict(line.split(":", 1) for line in lines)
+        return reply
+
+    def test_object_encoding(self):
+        """Test OBJECT ENCODING for each kind of value."""
+        self.mock_db.set("counter", 5)
+        self.mock_db.set("name", "value")
+        self.mock_db.set("list", create_list(["a", "b"]))
+
+        self.assertEqual(ObjectCommand(["ENCODING", "counter"]).execute(), "int")
+        self.assertEqual(ObjectCommand(["encoding", "name"]).execute(), "embstr")
+        self.assertEqual(ObjectCommand(["ENCODING", "list"]).execute(), "listpack")
+        self.assertIsNone(ObjectCommand(["ENCODING", "missing"]).execute())
+
+    def test_object_keys(self):
+        """Test that the key of OBJECT is its second argument."""
+        self.assertEqual(ObjectCommand(["ENCODING", "key"]).get_keys(), ["key"])
+
+    def test_memory_usage(self):
+        """Test MEMORY USAGE with and without SAMPLES."""
+        self.mock_db.set("name", "value")
+
+        usage = MemoryCommand(["USAGE", "name"]).execute()
+        self.assertGreater(usage, 0)
+        self.assertEqual(MemoryCommand(["USAGE", "name", "SAMPLES", "0"]).execute(), usage)
+        self.assertIsNone(MemoryCommand(["USAGE", "missing"]).execute())
+
+    def test_memory_stats(self):
+        """Test that MEMORY STATS reports the memory limit and evictions."""
+        self.addCleanup(self.mock_db.configure_maxmemory, 0)
+        self.mock_db.configure_maxmemory(10 ** 6, "allkeys-lfu")
+        self.mock_db.set("name", "value")
+
+        stats = MemoryCommand(["STATS"]).execute()
+        stats = dict(zip(stats[::2], stats[1::2]))
+        self.assertEqual(stats["maxmemory"], 10 ** 6)
+        self.assertEqual(stats["maxmemory-policy"], "allkeys-lfu")
+        self.assertEqual(stats["dataset.bytes"], self.mock_db.used_memory)
+        self.assertEqual(stats["keys.count"], 1)
+        self.assertEqual(stats["evicted_keys"], 0)
+        self.assertEqual(MemoryCommand(["STATS"]).get_keys(), [])
+
+    def test_invalid_arguments(self):
+        """Test that unknown subcommands and malformed options are refused."""
+        for command, arguments in [(ObjectCommand, []), (ObjectCommand, ["FREQ", "key"]),
+                                   (MemoryCommand, ["USAGE"]), (MemoryCommand, ["STATS", "key"]),
+                                   (MemoryCommand, ["USAGE", "key", "COUNT", "1"])]:
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    command(arguments)
+        with self.assertRaises(CommandProcessingException):
+            MemoryCommand(["USAGE", "key", "SAMPLES", "-1"]).execute()
+
+    def test_info_default_sections(self):
+        """Test the sections reported by INFO without arguments."""
+        self.mock_db.set("name", "value")
+        self.mock_db.set("volatile", "value", expire=10 ** 13)
+        self.stats.client_connected()
+
+        info = self.info()
+        self.assertEqual(list(info), ["Server", "Clients", "Memory", "Persistence",
+                                      "Stats", "Keyspace"])
+        self.assertEqual(info["Clients"]["connected_clients"], "1")
+        self.assertEqual(info["Stats"]["total_connections_received"], "1")
+        self.assertEqual(info["Memory"]["maxmemory_policy"], "noeviction")
+        self.assertEqual(info["Keyspace"], {"db0": "keys=2,expires=1"})
+        self.assertEqual(InfoCommand([]).get_keys(), [])
+
+    def test_used_memory_without_maxmemory(self):
+        """Test that INFO and MEMORY STATS estimate the memory used without a limit."""
+        self.assertEqual(self.info("memory")["Memory"]["used_memory"], "0")
+        for i in range(2000):
+            self.mock_db.set(f"key:{i}", "x" * 100)
+
+        used_memory = int(self.info("memory")["Memory"]["used_memory"])
+        self.assertGreater(used_memory, 2000 * 100)
+        self.assertLess(used_memory, 2000 * 1000)
+        stats = MemoryCommand(["STATS"]).execute()
+        self.assertGreater(stats[stats.index("dataset.bytes") + 1], 2000 * 100)
+
+    def test_info_command_statistics(self):
+        """Test the commandstats and latencystats sections."""
+        self.stats.record(GetCommand(["key"]), 3000)
+        self.stats.record(GetCommand(["key"]), 5000, failed=True)
+
+        info = self.info("COMMANDSTATS", "latencystats")
+        self.assertEqual(list(info), ["Commandstats", "Latencystats"])
+        self.assertEqual(info["Commandstats"], {
+            "cmdstat_get": "calls=2,usec=8,usec_per_call=4.00,rejected_calls=0,"
+                           "failed_calls=1",
+        })
+        self.assertEqual(info["Latencystats"], {
+            "latency_percentiles_usec_get": "p50=3.000,p99=5.000,p99.9=5.000",
+        })
+        self.assertEqual(self.info("all")["Stats"]["total_commands_processed"], "2")
+        self.assertEqual(InfoCommand(["unknown"]).execute(), "")
+
+    def test_latency_histogram(self):
+        """Test LATENCY HISTOGRAM for every command and for given commands."""
+        self.stats.record(GetCommand(["key"]), 1500)
+        self.stats.record(GetCommand(["key"]), 2500)
+        self.stats.record(SetCommand(["key", "value"]), 500)
+
+        self.assertEqual(LatencyCommand(["HISTOGRAM", "get", "unknown"]).execute(), [
+            "get", ["calls", 2, "histogram_usec", [1, 0, 2, 1, 4, 2]],
+        ])
+        self.assertEqual(LatencyCommand(["histogram"]).execute()[::2], ["get", "set"])
+        with self.assertRaises(InvalidCommandSyntaxError):
+            LatencyCommand(["DOCTOR"])
+
+    def test_latency_sampling(self):
+        """Test that only one call in latency_sample_rate is added to histograms."""
+        self.stats.latency_sample_rate = 4
+        for _ in range(8):
+            self.stats.record(GetCommand(["key"]), 1000)
+
+        stat = self.stats.command("get")
+        self.assertEqual((stat.calls, stat.nanoseconds), (8, 8000))
+        self.assertEqual(stat.histogram.total, 2)
+
+    def test_slowlog(self):
+        """Test SLOWLOG GET, LEN and RESET."""
+        for index in range(12):
+            self.slow_log.add("DEL", [f"key{index}"], 20_000_000, "127.0.0.1:5000")
+
+        self.assertEqual(SlowlogCommand(["LEN"]).execute(), 12)
+        entries = SlowlogCommand(["get"]).execute()
+        self.assertEqual(len(entries), 10)
+        self.assertEqual(entries[0][0], 11)
+        self.assertEqual(entries[0][2:], [20_000, ["DEL", "key11"], "127.0.0.1:5000", ""])
+        self.assertEqual(len(SlowlogCommand(["GET", "-1"]).execute()), 12)
+        self.assertEqual(SlowlogCommand(["RESET"]).execute(), "OK")
+        self.assertEqual(SlowlogCommand(["LEN"]).execute(), 0)
+
+        for arguments in (["DOCTOR"], ["LEN", "1"], ["GET", "1", "2"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    SlowlogCommand(arguments)
+        with self.assertRaises(CommandProcessingException):
+            SlowlogCommand(["GET", "many"]).execute()
+
+
+if __name__ == "__main__":
+    unittest.main()
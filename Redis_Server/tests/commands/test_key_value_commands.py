@@ -1,16 +1,31 @@
 import unittest
 from unittest.mock import patch
 from src.commands.key_value_commands import (
+    AppendCommand,
     DecrByCommand,
     GetCommand,
+    GetDelCommand,
+    GetExCommand,
+    GetSetCommand,
     IncrByCommand,
+    MGetCommand,
+    MSetCommand,
+    MSetNxCommand,
     SetCommand,
+    SetNxCommand,
+    StrLenCommand,
     DeleteCommand,
     ExistsCommand,
     IncrCommand,
     DecrCommand,
 )
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.encodings import create_list
 from src.redisDB.redis_db import RedisDB
+from src.utils.time_utils import get_current_time_in_ms
 
 
 class TestKeyValueCommands(unittest.TestCase):
@@ -36,7 +51,7 @@ class TestKeyValueCommands(unittest.TestCase):
         result = command.execute()
 
         self.assertEqual(result, "OK")
-        self.assertEqual(self.mock_db.get("mykey")[0], "myvalue")
+        self.assertEqual(self.mock_db.get("mykey"), "myvalue")
 
     def test_set_command_with_expiry(self):
         """Test SetCommand sets a key with expiry (EX)."""
@@ -44,21 +59,30 @@ class TestKeyValueCommands(unittest.TestCase):
         result = command.execute()
 
         self.assertEqual(result, "OK")
-        value, expires = self.mock_db.get("mykey")
-        self.assertEqual(value, "myvalue")
-        self.assertIsNotNone(expires)
+        self.assertEqual(self.mock_db.get("mykey"), "myvalue")
+        self.assertIsNotNone(self.mock_db.get_expire("mykey"))
 
     def test_get_command_existing_key(self):
         """Test GetCommand retrieves the value of an existing key."""
-        self.mock_db.set("mykey", ("myvalue", None))
+        self.mock_db.set("mykey", "myvalue")
         command = GetCommand(["mykey"])
         result = command.execute()
 
         self.assertEqual(result, "myvalue")
 
+    def test_integer_values_are_stored_as_int(self):
+        """Test that integer strings are stored natively and read back as strings."""
+        SetCommand(["counter", "42"]).execute()
+        SetCommand(["padded", "042"]).execute()
+
+        self.assertEqual(self.mock_db.get("counter"), 42)
+        self.assertEqual(self.mock_db.get("padded"), "042")
+        self.assertEqual(GetCommand(["counter"]).execute(), "42")
+        self.assertEqual(IncrCommand(["counter"]).execute(), 43)
+
     def test_get_command_expired_key(self):
         """Test GetCommand returns None for an expired key."""
-        self.mock_db.set("mykey", ("myvalue", 0))  # Expired key
+        self.mock_db.set("mykey", "myvalue", expire=0)  # Expired key
         command = GetCommand(["mykey"])
         result = command.execute()
 
@@ -67,8 +91,8 @@ class TestKeyValueCommands(unittest.TestCase):
 
     def test_delete_command(self):
         """Test DeleteCommand deletes one or more keys."""
-        self.mock_db.set("key1", ("value1", None))
-        self.mock_db.set("key2", ("value2", None))
+        self.mock_db.set("key1", "value1")
+        self.mock_db.set("key2", "value2")
 
         command = DeleteCommand(["key1", "key2", "key3"])
         result = command.execute()
@@ -79,9 +103,9 @@ class TestKeyValueCommands(unittest.TestCase):
 
     def test_exists_command(self):
         """Test ExistsCommand checks the existence of keys."""
-        self.mock_db.set("key1", ("value1", None))
-        self.mock_db.set("key2", ("value2", None))
-        self.mock_db.set("expired_key", ("value3", 0))  # Expired key
+        self.mock_db.set("key1", "value1")
+        self.mock_db.set("key2", "value2")
+        self.mock_db.set("expired_key", "value3", expire=0)  # Expired key
 
         command = ExistsCommand(["key1", "key2", "expired_key", "nonexistent"])
         result = command.execute()
@@ -94,16 +118,16 @@ class TestKeyValueCommands(unittest.TestCase):
         result = command.execute()
 
         self.assertEqual(result, 1)
-        self.assertEqual(self.mock_db.get("counter")[0], 1)
+        self.assertEqual(self.mock_db.get("counter"), 1)
 
     def test_incr_command_existing_key(self):
         """Test IncrCommand increments an existing key."""
-        self.mock_db.set("counter", ("5", None))
+        self.mock_db.set("counter", "5")
         command = IncrCommand(["counter"])
         result = command.execute()
 
         self.assertEqual(result, 6)
-        self.assertEqual(self.mock_db.get("counter")[0], 6)
+        self.assertEqual(self.mock_db.get("counter"), 6)
 
     def test_decr_command_new_key(self):
         """Test DecrCommand decrements a new key."""
@@ -111,16 +135,16 @@ class TestKeyValueCommands(unittest.TestCase):
         result = command.execute()
 
         self.assertEqual(result, -1)
-        self.assertEqual(self.mock_db.get("counter")[0], -1)
+        self.assertEqual(self.mock_db.get("counter"), -1)
 
     def test_decr_command_existing_key(self):
         """Test DecrCommand decrements an existing key."""
-        self.mock_db.set("counter", ("5", None))
+        self.mock_db.set("counter", "5")
         command = DecrCommand(["counter"])
         result = command.execute()
 
         self.assertEqual(result, 4)
-        self.assertEqual(self.mock_db.get("counter")[0], 4)
+        self.assertEqual(self.mock_db.get("counter"), 4)
         
     def test_incrby_command_new_key(self):
         """Test IncrByCommand increments a new key by a specific amount."""
@@ -128,16 +152,16 @@ class TestKeyValueCommands(unittest.TestCase):
         result = command.execute()
 
         self.assertEqual(result, 5)
-        self.assertEqual(self.mock_db.get("counter")[0], 5)
+        self.assertEqual(self.mock_db.get("counter"), 5)
 
     def test_incrby_command_existing_key(self):
         """Test IncrByCommand increments an existing key by a specific amount."""
-        self.mock_db.set("counter", ("10", None))
+        self.mock_db.set("counter", "10")
         command = IncrByCommand(["counter", "7"])
         result = command.execute()
 
         self.assertEqual(result, 17)
-        self.assertEqual(self.mock_db.get("counter")[0], 17)
+        self.assertEqual(self.mock_db.get("counter"), 17)
 
     def test_decrby_command_new_key(self):
         """Test DecrByCommand decrements a new key by a specific amount."""
@@ -145,16 +169,127 @@ class TestKeyValueCommands(unittest.TestCase):
         result = command.execute()
 
         self.assertEqual(result, -4)
-        self.assertEqual(self.mock_db.get("counter")[0], -4)
+        self.assertEqual(self.mock_db.get("counter"), -4)
 
     def test_decrby_command_existing_key(self):
         """Test DecrByCommand decrements an existing key by a specific amount."""
-        self.mock_db.set("counter", ("10", None))
+        self.mock_db.set("counter", "10")
         command = DecrByCommand(["counter", "6"])
         result = command.execute()
 
         self.assertEqual(result, 4)
-        self.assertEqual(self.mock_db.get("counter")[0], 4)
+        self.assertEqual(self.mock_db.get("counter"), 4)
+
+
+    def test_get_wrong_type(self):
+        """Test GET and the other string commands reject keys holding another type."""
+        self.mock_db.set("list", create_list(["a"]))
+        for command in (GetCommand(["list"]), GetSetCommand(["list", "v"]),
+                        GetDelCommand(["list"]), GetExCommand(["list"]),
+                        AppendCommand(["list", "v"]), StrLenCommand(["list"])):
+            with self.subTest(command=type(command).__name__):
+                with self.assertRaisesRegex(CommandProcessingException, "WRONGTYPE"):
+                    command.execute()
+
+    def test_incr_wrong_type(self):
+        """Test INCR and the other counter commands reject keys holding another type."""
+        self.mock_db.set("list", create_list(["1"]))
+        for command in (IncrCommand(["list"]), DecrCommand(["list"]),
+                        IncrByCommand(["list", "2"]), DecrByCommand(["list", "2"])):
+            with self.subTest(command=type(command).__name__):
+                with self.assertRaisesRegex(CommandProcessingException, "WRONGTYPE"):
+                    command.execute()
+        self.assertEqual(list(self.mock_db.get("list")), ["1"])
+
+    def test_mget_and_mset(self):
+        """Test MSET sets every pair and MGET returns None for missing or non-string keys."""
+        self.mock_db.set("a", "old", expire=get_current_time_in_ms() + 10_000)
+        self.mock_db.set("list", create_list(["x"]))
+
+        self.assertEqual(MSetCommand(["a", "1", "b", "two", "a", "3"]).execute(), "OK")
+        self.assertEqual(MGetCommand(["a", "b", "missing", "list"]).execute(),
+                         ["3", "two", None, None])
+        self.assertIs(type(self.mock_db.get("a")), int)
+        self.assertIsNone(self.mock_db.get_expire("a"))
+
+    def test_msetnx(self):
+        """Test MSETNX sets nothing if any key exists."""
+        self.assertEqual(MSetNxCommand(["a", "1", "b", "2"]).execute(), 1)
+        self.assertEqual(MSetNxCommand(["c", "3", "b", "4"]).execute(), 0)
+        self.assertNotIn("c", self.mock_db)
+        self.assertEqual(MGetCommand(["a", "b"]).execute(), ["1", "2"])
+
+    def test_multi_key_arguments(self):
+        """Test the keys and argument counts of the multi-key commands."""
+        self.assertEqual(MGetCommand(["a", "b"]).get_keys(), ["a", "b"])
+        self.assertEqual(MSetCommand(["a", "1", "b", "2"]).get_keys(), ["a", "b"])
+        for command, arguments in ((MGetCommand, []), (MSetCommand, []),
+                                   (MSetCommand, ["a", "1", "b"]), (MSetNxCommand, ["a"])):
+            with self.subTest(command=command.__name__, arguments=arguments):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    command(arguments)
+
+    def test_getset_and_getdel(self):
+        """Test GETSET replaces the value and its expiry, and GETDEL deletes the key."""
+        self.mock_db.set("key", 5, expire=get_current_time_in_ms() + 10_000)
+
+        self.assertEqual(GetSetCommand(["key", "new"]).execute(), "5")
+        self.assertIsNone(self.mock_db.get_expire("key"))
+        self.assertIsNone(GetSetCommand(["other", "value"]).execute())
+        self.assertEqual(GetDelCommand(["key"]).execute(), "new")
+        self.assertNotIn("key", self.mock_db)
+        self.assertIsNone(GetDelCommand(["key"]).execute())
+
+    def test_getex(self):
+        """Test GETEX sets or removes the expiry and propagates an absolute one."""
+        self.mock_db.set("key", "value")
+        now = get_current_time_in_ms()
+
+        command = GetExCommand(["key", "ex", "100"])
+        self.assertEqual(command.execute(), "value")
+        expire = self.mock_db.get_expire("key")
+        self.assertAlmostEqual(expire, now + 100_000, delta=1000)
+        self.assertEqual(command.get_propagated_command(), ["PEXPIREAT", "key", str(expire)])
+
+        command = GetExCommand(["key", "PERSIST"])
+        self.assertEqual(command.execute(), "value")
+        self.assertIsNone(self.mock_db.get_expire("key"))
+        self.assertEqual(command.get_propagated_command(), ["PERSIST", "key"])
+
+        self.assertIsNone(GetExCommand(["key"]).get_propagated_command())
+        self.assertIsNone(GetExCommand(["missing", "PX", "10"]).execute())
+        self.assertNotIn("missing", self.mock_db)
+
+    def test_getex_invalid_options(self):
+        """Test GETEX rejects unknown, repeated and non-positive options."""
+        for arguments in (["key", "EX"], ["key", "PERSIST", "EX", "1"], ["key", "KEEPTTL"],
+                          ["key", "PERSIST", "1"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaisesRegex(InvalidCommandSyntaxError, "syntax error"):
+                    GetExCommand(arguments)
+        for arguments in (["key", "EX", "0"], ["key", "PX", "-1"], ["key", "EX", "x"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(CommandProcessingException):
+                    GetExCommand(arguments)
+
+    def test_setnx(self):
+        """Test SETNX only sets missing keys."""
+        self.assertEqual(SetNxCommand(["key", "1"]).execute(), 1)
+        self.assertEqual(SetNxCommand(["key", "2"]).execute(), 0)
+        self.assertEqual(GetCommand(["key"]).execute(), "1")
+
+    def test_append_and_strlen(self):
+        """Test APPEND keeps the expiry and both report lengths in bytes."""
+        expire = get_current_time_in_ms() + 10_000
+        self.mock_db.set("key", 12, expire=expire)
+
+        self.assertEqual(AppendCommand(["key", "3"]).execute(), 3)
+        self.assertEqual(self.mock_db.get("key"), 123)
+        self.assertEqual(self.mock_db.get_expire("key"), expire)
+        self.assertEqual(AppendCommand(["key", "é"]).execute(), 5)
+        self.assertEqual(StrLenCommand(["key"]).execute(), 5)
+        self.assertEqual(AppendCommand(["new", "abc"]).execute(), 3)
+        self.assertEqual(StrLenCommand(["missing"]).execute(), 0)
 
 
 if __name__ == "__main__":
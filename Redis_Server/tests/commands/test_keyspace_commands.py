@@ -0,0 +1,157 @@
+import random
+import unittest
+from unittest.mock import patch
+from src.commands.keyspace_commands import DBSizeCommand, KeysCommand, ScanCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.encodings import create_hash, create_list, create_set
+from src.redisDB.redis_db import RedisDB
+from src.utils.time_utils import get_current_time_in_ms
+
+
+class TestKeyspaceCommands(unittest.TestCase):
+    """
+    Unit tests for the SCAN, KEYS and DBSIZE commands.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh RedisDB instance for each test.
+        """
+        self.mock_db = RedisDB("test_snapshot.pkl")
+        self.mock_db.clear()
+
+        patcher = patch("src.commands.keyspace_commands.REDIS_DB", self.mock_db)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def scan_all(self, *options: str) -> list[str]:
+        """Run a whole SCAN iteration and return every key it returned."""
+        keys, cursor = [], "0"
+        while True:
+            cursor, batch = ScanCommand([cursor, *options]).execute()
+            keys += batch
+            if cursor == "0":
+                return keys
+
+    def test_scan_returns_every_key_once(self):
+        """Test that a full iteration returns each key exactly once."""
+        for i in range(500):
+            self.mock_db.set(f"key:{i}", "v")
+
+        keys = self.scan_all("COUNT", "7")
+        self.assertEqual(len(keys), 500)
+        self.assertEqual(set(keys), {f"key:{i}" for i in range(500)})
+
+    def test_scan_count_bounds_each_call(self):
+        """Test that a call returns at most COUNT keys and crosses shards to fill them."""
+        for i in range(100):
+            self.mock_db.set(f"key:{i}", "v")
+
+        cursor, keys = ScanCommand(["0", "COUNT", "30"]).execute()
+        self.assertEqual(len(keys), 30)
+        self.assertNotEqual(cursor, "0")
+        self.assertEqual(len(ScanCommand(["0"]).execute()[1]), 10)
+        self.assertEqual(ScanCommand(["0", "COUNT", "1000"]).execute()[0], "0")
+
+    def test_scan_guarantees_with_concurrent_writes(self):
+        """Test that keys present for the whole scan are returned, and deleted ones are not."""
+        stable = {f"stable:{i}" for i in range(300)}
+        doomed = [f"doomed:{i}" for i in range(300)]
+        for key in [*stable, *doomed]:
+            self.mock_db.set(key, "v")
+
+        rng = random.Random(0)
+        rng.shuffle(doomed)
+        returned, cursor, added = set(), "0", 0
+        while True:
+            cursor, batch = ScanCommand([cursor, "COUNT", "25"]).execute()
+            self.assertTrue(all(key in self.mock_db for key in batch))
+            returned.update(batch)
+            for _ in range(5):
+                if doomed:
+                    self.mock_db.delete(doomed.pop())
+                self.mock_db.set(f"added:{added}", "v")
+                added += 1
+            if cursor == "0":
+                break
+
+        self.assertLessEqual(stable, returned)
+
+    def test_scan_cursor_is_stateless(self):
+        """Test that interleaved iterations with deletions each return every stable key."""
+        stable = {f"stable:{i}" for i in range(200)}
+        doomed = [f"doomed:{i}" for i in range(2000)]
+        for key in [*doomed, *stable]:
+            self.mock_db.set(key, "v")
+        random.Random(0).shuffle(doomed)
+
+        iterations = [[set(), "0"] for _ in range(70)]
+        while iterations:
+            for iteration in list(iterations):
+                returned, cursor = iteration
+                cursor, batch = ScanCommand([cursor, "COUNT", "20"]).execute()
+                self.assertLessEqual(len(batch), 20)
+                returned.update(batch)
+                iteration[1] = cursor
+                if cursor == "0":
+                    self.assertLessEqual(stable, returned)
+                    iterations.remove(iteration)
+            for _ in range(10):
+                if doomed:
+                    self.mock_db.delete(doomed.pop())
+
+    def test_scan_match_and_type(self):
+        """Test that MATCH and TYPE filter the returned keys."""
+        self.mock_db.set("user:1", "v")
+        self.mock_db.set("user:2", 5)
+        self.mock_db.set("user:list", create_list(["a"]))
+        self.mock_db.set("user:hash", create_hash([("f", "v")]))
+        self.mock_db.set("order:1", create_set(["1"]))
+        self.mock_db.set("gone", "v", expire=get_current_time_in_ms() - 1)
+
+        self.assertEqual(sorted(self.scan_all("MATCH", "user:[0-9]")), ["user:1", "user:2"])
+        self.assertEqual(sorted(self.scan_all("TYPE", "string")), ["user:1", "user:2"])
+        self.assertEqual(self.scan_all("MATCH", "*", "TYPE", "SET"), ["order:1"])
+        self.assertEqual(self.scan_all("TYPE", "hash", "MATCH", "user:*"), ["user:hash"])
+        self.assertNotIn("gone", self.scan_all())
+
+    def test_scan_invalid_arguments(self):
+        """Test invalid cursors, counts, types and options."""
+        for arguments in ([], ["0", "COUNT"], ["0", "COUNT", "0"], ["0", "LIMIT", "1"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    ScanCommand(arguments)
+        for arguments in (["-1"], ["abc"], ["0", "COUNT", "x"], ["0", "TYPE", "stream"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(CommandProcessingException):
+                    ScanCommand(arguments)
+
+    def test_keys(self):
+        """Test that KEYS matches patterns and skips expired keys."""
+        for key in ("hello", "hallo", "hxllo", "heeeello", "other"):
+            self.mock_db.set(key, "v")
+        self.mock_db.set("hullo", "v", expire=get_current_time_in_ms() - 1)
+        self.mock_db.set("hillo", "v", expire=get_current_time_in_ms() + 10_000)
+
+        self.assertEqual(sorted(KeysCommand(["h?llo"]).execute()),
+                         ["hallo", "hello", "hillo", "hxllo"])
+        self.assertEqual(sorted(KeysCommand(["h[ae]llo"]).execute()), ["hallo", "hello"])
+        self.assertEqual(sorted(KeysCommand(["h*llo"]).execute()),
+                         ["hallo", "heeeello", "hello", "hillo", "hxllo"])
+        self.assertEqual(len(KeysCommand(["*"]).execute()), 6)
+        self.assertEqual(KeysCommand(["nothing*"]).execute(), [])
+
+    def test_dbsize(self):
+        """Test that DBSIZE counts the keys of every shard."""
+        self.assertEqual(DBSizeCommand([]).execute(), 0)
+        for i in range(100):
+            self.mock_db.set(f"key:{i}", "v")
+        self.mock_db.delete("key:0")
+        self.assertEqual(DBSizeCommand([]).execute(), 99)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,33 @@
 import unittest
-from collections import deque
 from unittest.mock import patch
-from src.commands.list_commands import LPushCommand, RPushCommand
+from src.commands.list_commands import (
+    BLMoveCommand,
+    BLPopCommand,
+    LIndexCommand,
+    LInsertCommand,
+    LLenCommand,
+    LMoveCommand,
+    LPopCommand,
+    LPushCommand,
+    LRangeCommand,
+    LRemCommand,
+    LSetCommand,
+    LTrimCommand,
+    RPopCommand,
+    RPushCommand,
+)
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.listpack import ListPack
+from src.redisDB.quicklist import QuickList
 from src.redisDB.redis_db import RedisDB
 
 
 class TestListCommands(unittest.TestCase):
     """
-    Unit tests for LPushCommand and RPushCommand.
+    Unit tests for the list commands.
     """
 
     def setUp(self):
@@ -28,7 +48,7 @@ class TestListCommands(unittest.TestCase):
         result = command.execute()
         self.assertEqual(result, 3)
 
-        self.assertEqual(self.mock_db.get("mylist")[0], deque(["C", "B", "A"]))
+        self.assertEqual(self.mock_db.get("mylist"), ListPack(["C", "B", "A"]))
 
     def test_rpush_command_new_list(self):
         """Test RPushCommand adds values to a new list."""
@@ -36,7 +56,150 @@ class TestListCommands(unittest.TestCase):
         result = command.execute()
         self.assertEqual(result, 3)
 
-        self.assertEqual(self.mock_db.get("mylist")[0], deque(["1", "2", "3"]))
+        self.assertEqual(self.mock_db.get("mylist"), ListPack(["1", "2", "3"]))
+
+    def test_list_is_converted_when_it_grows(self):
+        """Test that a list leaves the listpack encoding past 128 elements."""
+        RPushCommand(["mylist", *map(str, range(128))]).execute()
+        self.assertIsInstance(self.mock_db.get("mylist"), ListPack)
+
+        self.assertEqual(LPushCommand(["mylist", "head"]).execute(), 129)
+        self.assertIsInstance(self.mock_db.get("mylist"), QuickList)
+        self.assertEqual(list(self.mock_db.get("mylist")), ["head", *map(str, range(128))])
+
+    def test_push_to_wrong_type(self):
+        """Test that pushing to a string value fails with WRONGTYPE."""
+        self.mock_db.set("mykey", "value")
+        with self.assertRaises(CommandProcessingException):
+            RPushCommand(["mykey", "1"]).execute()
+        with self.assertRaises(CommandProcessingException):
+            LRangeCommand(["mykey", "0", "-1"]).execute()
+
+    def test_pop_from_both_ends(self):
+        """Test LPOP and RPOP with and without a count."""
+        RPushCommand(["mylist", "a", "b", "c", "d", "e"]).execute()
+
+        self.assertEqual(LPopCommand(["mylist"]).execute(), "a")
+        self.assertEqual(RPopCommand(["mylist"]).execute(), "e")
+        self.assertEqual(LPopCommand(["mylist", "2"]).execute(), ["b", "c"])
+        self.assertEqual(RPopCommand(["mylist", "5"]).execute(), ["d"])
+        self.assertNotIn("mylist", self.mock_db)
+        self.assertIsNone(LPopCommand(["mylist"]).execute())
+        self.assertIsNone(RPopCommand(["mylist", "1"]).execute())
+        with self.assertRaises(CommandProcessingException):
+            LPopCommand(["mylist", "-1"]).execute()
+
+    def test_len_index_and_range(self):
+        """Test LLEN, LINDEX and LRANGE with negative and out of range indexes."""
+        RPushCommand(["mylist", *map(str, range(1000))]).execute()
+
+        self.assertEqual(LLenCommand(["mylist"]).execute(), 1000)
+        self.assertEqual(LLenCommand(["missing"]).execute(), 0)
+        self.assertEqual(LIndexCommand(["mylist", "500"]).execute(), "500")
+        self.assertEqual(LIndexCommand(["mylist", "-1"]).execute(), "999")
+        self.assertIsNone(LIndexCommand(["mylist", "1000"]).execute())
+        self.assertEqual(LRangeCommand(["mylist", "998", "2000"]).execute(), ["998", "999"])
+        self.assertEqual(LRangeCommand(["mylist", "-3", "-2"]).execute(), ["997", "998"])
+        self.assertEqual(LRangeCommand(["mylist", "5", "2"]).execute(), [])
+        self.assertEqual(len(LRangeCommand(["mylist", "0", "-1"]).execute()), 1000)
+        self.assertEqual(LRangeCommand(["missing", "0", "-1"]).execute(), [])
+
+    def test_lset(self):
+        """Test LSET replaces elements and fails outside of the list."""
+        RPushCommand(["mylist", "a", "b"]).execute()
+
+        self.assertEqual(LSetCommand(["mylist", "-1", "z"]).execute(), "OK")
+        self.assertEqual(list(self.mock_db.get("mylist")), ["a", "z"])
+        with self.assertRaisesRegex(CommandProcessingException, "index out of range"):
+            LSetCommand(["mylist", "2", "x"]).execute()
+        with self.assertRaisesRegex(CommandProcessingException, "no such key"):
+            LSetCommand(["missing", "0", "x"]).execute()
+
+    def test_ltrim(self):
+        """Test LTRIM keeps a range, deletes emptied lists and shrinks big ones."""
+        RPushCommand(["mylist", *map(str, range(1000))]).execute()
+
+        self.assertEqual(LTrimCommand(["mylist", "10", "-11"]).execute(), "OK")
+        self.assertEqual(LRangeCommand(["mylist", "0", "0"]).execute(), ["10"])
+        self.assertEqual(LLenCommand(["mylist"]).execute(), 980)
+
+        LTrimCommand(["mylist", "0", "9"]).execute()
+        self.assertIsInstance(self.mock_db.get("mylist"), ListPack)
+        self.assertEqual(list(self.mock_db.get("mylist")), list(map(str, range(10, 20))))
+
+        LTrimCommand(["mylist", "5", "1"]).execute()
+        self.assertNotIn("mylist", self.mock_db)
+
+    def test_lrem(self):
+        """Test LREM from the head, from the tail and for all occurrences."""
+        RPushCommand(["mylist", "a", "b", "a", "c", "a"]).execute()
+
+        self.assertEqual(LRemCommand(["mylist", "-1", "a"]).execute(), 1)
+        self.assertEqual(list(self.mock_db.get("mylist")), ["a", "b", "a", "c"])
+        self.assertEqual(LRemCommand(["mylist", "1", "a"]).execute(), 1)
+        self.assertEqual(LRemCommand(["mylist", "0", "missing"]).execute(), 0)
+        self.assertEqual(LRemCommand(["mylist", "0", "b"]).execute(), 1)
+        self.assertEqual(list(self.mock_db.get("mylist")), ["a", "c"])
+        self.assertEqual(LRemCommand(["missing", "0", "a"]).execute(), 0)
+
+    def test_linsert(self):
+        """Test LINSERT before and after a pivot."""
+        RPushCommand(["mylist", "a", "c"]).execute()
+
+        self.assertEqual(LInsertCommand(["mylist", "BEFORE", "c", "b"]).execute(), 3)
+        self.assertEqual(LInsertCommand(["mylist", "after", "c", "d"]).execute(), 4)
+        self.assertEqual(list(self.mock_db.get("mylist")), ["a", "b", "c", "d"])
+        self.assertEqual(LInsertCommand(["mylist", "BEFORE", "x", "y"]).execute(), -1)
+        self.assertEqual(LInsertCommand(["missing", "BEFORE", "x", "y"]).execute(), 0)
+        with self.assertRaises(InvalidCommandSyntaxError):
+            LInsertCommand(["mylist", "AROUND", "c", "y"])
+
+    def test_linsert_converts_big_lists(self):
+        """Test that inserting into a full listpack converts it to a quicklist."""
+        RPushCommand(["mylist", *map(str, range(128))]).execute()
+
+        self.assertEqual(LInsertCommand(["mylist", "AFTER", "63", "x"]).execute(), 129)
+        self.assertIsInstance(self.mock_db.get("mylist"), QuickList)
+        self.assertEqual(LIndexCommand(["mylist", "64"]).execute(), "x")
+
+
+    def test_lmove(self):
+        """Test LMOVE between lists and within one list."""
+        RPushCommand(["source", "a", "b", "c"]).execute()
+
+        self.assertEqual(LMoveCommand(["source", "dest", "LEFT", "RIGHT"]).execute(), "a")
+        self.assertEqual(LMoveCommand(["source", "dest", "right", "left"]).execute(), "c")
+        self.assertEqual(list(self.mock_db.get("dest")), ["c", "a"])
+        self.assertEqual(LMoveCommand(["source", "source", "LEFT", "RIGHT"]).execute(), "b")
+        self.assertEqual(list(self.mock_db.get("source")), ["b"])
+        self.assertIsNone(LMoveCommand(["missing", "dest", "LEFT", "RIGHT"]).execute())
+        with self.assertRaises(InvalidCommandSyntaxError):
+            LMoveCommand(["source", "dest", "UP", "RIGHT"])
+
+    def test_lmove_to_wrong_type_keeps_the_source(self):
+        """Test that LMOVE does not pop when the destination is not a list."""
+        RPushCommand(["source", "a"]).execute()
+        self.mock_db.set("dest", "string")
+
+        with self.assertRaises(CommandProcessingException):
+            LMoveCommand(["source", "dest", "LEFT", "RIGHT"]).execute()
+        self.assertEqual(list(self.mock_db.get("source")), ["a"])
+
+    def test_blocking_commands_keys_and_propagation(self):
+        """Test the keys, timeouts and propagated commands of blocking commands."""
+        command = BLPopCommand(["a", "b", "1.5"])
+        self.assertEqual(command.get_keys(), ["a", "b"])
+        self.assertEqual(command.timeout, 1.5)
+        self.assertIsNone(command.execute())
+
+        RPushCommand(["b", "x"]).execute()
+        self.assertEqual(command.execute(), ["b", "x"])
+        self.assertEqual(command.get_propagated_command(), ["LPOP", "b"])
+
+        command = BLMoveCommand(["src", "dst", "LEFT", "LEFT", "0"])
+        self.assertEqual(command.get_keys(), ["src", "dst"])
+        self.assertEqual(command.get_blocking_keys(), ["src"])
+        self.assertEqual(command.get_propagated_command(), ["LMOVE", "src", "dst", "LEFT", "LEFT"])
 
 
 if __name__ == "__main__":
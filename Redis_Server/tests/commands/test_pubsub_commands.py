@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import patch
+
+from src.commands.pubsub_commands import PublishCommand, PubsubCommand
+from src.exceptions.redis_exceptions import InvalidCommandSyntaxError
+from src.handlers.pubsub import PubSub, Subscriber
+
+
+class TestPubSubCommands(unittest.TestCase):
+    """
+    Unit tests for the PUBLISH and PUBSUB commands.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh Pub/Sub registry for each test.
+        """
+        self.pubsub = PubSub()
+        patcher = patch("src.commands.pubsub_commands.PUBSUB", self.pubsub)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        self.subscriber = Subscriber()
+        self.pubsub.subscribe(self.subscriber, "news.tech")
+        self.pubsub.subscribe(self.subscriber, "sport")
+        self.pubsub.psubscribe(self.subscriber, "news.*")
+
+    def test_publish(self):
+        """
+        Test that PUBLISH counts the channel and pattern subscriptions reached.
+        """
+        self.assertEqual(PublishCommand(["news.tech", "hello"]).execute(), 2)
+        self.assertEqual(PublishCommand(["news.sport", "hello"]).execute(), 1)
+        self.assertEqual(PublishCommand(["weather", "hello"]).execute(), 0)
+
+    def test_pubsub_subcommands(self):
+        """
+        Test PUBSUB CHANNELS, NUMSUB and NUMPAT.
+        """
+        self.assertEqual(sorted(PubsubCommand(["CHANNELS"]).execute()), ["news.tech", "sport"])
+        self.assertEqual(PubsubCommand(["channels", "news.*"]).execute(), ["news.tech"])
+        self.assertEqual(PubsubCommand(["NUMSUB", "sport", "news.*"]).execute(),
+                         ["sport", 1, "news.*", 0])
+        self.assertEqual(PubsubCommand(["NUMSUB"]).execute(), [])
+        self.assertEqual(PubsubCommand(["NUMPAT"]).execute(), 1)
+
+    def test_pubsub_invalid_arguments(self):
+        """
+        Test that unknown subcommands and extra arguments are rejected.
+        """
+        for arguments in (["HELP"], ["CHANNELS", "a", "b"], ["NUMPAT", "x"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    PubsubCommand(arguments)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+from unittest.mock import patch
+from src.commands.set_commands import (
+    SAddCommand,
+    SCardCommand,
+    SDiffCommand,
+    SDiffStoreCommand,
+    SInterCommand,
+    SInterStoreCommand,
+    SIsMemberCommand,
+    SMembersCommand,
+    SRemCommand,
+    SUnionCommand,
+    SUnionStoreCommand,
+)
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.intset import IntSet
+from src.redisDB.redis_db import RedisDB
+
+
+class TestSetCommands(unittest.TestCase):
+    """
+    Unit tests for the set commands.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh RedisDB instance for each test.
+        """
+        self.mock_db = RedisDB("test_snapshot.pkl")
+        self.mock_db._data = {}  # Clear in-memory data
+        self.mock_db.clear()
+
+        # Patch REDIS_DB in set_commands.py
+        patcher = patch("src.commands.set_commands.REDIS_DB", self.mock_db)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def test_sadd_and_smembers(self):
+        """Test SADD counts new members and SMEMBERS returns them."""
+        self.assertEqual(SAddCommand(["numbers", "3", "1", "2", "1"]).execute(), 3)
+        self.assertEqual(SAddCommand(["numbers", "2", "4"]).execute(), 1)
+
+        self.assertIsInstance(self.mock_db.get("numbers"), IntSet)
+        self.assertEqual(SMembersCommand(["numbers"]).execute(), ["1", "2", "3", "4"])
+        self.assertEqual(SCardCommand(["numbers"]).execute(), 4)
+        self.assertEqual(SMembersCommand(["missing"]).execute(), [])
+
+    def test_non_integer_member_converts_to_set(self):
+        """Test that an intset becomes a set when a non-integer member is added."""
+        SAddCommand(["numbers", "1", "2"]).execute()
+        self.assertEqual(SAddCommand(["numbers", "two", "2", "3"]).execute(), 2)
+
+        value = self.mock_db.get("numbers")
+        self.assertIs(type(value), set)
+        self.assertEqual(value, {"1", "2", "3", "two"})
+
+    def test_big_integer_set_converts_to_set(self):
+        """Test that an intset becomes a set past 512 members."""
+        SAddCommand(["numbers", *map(str, range(512))]).execute()
+        self.assertIsInstance(self.mock_db.get("numbers"), IntSet)
+        SAddCommand(["numbers", "512"]).execute()
+        self.assertIs(type(self.mock_db.get("numbers")), set)
+        self.assertEqual(SCardCommand(["numbers"]).execute(), 513)
+
+    def test_sismember(self):
+        """Test SISMEMBER for both encodings and missing keys."""
+        SAddCommand(["numbers", "1", "2"]).execute()
+        SAddCommand(["words", "a", "b"]).execute()
+
+        self.assertEqual(SIsMemberCommand(["numbers", "2"]).execute(), 1)
+        self.assertEqual(SIsMemberCommand(["numbers", "02"]).execute(), 0)
+        self.assertEqual(SIsMemberCommand(["words", "a"]).execute(), 1)
+        self.assertEqual(SIsMemberCommand(["missing", "a"]).execute(), 0)
+
+    def test_srem_deletes_empty_set(self):
+        """Test SREM for both encodings and that an emptied set is deleted."""
+        SAddCommand(["numbers", "1", "2"]).execute()
+        SAddCommand(["words", "a", "b"]).execute()
+
+        self.assertEqual(SRemCommand(["numbers", "1", "x"]).execute(), 1)
+        self.assertEqual(SRemCommand(["words", "a", "b", "c"]).execute(), 2)
+        self.assertNotIn("words", self.mock_db)
+        self.assertEqual(SRemCommand(["numbers", "2"]).execute(), 1)
+        self.assertNotIn("numbers", self.mock_db)
+        self.assertEqual(SRemCommand(["numbers", "2"]).execute(), 0)
+
+    def test_set_algebra(self):
+        """Test SINTER, SUNION and SDIFF across encodings and missing keys."""
+        SAddCommand(["a", "1", "2", "3", "x"]).execute()
+        SAddCommand(["b", "2", "3", "4"]).execute()
+        SAddCommand(["c", "3", "x"]).execute()
+
+        self.assertEqual(sorted(SInterCommand(["a", "b"]).execute()), ["2", "3"])
+        self.assertEqual(SInterCommand(["a", "b", "c"]).execute(), ["3"])
+        self.assertEqual(SInterCommand(["a", "missing"]).execute(), [])
+        self.assertEqual(sorted(SUnionCommand(["b", "c", "missing"]).execute()),
+                         ["2", "3", "4", "x"])
+        self.assertEqual(sorted(SDiffCommand(["a", "b", "missing"]).execute()), ["1", "x"])
+        self.assertEqual(SDiffCommand(["missing", "a"]).execute(), [])
+
+    def test_store_variants(self):
+        """Test that the STORE variants replace the destination with the result."""
+        SAddCommand(["a", "1", "2", "3"]).execute()
+        SAddCommand(["b", "2", "3", "y"]).execute()
+        self.mock_db.set("destination", "old", expire=100_000)
+
+        self.assertEqual(SInterStoreCommand(["destination", "a", "b"]).execute(), 2)
+        self.assertIsInstance(self.mock_db.get("destination"), IntSet)
+        self.assertIsNone(self.mock_db.get_expire("destination"))
+        self.assertEqual(SUnionStoreCommand(["destination", "a", "b"]).execute(), 4)
+        self.assertIs(type(self.mock_db.get("destination")), set)
+        self.assertEqual(SDiffStoreCommand(["a", "a", "b"]).execute(), 1)
+        self.assertEqual(SMembersCommand(["a"]).execute(), ["1"])
+        self.assertEqual(SInterStoreCommand(["destination", "a", "missing"]).execute(), 0)
+        self.assertNotIn("destination", self.mock_db)
+
+    def test_store_empty_result_without_destination(self):
+        """Test that an empty result with a missing destination stores nothing."""
+        for command in (SInterStoreCommand, SUnionStoreCommand, SDiffStoreCommand):
+            with self.subTest(command=command.__name__):
+                self.assertEqual(command(["destination", "missing"]).execute(), 0)
+                self.assertNotIn("destination", self.mock_db)
+
+    def test_keys(self):
+        """Test that every argument of the set operations is a key."""
+        self.assertEqual(SInterCommand(["a", "b"]).get_keys(), ["a", "b"])
+        self.assertEqual(SUnionStoreCommand(["d", "a", "b"]).get_keys(), ["d", "a", "b"])
+
+    def test_wrong_arguments_and_types(self):
+        """Test missing arguments and keys holding other types."""
+        for command, arguments in ((SAddCommand, ["key"]), (SInterCommand, []),
+                                   (SDiffStoreCommand, ["destination"])):
+            with self.subTest(command=command.__name__):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    command(arguments)
+        self.mock_db.set("string", "value")
+        SAddCommand(["set", "a"]).execute()
+        for command in (SAddCommand(["string", "a"]), SInterCommand(["missing", "string"]),
+                        SUnionStoreCommand(["destination", "set", "string"])):
+            with self.subTest(command=type(command).__name__):
+                with self.assertRaisesRegex(CommandProcessingException, "WRONGTYPE"):
+                    command.execute()
+
+
+if __name__ == "__main__":
+    unittest.main()
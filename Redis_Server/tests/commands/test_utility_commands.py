@@ -2,7 +2,14 @@
 from unittest.mock import patch
 import unittest
 
-from src.commands.utility_commands import EchoCommand, PingCommand, SaveCommand
+from src.commands.utility_commands import (
+    BgSaveCommand,
+    EchoCommand,
+    LastSaveCommand,
+    PingCommand,
+    SaveCommand,
+)
+from src.exceptions.redis_exceptions import CommandProcessingException
 from src.redisDB.redis_db import RedisDB
 
 class TestUtilityCommands(unittest.TestCase):
@@ -18,6 +25,23 @@ class TestUtilityCommands(unittest.TestCase):
         command = EchoCommand([])
         self.assertEqual(command.execute(), "")
 
+    @patch("src.commands.utility_commands.REDIS_DB")
+    def test_bgsave_command(self, mock_db):
+        self.assertEqual(BgSaveCommand([]).execute(), "Background saving started")
+        mock_db.background_save.assert_called_once()
+
+    @patch("src.commands.utility_commands.REDIS_DB")
+    def test_save_refused_during_bgsave(self, mock_db):
+        mock_db.is_saving = True
+        with self.assertRaises(CommandProcessingException):
+            SaveCommand([]).execute()
+        mock_db.dump_data.assert_not_called()
+
+    @patch("src.commands.utility_commands.REDIS_DB")
+    def test_lastsave_command(self, mock_db):
+        mock_db.last_save = 1700000000
+        self.assertEqual(LastSaveCommand([]).execute(), 1700000000)
+
 
 if __name__ == "__main__":
     unittest.main()
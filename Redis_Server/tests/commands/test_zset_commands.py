@@ -0,0 +1,147 @@
+import unittest
+from unittest.mock import patch
+from src.commands.zset_commands import (
+    ZAddCommand,
+    ZCardCommand,
+    ZIncrByCommand,
+    ZPopMinCommand,
+    ZRangeByScoreCommand,
+    ZRangeCommand,
+    ZRankCommand,
+    ZRemCommand,
+)
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    InvalidCommandSyntaxError,
+)
+from src.redisDB.redis_db import RedisDB
+from src.redisDB.zset import ZSet
+
+
+class TestZSetCommands(unittest.TestCase):
+    """
+    Unit tests for the sorted set commands.
+    """
+
+    def setUp(self):
+        """
+        Set up a fresh RedisDB instance for each test, with a small leaderboard.
+        """
+        self.mock_db = RedisDB("test_snapshot.pkl")
+        self.mock_db._data = {}  # Clear in-memory data
+        self.mock_db.clear()
+
+        # Patch REDIS_DB in zset_commands.py
+        patcher = patch("src.commands.zset_commands.REDIS_DB", self.mock_db)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+        ZAddCommand(["board", "10", "ada", "20", "bob", "20", "cy", "30.5", "dee"]).execute()
+
+    def test_zadd(self):
+        """Test ZADD adds members and counts only new ones."""
+        self.assertEqual(ZAddCommand(["board", "15", "ada", "1", "eve"]).execute(), 1)
+        self.assertIsInstance(self.mock_db.get("board"), ZSet)
+        self.assertEqual(ZCardCommand(["board"]).execute(), 5)
+        self.assertEqual(ZRankCommand(["board", "ada"]).execute(), 1)
+
+    def test_zadd_flags(self):
+        """Test the NX, XX, GT, LT, CH and INCR flags."""
+        self.assertEqual(ZAddCommand(["board", "NX", "0", "ada", "0", "new"]).execute(), 1)
+        self.assertEqual(ZRangeCommand(["board", "0", "0"]).execute(), ["new"])
+        self.assertEqual(ZAddCommand(["board", "XX", "CH", "5", "ada", "1", "ghost"]).execute(), 1)
+        self.assertEqual(ZCardCommand(["board"]).execute(), 5)
+        self.assertEqual(ZAddCommand(["board", "GT", "CH", "1", "ada", "40", "bob"]).execute(), 1)
+        self.assertEqual(ZAddCommand(["board", "LT", "CH", "1", "ada", "50", "bob"]).execute(), 1)
+        self.assertEqual(ZAddCommand(["board", "INCR", "2.5", "ada"]).execute(), "3.5")
+        self.assertIsNone(ZAddCommand(["board", "NX", "INCR", "1", "ada"]).execute())
+        self.assertEqual(ZAddCommand(["missing", "XX", "1", "a"]).execute(), 0)
+        self.assertNotIn("missing", self.mock_db)
+
+    def test_zadd_invalid_arguments(self):
+        """Test ZADD refuses invalid scores and incompatible flags."""
+        cases = [
+            (["board", "1", "a", "2"], InvalidCommandSyntaxError, "syntax error"),
+            (["board", "NX", "XX", "1", "a"], InvalidCommandSyntaxError, "not compatible"),
+            (["board", "GT", "LT", "1", "a"], InvalidCommandSyntaxError, "not compatible"),
+            (["board", "INCR", "1", "a", "2", "b"], InvalidCommandSyntaxError, "single"),
+            (["board", "nan", "a"], CommandProcessingException, "not a valid float"),
+            (["board", "1_0", "a"], CommandProcessingException, "not a valid float"),
+        ]
+        for arguments, exception, message in cases:
+            with self.subTest(arguments=arguments):
+                with self.assertRaisesRegex(exception, message):
+                    ZAddCommand(arguments)
+
+    def test_zincrby(self):
+        """Test ZINCRBY on existing and new members."""
+        self.assertEqual(ZIncrByCommand(["board", "0.5", "ada"]).execute(), "10.5")
+        self.assertEqual(ZIncrByCommand(["board", "-3", "new"]).execute(), "-3")
+        self.assertEqual(ZIncrByCommand(["other", "inf", "a"]).execute(), "inf")
+        with self.assertRaisesRegex(CommandProcessingException, "NaN"):
+            ZIncrByCommand(["other", "-inf", "a"]).execute()
+
+    def test_zrange_by_rank(self):
+        """Test ZRANGE by rank, reversed and with scores."""
+        self.assertEqual(ZRangeCommand(["board", "0", "-1"]).execute(), ["ada", "bob", "cy", "dee"])
+        self.assertEqual(ZRangeCommand(["board", "1", "2", "WITHSCORES"]).execute(),
+                         ["bob", "20", "cy", "20"])
+        self.assertEqual(ZRangeCommand(["board", "0", "1", "REV"]).execute(), ["dee", "cy"])
+        self.assertEqual(ZRangeCommand(["board", "5", "10"]).execute(), [])
+        self.assertEqual(ZRangeCommand(["missing", "0", "-1"]).execute(), [])
+
+    def test_zrange_by_score(self):
+        """Test ZRANGE BYSCORE with exclusive bounds, REV and LIMIT."""
+        self.assertEqual(ZRangeCommand(["board", "(10", "+inf", "BYSCORE"]).execute(),
+                         ["bob", "cy", "dee"])
+        self.assertEqual(ZRangeCommand(["board", "+inf", "20", "BYSCORE", "REV", "LIMIT", "1", "5"])
+                         .execute(), ["cy", "bob"])
+        with self.assertRaisesRegex(InvalidCommandSyntaxError, "LIMIT"):
+            ZRangeCommand(["board", "0", "1", "LIMIT", "0", "1"]).execute()
+
+    def test_zrangebyscore(self):
+        """Test ZRANGEBYSCORE bounds, LIMIT and WITHSCORES."""
+        self.assertEqual(ZRangeByScoreCommand(["board", "-inf", "(30.5"]).execute(),
+                         ["ada", "bob", "cy"])
+        self.assertEqual(ZRangeByScoreCommand(["board", "20", "40", "WITHSCORES", "LIMIT", "1", "-1"])
+                         .execute(), ["cy", "20", "dee", "30.5"])
+        self.assertEqual(ZRangeByScoreCommand(["board", "50", "60"]).execute(), [])
+        with self.assertRaisesRegex(CommandProcessingException, "min or max is not a float"):
+            ZRangeByScoreCommand(["board", "low", "10"]).execute()
+
+    def test_zrank(self):
+        """Test ZRANK with and without the score."""
+        self.assertEqual(ZRankCommand(["board", "dee"]).execute(), 3)
+        self.assertEqual(ZRankCommand(["board", "dee", "WITHSCORE"]).execute(), [3, "30.5"])
+        self.assertIsNone(ZRankCommand(["board", "ghost"]).execute())
+        self.assertIsNone(ZRankCommand(["missing", "ghost", "WITHSCORE"]).execute())
+
+    def test_zrem_deletes_empty_set(self):
+        """Test ZREM counts removed members and deletes the emptied set."""
+        self.assertEqual(ZRemCommand(["board", "ada", "ghost"]).execute(), 1)
+        self.assertEqual(ZRemCommand(["board", "bob", "cy", "dee"]).execute(), 3)
+        self.assertNotIn("board", self.mock_db)
+        self.assertEqual(ZCardCommand(["board"]).execute(), 0)
+
+    def test_zpopmin(self):
+        """Test ZPOPMIN with and without a count."""
+        self.assertEqual(ZPopMinCommand(["board"]).execute(), ["ada", "10"])
+        self.assertEqual(ZPopMinCommand(["board", "2"]).execute(), ["bob", "20", "cy", "20"])
+        self.assertEqual(ZPopMinCommand(["board", "5"]).execute(), ["dee", "30.5"])
+        self.assertNotIn("board", self.mock_db)
+        self.assertEqual(ZPopMinCommand(["board"]).execute(), [])
+        with self.assertRaisesRegex(CommandProcessingException, "must be positive"):
+            ZPopMinCommand(["board", "-1"]).execute()
+
+    def test_wrong_type(self):
+        """Test that sorted set commands refuse keys holding other types."""
+        self.mock_db.set("string", "value")
+        for command in (ZAddCommand(["string", "1", "a"]), ZRangeCommand(["string", "0", "1"]),
+                        ZCardCommand(["string"]), ZPopMinCommand(["string"])):
+            with self.subTest(command=type(command).__name__):
+                with self.assertRaisesRegex(CommandProcessingException, "WRONGTYPE"):
+                    command.execute()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Unit tests for blocking commands: blocking clients, serving them in FIFO order
+when their keys get elements, timeouts and cancellation.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.handlers.blocked_clients import BLOCKED_CLIENTS
+from src.handlers.request_handler import process_commands, reply_to_unblocked
+from src.redisDB.redis_db import REDIS_DB
+
+
+class TestBlockedClients(unittest.TestCase):
+    """Tests for BLPOP, BRPOP and BLMOVE through the request handler."""
+
+    def setUp(self):
+        """Start every test with an empty keyspace and no blocked client."""
+        REDIS_DB.clear()
+        BLOCKED_CLIENTS.clear()
+        self.addCleanup(BLOCKED_CLIENTS.clear)
+        self.addCleanup(REDIS_DB.clear)
+
+    def block(self, *request: bytes):
+        """Run a command that is expected to block and return the blocked client."""
+        blocked = []
+        out = process_commands([list(request)], on_block=lambda client, pending: blocked.append(client))
+        self.assertEqual(out, b"")
+        self.assertEqual(len(blocked), 1)
+        return blocked[0]
+
+    def reply(self, client) -> bytes:
+        """Return the RESP reply of an unblocked client."""
+        out = bytearray()
+        reply_to_unblocked(client, out)
+        return bytes(out)
+
+    def test_pop_without_blocking(self):
+        """Test that BLPOP and BRPOP reply at once when a list has elements."""
+        process_commands([[b"RPUSH", b"queue", b"a", b"b"]])
+        self.assertEqual(process_commands([[b"BLPOP", b"empty", b"queue", b"0"]]),
+                         b"*2\r\n$5\r\nqueue\r\n$1\r\na\r\n")
+        self.assertEqual(process_commands([[b"BRPOP", b"queue", b"0"]]),
+                         b"*2\r\n$5\r\nqueue\r\n$1\r\nb\r\n")
+        self.assertEqual(BLOCKED_CLIENTS.blocked_count, 0)
+
+    def test_push_unblocks_clients_in_fifo_order(self):
+        """Test that clients blocked first are served first."""
+        first = self.block(b"BLPOP", b"queue", b"0")
+        second = self.block(b"BLPOP", b"other", b"queue", b"0")
+        third = self.block(b"BRPOP", b"queue", b"0")
+        self.assertEqual(BLOCKED_CLIENTS.blocked_count, 3)
+
+        self.assertEqual(process_commands([[b"RPUSH", b"queue", b"a", b"b"]]), b":2\r\n")
+
+        self.assertEqual(self.reply(first), b"*2\r\n$5\r\nqueue\r\n$1\r\na\r\n")
+        self.assertEqual(self.reply(second), b"*2\r\n$5\r\nqueue\r\n$1\r\nb\r\n")
+        self.assertFalse(third.unblocked)
+        self.assertNotIn("queue", REDIS_DB)
+
+        process_commands([[b"LPUSH", b"queue", b"c"]])
+        self.assertEqual(self.reply(third), b"*2\r\n$5\r\nqueue\r\n$1\r\nc\r\n")
+        self.assertEqual(BLOCKED_CLIENTS.blocked_count, 0)
+
+    def test_served_commands_are_propagated_as_pops(self):
+        """Test that served blocking commands are logged as their non-blocking variant."""
+        self.block(b"BLPOP", b"queue", b"0")
+        self.block(b"BLMOVE", b"source", b"destination", b"LEFT", b"RIGHT", b"0")
+
+        with patch("src.handlers.request_handler.APPEND_ONLY_FILE") as aof:
+            process_commands([[b"RPUSH", b"queue", b"a"], [b"RPUSH", b"source", b"b"]])
+
+        propagated = [call.args[0] for call in aof.append.call_args_list]
+        self.assertEqual(propagated, [
+            [b"RPUSH", b"queue", b"a"], ["LPOP", "queue"],
+            [b"RPUSH", b"source", b"b"], ["LMOVE", "source", "destination", "LEFT", "RIGHT"],
+        ])
+
+    def test_blmove_unblocks_clients_of_the_destination(self):
+        """Test that an element moved by BLMOVE can serve a client blocked on the destination."""
+        mover = self.block(b"BLMOVE", b"source", b"destination", b"RIGHT", b"LEFT", b"0")
+        popper = self.block(b"BLPOP", b"destination", b"0")
+
+        process_commands([[b"RPUSH", b"source", b"job"]])
+
+        self.assertEqual(self.reply(mover), b"$3\r\njob\r\n")
+        self.assertEqual(self.reply(popper), b"*2\r\n$11\r\ndestination\r\n$3\r\njob\r\n")
+        self.assertNotIn("destination", REDIS_DB)
+
+    def test_timeout(self):
+        """Test that a client is unblocked with a null reply once its timeout expires."""
+        client = self.block(b"BLPOP", b"queue", b"0.05")
+        self.assertLessEqual(BLOCKED_CLIENTS.seconds_until_next_timeout(), 0.05)
+
+        BLOCKED_CLIENTS.unblock_timed_out()
+        self.assertFalse(client.unblocked)
+
+        time.sleep(0.06)
+        BLOCKED_CLIENTS.unblock_timed_out()
+        self.assertTrue(client.unblocked)
+        self.assertEqual(self.reply(client), b"$-1\r\n")
+        self.assertEqual(BLOCKED_CLIENTS.blocked_count, 0)
+
+    def test_cancelled_client_is_not_served(self):
+        """Test that a client that disconnected does not consume elements."""
+        client = self.block(b"BLPOP", b"queue", b"0")
+        BLOCKED_CLIENTS.cancel(client)
+
+        process_commands([[b"RPUSH", b"queue", b"a"]])
+        self.assertEqual(list(REDIS_DB.get("queue")), ["a"])
+
+    def test_thread_waits_without_on_block(self):
+        """Test that without `on_block` the calling thread waits for the reply."""
+        replies = []
+        waiter = threading.Thread(target=lambda: replies.append(
+            process_commands([[b"BLPOP", b"queue", b"5"], [b"PING"]])))
+        waiter.start()
+        while not BLOCKED_CLIENTS.blocked_count:
+            time.sleep(0.001)
+
+        process_commands([[b"RPUSH", b"queue", b"a"]])
+        waiter.join(timeout=5)
+
+        self.assertEqual(replies, [b"*2\r\n$5\r\nqueue\r\n$1\r\na\r\n$4\r\nPONG\r\n"])
+
+    def test_thread_wait_times_out(self):
+        """Test that a waiting thread gets a null reply after the timeout."""
+        start = time.monotonic()
+        self.assertEqual(process_commands([[b"BLPOP", b"queue", b"0.05"]]), b"$-1\r\n")
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_wait_for(self):
+        """Test that `wait_for` returns after its timeout, or the client's deadline."""
+        client = self.block(b"BLPOP", b"queue", b"0.1")
+        self.assertFalse(client.wait_for(0.01))
+        self.assertTrue(client.wait_for(5))
+        self.assertEqual(self.reply(client), b"$-1\r\n")
+
+        client = self.block(b"BLPOP", b"queue", b"0")
+        process_commands([[b"RPUSH", b"queue", b"a"]])
+        self.assertTrue(client.wait_for(0.01))
+
+    def test_invalid_timeout(self):
+        """Test that negative or non-numeric timeouts are refused."""
+        self.assertEqual(process_commands([[b"BLPOP", b"queue", b"-1"]]),
+                         b"-ERR timeout is negative\r\n")
+        self.assertEqual(process_commands([[b"BLPOP", b"queue", b"soon"]]),
+                         b"-ERR timeout is not a float or out of range\r\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from src.handlers.pubsub import PubSub, Subscriber
+
+
+class TestPubSub(unittest.TestCase):
+    """
+    Unit tests for the Pub/Sub registry and the subscriber buffers.
+    """
+
+    def test_publish_to_channel_subscribers(self):
+        """Test that a message reaches the subscribers of its channel only."""
+        pubsub = PubSub()
+        first, second, other = Subscriber(), Subscriber(), Subscriber()
+        self.assertEqual(pubsub.subscribe(first, "news"), 1)
+        self.assertEqual(pubsub.subscribe(first, "sport"), 2)
+        pubsub.subscribe(second, "news")
+        pubsub.subscribe(other, "weather")
+
+        self.assertEqual(pubsub.publish("news", "hello"), 2)
+        expected = b"*3\r\n$7\r\nmessage\r\n$4\r\nnews\r\n$5\r\nhello\r\n"
+        self.assertEqual(first.take(), expected)
+        self.assertEqual(second.take(), expected)
+        self.assertEqual(other.take(), b"")
+        self.assertEqual(pubsub.publish("nobody", "hello"), 0)
+
+    def test_pattern_subscriptions(self):
+        """Test that pattern subscribers get pmessages, and the match cache follows
+        the patterns subscribed to."""
+        pubsub = PubSub()
+        subscriber = Subscriber()
+        pubsub.psubscribe(subscriber, "news.*")
+        self.assertEqual(pubsub.publish("news.tech", "a"), 1)
+        self.assertEqual(pubsub.publish("sport", "b"), 0)
+        self.assertEqual(
+            subscriber.take(),
+            b"*4\r\n$8\r\npmessage\r\n$6\r\nnews.*\r\n$9\r\nnews.tech\r\n$1\r\na\r\n")
+
+        pubsub.psubscribe(subscriber, "*tech")
+        pubsub.subscribe(subscriber, "news.tech")
+        self.assertEqual(pubsub.publish("news.tech", "c"), 3)
+        self.assertEqual(pubsub.numpat(), 2)
+
+        self.assertEqual(pubsub.punsubscribe(subscriber, "news.*"), 2)
+        self.assertEqual(pubsub.publish("news.tech", "d"), 2)
+        self.assertEqual(pubsub.numpat(), 1)
+
+    def test_slow_subscriber_is_dropped(self):
+        """Test that a subscriber over the output buffer limit is unsubscribed."""
+        pubsub = PubSub(output_buffer_limit=200)
+        slow, fast = Subscriber(), Subscriber()
+        notified = []
+        slow.on_message = notified.append
+        pubsub.subscribe(slow, "channel")
+        pubsub.psubscribe(slow, "chan*")
+        pubsub.subscribe(fast, "channel")
+
+        pubsub.publish("channel", "x")
+        pubsub.publish("channel", "y")
+        self.assertEqual(notified, [slow])
+        self.assertFalse(slow.dropped)
+
+        for _ in range(3):
+            pubsub.publish("channel", "z" * 10)
+            fast.take()
+        self.assertTrue(slow.dropped)
+        self.assertEqual(notified, [slow, slow])
+        self.assertEqual(slow.take(), b"")
+        self.assertEqual(slow.subscriptions, 0)
+        self.assertEqual(pubsub.numsub("channel"), 1)
+        self.assertEqual(pubsub.numpat(), 0)
+
+    def test_unsubscribe_all(self):
+        """Test that closing a connection removes all of its subscriptions."""
+        pubsub = PubSub()
+        subscriber = Subscriber()
+        pubsub.subscribe(subscriber, "a")
+        pubsub.subscribe(subscriber, "b")
+        pubsub.psubscribe(subscriber, "*")
+        pubsub.unsubscribe_all(subscriber)
+        subscriber.close()
+
+        self.assertEqual(pubsub.channels(), [])
+        self.assertEqual(pubsub.publish("a", "message"), 0)
+        self.assertEqual(subscriber.wait(), b"")
+
+    def test_channels_and_numsub(self):
+        """Test the introspection of active channels."""
+        pubsub = PubSub()
+        first, second = Subscriber(), Subscriber()
+        pubsub.subscribe(first, "news.tech")
+        pubsub.subscribe(second, "news.tech")
+        pubsub.subscribe(second, "sport")
+        pubsub.psubscribe(first, "news.*")
+
+        self.assertEqual(sorted(pubsub.channels()), ["news.tech", "sport"])
+        self.assertEqual(pubsub.channels("news.*"), ["news.tech"])
+        self.assertEqual(pubsub.numsub("news.tech"), 2)
+        self.assertEqual(pubsub.numsub("news.*"), 0)
+        pubsub.unsubscribe(second, "sport")
+        self.assertEqual(pubsub.numsub("sport"), 0)
+        self.assertEqual(pubsub.channels(), ["news.tech"])
+
+
+if __name__ == "__main__":
+    unittest.main()
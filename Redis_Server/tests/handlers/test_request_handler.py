@@ -1,5 +1,11 @@
+import sys
+import threading
 import unittest
-from src.handlers.request_handler import process_request
+from src.handlers.pubsub import PUBSUB, Subscriber
+from src.handlers.request_handler import process_commands, process_request
+from src.handlers.server_stats import SERVER_STATS
+from src.handlers.slow_log import SLOW_LOG
+from src.redisDB.redis_db import REDIS_DB
 
 
 class TestRequestHandler(unittest.TestCase):
@@ -39,6 +45,145 @@ class TestRequestHandler(unittest.TestCase):
         response = process_request(delete_request)
         self.assertEqual(response, b":2\r\n")
 
+    def test_process_commands_batches_replies(self):
+        """Test that pipelined commands are answered with one concatenated buffer."""
+        response = process_commands([
+            ["SET", "batch", "1"],
+            ["INCR", "batch"],
+            ["UNKNOWN"],
+            ["GET", "batch"],
+        ])
+        self.assertEqual(
+            response,
+            b"$2\r\nOK\r\n:2\r\n-ERR Unsupported command `UNKNOWN`\r\n$1\r\n2\r\n",
+        )
+
+    def test_wrong_number_of_arguments(self):
+        """Test that requests are checked against the arity of their command."""
+        response = process_commands([
+            [b"GET", b"a", b"b"],
+            [b"get"],
+            [b"DEL"],
+            [b"gEt", b"missing"],
+        ])
+        self.assertEqual(response, b"-ERR wrong number of arguments for command\r\n" * 3
+                                   + b"$-1\r\n")
+
+    def test_command_statistics(self):
+        """Test that dispatch counts calls, failed calls and rejected calls."""
+        SERVER_STATS.reset()
+        self.addCleanup(SERVER_STATS.reset)
+        process_commands([
+            [b"SET", b"stats", b"value"],
+            [b"GET", b"stats"],
+            [b"GET"],
+            [b"LPUSH", b"stats", b"element"],
+        ])
+
+        get, lpush = SERVER_STATS.command("get"), SERVER_STATS.command("LPUSH")
+        self.assertEqual((get.calls, get.rejected_calls, get.failed_calls), (1, 1, 0))
+        self.assertEqual((lpush.calls, lpush.failed_calls), (1, 1))
+        self.assertEqual(get.histogram.total, 1)
+        self.assertEqual(SERVER_STATS.total_commands_processed, 3)
+        self.assertEqual([stat.name for stat in SERVER_STATS.commands()],
+                         ["GET", "LPUSH", "SET"])
+
+    def test_slow_commands_are_logged(self):
+        """Test that commands over the threshold are logged with their client."""
+        threshold = SLOW_LOG.threshold_ns
+        self.addCleanup(SLOW_LOG.reset)
+        self.addCleanup(setattr, SLOW_LOG, "threshold_ns", threshold)
+        SLOW_LOG.reset()
+
+        process_commands([[b"SET", b"slow", b"value"]], client_address="10.0.0.1:4242")
+        self.assertEqual(len(SLOW_LOG), 0)
+
+        SLOW_LOG.threshold_ns = 0
+        process_commands([[b"SET", b"slow", b"value"], [b"LPUSH", b"slow", b"x"]],
+                         client_address="10.0.0.1:4242")
+        failed, logged = SLOW_LOG.get()
+        self.assertEqual(logged.arguments, ["SET", "slow", "value"])
+        self.assertEqual(logged.client_address, "10.0.0.1:4242")
+        self.assertEqual(failed.arguments, ["LPUSH", "slow", "x"])
+
+    def test_subscribed_client(self):
+        """Test SUBSCRIBE confirmations and the commands allowed once subscribed."""
+        subscriber = Subscriber()
+        self.addCleanup(PUBSUB.unsubscribe_all, subscriber)
+        response = process_commands([
+            [b"SUBSCRIBE", b"first", b"second"],
+            [b"GET", b"key"],
+            [b"PING"],
+            [b"PSUBSCRIBE", b"f*"],
+        ], subscriber=subscriber)
+        self.assertEqual(
+            response,
+            b"*3\r\n$9\r\nsubscribe\r\n$5\r\nfirst\r\n:1\r\n"
+            b"*3\r\n$9\r\nsubscribe\r\n$6\r\nsecond\r\n:2\r\n"
+            b"-ERR Can't execute 'get': only (P)SUBSCRIBE / (P)UNSUBSCRIBE / PING are "
+            b"allowed in this context\r\n"
+            b"$4\r\nPONG\r\n"
+            b"*3\r\n$10\r\npsubscribe\r\n$2\r\nf*\r\n:3\r\n")
+
+        self.assertEqual(process_commands([[b"PUBLISH", b"first", b"hi"]]), b":2\r\n")
+        self.assertEqual(subscriber.take(),
+                         b"*3\r\n$7\r\nmessage\r\n$5\r\nfirst\r\n$2\r\nhi\r\n"
+                         b"*4\r\n$8\r\npmessage\r\n$2\r\nf*\r\n$5\r\nfirst\r\n"
+                         b"$2\r\nhi\r\n")
+
+        response = process_commands([[b"PUNSUBSCRIBE"], [b"UNSUBSCRIBE"], [b"UNSUBSCRIBE"],
+                                     [b"GET", b"key"]], subscriber=subscriber)
+        self.assertTrue(response.startswith(
+            b"*3\r\n$12\r\npunsubscribe\r\n$2\r\nf*\r\n:2\r\n"))
+        self.assertTrue(response.endswith(
+            b"*3\r\n$11\r\nunsubscribe\r\n$-1\r\n:0\r\n$-1\r\n"))
+        self.assertEqual(subscriber.subscriptions, 0)
+
+    def test_mset_and_mget(self):
+        """Test that MGET answers many keys with one array reply."""
+        response = process_commands([
+            ["MSET", "m1", "a", "m2", "10"],
+            ["MGET", "m1", "missing", "m2"],
+        ])
+        self.assertEqual(response, b"$2\r\nOK\r\n*3\r\n$1\r\na\r\n$-1\r\n$2\r\n10\r\n")
+
+    def test_writes_over_maxmemory(self):
+        """Test that writes evict keys, or are refused with noeviction."""
+        REDIS_DB.clear()
+        self.addCleanup(REDIS_DB.configure_maxmemory, 0)
+
+        REDIS_DB.configure_maxmemory(5000, "allkeys-lru")
+        process_commands([["SET", f"key{i}", "value"] for i in range(200)])
+        self.assertTrue(REDIS_DB.perform_evictions())
+        self.assertLessEqual(REDIS_DB.used_memory, 5000)
+        self.assertEqual(len(REDIS_DB) + REDIS_DB.evicted_keys, 200)
+
+        REDIS_DB.configure_maxmemory(1, "noeviction")
+        response = process_commands([["SET", "key", "value"], ["GET", "key0"], ["DEL", "key0"]])
+        self.assertTrue(response.startswith(
+            b"-OOM command not allowed when used memory > 'maxmemory'.\r\n"))
+        self.assertNotIn("key", REDIS_DB)
+
+    def test_concurrent_incr_is_atomic(self):
+        """Test that INCR from many threads does not lose increments."""
+        REDIS_DB.clear()
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def client():
+            for _ in range(500):
+                process_commands([[b"INCR", b"shared"], [b"LPUSH", b"list", b"x"]])
+
+        threads = [threading.Thread(target=client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(REDIS_DB.get("shared"), 4000)
+        self.assertEqual(len(REDIS_DB.get("list")), 4000)
+
 
 if __name__ == "__main__":
     unittest.main()
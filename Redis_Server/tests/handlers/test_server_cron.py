@@ -0,0 +1,48 @@
+import time
+import unittest
+
+from src.handlers.server_cron import ServerCron
+
+
+class TestServerCron(unittest.TestCase):
+    """
+    Unit tests for the ServerCron scheduler.
+    """
+
+    def test_runs_only_due_jobs(self):
+        """Test that a job runs once its interval has elapsed."""
+        cron = ServerCron()
+        calls = []
+        cron.register("job", 0.05, lambda: calls.append(1))
+
+        cron.run_due()
+        self.assertEqual(calls, [])
+
+        time.sleep(0.06)
+        cron.run_due()
+        self.assertEqual(calls, [1])
+
+    def test_job_can_override_next_delay(self):
+        """Test that a job's return value reschedules it."""
+        cron = ServerCron()
+        cron.register("job", 0.01, lambda: 60.0)
+
+        time.sleep(0.02)
+        cron.run_due()
+        self.assertGreater(cron.seconds_until_next_job(), 59)
+
+    def test_failing_job_does_not_stop_cron(self):
+        """Test that an exception in one job does not prevent the others."""
+        cron = ServerCron()
+        calls = []
+        cron.register("failing", 0.01, lambda: 1 / 0)
+        cron.register("job", 0.01, lambda: calls.append(1))
+
+        time.sleep(0.02)
+        with self.assertLogs("src.handlers.server_cron", level="ERROR"):
+            cron.run_due()
+        self.assertEqual(calls, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
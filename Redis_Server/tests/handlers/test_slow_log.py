@@ -0,0 +1,53 @@
+import unittest
+
+from src.handlers.slow_log import SlowLog, truncate_arguments
+
+
+class TestSlowLog(unittest.TestCase):
+    """
+    Unit tests for the SlowLog ring buffer.
+    """
+
+    def test_keeps_the_newest_entries(self):
+        """Test that a full log drops its oldest entry for each new one."""
+        slow_log = SlowLog(threshold_us=0, max_len=3)
+        for index in range(5):
+            slow_log.add("GET", [f"key{index}"], 2500 * (index + 1), "127.0.0.1:5000")
+
+        entries = slow_log.get()
+        self.assertEqual(len(slow_log), 3)
+        self.assertEqual([entry.id for entry in entries], [4, 3, 2])
+        self.assertEqual(entries[0].to_reply()[2:], [12, ["GET", "key4"], "127.0.0.1:5000", ""])
+        self.assertEqual(len(slow_log.get(2)), 2)
+        self.assertEqual(len(slow_log.get(-1)), 3)
+
+        slow_log.reset()
+        self.assertEqual(slow_log.get(), [])
+        slow_log.add("GET", ["key"], 1000)
+        self.assertEqual(slow_log.get()[0].id, 5)
+
+    def test_configure(self):
+        """Test the threshold and resizing the log."""
+        slow_log = SlowLog(threshold_us=100, max_len=4)
+        self.assertEqual(slow_log.threshold_ns, 100_000)
+        for index in range(4):
+            slow_log.add("GET", [f"key{index}"], 1000)
+
+        slow_log.configure(-1, 2)
+        self.assertEqual(slow_log.threshold_ns, float("inf"))
+        self.assertEqual([entry.id for entry in slow_log.get()], [3, 2])
+
+    def test_truncate_arguments(self):
+        """Test that long argument lists and long arguments are truncated."""
+        self.assertEqual(truncate_arguments("DEL", ["a", "b"]), ["DEL", "a", "b"])
+
+        items = truncate_arguments("DEL", [str(i) for i in range(100)])
+        self.assertEqual(len(items), 32)
+        self.assertEqual(items[-2:], ["29", "... (70 more arguments)"])
+
+        items = truncate_arguments("SET", ["key", "x" * 200])
+        self.assertEqual(items[2], "x" * 128 + "... (72 more bytes)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Unit tests for MULTI/EXEC/DISCARD transactions and WATCH.
+Tests include queueing, errors while queueing and while running, optimistic
+locking with WATCH and the atomicity of EXEC across threads.
+"""
+
+import threading
+import time
+import unittest
+
+from src.handlers.request_handler import process_commands
+from src.handlers.transactions import Transaction
+from src.redisDB.redis_db import REDIS_DB
+
+
+class TestTransactions(unittest.TestCase):
+    """Unit tests for transactions through the request handler."""
+
+    def setUp(self):
+        """
+        Start from an empty database and a fresh connection state.
+        """
+        REDIS_DB.clear()
+        self.transaction = Transaction()
+        self.addCleanup(self.transaction.reset)
+
+    def run_commands(self, *commands, transaction=None) -> bytes:
+        """Execute commands as a client connection and return its replies."""
+        return process_commands(list(commands),
+                                transaction=transaction or self.transaction)
+
+    def test_exec_runs_queued_commands(self):
+        """
+        Test that commands are queued after MULTI and run by EXEC.
+        """
+        response = self.run_commands(["MULTI"], ["SET", "a", "1"], ["INCR", "a"],
+                                     ["GET", "a"])
+        self.assertEqual(response, b"$2\r\nOK\r\n$6\r\nQUEUED\r\n$6\r\nQUEUED\r\n$6\r\nQUEUED\r\n")
+        self.assertNotIn("a", REDIS_DB)
+
+        response = self.run_commands(["EXEC"])
+        self.assertEqual(response, b"*3\r\n$2\r\nOK\r\n:2\r\n$1\r\n2\r\n")
+        self.assertEqual(REDIS_DB.get("a"), 2)
+        self.assertFalse(self.transaction.active)
+
+    def test_runtime_error_does_not_stop_transaction(self):
+        """
+        Test that a command failing in EXEC is answered with an error in the array.
+        """
+        response = self.run_commands(["SET", "a", "text"], ["MULTI"], ["INCR", "a"],
+                                     ["SET", "b", "1"], ["EXEC"])
+        self.assertTrue(response.endswith(
+            b"*2\r\n-ERR value is not an integer or out of range\r\n$2\r\nOK\r\n"))
+        self.assertEqual(REDIS_DB.get("b"), 1)
+
+    def test_queueing_error_aborts_transaction(self):
+        """
+        Test that a command that fails to queue makes EXEC discard the transaction.
+        """
+        response = self.run_commands(["MULTI"], ["SET", "a", "1"], ["NOSUCHCOMMAND"],
+                                     ["EXEC"])
+        self.assertIn(b"-ERR Unsupported command `NOSUCHCOMMAND`\r\n", response)
+        self.assertTrue(response.endswith(
+            b"-EXECABORT Transaction discarded because of previous errors.\r\n"))
+        self.assertNotIn("a", REDIS_DB)
+        self.assertFalse(self.transaction.active)
+
+    def test_misplaced_transaction_commands(self):
+        """
+        Test the errors of nested MULTI, EXEC or DISCARD without MULTI and WATCH inside MULTI.
+        """
+        self.assertEqual(self.run_commands(["EXEC"]), b"-ERR EXEC without MULTI\r\n")
+        self.assertEqual(self.run_commands(["DISCARD"]), b"-ERR DISCARD without MULTI\r\n")
+
+        response = self.run_commands(["MULTI"], ["MULTI"], ["WATCH", "a"])
+        self.assertEqual(response, b"$2\r\nOK\r\n-ERR MULTI calls can not be nested\r\n"
+                                   b"-ERR WATCH inside MULTI is not allowed\r\n")
+        self.assertEqual(self.run_commands(["EXEC"]), b"*0\r\n")
+
+    def test_discard(self):
+        """
+        Test that DISCARD drops the queued commands and unwatches every key.
+        """
+        self.run_commands(["WATCH", "a"], ["MULTI"], ["SET", "a", "1"])
+        self.assertEqual(self.run_commands(["DISCARD"]), b"$2\r\nOK\r\n")
+
+        self.assertNotIn("a", REDIS_DB)
+        self.assertEqual(self.transaction.watched, {})
+        self.assertFalse(REDIS_DB._shard("a").watched)
+        self.assertEqual(self.run_commands(["GET", "a"]), b"$-1\r\n")
+
+    def test_watch_aborts_when_key_changes(self):
+        """
+        Test that EXEC returns a null reply if a watched key was changed by another client.
+        """
+        self.run_commands(["SET", "a", "1"], ["WATCH", "a"])
+        process_commands([["SET", "a", "2"]])
+
+        response = self.run_commands(["MULTI"], ["SET", "a", "3"], ["EXEC"])
+        self.assertTrue(response.endswith(b"$-1\r\n"))
+        self.assertEqual(REDIS_DB.get("a"), 2)
+
+        response = self.run_commands(["MULTI"], ["SET", "a", "3"], ["EXEC"])
+        self.assertTrue(response.endswith(b"*1\r\n$2\r\nOK\r\n"))
+        self.assertEqual(REDIS_DB.get("a"), 3)
+
+    def test_watch_succeeds_when_key_is_unchanged(self):
+        """
+        Test that reading or writing other keys does not abort a transaction.
+        """
+        self.run_commands(["WATCH", "a", "missing"])
+        process_commands([["GET", "a"], ["SET", "b", "1"]])
+
+        response = self.run_commands(["MULTI"], ["SET", "a", "1"], ["EXEC"])
+        self.assertTrue(response.endswith(b"*1\r\n$2\r\nOK\r\n"))
+
+    def test_unwatch(self):
+        """
+        Test that UNWATCH forgets the watched keys.
+        """
+        self.run_commands(["WATCH", "a"])
+        process_commands([["SET", "a", "2"]])
+        self.assertEqual(self.run_commands(["UNWATCH"]), b"$2\r\nOK\r\n")
+
+        response = self.run_commands(["MULTI"], ["INCR", "a"], ["EXEC"])
+        self.assertTrue(response.endswith(b"*1\r\n:3\r\n"))
+
+    def test_watched_key_expiring_aborts_transaction(self):
+        """
+        Test that a watched key that expires counts as a change.
+        """
+        self.run_commands(["SET", "a", "1", "PX", "20"], ["WATCH", "a"])
+        time.sleep(0.05)
+
+        response = self.run_commands(["MULTI"], ["SET", "a", "3"], ["EXEC"])
+        self.assertTrue(response.endswith(b"$-1\r\n"))
+        self.assertNotIn("a", REDIS_DB)
+
+    def test_exec_is_atomic(self):
+        """
+        Test that no client sees a transaction half applied.
+        """
+        self.run_commands(["MSET", "a", "0", "b", "0"])
+        stop = threading.Event()
+
+        def writer():
+            connection = Transaction()
+            while not stop.is_set():
+                process_commands([["MULTI"], ["INCR", "a"], ["INCR", "b"], ["EXEC"]],
+                                 transaction=connection)
+
+        threads = [threading.Thread(target=writer) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        try:
+            reader = Transaction()
+            for _ in range(200):
+                response = process_commands([["MULTI"], ["GET", "a"], ["GET", "b"],
+                                             ["EXEC"]], transaction=reader)
+                a, b = response.split(b"*2\r\n")[1].split(b"\r\n")[1:4:2]
+                self.assertEqual(a, b)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
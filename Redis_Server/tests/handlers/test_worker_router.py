@@ -0,0 +1,115 @@
+"""
+Unit tests for the hash slot mapping, the WorkerRouter and the CLUSTER command.
+"""
+
+import unittest
+
+from src.commands.cluster_commands import ClusterCommand
+from src.exceptions.redis_exceptions import (
+    CommandProcessingException,
+    CrossSlotException,
+    InvalidCommandSyntaxError,
+    MovedException,
+)
+from src.handlers.request_handler import process_commands
+from src.handlers.worker_router import WORKER_ROUTER, WorkerRouter
+from src.utils.cluster_utils import key_hash_slot, slot_ranges
+
+ADDRESSES = [("127.0.0.1", 7001), ("127.0.0.1", 7002)]
+
+
+class TestKeyHashSlot(unittest.TestCase):
+    """Unit tests for the key to hash slot mapping."""
+
+    def test_known_slots(self):
+        """Test that slots match the ones Redis Cluster computes."""
+        self.assertEqual(key_hash_slot("foo"), 12182)
+        self.assertEqual(key_hash_slot("bar"), 5061)
+        self.assertEqual(key_hash_slot("123456789"), 12739)
+
+    def test_hash_tags(self):
+        """Test that only a non-empty hash tag is hashed."""
+        self.assertEqual(key_hash_slot("{user1000}.following"), key_hash_slot("user1000"))
+        self.assertEqual(key_hash_slot("{user1000}.followers"), key_hash_slot("user1000"))
+        self.assertEqual(key_hash_slot("foo{}{bar}"), key_hash_slot("foo{}{bar}"))
+        self.assertNotEqual(key_hash_slot("foo{}{bar}"), key_hash_slot("bar"))
+
+    def test_slot_ranges_cover_every_slot(self):
+        """Test that the ranges of the workers are contiguous and cover all slots."""
+        self.assertEqual(slot_ranges(1), [(0, 16383)])
+        self.assertEqual(slot_ranges(3), [(0, 5460), (5461, 10921), (10922, 16383)])
+
+
+class TestWorkerRouter(unittest.TestCase):
+    """Unit tests for the WorkerRouter class."""
+
+    def setUp(self):
+        """Create a router for the first of two workers."""
+        self.router = WorkerRouter()
+        self.router.configure(0, ADDRESSES)
+
+    def test_local_keys_are_accepted(self):
+        """Test that keys owned by the worker pass the check."""
+        self.router.check(["bar"])
+        self.router.check([])
+
+    def test_foreign_keys_are_moved(self):
+        """Test that a key owned by another worker is redirected to its address."""
+        with self.assertRaises(MovedException) as context:
+            self.router.check(["foo"])
+        self.assertEqual(str(context.exception), "MOVED 12182 127.0.0.1:7002")
+
+    def test_keys_in_different_slots(self):
+        """Test that keys hashing to different slots are refused."""
+        with self.assertRaises(CrossSlotException):
+            self.router.check(["foo", "bar"])
+        self.router.check(["{bar}:1", "{bar}:2"])
+
+    def test_invalid_configuration(self):
+        """Test that an out of range worker index is refused."""
+        with self.assertRaises(ValueError):
+            WorkerRouter().configure(2, ADDRESSES)
+
+    def test_slots(self):
+        """Test that every worker's slot range and address are described."""
+        self.assertEqual(self.router.slots(), [
+            [0, 8191, ["127.0.0.1", 7001, "worker-0"]],
+            [8192, 16383, ["127.0.0.1", 7002, "worker-1"]],
+        ])
+
+
+class TestRoutedCommands(unittest.TestCase):
+    """Tests for routing in the request handler and the CLUSTER command."""
+
+    def test_request_handler_redirects(self):
+        """Test that commands on keys of another worker get a MOVED error."""
+        WORKER_ROUTER.configure(0, ADDRESSES)
+        self.addCleanup(WORKER_ROUTER.disable)
+
+        response = process_commands([
+            ["SET", "bar", "1"],
+            ["SET", "foo", "1"],
+            ["PING"],
+        ])
+        self.assertEqual(
+            response, b"$2\r\nOK\r\n-MOVED 12182 127.0.0.1:7002\r\n$4\r\nPONG\r\n")
+
+    def test_cluster_keyslot(self):
+        """Test CLUSTER KEYSLOT."""
+        self.assertEqual(ClusterCommand(["keyslot", "foo"]).execute(), 12182)
+
+    def test_cluster_slots_requires_workers(self):
+        """Test that CLUSTER SLOTS fails outside worker mode."""
+        with self.assertRaises(CommandProcessingException):
+            ClusterCommand(["SLOTS"]).execute()
+
+    def test_cluster_invalid_subcommand(self):
+        """Test that unknown subcommands and wrong arities are refused."""
+        for arguments in ([], ["NODES"], ["KEYSLOT"]):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(InvalidCommandSyntaxError):
+                    ClusterCommand(arguments)
+
+
+if __name__ == "__main__":
+    unittest.main()
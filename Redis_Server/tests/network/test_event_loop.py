@@ -0,0 +1,109 @@
+import socket
+import threading
+import time
+import unittest
+
+from src.network.event_loop import start_event_loop_server
+
+
+class TestEventLoopServer(unittest.TestCase):
+    """
+    End-to-end tests for the single-threaded event-loop server mode.
+    """
+
+    HOST = "127.0.0.1"
+    PORT = 6381
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the event-loop server in a separate thread for testing."""
+        cls.server_thread = threading.Thread(
+            target=start_event_loop_server, args=(cls.HOST, cls.PORT), daemon=True
+        )
+        cls.server_thread.start()
+        time.sleep(1)  # Allow server time to start
+
+    def connect(self) -> socket.socket:
+        """Open a client connection to the server."""
+        return socket.create_connection((self.HOST, self.PORT))
+
+    def test_ping_command(self):
+        """Test PING command."""
+        with self.connect() as client_socket:
+            client_socket.sendall(b"*1\r\n$4\r\nPING\r\n")
+            self.assertEqual(client_socket.recv(1024), b"$4\r\nPONG\r\n")
+
+    def test_set_and_get_command(self):
+        """Test SET and GET commands over the same connection."""
+        with self.connect() as client_socket:
+            client_socket.sendall(b"*3\r\n$3\r\nSET\r\n$4\r\nloop\r\n$5\r\nvalue\r\n")
+            self.assertEqual(client_socket.recv(1024), b"$2\r\nOK\r\n")
+
+            client_socket.sendall(b"*2\r\n$3\r\nGET\r\n$4\r\nloop\r\n")
+            self.assertEqual(client_socket.recv(1024), b"$5\r\nvalue\r\n")
+
+    def test_pipelined_commands(self):
+        """Test that a pipeline larger than one socket read is fully answered."""
+        with self.connect() as client_socket:
+            client_socket.sendall(b"*2\r\n$4\r\nINCR\r\n$4\r\npipe\r\n" * 2000)
+            expected = b"".join(f":{i}\r\n".encode() for i in range(1, 2001))
+            response = b""
+            while len(response) < len(expected):
+                response += client_socket.recv(65536)
+            self.assertEqual(response, expected)
+
+    def test_blpop_waits_for_a_push_from_another_client(self):
+        """Test that a blocked client is woken up by a push while others are served."""
+        with self.connect() as blocked, self.connect() as pusher:
+            blocked.sendall(b"*3\r\n$5\r\nBLPOP\r\n$4\r\njobs\r\n$1\r\n0\r\n"
+                            b"*1\r\n$4\r\nPING\r\n")
+            time.sleep(0.1)
+            pusher.sendall(b"*1\r\n$4\r\nPING\r\n")
+            self.assertEqual(pusher.recv(1024), b"$4\r\nPONG\r\n")
+
+            pusher.sendall(b"*3\r\n$5\r\nRPUSH\r\n$4\r\njobs\r\n$3\r\njob\r\n")
+            self.assertEqual(pusher.recv(1024), b":1\r\n")
+
+            expected = b"*2\r\n$4\r\njobs\r\n$3\r\njob\r\n$4\r\nPONG\r\n"
+            response = b""
+            while len(response) < len(expected):
+                response += blocked.recv(1024)
+            self.assertEqual(response, expected)
+
+    def test_publish_reaches_subscribers(self):
+        """Test that a subscriber gets the messages published by another client."""
+        with self.connect() as subscriber, self.connect() as publisher:
+            subscriber.sendall(b"*2\r\n$9\r\nSUBSCRIBE\r\n$4\r\nloop\r\n")
+            self.assertEqual(subscriber.recv(1024),
+                             b"*3\r\n$9\r\nsubscribe\r\n$4\r\nloop\r\n:1\r\n")
+
+            publisher.sendall(b"*3\r\n$7\r\nPUBLISH\r\n$4\r\nloop\r\n$2\r\nhi\r\n")
+            self.assertEqual(publisher.recv(1024), b":1\r\n")
+            self.assertEqual(subscriber.recv(1024),
+                             b"*3\r\n$7\r\nmessage\r\n$4\r\nloop\r\n$2\r\nhi\r\n")
+
+    def test_blpop_timeout(self):
+        """Test that a blocked client gets a null reply once its timeout expires."""
+        with self.connect() as client_socket:
+            start = time.monotonic()
+            client_socket.sendall(b"*3\r\n$5\r\nBLPOP\r\n$7\r\nnothing\r\n$3\r\n0.1\r\n")
+            self.assertEqual(client_socket.recv(1024), b"$-1\r\n")
+            self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_many_concurrent_connections_share_one_thread(self):
+        """Test that many open connections are served without spawning threads."""
+        threads_before = threading.active_count()
+        clients = [self.connect() for _ in range(200)]
+        try:
+            for client_socket in clients:
+                client_socket.sendall(b"*1\r\n$4\r\nPING\r\n")
+            for client_socket in clients:
+                self.assertEqual(client_socket.recv(1024), b"$4\r\nPONG\r\n")
+            self.assertEqual(threading.active_count(), threads_before)
+        finally:
+            for client_socket in clients:
+                client_socket.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
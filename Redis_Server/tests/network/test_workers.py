@@ -0,0 +1,93 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(__file__), "..", "..", "server.py")
+
+
+class TestWorkers(unittest.TestCase):
+    """
+    End-to-end tests for the multi-process `--workers` mode.
+    """
+
+    HOST = "127.0.0.1"
+    PORT = 6390
+
+    @classmethod
+    def setUpClass(cls):
+        """Start a server with two workers in a temporary directory."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.process = subprocess.Popen(
+            [sys.executable, SERVER_SCRIPT, "--port", str(cls.PORT), "--workers", "2",
+             "--save", "", "--appendonly"],
+            cwd=cls.directory.name, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        deadline = time.monotonic() + 10
+        for port in (cls.PORT, cls.PORT + 1, cls.PORT + 2):
+            while True:
+                try:
+                    socket.create_connection((cls.HOST, port)).close()
+                    break
+                except ConnectionRefusedError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.05)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the server, which stops its workers."""
+        cls.process.send_signal(signal.SIGTERM)
+        cls.process.wait(10)
+        cls.directory.cleanup()
+
+    def send_command(self, port: int, *arguments: str) -> bytes:
+        """Send a command to a port and return the raw reply."""
+        request = b"*%d\r\n" % len(arguments) + b"".join(
+            b"$%d\r\n%s\r\n" % (len(argument), argument.encode()) for argument in arguments)
+        with socket.create_connection((self.HOST, port)) as client_socket:
+            client_socket.sendall(request)
+            return client_socket.recv(65536)
+
+    def set_following_redirects(self, key: str) -> None:
+        """SET a key through the public port, following a MOVED reply."""
+        reply = self.send_command(self.PORT, "SET", key, "value")
+        if reply.startswith(b"-MOVED"):
+            port = int(reply.split(b":")[-1])
+            reply = self.send_command(port, "SET", key, "value")
+        self.assertEqual(reply, b"$2\r\nOK\r\n")
+
+    def test_private_ports_redirect_to_owner(self):
+        """Test that each worker only serves its own slots."""
+        self.assertEqual(self.send_command(self.PORT + 1, "SET", "bar", "1"), b"$2\r\nOK\r\n")
+        self.assertEqual(self.send_command(self.PORT + 2, "SET", "bar", "1"),
+                         b"-MOVED 5061 127.0.0.1:%d\r\n" % (self.PORT + 1))
+        self.assertEqual(self.send_command(self.PORT + 1, "GET", "foo"),
+                         b"-MOVED 12182 127.0.0.1:%d\r\n" % (self.PORT + 2))
+
+    def test_clients_reach_every_key_through_the_public_port(self):
+        """Test that keys set through the public port are readable from their owner."""
+        for i in range(20):
+            key = f"key:{i}"
+            self.set_following_redirects(key)
+            slot = int(self.send_command(self.PORT, "CLUSTER", "KEYSLOT", key)[1:])
+            owner = self.PORT + 1 if slot < 8192 else self.PORT + 2
+            self.assertEqual(self.send_command(owner, "GET", key), b"$5\r\nvalue\r\n")
+
+    def test_cluster_slots(self):
+        """Test that CLUSTER SLOTS describes both workers."""
+        reply = self.send_command(self.PORT, "CLUSTER", "SLOTS")
+        self.assertTrue(reply.startswith(b"*2\r\n*3\r\n:0\r\n:8191\r\n"))
+
+    def test_each_worker_has_its_own_append_only_file(self):
+        """Test that every worker logs to its own append-only file."""
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "appendonly-0.aof")))
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "appendonly-1.aof")))
+
+
+if __name__ == "__main__":
+    unittest.main()
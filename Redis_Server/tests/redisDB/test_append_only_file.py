@@ -0,0 +1,336 @@
+"""
+Unit tests for the AppendOnlyFile class and AOF replay.
+Tests include appending and committing commands under each fsync policy,
+streaming the log back (including a truncated tail), replay through the
+request handler and background rewrites.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from collections import deque
+from unittest.mock import patch
+
+from src.commands.key_value_commands import SetCommand
+from src.exceptions.redis_exceptions import CommandProcessingException
+from src.handlers.request_handler import load_append_only_file, process_commands
+from src.redisDB.append_only_file import AppendOnlyFile, read_commands
+from src.redisDB.redis_db import RedisDB
+
+
+class TestAppendOnlyFile(unittest.TestCase):
+    """Unit tests for the AppendOnlyFile class."""
+
+    def setUp(self):
+        """
+        Create a fresh database, a temporary log file and an AOF patched into
+        the request handler and the AOF module.
+        """
+        self.db = RedisDB("test_snapshot.pkl")
+        self.db.clear()
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, "appendonly.aof")
+
+        self.aof = AppendOnlyFile()
+        self.addCleanup(self.aof.close)
+        for target in ("src.handlers.request_handler.APPEND_ONLY_FILE",
+                       "src.redisDB.append_only_file.REDIS_DB"):
+            value = self.aof if target.endswith("APPEND_ONLY_FILE") else self.db
+            patcher = patch(target, value)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+
+    def read_log(self) -> list:
+        """Return the commands stored in the log, decoded to text."""
+        return [[item.decode() for item in command]
+                for command in read_commands(self.filename)]
+
+    def run_commands(self, *commands):
+        """Execute commands through the request handler and commit the AOF."""
+        process_commands([[item.encode() for item in command] for command in commands])
+        self.aof.commit()
+
+    def test_only_write_commands_are_logged(self):
+        """
+        Test that write commands are logged and read commands are not.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["SET", "a", "1"], ["GET", "a"], ["INCR", "a"], ["GET", "missing"])
+
+        self.assertEqual(self.read_log(), [["SET", "a", "1"], ["INCR", "a"]])
+
+    def test_failed_commands_are_not_logged(self):
+        """
+        Test that a command failing with an error is not logged.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["SET", "a", "text"], ["INCR", "a"])
+
+        self.assertEqual(self.read_log(), [["SET", "a", "text"]])
+
+    def test_relative_expiry_is_logged_as_absolute(self):
+        """
+        Test that EXPIRE and SET EX are logged with absolute timestamps.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["SET", "a", "1", "EX", "100"], ["SET", "b", "2"],
+                          ["EXPIRE", "b", "100"], ["EXPIRE", "a", "-1"])
+
+        log = self.read_log()
+        self.assertEqual(log[0][:4], ["SET", "a", "1", "PXAT"])
+        self.assertEqual(log[2][:2], ["PEXPIREAT", "b"])
+        self.assertEqual(log[3], ["DEL", "a"])
+
+    def test_commit_policies(self):
+        """
+        Test that every fsync policy writes the commands before the commit returns.
+        """
+        for policy in ("always", "everysec", "no"):
+            with self.subTest(policy=policy):
+                aof = AppendOnlyFile()
+                aof.open(self.filename, policy)
+                aof.append(["SET", "key", policy])
+                aof.commit()
+                self.assertEqual(self.read_log()[-1], ["SET", "key", policy])
+                aof.close()
+
+    def test_group_commit_from_concurrent_clients(self):
+        """
+        Test that concurrent committers all get their commands logged.
+        """
+        self.aof.open(self.filename, "always")
+
+        def client(n):
+            for i in range(50):
+                self.aof.append(["RPUSH", "list", f"{n}-{i}"])
+                self.aof.commit()
+
+        threads = [threading.Thread(target=client, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.read_log()), 400)
+
+    def test_truncated_tail_is_dropped(self):
+        """
+        Test that a truncated last command is ignored and cut from the file.
+        """
+        with open(self.filename, "wb") as file:
+            file.write(b"*3\r\n$3\r\nSET\r\n$1\r\na\r\n$1\r\n1\r\n*3\r\n$3\r\nSET\r\n$1\r\nb")
+
+        self.assertEqual(self.read_log(), [["SET", "a", "1"]])
+        self.assertEqual(os.path.getsize(self.filename), 27)
+
+    def test_replay_rebuilds_database(self):
+        """
+        Test that replaying the log rebuilds keys, lists and expiry times.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["SET", "a", "1"], ["INCRBY", "a", "41"],
+                          ["RPUSH", "list", "x", "y"], ["LPUSH", "list", "w"],
+                          ["SET", "volatile", "v", "EX", "100"], ["SET", "gone", "v"],
+                          ["DEL", "gone"])
+        expire = self.db.get_expire("volatile")
+        self.aof.close()
+
+        self.db.clear()
+        self.assertEqual(load_append_only_file(self.filename), 7)
+
+        self.assertEqual(self.db.get("a"), 42)
+        self.assertEqual(self.db.get("list"), deque(["w", "x", "y"]))
+        self.assertEqual(self.db.get_expire("volatile"), expire)
+        self.assertNotIn("gone", self.db)
+
+    def test_transactions_are_logged_atomically(self):
+        """
+        Test that the writes of a transaction are wrapped in MULTI/EXEC and that a
+        transaction cut short at the end of the log is not replayed.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["MULTI"], ["SET", "a", "1"], ["GET", "a"], ["INCR", "a"],
+                          ["EXEC"], ["MULTI"], ["GET", "a"], ["EXEC"])
+
+        self.assertEqual(self.read_log(), [["MULTI"], ["SET", "a", "1"], ["INCR", "a"],
+                                           ["EXEC"]])
+
+        self.run_commands(["SET", "b", "1"])
+        self.aof.close()
+        with open(self.filename, "ab") as log:
+            log.write(b"*1\r\n$5\r\nMULTI\r\n*3\r\n$3\r\nSET\r\n$1\r\nc\r\n$1\r\n1\r\n")
+
+        self.db.clear()
+        load_append_only_file(self.filename)
+        self.assertEqual(self.db.get("a"), 2)
+        self.assertEqual(self.db.get("b"), 1)
+        self.assertNotIn("c", self.db)
+
+    def test_failing_transaction_is_closed_in_log(self):
+        """
+        Test that a transaction whose command fails unexpectedly is still closed
+        with EXEC, so that later writes are replayed.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["MULTI"], ["SET", "a", "1"], ["SET", "x", "1", "EX", "abc"],
+                          ["EXEC"], ["SET", "b", "2"])
+        self.assertEqual(self.read_log(), [["MULTI"], ["SET", "a", "1"], ["EXEC"],
+                                           ["SET", "b", "2"]])
+
+        self.aof.close()
+        self.db.clear()
+        load_append_only_file(self.filename)
+        self.assertEqual(self.db.get("a"), 1)
+        self.assertEqual(self.db.get("b"), 2)
+
+    def test_concurrent_write_is_not_logged_inside_transaction(self):
+        """
+        Test that a write of another client, made while a transaction runs, is not
+        logged inside its MULTI/EXEC block, where a cut at EXEC would drop it.
+        """
+        self.aof.open(self.filename, "always")
+        other = next(key for key in (f"other{i}" for i in range(100))
+                     if self.db._shard(key) not in (self.db._shard("a"), self.db._shard("b")))
+        original_execute = SetCommand.execute
+        interleaved = []
+
+        def execute(command):
+            result = original_execute(command)
+            if not interleaved:
+                interleaved.append(other)
+                client = threading.Thread(target=self.run_commands,
+                                          args=(["SET", other, "1"],))
+                client.start()
+                client.join()
+            return result
+
+        with patch.object(SetCommand, "execute", execute):
+            self.run_commands(["MULTI"], ["SET", "a", "1"], ["SET", "b", "2"], ["EXEC"])
+        self.assertEqual(self.read_log(), [["SET", other, "1"], ["MULTI"], ["SET", "a", "1"],
+                                           ["SET", "b", "2"], ["EXEC"]])
+
+        self.aof.close()
+        with open(self.filename, "rb+") as log:
+            log.truncate(os.path.getsize(self.filename) - 3)
+        self.db.clear()
+        load_append_only_file(self.filename)
+        self.assertEqual(self.db.get(other), 1)
+        self.assertNotIn("a", self.db)
+
+    def test_rewrite_compacts_log(self):
+        """
+        Test that a rewrite replaces the history of a key by its final value.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(*[["INCR", "counter"] for _ in range(100)])
+        self.run_commands(["RPUSH", "list", *map(str, range(100))])
+
+        self.aof.rewrite(background=False)
+
+        log = self.read_log()
+        self.assertIn(["SET", "counter", "100"], log)
+        self.assertEqual(len(log), 3)
+        self.assertEqual(self.aof.rewrites, 1)
+
+        self.run_commands(["INCR", "counter"])
+        self.db.clear()
+        load_append_only_file(self.filename)
+        self.assertEqual(self.db.get("counter"), 101)
+        self.assertEqual(len(self.db.get("list")), 100)
+
+    def test_rewrite_hashes(self):
+        """
+        Test that a rewrite recreates hashes of both encodings with HSET.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["HSET", "small", "a", "1", "b", "2"], ["HINCRBY", "small", "a", "9"],
+                          ["HSET", "big", *[str(i) for i in range(600)]], ["HDEL", "big", "0"])
+
+        self.aof.rewrite(background=False)
+
+        log = self.read_log()
+        self.assertIn(["HSET", "small", "a", "10", "b", "2"], log)
+        self.assertTrue(all(command[0] == "HSET" for command in log))
+
+        small, big = self.db.get("small"), self.db.get("big")
+        self.db.clear()
+        load_append_only_file(self.filename)
+        self.assertEqual(self.db.get("small"), small)
+        self.assertEqual(self.db.get("big"), big)
+        self.assertEqual(len(big), 299)
+
+    def test_rewrite_sorted_sets(self):
+        """
+        Test that a rewrite recreates sorted sets with ZADD and exact scores.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["ZADD", "board", *[item for i in range(200) for item in (str(i / 3), f"m{i}")]],
+                          ["ZINCRBY", "board", "0.1", "m0"], ["ZADD", "board", "-inf", "last"])
+
+        self.aof.rewrite(background=False)
+        self.assertTrue(all(command[0] == "ZADD" for command in self.read_log()))
+
+        board = self.db.get("board")
+        self.db.clear()
+        load_append_only_file(self.filename)
+        self.assertEqual(list(self.db.get("board")), list(board))
+
+    def test_rewrite_sets(self):
+        """
+        Test that a rewrite recreates sets of both encodings with SADD.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["SADD", "numbers", *map(str, range(100))], ["SREM", "numbers", "7"],
+                          ["SADD", "words", *[f"w{i}" for i in range(100)]])
+
+        self.aof.rewrite(background=False)
+        self.assertTrue(all(command[0] == "SADD" for command in self.read_log()))
+
+        numbers, words = self.db.get("numbers"), self.db.get("words")
+        self.db.clear()
+        load_append_only_file(self.filename)
+        self.assertEqual(self.db.get("numbers"), numbers)
+        self.assertEqual(self.db.get("words"), words)
+
+    def test_background_rewrite_keeps_concurrent_writes(self):
+        """
+        Test that commands executed during a background rewrite end up in the new log.
+        """
+        self.aof.open(self.filename, "always")
+        self.run_commands(["SET", "before", "1"])
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_write_snapshot(file, data, expires):
+            started.set()
+            release.wait(5)
+            AppendOnlyFile._write_snapshot(file, data, expires)
+
+        with patch.object(self.aof, "_write_snapshot", slow_write_snapshot):
+            self.aof.rewrite()
+            self.assertTrue(started.wait(5))
+            with self.assertRaises(CommandProcessingException):
+                self.aof.rewrite()
+            self.run_commands(["SET", "during", "2"])
+            release.set()
+            deadline = time.monotonic() + 5
+            while self.aof.rewrites == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertEqual(self.read_log(), [["SET", "before", "1"], ["SET", "during", "2"]])
+
+    def test_rewrite_requires_enabled_aof(self):
+        """
+        Test that a rewrite is refused while the AOF is disabled.
+        """
+        with self.assertRaises(CommandProcessingException):
+            self.aof.rewrite()
+
+
+if __name__ == "__main__":
+    unittest.main()
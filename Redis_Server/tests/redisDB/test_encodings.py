@@ -0,0 +1,150 @@
+"""
+Unit tests for the compact value encodings.
+"""
+
+import unittest
+
+from src.redisDB.encodings import (
+    SHARED_INTEGERS,
+    add_to_set,
+    create_hash,
+    create_list,
+    create_set,
+    encode_string,
+    grow_list,
+    memory_usage,
+    object_encoding,
+    push_to_list,
+    set_hash_field,
+    shared_integer,
+    shrink_list,
+    type_name,
+)
+from src.redisDB.intset import IntSet
+from src.redisDB.listpack import ListPack, ListPackHash
+from src.redisDB.quicklist import QuickList
+from src.redisDB.zset import ZSet
+
+
+class TestEncodings(unittest.TestCase):
+    """Unit tests for the value encodings."""
+
+    def test_encode_string(self):
+        """Test that only canonical 64-bit integers get the int encoding."""
+        for value, expected in [("0", 0), ("-15", -15), ("9223372036854775807", 2 ** 63 - 1)]:
+            with self.subTest(value=value):
+                self.assertEqual(encode_string(value), expected)
+        for value in ["", "abc", "007", "-0", "+1", " 1", "1_000", "1.5",
+                      "9223372036854775808", "١٢"]:
+            with self.subTest(value=value):
+                self.assertEqual(encode_string(value), value)
+
+    def test_small_integers_are_shared(self):
+        """Test that small integers point to the shared objects."""
+        self.assertIs(encode_string("1234"), SHARED_INTEGERS[1234])
+        self.assertIs(shared_integer(int("9999")), SHARED_INTEGERS[9999])
+        self.assertEqual(shared_integer(10000), 10000)
+
+    def test_create_list(self):
+        """Test that small lists are listpacks and big ones quicklists."""
+        self.assertIsInstance(create_list(["a"] * 128), ListPack)
+        self.assertIsInstance(create_list(["a"] * 129), QuickList)
+        self.assertIsInstance(create_list(["x" * 5000] * 2), QuickList)
+
+    def test_push_converts_big_values(self):
+        """Test that pushing an element too big for a listpack converts the list."""
+        result = push_to_list(create_list(["a"]), ["x" * 10000], is_left=False)
+        self.assertIsInstance(result, QuickList)
+        self.assertEqual(len(result), 2)
+
+    def test_grow_and_shrink_list(self):
+        """Test the conversions after insertions and removals."""
+        listpack = create_list(["a"] * 128)
+        listpack.insert(1, "b")
+        self.assertIsInstance(grow_list(listpack), QuickList)
+
+        quicklist = QuickList(["a"] * 200)
+        self.assertIs(shrink_list(quicklist), quicklist)
+        quicklist.trim(0, 64)
+        shrunk = shrink_list(quicklist)
+        self.assertIsInstance(shrunk, ListPack)
+        self.assertEqual(list(shrunk), ["a"] * 64)
+
+    def test_hash_conversions(self):
+        """Test that hashes are converted to a dict when they outgrow a listpack."""
+        self.assertIsInstance(create_hash([("a", "1")]), ListPackHash)
+        self.assertIsInstance(create_hash((str(i), "v") for i in range(129)), dict)
+        self.assertIsInstance(create_hash([("a", "x" * 65)]), dict)
+
+        small = create_hash((str(i), "v") for i in range(128))
+        self.assertIs(set_hash_field(small, "0", "w"), small)
+        grown = set_hash_field(small, "new", "v")
+        self.assertIsInstance(grown, dict)
+        self.assertEqual(len(grown), 129)
+        self.assertEqual(grown["0"], "w")
+
+        long_field = set_hash_field(create_hash([("a", "1")]), "é" * 40, "v")
+        self.assertEqual(long_field, {"a": "1", "é" * 40: "v"})
+
+    def test_set_conversions(self):
+        """Test that sets are converted from an intset when they cannot be one."""
+        self.assertIsInstance(create_set(["3", "1"]), IntSet)
+        self.assertIs(type(create_set(["1", "01"])), set)
+        self.assertIs(type(create_set(map(str, range(513)))), set)
+
+        small = create_set(map(str, range(511)))
+        value, added = add_to_set(small, ["511", "0"])
+        self.assertIs(value, small)
+        self.assertEqual(added, 1)
+        value, added = add_to_set(small, ["512"])
+        self.assertIs(type(value), set)
+        self.assertEqual((len(value), added), (513, 1))
+        value, added = add_to_set(create_set(["1"]), ["a", "1", "a"])
+        self.assertEqual((value, added), ({"1", "a"}, 1))
+
+    def test_object_encoding(self):
+        """Test the encoding names reported by OBJECT ENCODING."""
+        self.assertEqual(object_encoding(12), "int")
+        self.assertEqual(object_encoding("short"), "embstr")
+        self.assertEqual(object_encoding("x" * 45), "raw")
+        self.assertEqual(object_encoding(ListPack(["a"])), "listpack")
+        self.assertEqual(object_encoding(QuickList(["a"])), "quicklist")
+        self.assertEqual(object_encoding(ListPackHash([("a", "1")])), "listpack")
+        self.assertEqual(object_encoding({"a": "1"}), "hashtable")
+        self.assertEqual(object_encoding(ZSet([("a", 1.0)])), "skiplist")
+        self.assertEqual(object_encoding(IntSet([1])), "intset")
+        self.assertEqual(object_encoding({"a"}), "hashtable")
+
+    def test_type_name(self):
+        """Test the type names reported whatever the encoding."""
+        for value, expected in [(12, "string"), ("v", "string"), (ListPack(["a"]), "list"),
+                                (QuickList(["a"]), "list"), (ListPackHash([("a", "1")]), "hash"),
+                                ({"a": "1"}, "hash"), (IntSet([1]), "set"), ({"a"}, "set"),
+                                (ZSet([("a", 1.0)]), "zset")]:
+            with self.subTest(value=value):
+                self.assertEqual(type_name(value), expected)
+
+    def test_memory_usage(self):
+        """Test that compact encodings report less memory."""
+        self.assertLess(memory_usage("key", shared_integer(5)), memory_usage("key", "5"))
+        items = [f"item-{i}" for i in range(10)]
+        self.assertLess(memory_usage("key", ListPack(items)),
+                        memory_usage("key", QuickList(items)))
+        big = QuickList(["x"] * 1000)
+        self.assertEqual(memory_usage("key", big, samples=5), memory_usage("key", big))
+        pairs = [(f"field-{i}", f"value-{i}") for i in range(10)]
+        self.assertLess(memory_usage("key", ListPackHash(pairs)),
+                        memory_usage("key", dict(pairs)) / 3)
+        uniform = {f"field-{i:04}": "v" for i in range(1000)}
+        self.assertEqual(memory_usage("key", uniform, samples=5), memory_usage("key", uniform))
+        scores = ZSet((f"member-{i:04}", float(i)) for i in range(1000))
+        self.assertEqual(memory_usage("key", scores, samples=5), memory_usage("key", scores))
+        self.assertGreater(memory_usage("key", scores), 1000 * 100)
+        self.assertLess(memory_usage("key", IntSet(range(100))),
+                        memory_usage("key", set(map(str, range(100)))) / 10)
+        members = {f"member-{i:04}" for i in range(1000)}
+        self.assertEqual(memory_usage("key", members, samples=5), memory_usage("key", members))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Unit tests for the eviction policies and the per-key metadata helpers.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.redisDB import eviction
+from src.redisDB.eviction import (
+    LFU_INIT_VAL,
+    LRU_CLOCK_MAX,
+    create_eviction_policy,
+    lfu_log_increment,
+    metadata_access,
+    metadata_size,
+    pack_metadata,
+)
+
+
+class TestEviction(unittest.TestCase):
+    """Unit tests for the eviction policies."""
+
+    def test_pack_metadata(self):
+        """Test that size and access metadata round-trip through one int."""
+        metadata = pack_metadata(123456, 0xABCDEF)
+        self.assertEqual(metadata_size(metadata), 123456)
+        self.assertEqual(metadata_access(metadata), 0xABCDEF)
+
+    def test_lru_score_is_idle_time(self):
+        """Test that the LRU score is the idle time, also across clock wraps."""
+        policy = create_eviction_policy("allkeys-lru")
+        with patch.object(eviction, "lru_clock", return_value=100):
+            access = policy.new_access()
+        with patch.object(eviction, "lru_clock", return_value=160):
+            self.assertEqual(policy.score(access, None), 60)
+            self.assertEqual(policy.score(policy.touch(access), None), 0)
+        with patch.object(eviction, "lru_clock", return_value=5):
+            self.assertEqual(policy.score(LRU_CLOCK_MAX - 4, None), 10)
+
+    def test_lfu_counter(self):
+        """Test that the LFU counter grows with accesses and decays with time."""
+        policy = create_eviction_policy("allkeys-lfu")
+        with patch.object(eviction, "lfu_time_in_minutes", return_value=10):
+            access = policy.new_access()
+            self.assertEqual(access & 0xFF, LFU_INIT_VAL)
+            for _ in range(1000):
+                access = policy.touch(access)
+            hot_score = policy.score(access, None)
+            self.assertLess(hot_score, policy.score(policy.new_access(), None))
+        with patch.object(eviction, "lfu_time_in_minutes", return_value=13):
+            self.assertEqual(policy.score(access, None), hot_score + 3)
+
+    def test_lfu_log_increment_saturates(self):
+        """Test that the 8-bit LFU counter never overflows."""
+        self.assertEqual(lfu_log_increment(255), 255)
+        self.assertEqual(lfu_log_increment(0), 1)
+
+    def test_volatile_ttl_score(self):
+        """Test that keys expiring sooner rank higher."""
+        policy = create_eviction_policy("volatile-ttl")
+        self.assertTrue(policy.VOLATILE)
+        self.assertGreater(policy.score(0, 1000), policy.score(0, 2000))
+
+    def test_unknown_policy(self):
+        """Test that unknown policies are refused."""
+        with self.assertRaises(ValueError):
+            create_eviction_policy("allkeys-random")
+        self.assertFalse(create_eviction_policy("noeviction").EVICTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for the IntSet class.
+"""
+
+import copy
+import sys
+import unittest
+
+from src.redisDB.intset import IntSet, as_integer
+
+
+class TestIntSet(unittest.TestCase):
+    """Unit tests for the IntSet class."""
+
+    def test_as_integer(self):
+        """Test that only canonical 64-bit integers can be stored."""
+        for member, expected in [("0", 0), ("-15", -15), ("9223372036854775807", 2 ** 63 - 1),
+                                 ("-9223372036854775808", -2 ** 63)]:
+            with self.subTest(member=member):
+                self.assertEqual(as_integer(member), expected)
+        for member in ["", "abc", "007", "-0", "+1", " 1", "1_000", "1.5",
+                       "9223372036854775808", "١٢"]:
+            with self.subTest(member=member):
+                self.assertIsNone(as_integer(member))
+
+    def test_members_are_sorted_strings(self):
+        """Test that members are unique, sorted and returned as strings."""
+        integers = IntSet([5, -3, 5, 100])
+
+        self.assertEqual(list(integers), ["-3", "5", "100"])
+        self.assertEqual(len(integers), 3)
+        self.assertIn("5", integers)
+        self.assertNotIn("05", integers)
+        self.assertNotIn("x", integers)
+        self.assertEqual(integers, {"-3", "5", "100"})
+
+    def test_add_upgrades_item_size(self):
+        """Test that the array is widened only when a member needs it."""
+        integers = IntSet([1, 2])
+        self.assertEqual(integers.itemsize, 2)
+        self.assertFalse(integers.add(2))
+        self.assertTrue(integers.add(-70000))
+        self.assertEqual(integers.itemsize, 4)
+        self.assertTrue(integers.add(2 ** 40))
+        self.assertEqual(integers.itemsize, 8)
+        self.assertEqual(list(integers), ["-70000", "1", "2", str(2 ** 40)])
+
+    def test_discard(self):
+        """Test removing members."""
+        integers = IntSet([1, 2, 3])
+        self.assertTrue(integers.discard("2"))
+        self.assertFalse(integers.discard("2"))
+        self.assertFalse(integers.discard("two"))
+        self.assertEqual(list(integers), ["1", "3"])
+
+    def test_copy_is_independent(self):
+        """Test that a copy does not share the array."""
+        integers = IntSet([1])
+        clone = copy.copy(integers)
+        integers.add(2)
+        self.assertEqual(list(clone), ["1"])
+
+    def test_smaller_than_set(self):
+        """Test that an intset takes far less memory than a set of strings."""
+        members = [str(i) for i in range(500)]
+        set_size = sys.getsizeof(set(members)) + sum(map(sys.getsizeof, members))
+        self.assertLess(sys.getsizeof(IntSet(range(500))), set_size / 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the ListPack class.
+"""
+
+import copy
+import sys
+import unittest
+from collections import deque
+
+from src.redisDB.listpack import ListPack, ListPackHash
+
+
+class TestListPack(unittest.TestCase):
+    """Unit tests for the ListPack class."""
+
+    def test_push_and_iterate(self):
+        """Test that elements pushed at both ends come back in order."""
+        listpack = ListPack(["b", "c"])
+        listpack.appendleft("a")
+        listpack.append("d")
+
+        self.assertEqual(len(listpack), 4)
+        self.assertEqual(list(listpack), ["a", "b", "c", "d"])
+        self.assertEqual(listpack, deque(["a", "b", "c", "d"]))
+
+    def test_long_and_non_ascii_elements(self):
+        """Test elements needing a multi-byte length prefix and non-ASCII text."""
+        items = ["x" * 200, "", "héllo", "x" * 20000]
+        listpack = ListPack(items)
+
+        self.assertEqual(list(listpack), items)
+        self.assertEqual(len(listpack), 4)
+
+    def test_indexing_from_both_ends(self):
+        """Test reading and replacing elements by positive and negative index."""
+        listpack = ListPack(["a", "x" * 300, "c", "d"])
+        listpack[1] = "b"
+        listpack[-1] = "y" * 200
+
+        self.assertEqual(listpack[0], "a")
+        self.assertEqual(listpack[-3], "b")
+        self.assertEqual(listpack[3], "y" * 200)
+        self.assertEqual(list(reversed(listpack)), ["y" * 200, "c", "b", "a"])
+        self.assertEqual(ListPack(["x" * 300, "a", "b", "c", "d"])[1], "a")
+        with self.assertRaises(IndexError):
+            listpack[4]
+
+    def test_pop_insert_and_trim(self):
+        """Test removing and inserting elements in the middle and at both ends."""
+        listpack = ListPack(map(str, range(10)))
+        self.assertEqual(listpack.pop(), "9")
+        self.assertEqual(listpack.popleft(), "0")
+        listpack.insert(2, "new")
+        listpack.trim(1, 6)
+
+        self.assertEqual(list(listpack), ["2", "new", "3", "4", "5"])
+        self.assertEqual(listpack.slice(1, 3), ["new", "3"])
+        self.assertEqual(listpack.find("3"), 2)
+        self.assertEqual(listpack.find("missing"), -1)
+
+    def test_remove(self):
+        """Test removing occurrences from the head, the tail, or all of them."""
+        items = ["a", "b", "a", "c", "a"]
+        cases = {2: ["b", "c", "a"], -2: ["a", "b", "c"], 0: ["b", "c"]}
+        for count, expected in cases.items():
+            with self.subTest(count=count):
+                listpack = ListPack(items)
+                self.assertEqual(listpack.remove("a", count), len(items) - len(expected))
+                self.assertEqual(list(listpack), expected)
+
+    def test_copy_is_independent(self):
+        """Test that a copy does not share the buffer."""
+        listpack = ListPack(["a"])
+        clone = copy.copy(listpack)
+        listpack.append("b")
+
+        self.assertEqual(list(clone), ["a"])
+
+    def test_smaller_than_deque(self):
+        """Test that a small listpack takes less memory than the same deque."""
+        items = [f"item-{i}" for i in range(10)]
+        deque_size = sys.getsizeof(deque(items)) + sum(map(sys.getsizeof, items))
+        self.assertLess(sys.getsizeof(ListPack(items)), deque_size / 3)
+
+
+
+class TestListPackHash(unittest.TestCase):
+    """Unit tests for the ListPackHash class."""
+
+    def test_mapping_operations(self):
+        """Test setting, replacing, reading and removing fields."""
+        packed = ListPackHash([("a", "1"), ("b", "x" * 300)])
+        packed["c"] = "3"
+        packed["b"] = "2"
+
+        self.assertEqual(len(packed), 3)
+        self.assertEqual(list(packed.items()), [("a", "1"), ("b", "2"), ("c", "3")])
+        self.assertEqual(packed["b"], "2")
+        self.assertIn("c", packed)
+        self.assertEqual(packed.pop("a"), "1")
+        self.assertIsNone(packed.pop("a", None))
+        self.assertIsNone(packed.get("a"))
+        self.assertEqual(packed, {"b": "2", "c": "3"})
+        with self.assertRaises(KeyError):
+            packed["a"]
+
+    def test_fields_and_values_do_not_collide(self):
+        """Test that a value equal to a field name is not taken for that field."""
+        packed = ListPackHash([("a", "b"), ("b", "a")])
+        self.assertEqual(packed["b"], "a")
+        self.assertNotIn("1", packed)
+        packed["a"] = "b"
+        self.assertEqual(dict(packed.items()), {"a": "b", "b": "a"})
+
+    def test_copy_is_independent(self):
+        """Test that a copy is a ListPackHash that does not share the buffer."""
+        packed = ListPackHash([("a", "1")])
+        clone = copy.copy(packed)
+        packed["b"] = "2"
+
+        self.assertIsInstance(clone, ListPackHash)
+        self.assertEqual(list(clone), ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Unit tests for the QuickList class.
+"""
+
+import copy
+import random
+import unittest
+from unittest.mock import patch
+
+from src.redisDB import quicklist
+from src.redisDB.quicklist import QuickList
+
+
+class TestQuickList(unittest.TestCase):
+    """Unit tests for the QuickList class."""
+
+    def test_nodes_are_bounded(self):
+        """Test that elements are spread over nodes of at most NODE_MAX_ENTRIES."""
+        items = [str(i) for i in range(1000)]
+        qlist = QuickList(items)
+
+        self.assertEqual(len(qlist), 1000)
+        self.assertEqual(qlist.node_count, 8)
+        self.assertEqual(list(qlist), items)
+        self.assertEqual(list(reversed(qlist)), items[::-1])
+
+    def test_big_elements_fill_nodes_by_bytes(self):
+        """Test that nodes are also bounded by NODE_MAX_BYTES."""
+        qlist = QuickList(["x" * 3000] * 10)
+        self.assertEqual(qlist.node_count, 4)
+
+    def test_indexing_after_pushes_at_the_head(self):
+        """Test that the cached node positions follow pushes and pops at both ends."""
+        qlist = QuickList(map(str, range(300)))
+        self.assertEqual(qlist[150], "150")
+        for i in range(200):
+            qlist.appendleft(f"h{i}")
+        qlist.popleft()
+        qlist.pop()
+
+        self.assertEqual(qlist[0], "h198")
+        self.assertEqual(qlist[199], "0")
+        self.assertEqual(qlist[-1], "298")
+        qlist[-2] = "replaced"
+        self.assertEqual(qlist.slice(495, 498), ["296", "replaced", "298"])
+        with self.assertRaises(IndexError):
+            qlist[498]
+
+    def test_insert_splits_full_nodes(self):
+        """Test that inserting into a full node splits it."""
+        qlist = QuickList(map(str, range(128)))
+        qlist.insert(64, "middle")
+
+        self.assertEqual(qlist.node_count, 2)
+        self.assertEqual(qlist[64], "middle")
+        self.assertEqual(qlist.find("middle"), 64)
+        self.assertEqual(len(qlist), 129)
+
+    def test_remove_and_trim_compact_nodes(self):
+        """Test that removals merge nodes that became small."""
+        qlist = QuickList(["a", "b"] * 500)
+        self.assertEqual(qlist.remove("a", -10), 10)
+        self.assertEqual(qlist.remove("a"), 490)
+        self.assertEqual(list(qlist), ["b"] * 500)
+        self.assertEqual(qlist.node_count, 4)
+
+        qlist.trim(100, 150)
+        self.assertEqual(len(qlist), 50)
+        self.assertEqual(qlist.node_count, 1)
+        self.assertEqual(qlist.nbytes, 150)
+
+    def test_copy_is_independent(self):
+        """Test that a copy does not share nodes."""
+        qlist = QuickList(["a"] * 200)
+        clone = copy.copy(qlist)
+        qlist[0] = "b"
+        qlist.append("c")
+
+        self.assertEqual(list(clone), ["a"] * 200)
+
+    @patch.object(quicklist, "NODE_MAX_ENTRIES", 4)
+    def test_matches_a_python_list(self):
+        """Test random operations on small nodes against a Python list."""
+        rng = random.Random(13)
+        qlist, expected = QuickList(), []
+        for _ in range(3000):
+            operation = rng.randrange(8)
+            item = str(rng.randrange(5))
+            if operation == 0:
+                qlist.append(item)
+                expected.append(item)
+            elif operation == 1:
+                qlist.appendleft(item)
+                expected.insert(0, item)
+            elif operation == 2 and expected:
+                self.assertEqual(qlist.pop(), expected.pop())
+            elif operation == 3 and expected:
+                self.assertEqual(qlist.popleft(), expected.pop(0))
+            elif operation == 4:
+                index = rng.randint(0, len(expected))
+                qlist.insert(index, item)
+                expected.insert(index, item)
+            elif operation == 5 and expected:
+                index = rng.randrange(len(expected))
+                qlist[index] = item
+                expected[index] = item
+                self.assertEqual(qlist[index], expected[index])
+            elif operation == 6:
+                count = rng.randint(-2, 2)
+                removed = qlist.remove(item, count)
+                matches = [i for i, value in enumerate(expected) if value == item]
+                if count:
+                    matches = matches[count:] if count < 0 else matches[:count]
+                for i in reversed(matches):
+                    del expected[i]
+                self.assertEqual(removed, len(matches))
+            elif operation == 7 and expected:
+                start = rng.randrange(len(expected))
+                stop = rng.randint(start, len(expected))
+                self.assertEqual(qlist.slice(start, stop), expected[start:stop])
+            self.assertEqual(len(qlist), len(expected))
+        self.assertEqual(list(qlist), expected)
+        self.assertEqual(qlist.nbytes, sum(node.nbytes for node in qlist._nodes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Unit tests for the binary RDB snapshot format in rdb.py.
+Tests include round trips of every value type with and without compression,
+streaming across chunk boundaries, and rejection of corrupted files.
+"""
+
+import io
+import unittest
+from unittest.mock import patch
+
+from src.exceptions.redis_exceptions import RdbLoadError
+from src.redisDB import rdb
+from src.redisDB.encodings import create_hash, create_list, create_set
+from src.redisDB.intset import IntSet
+from src.redisDB.zset import ZSet
+
+
+class TestRdb(unittest.TestCase):
+    """Unit tests for rdb.dump and rdb.load."""
+
+    DATA = {
+        "string": "value",
+        "empty": "",
+        "unicode": "héllo wörld ✓",
+        "with-nul": "a\0b",
+        "long": "x" * 70_000,
+        "integer": 42,
+        "negative": -7,
+        "huge": 2 ** 80,
+        "list": create_list(["a", "b", "c"]),
+        "big-list": create_list(map(str, range(1000))),
+        "empty-list": create_list(),
+        "hash": create_hash([("field", "value"), ("n", "1")]),
+        "big-hash": create_hash((f"field:{i}", str(i)) for i in range(1000)),
+        "zset": ZSet([("a", 1.5), ("b", float("-inf")), ("c", 0.1 + 0.2)]),
+        "big-zset": ZSet((f"member:{i}", float(i % 10)) for i in range(300)),
+        "int-set": create_set(["3", "-1", "70000"]),
+        "set": create_set(["a", "1", "b"]),
+    }
+    EXPIRES = {"string": 1_900_000_000_000, "list": 1_800_000_000_000}
+
+    def dump(self, data=None, expires=None, compress=False) -> bytes:
+        """Serialize data to RDB bytes."""
+        file = io.BytesIO()
+        rdb.dump(file, self.DATA if data is None else data,
+                 self.EXPIRES if expires is None else expires, compress=compress)
+        return file.getvalue()
+
+    def load(self, raw: bytes):
+        """Load RDB bytes."""
+        return rdb.load(io.BytesIO(raw))
+
+    def test_round_trip(self):
+        """Test that every value type and expiry time survives a round trip."""
+        for compress in (False, True):
+            with self.subTest(compress=compress):
+                data, expires = self.load(self.dump(compress=compress))
+                self.assertEqual(data, self.DATA)
+                self.assertEqual(expires, self.EXPIRES)
+                self.assertIs(type(data["integer"]), int)
+                self.assertIs(type(data["big-hash"]), dict)
+                self.assertIsInstance(data["int-set"], IntSet)
+
+    def test_many_keys_span_several_batches(self):
+        """Test a dataset larger than one batch record."""
+        data = {f"key:{i}": f"value:{i}" for i in range(10_000)}
+        expires = {f"key:{i}": i for i in range(0, 10_000, 3)}
+        self.assertEqual(self.load(self.dump(data, expires)), (data, expires))
+
+    def test_streaming_load_with_small_chunks(self):
+        """Test that records split across read chunks are reassembled."""
+        for compress in (False, True):
+            raw = self.dump(compress=compress)
+            with self.subTest(compress=compress), patch.object(rdb, "CHUNK_SIZE", 7):
+                self.assertEqual(self.load(raw), (self.DATA, self.EXPIRES))
+
+    def test_compression_shrinks_file(self):
+        """Test that compression reduces the size of repetitive data."""
+        self.assertLess(len(self.dump(compress=True)), len(self.dump()) // 10)
+
+    def test_is_rdb_file(self):
+        """Test detection of the RDB magic string."""
+        self.assertTrue(rdb.is_rdb_file(io.BytesIO(self.dump())))
+        self.assertFalse(rdb.is_rdb_file(io.BytesIO(b"\x80\x05pickle")))
+
+    def test_wrong_signature(self):
+        """Test that a file without the magic string is rejected."""
+        with self.assertRaises(RdbLoadError):
+            self.load(b"NOTRDB0001\x00")
+
+    def test_newer_version(self):
+        """Test that a file from a newer format version is rejected."""
+        raw = bytearray(self.dump())
+        raw[5:9] = b"9999"
+        with self.assertRaises(RdbLoadError):
+            self.load(bytes(raw))
+
+    def test_checksum_mismatch(self):
+        """Test that a corrupted byte is detected by the CRC."""
+        raw = bytearray(self.dump())
+        raw[raw.index(b"value")] ^= 0x20
+        with self.assertRaises(RdbLoadError):
+            self.load(bytes(raw))
+
+    def test_truncated_file(self):
+        """Test that a truncated file is rejected."""
+        raw = self.dump()
+        for size in (len(raw) - 1, len(raw) - 5, len(raw) // 2, 12):
+            with self.subTest(size=size), self.assertRaises(RdbLoadError):
+                self.load(raw[:size])
+
+    def test_unsupported_value_type(self):
+        """Test that saving an unsupported value type fails."""
+        with self.assertRaises(TypeError):
+            self.dump({"key": object()}, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,19 @@
 """
 Unit tests for the RedisDB class.
 Tests include singleton behavior, data manipulation (set, get, delete),
-and snapshot persistence using pickle.
+and snapshot persistence in the RDB format.
 """
 
 import unittest
 import os
+import pickle
+import threading
+import time
+from unittest.mock import patch
 
+from src.exceptions.redis_exceptions import CommandProcessingException, RdbLoadError
 from src.redisDB.redis_db import RedisDB
+from src.utils.time_utils import get_current_time_in_ms
 
 
 class TestRedisDB(unittest.TestCase):
@@ -26,8 +32,10 @@ class TestRedisDB(unittest.TestCase):
 
     def tearDown(self):
         """
-        Clean up after each test by deleting the test snapshot file.
+        Clean up after each test by deleting the test snapshot file and
+        removing any memory limit.
         """
+        self.db.configure_maxmemory(0)
         if os.path.exists(self.TEST_SNAPSHOT_FILE):
             os.remove(self.TEST_SNAPSHOT_FILE)
 
@@ -70,6 +78,51 @@ class TestRedisDB(unittest.TestCase):
         self.assertTrue("key_exists" in self.db, "__contains__ failed for existing key.")
         self.assertFalse("key_missing" in self.db, "__contains__ failed for missing key.")
 
+    def test_keys_and_scan_shard(self):
+        """
+        Test listing the keys, whole or one shard at a time.
+        """
+        self.db.clear()
+        for i in range(50):
+            self.db.set(f"key{i}", "value")
+        self.db.set("expired", "value", expire=get_current_time_in_ms() - 1)
+
+        self.assertEqual(len(self.db.keys()), 50)
+        self.assertEqual(sorted(self.db.keys(lambda key: key.endswith("7"))), ["key17", "key27",
+                                                                              "key37", "key47", "key7"])
+        shard_keys = []
+        for index in range(self.db.shards):
+            cursor = 0
+            while True:
+                cursor, keys = self.db.scan_shard(index, cursor, 2)
+                self.assertLessEqual(len(keys), 2)
+                shard_keys += keys
+                if not cursor:
+                    break
+        self.assertEqual(sorted(shard_keys), sorted([*self.db.keys(), "expired"]))
+
+    def test_scan_cursor_survives_compaction(self):
+        """
+        Test that a shard cursor resumes at the same key after the log of the shard
+        was compacted, and that deleted keys are pruned from the log.
+        """
+        db = RedisDB("test_snapshot.pkl", shards=1)
+        db.clear()
+        for i in range(100):
+            db.set(f"key{i}", "value")
+        cursor, keys = db.scan_shard(0, 0, 50)
+        self.assertEqual(keys, [f"key{i}" for i in range(50)])
+
+        for i in range(0, 100, 2):
+            db.delete(f"key{i}")
+        for i in range(200):
+            db.set(f"new{i}", "value")
+            db.delete(f"new{i}")
+        self.assertLess(len(db.scan_shard(0, 0, 1000)[1]), 200)
+
+        cursor, keys = db.scan_shard(0, cursor, 25)
+        self.assertEqual(keys[:25], [f"key{i}" for i in range(51, 100, 2)])
+
     def test_persistence_snapshot(self):
         """
         Test saving data to a snapshot file and reloading it.
@@ -82,6 +135,377 @@ class TestRedisDB(unittest.TestCase):
         result = new_db.get("persistent_key")
         self.assertEqual(result, "persistent_value", "Snapshot persistence failed.")
 
+    def test_persistence_snapshot_keeps_expiry(self):
+        """
+        Test that expiry times survive a snapshot round trip.
+        """
+        expire = get_current_time_in_ms() + 60_000
+        self.db.set("volatile_key", "value", expire=expire)
+        self.db.dump_data()
+
+        new_db = RedisDB.from_file(self.TEST_SNAPSHOT_FILE)
+        self.assertEqual(new_db.get_expire("volatile_key"), expire)
+
+    def test_lazy_expiration(self):
+        """
+        Test that an expired key is removed when it is looked up.
+        """
+        self.db.set("expired_key", "value", expire=0)
+        self.assertIsNone(self.db.get("expired_key"))
+        self.assertEqual(len(self.db), 0)
+        self.assertEqual(self.db.expired_keys, 1)
+
+    def test_active_expire_cycle(self):
+        """
+        Test that the active expire cycle reclaims keys nobody reads again.
+        """
+        future = get_current_time_in_ms() + 60_000
+        for i in range(100):
+            self.db.set(f"expired_{i}", "value", expire=i)
+        self.db.set("volatile_key", "value", expire=future)
+        self.db.set("persistent_key", "value")
+
+        self.assertFalse(self.db.active_expire_cycle(time_budget_ms=1000))
+        self.assertEqual(len(self.db), 2)
+        self.assertEqual(self.db.expired_keys, 100)
+        self.assertEqual(self.db.get_expire("volatile_key"), future)
+
+    def test_active_expire_cycle_respects_time_budget(self):
+        """
+        Test that the cycle stops when its time budget is exhausted.
+        """
+        for i in range(1000):
+            self.db.set(f"expired_{i}", "value", expire=i)
+
+        self.assertTrue(self.db.active_expire_cycle(time_budget_ms=0))
+        self.assertGreater(len(self.db), 0)
+
+    def test_active_expire_cycle_skips_stale_entries(self):
+        """
+        Test that an outdated expiry entry does not delete a key whose TTL was removed.
+        """
+        self.db.set("key", "value", expire=1)
+        self.db.set("key", "value")
+
+        self.assertFalse(self.db.active_expire_cycle(time_budget_ms=1000))
+        self.assertEqual(self.db.get("key"), "value")
+        self.assertEqual(self.db.expired_keys, 0)
+
+    def wait_for_background_save(self):
+        """
+        Wait until the background save in progress has finished.
+        """
+        deadline = time.monotonic() + 5
+        while self.db.is_saving and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_dirty_counter(self):
+        """
+        Test that every change is counted and a save resets the counter.
+        """
+        self.db.set("key", "value")
+        self.db.set_expire("key", get_current_time_in_ms() + 60_000)
+        self.db.persist("key")
+        self.db.persist("key")
+        self.db.delete("key")
+        self.assertEqual(self.db.dirty, 4)
+
+        self.db.dump_data()
+        self.assertEqual(self.db.dirty, 0)
+
+    def test_background_save(self):
+        """
+        Test that BGSAVE writes a point-in-time copy that can be reloaded.
+        """
+        self.db.set("key", "value")
+        self.db.background_save()
+        self.db.set("later", "value")
+        self.wait_for_background_save()
+
+        self.assertTrue(self.db.last_bgsave_ok)
+        self.assertEqual(self.db.dirty, 1)
+        new_db = RedisDB.from_file(self.TEST_SNAPSHOT_FILE)
+        self.assertEqual(new_db.get("key"), "value")
+        self.assertIsNone(new_db.get("later"))
+
+    def test_background_save_already_in_progress(self):
+        """
+        Test that a second background save is refused while one is running.
+        """
+        with patch.object(self.db, "_write_snapshot", side_effect=lambda *_: time.sleep(0.2)):
+            self.db.background_save()
+            with self.assertRaises(CommandProcessingException):
+                self.db.background_save()
+            self.wait_for_background_save()
+
+    def test_failed_save_keeps_previous_snapshot(self):
+        """
+        Test that a failed save leaves the previous snapshot intact and no temp file.
+        """
+        self.db.set("key", "value")
+        self.db.dump_data()
+        self.db.set("unpicklable", lambda: None)
+
+        self.db.background_save()
+        self.wait_for_background_save()
+
+        self.assertFalse(self.db.last_bgsave_ok)
+        self.assertEqual(
+            [name for name in os.listdir(".") if name.startswith(self.TEST_SNAPSHOT_FILE)],
+            [self.TEST_SNAPSHOT_FILE])
+        self.assertEqual(RedisDB.from_file(self.TEST_SNAPSHOT_FILE).get("key"), "value")
+
+    def test_save_points(self):
+        """
+        Test that a background save starts only once a save point is reached.
+        """
+        self.db.save_points = [(60, 1), (0, 3)]
+        self.db.set("a", "1")
+        self.db.set("b", "2")
+        self.db.background_save_if_needed()
+        self.assertFalse(self.db.is_saving)
+
+        self.db.set("c", "3")
+        self.db.background_save_if_needed()
+        self.wait_for_background_save()
+        self.assertEqual(self.db.dirty, 0)
+        self.assertTrue(os.path.exists(self.TEST_SNAPSHOT_FILE))
+
+    def test_snapshot_is_written_as_rdb(self):
+        """
+        Test that snapshots are written in the RDB format.
+        """
+        self.db.set("key", "value")
+        self.db.dump_data()
+
+        with open(self.TEST_SNAPSHOT_FILE, "rb") as file:
+            self.assertEqual(file.read(5), b"REDIS")
+
+    def test_non_rdb_snapshot_is_refused(self):
+        """
+        Test that a pickle, empty or truncated snapshot is refused rather than unpickled.
+        """
+        for content in (pickle.dumps({"key": "value"}), b"", b"REDI"):
+            with self.subTest(content=content):
+                with open(self.TEST_SNAPSHOT_FILE, "wb") as file:
+                    file.write(content)
+                with self.assertRaises(RdbLoadError):
+                    RedisDB.from_file(self.TEST_SNAPSHOT_FILE)
+
+    def test_pickle_snapshot_migration(self):
+        """
+        Test that a snapshot written with pickle by an earlier version can be
+        migrated to RDB.
+        """
+        pickle_file = "test_legacy_snapshot.pkl"
+        self.addCleanup(os.remove, pickle_file)
+        with open(pickle_file, "wb") as file:
+            pickle.dump({"key": ("value", None), "volatile": ("value", 2 ** 60)}, file)
+
+        data, expires = RedisDB.load_pickle_snapshot(pickle_file)
+        RedisDB(self.TEST_SNAPSHOT_FILE, data=data, expires=expires).dump_data()
+        new_db = RedisDB.from_file(self.TEST_SNAPSHOT_FILE)
+        self.assertEqual(new_db.get("key"), "value")
+        self.assertEqual(new_db.get_expire("volatile"), 2 ** 60)
+
+    def test_keys_are_spread_over_shards(self):
+        """
+        Test that keys are spread over the shards and seen as one keyspace.
+        """
+        db = RedisDB(self.TEST_SNAPSHOT_FILE, data={f"key{i}": i for i in range(100)},
+                     expires={"key0": get_current_time_in_ms() + 60_000}, shards=4)
+
+        self.assertEqual(db.shards, 4)
+        self.assertTrue(all(shard.data for shard in db._shards))
+        self.assertEqual(len(db), 100)
+        self.assertEqual(db.get("key42"), 42)
+        data, expires = db.snapshot()
+        self.assertEqual(len(data), 100)
+        self.assertEqual(list(expires), ["key0"])
+
+    def test_locked_keys_exclude_other_threads(self):
+        """
+        Test that holding the lock of a key blocks writers of that key only.
+        """
+        db = RedisDB(self.TEST_SNAPSHOT_FILE, shards=4)
+        other = next(f"key{i}" for i in range(100)
+                     if db._shard(f"key{i}") is not db._shard("key"))
+        done = {}
+
+        def write(key):
+            db.set(key, "value")
+            done[key] = True
+
+        with db.locked(["key", other]):
+            with db.locked(["key"]):
+                pass
+            writer = threading.Thread(target=write, args=("key",))
+            writer.start()
+            writer.join(0.1)
+            self.assertNotIn("key", done)
+        writer.join(5)
+        self.assertIn("key", done)
+
+        with db.locked(["key"]):
+            writer = threading.Thread(target=write, args=(other,))
+            writer.start()
+            writer.join(5)
+            self.assertIn(other, done)
+
+    def test_invalid_shard_count(self):
+        """
+        Test that a keyspace without shards is refused.
+        """
+        with self.assertRaises(ValueError):
+            RedisDB(self.TEST_SNAPSHOT_FILE, shards=0)
+
+    def test_memory_is_tracked_with_maxmemory(self):
+        """
+        Test that the estimated memory follows writes, deletions and expirations.
+        """
+        self.db.set("key", "value")
+        estimated = self.db.used_memory
+        self.assertGreater(estimated, 0)
+
+        self.db.configure_maxmemory(10 ** 6, "allkeys-lru")
+        used = self.db.used_memory
+        self.assertEqual(used, estimated)
+
+        self.db.set("other", "x" * 1000)
+        self.assertGreater(self.db.used_memory, used + 1000)
+        self.db.delete("other")
+        self.assertEqual(self.db.used_memory, used)
+
+        self.db.set("key", "value", expire=get_current_time_in_ms() - 1)
+        self.assertIsNone(self.db.get("key"))
+        self.assertEqual(self.db.used_memory, 0)
+
+    def test_used_memory_is_estimated_without_maxmemory(self):
+        """
+        Test that without a memory limit the memory used is estimated from samples.
+        """
+        for i in range(5000):
+            self.db.set(f"key{i}", f"value{i}")
+        for i in range(0, 5000, 2):
+            self.db.delete(f"key{i}")
+        estimated = self.db.used_memory
+        self.db.configure_maxmemory(10 ** 9, "allkeys-lru")
+        tracked = self.db.used_memory
+        self.assertAlmostEqual(estimated / tracked, 1, delta=0.1)
+
+    def test_evictions_fit_the_limit(self):
+        """
+        Test that keys are evicted until the dataset fits in the memory limit.
+        """
+        self.db.configure_maxmemory(20000, "allkeys-lru")
+        evicted = []
+        for i in range(1000):
+            self.db.set(f"key{i}", f"value{i}")
+            self.assertTrue(self.db.perform_evictions(evicted.append))
+
+        self.assertLessEqual(self.db.used_memory, 20000)
+        self.assertEqual(self.db.evicted_keys, len(evicted))
+        self.assertEqual(len(self.db), 1000 - len(evicted))
+        self.assertFalse(any(evicted_key in self.db for evicted_key in evicted))
+
+    def test_lru_eviction_keeps_recently_used_keys(self):
+        """
+        Test that allkeys-lru evicts keys that were not accessed recently.
+        """
+        self.db.configure_maxmemory(10 ** 6, "allkeys-lru")
+        with patch("src.redisDB.eviction.lru_clock", return_value=0):
+            for i in range(200):
+                self.db.set(f"key{i}", "value")
+        with patch("src.redisDB.eviction.lru_clock", return_value=100):
+            for i in range(100):
+                self.db.get(f"key{i}")
+            self.db.maxmemory = self.db.used_memory // 2
+            self.assertTrue(self.db.perform_evictions())
+
+        survivors = sum(f"key{i}" in self.db for i in range(100))
+        self.assertGreater(survivors, 80)
+
+    def test_lfu_eviction_keeps_frequently_used_keys(self):
+        """
+        Test that allkeys-lfu evicts keys that are rarely accessed.
+        """
+        self.db.configure_maxmemory(10 ** 6, "allkeys-lfu")
+        for i in range(200):
+            self.db.set(f"key{i}", "value")
+        for _ in range(20):
+            for i in range(100):
+                self.db.get(f"key{i}")
+        self.db.maxmemory = self.db.used_memory // 2
+        self.assertTrue(self.db.perform_evictions())
+
+        survivors = sum(f"key{i}" in self.db for i in range(100))
+        self.assertGreater(survivors, 80)
+
+    def test_volatile_ttl_eviction(self):
+        """
+        Test that volatile-ttl only evicts keys with an expiry time, soonest first.
+        """
+        self.db.configure_maxmemory(10 ** 6, "volatile-ttl")
+        now = get_current_time_in_ms()
+        self.db.set("persistent", "value")
+        self.db.set("soon", "value", expire=now + 1000)
+        self.db.set("later", "value", expire=now + 100000)
+        self.db.maxmemory = self.db.used_memory - 1
+
+        self.assertTrue(self.db.perform_evictions())
+        self.assertNotIn("soon", self.db)
+        self.assertIn("later", self.db)
+
+        self.db.maxmemory = 1
+        self.assertFalse(self.db.perform_evictions())
+        self.assertIn("persistent", self.db)
+        self.assertNotIn("later", self.db)
+
+    def test_noeviction(self):
+        """
+        Test that noeviction reports that the limit is exceeded without evicting.
+        """
+        self.db.configure_maxmemory(1, "noeviction")
+        self.db.set("key", "value")
+        self.assertFalse(self.db.perform_evictions())
+        self.assertIn("key", self.db)
+        self.assertEqual(self.db.evicted_keys, 0)
+
+    def test_invalid_maxmemory(self):
+        """
+        Test that invalid limits and policies are refused.
+        """
+        with self.assertRaises(ValueError):
+            self.db.configure_maxmemory(-1)
+        with self.assertRaises(ValueError):
+            self.db.configure_maxmemory(100, "volatile-random")
+
+    def test_watched_key_versions(self):
+        """
+        Test that the version of a watched key changes with every change of the key
+        and that keys are no longer tracked once unwatched.
+        """
+        version = self.db.watch("key")
+        self.assertEqual(self.db.key_version("key"), version)
+        self.db.get("key")
+        self.db.set("other", "value")
+        self.assertEqual(self.db.key_version("key"), version)
+
+        for change in (lambda: self.db.set("key", "value"),
+                       lambda: self.db.set_expire("key", get_current_time_in_ms() + 10_000),
+                       lambda: self.db.persist("key"),
+                       lambda: self.db.delete("key"),
+                       lambda: self.db.clear()):
+            change()
+            self.assertNotEqual(self.db.key_version("key"), version)
+            version = self.db.key_version("key")
+
+        self.db.watch("key")
+        self.db.unwatch("key")
+        self.assertEqual(len(self.db._shard("key").watched), 1)
+        self.db.unwatch("key")
+        self.assertEqual(self.db._shard("key").watched, {})
+
     def test_empty_snapshot_file(self):
         """
         Test behavior when loading from a non-existent or empty snapshot file.
@@ -0,0 +1,100 @@
+"""
+Unit tests for the ZSet class.
+"""
+
+import copy
+import random
+import unittest
+from unittest.mock import patch
+
+from src.redisDB import zset
+from src.redisDB.zset import ZSet
+
+
+class TestZSet(unittest.TestCase):
+    """Unit tests for the ZSet class."""
+
+    def test_members_are_ordered_by_score_then_member(self):
+        """Test the ordering of members, ties broken lexicographically."""
+        scores = ZSet([("b", 1.0), ("a", 1.0), ("c", 0.5), ("d", float("-inf"))])
+
+        self.assertEqual(list(scores), [("d", float("-inf")), ("c", 0.5), ("a", 1.0), ("b", 1.0)])
+        self.assertEqual(scores.rank("a"), 2)
+        self.assertIsNone(scores.rank("missing"))
+        self.assertEqual(scores.score("c"), 0.5)
+
+    def test_add_updates_and_remove(self):
+        """Test that updating a score moves the member and removal forgets it."""
+        scores = ZSet([("a", 1.0), ("b", 2.0)])
+        scores.add("a", 3.0)
+        scores.add("c", 0.0)
+
+        self.assertEqual(scores.slice(0, 3), [("c", 0.0), ("b", 2.0), ("a", 3.0)])
+        self.assertTrue(scores.remove("b"))
+        self.assertFalse(scores.remove("b"))
+        self.assertEqual(len(scores), 2)
+        self.assertNotIn("b", scores)
+
+    def test_rank_of_score(self):
+        """Test inclusive and exclusive score bounds."""
+        scores = ZSet((str(i), float(i // 2)) for i in range(10))
+
+        self.assertEqual(scores.rank_of_score(2.0), 4)
+        self.assertEqual(scores.rank_of_score(2.0, exclusive=True), 6)
+        self.assertEqual(scores.rank_of_score(float("-inf")), 0)
+        self.assertEqual(scores.rank_of_score(100.0), 10)
+
+    def test_pop_min(self):
+        """Test that the lowest members are removed first."""
+        scores = ZSet([("a", 3.0), ("b", 1.0), ("c", 2.0)])
+        self.assertEqual(scores.pop_min(2), [("b", 1.0), ("c", 2.0)])
+        self.assertEqual(scores.pop_min(5), [("a", 3.0)])
+        self.assertFalse(scores)
+
+    def test_copy_is_independent(self):
+        """Test that a copy does not share the index."""
+        scores = ZSet([("a", 1.0)])
+        clone = copy.copy(scores)
+        scores.add("b", 0.0)
+
+        self.assertEqual(list(clone), [("a", 1.0)])
+        self.assertEqual(clone.rank("a"), 0)
+
+    @patch.object(zset, "CHUNK_MAX_ENTRIES", 8)
+    def test_matches_a_sorted_list(self):
+        """Test random operations on small chunks against a sorted Python list."""
+        rng = random.Random(7)
+        scores, expected = ZSet(), {}
+        for step in range(4000):
+            operation = rng.randrange(6)
+            member = f"m{rng.randrange(200)}"
+            if operation < 3:
+                score = float(rng.randrange(40))
+                scores.add(member, score)
+                expected[member] = score
+            elif operation < 5:
+                self.assertEqual(scores.remove(member), expected.pop(member, None) is not None)
+            else:
+                count = rng.randrange(4)
+                popped = scores.pop_min(count)
+                self.assertEqual(popped, sorted(expected.items(), key=lambda p: (p[1], p[0]))[:count])
+                for member, _ in popped:
+                    del expected[member]
+
+            if step % 40 == 0:
+                ordered = sorted(expected.items(), key=lambda p: (p[1], p[0]))
+                self.assertEqual(list(scores), ordered)
+                for rank, (member, _) in enumerate(ordered):
+                    self.assertEqual(scores.rank(member), rank)
+                start = rng.randint(0, len(ordered))
+                stop = rng.randint(start, len(ordered))
+                self.assertEqual(scores.slice(start, stop), ordered[start:stop])
+                score = float(rng.randrange(-1, 41))
+                self.assertEqual(scores.rank_of_score(score),
+                                 sum(1 for _, s in ordered if s < score))
+                self.assertEqual(scores.rank_of_score(score, exclusive=True),
+                                 sum(1 for _, s in ordered if s <= score))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Unit tests for the RespBufferParser class in buffer_parser.py.
+Tests offset-based parsing of Simple Strings, Errors, Integers, Bulk Strings,
+Null Bulk Strings and Arrays, as well as truncated and malformed input.
+"""
+
+import unittest
+from src.redis_protocol.buffer_parser import RespBufferParser
+from src.exceptions.redis_exceptions import (
+    RespIncompleteDataError,
+    RespParsingError,
+    RespProtocolError,
+)
+
+
+class TestRespBufferParser(unittest.TestCase):
+    """
+    Unit test class for RespBufferParser.
+    """
+
+    def parse(self, data):
+        """
+        Parse a single frame from `data`.
+        """
+        with RespBufferParser(data) as parser:
+            return parser.parse()
+
+    def test_simple_string(self):
+        """
+        Test parsing of a Simple String.
+        """
+        self.assertEqual(self.parse(b"+OK\r\n"), b"OK")
+
+    def test_error_string(self):
+        """
+        Test parsing of an Error response.
+        """
+        self.assertEqual(self.parse(b"-Error message\r\n"), b"Error message")
+
+    def test_integer(self):
+        """
+        Test parsing of an Integer.
+        """
+        self.assertEqual(self.parse(b":-1000\r\n"), -1000)
+
+    def test_bulk_string(self):
+        """
+        Test parsing of a Bulk String, including embedded CRLF.
+        """
+        self.assertEqual(self.parse(b"$11\r\nhello world\r\n"), b"hello world")
+        self.assertEqual(self.parse(b"$4\r\na\r\nb\r\n"), b"a\r\nb")
+
+    def test_null_bulk_string(self):
+        """
+        Test parsing of a Null Bulk String.
+        """
+        self.assertIsNone(self.parse(b"$-1\r\n"))
+
+    def test_nested_array(self):
+        """
+        Test parsing of a nested Array with mixed element types.
+        """
+        data = b"*4\r\n$3\r\nfoo\r\n*2\r\n:1\r\n+bar\r\n$-1\r\n*0\r\n"
+        self.assertEqual(self.parse(data), [b"foo", [1, b"bar"], None, []])
+
+    def test_position_advances_over_consecutive_frames(self):
+        """
+        Test that consecutive frames in one buffer are parsed in order.
+        """
+        data = bytearray(b"*1\r\n$4\r\nPING\r\n:7\r\n")
+        with RespBufferParser(data) as parser:
+            self.assertEqual(parser.parse(), [b"PING"])
+            self.assertEqual(parser.position, 14)
+            self.assertEqual(parser.parse(), 7)
+            self.assertEqual(parser.position, len(data))
+
+    def test_parse_array_header(self):
+        """
+        Test that the elements of an array can be parsed one at a time after its header.
+        """
+        with RespBufferParser(b"*2\r\n$3\r\nGET\r\n$3\r\nke") as parser:
+            self.assertEqual(parser.parse_array_header(), 2)
+            self.assertEqual(parser.position, 4)
+            self.assertEqual(parser.parse(), b"GET")
+            with self.assertRaises(RespIncompleteDataError):
+                parser.parse()
+            self.assertEqual(parser.position, 13)
+        for data, error in ((b"*2\r", RespIncompleteDataError),
+                            (b"$3\r\nGET\r\n", RespParsingError)):
+            with RespBufferParser(data) as parser:
+                with self.assertRaises(error):
+                    parser.parse_array_header()
+                self.assertEqual(parser.position, 0)
+
+    def test_incomplete_frame_keeps_position(self):
+        """
+        Test that a truncated frame raises and leaves the position untouched.
+        """
+        for data in (b"*2\r\n$3\r\nGET\r\n$3\r\nke", b"$5\r\nhel", b"*1\r\n", b":12"):
+            with RespBufferParser(data) as parser:
+                with self.assertRaises(RespIncompleteDataError):
+                    parser.parse()
+                self.assertEqual(parser.position, 0)
+
+    def test_malformed_input(self):
+        """
+        Test malformed lengths and unsupported types.
+        """
+        with self.assertRaises(RespParsingError):
+            self.parse(b"*x\r\n")
+        with self.assertRaises(RespParsingError):
+            self.parse(b"$3\r\nfoobar\r\n")
+        with self.assertRaises(RespProtocolError):
+            self.parse(b"~5\r\nhello\r\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
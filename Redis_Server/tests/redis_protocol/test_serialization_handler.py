@@ -5,7 +5,12 @@ Errors, Integers, Bulk Strings, Arrays, and Null values.
 """
 
 import unittest
-from src.redis_protocol.serialization_handler import RespSerializer
+from src.redis_protocol.serialization_handler import (
+    MultipleReplies,
+    RespSerializer,
+    SHARED_BULK_STRINGS,
+    SHARED_INTEGERS,
+)
 from src.exceptions.redis_exceptions import RespSerializationError
 
 
@@ -69,6 +74,14 @@ class TestRespSerializer(unittest.TestCase):
             b'*4\r\n$3\r\nSET\r\n$3\r\nkey\r\n$5\r\nvalue\r\n*1\r\n$5\r\ninner\r\n'
         )
 
+    def test_error_inside_array(self):
+        """
+        Test that an exception inside an Array is serialized as an Error, like
+        the failed commands of a transaction.
+        """
+        result = self.serializer.serialize(["OK", ValueError("ERR failed")])
+        self.assertEqual(result, b'*2\r\n$2\r\nOK\r\n-ERR failed\r\n')
+
     def test_unsupported_type(self):
         """
         Test serialization of unsupported data types.
@@ -77,6 +90,57 @@ class TestRespSerializer(unittest.TestCase):
             self.serializer.serialize({"key": "value"})
         self.assertIn("Unsupported RESP type", str(context.exception))
 
+    def test_non_ascii_bulk_string_length(self):
+        """
+        Test that Bulk String lengths count encoded bytes, not characters.
+        """
+        result = self.serializer.serialize("héllo")
+        self.assertEqual(result, "$6\r\nhéllo\r\n".encode("utf-8"))
+
+    def test_bytes_bulk_string(self):
+        """
+        Test serialization of raw bytes as a Bulk String.
+        """
+        result = self.serializer.serialize([b"raw", 7])
+        self.assertEqual(result, b'*2\r\n$3\r\nraw\r\n:7\r\n')
+
+    def test_shared_replies(self):
+        """
+        Test that hot replies come from the pre-encoded shared tables.
+        """
+        self.assertEqual(self.serializer.serialize("OK"), SHARED_BULK_STRINGS["OK"])
+        self.assertEqual(self.serializer.serialize(9999), SHARED_INTEGERS[9999])
+        self.assertEqual(self.serializer.serialize(10000), b':10000\r\n')
+        self.assertEqual(self.serializer.serialize(-1), b':-1\r\n')
+
+    def test_serialize_into_appends_to_buffer(self):
+        """
+        Test that replies are appended to a reusable output buffer.
+        """
+        out = bytearray(b"+existing\r\n")
+        self.serializer.serialize_into(out, "PONG")
+        self.serializer.serialize_into(out, 3)
+        self.assertEqual(out, b'+existing\r\n$4\r\nPONG\r\n:3\r\n')
+
+    def test_serialize_into_rolls_back_on_failure(self):
+        """
+        Test that a failed serialization leaves the output buffer untouched.
+        """
+        out = bytearray(b":1\r\n")
+        with self.assertRaises(RespSerializationError):
+            self.serializer.serialize_into(out, ["ok", {"key": "value"}])
+        self.assertEqual(out, b":1\r\n")
+
+    def test_serialize_multiple_replies(self):
+        """
+        Test that a command answering with several replies gets them concatenated.
+        """
+        replies = MultipleReplies([["subscribe", "a", 1], ["subscribe", "b", 2]])
+        self.assertEqual(
+            self.serializer.serialize(replies),
+            b'*3\r\n$9\r\nsubscribe\r\n$1\r\na\r\n:1\r\n'
+            b'*3\r\n$9\r\nsubscribe\r\n$1\r\nb\r\n:2\r\n')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,140 @@
+"""
+Unit tests for the RespStreamParser class in stream_parser.py.
+Tests accumulation of partial frames across reads, pipelined commands,
+and oversized or malformed input.
+"""
+
+import unittest
+from src.redis_protocol.stream_parser import RespStreamParser
+from src.exceptions.redis_exceptions import RespParsingError, RespProtocolError
+
+
+class TestRespStreamParser(unittest.TestCase):
+    """
+    Unit test class for RespStreamParser.
+    """
+
+    def setUp(self):
+        """
+        Create a fresh RespStreamParser for each test.
+        """
+        self.parser = RespStreamParser()
+
+    def test_single_command(self):
+        """
+        Test parsing a single complete command.
+        """
+        self.parser.feed(b"*1\r\n$4\r\nPING\r\n")
+        self.assertEqual(self.parser.parse_commands(), [[b"PING"]])
+        self.assertEqual(len(self.parser), 0)
+
+    def test_pipelined_commands(self):
+        """
+        Test that every command in a pipelined read is returned in order.
+        """
+        self.parser.feed(
+            b"*3\r\n$3\r\nSET\r\n$1\r\nk\r\n$1\r\nv\r\n"
+            b"*2\r\n$3\r\nGET\r\n$1\r\nk\r\n"
+            b"*1\r\n$4\r\nPING\r\n"
+        )
+        self.assertEqual(
+            self.parser.parse_commands(),
+            [[b"SET", b"k", b"v"], [b"GET", b"k"], [b"PING"]],
+        )
+
+    def test_partial_frame_is_kept_until_complete(self):
+        """
+        Test that a frame split across reads is returned once it is complete.
+        """
+        self.parser.feed(b"*2\r\n$4\r\nECHO\r\n$11\r\nHello")
+        self.assertEqual(self.parser.parse_commands(), [])
+
+        self.parser.feed(b" World\r\n*1\r\n$4\r\nPI")
+        self.assertEqual(self.parser.parse_commands(), [[b"ECHO", b"Hello World"]])
+
+        self.parser.feed(b"NG\r\n")
+        self.assertEqual(self.parser.parse_commands(), [[b"PING"]])
+
+    def test_byte_by_byte_feed(self):
+        """
+        Test feeding a command one byte at a time.
+        """
+        data = b"*2\r\n$3\r\nGET\r\n$3\r\nkey\r\n"
+        commands = []
+        for i in range(len(data)):
+            self.parser.feed(data[i:i + 1])
+            commands.extend(self.parser.parse_commands())
+        self.assertEqual(commands, [[b"GET", b"key"]])
+
+    def test_large_bulk_string(self):
+        """
+        Test a request much larger than a single socket read.
+        """
+        value = b"x" * 100_000
+        data = b"*2\r\n$4\r\nECHO\r\n$%d\r\n%s\r\n" % (len(value), value)
+        self.parser.feed(data[:1024])
+        self.assertEqual(self.parser.parse_commands(), [])
+        self.parser.feed(data[1024:])
+        self.assertEqual(self.parser.parse_commands(), [[b"ECHO", value]])
+
+    def test_partial_array_is_not_parsed_again(self):
+        """
+        Test that the elements of a partial array are removed from the buffer as
+        they arrive, and the array is returned whole once complete.
+        """
+        items = [b"MSET"] + [b"key:%04d" % i for i in range(1000)]
+        data = b"*%d\r\n" % len(items) + b"".join(
+            b"$%d\r\n%s\r\n" % (len(item), item) for item in items)
+        data += b"*1\r\n$4\r\nPING\r\n"
+        commands = []
+        for i in range(0, len(data), 100):
+            self.parser.feed(data[i:i + 100])
+            commands.extend(self.parser.parse_commands())
+            self.assertLess(len(self.parser), 100)
+        self.assertEqual(commands, [items, [b"PING"]])
+        self.assertEqual(len(self.parser), 0)
+
+    def test_escaped_crlf(self):
+        """
+        Test that literal backslash-r-backslash-n sequences are treated as CRLF.
+        """
+        self.parser.feed(b"*1\\r\\n$4\\r\\nPING\\r\\n")
+        self.assertEqual(self.parser.parse_commands(), [[b"PING"]])
+
+    def test_malformed_input(self):
+        """
+        Test that malformed input raises instead of waiting for more data.
+        """
+        self.parser.feed(b"~5\r\nhello\r\n")
+        with self.assertRaises(RespProtocolError):
+            self.parser.parse_commands()
+
+        parser = RespStreamParser()
+        parser.feed(b"*x\r\n")
+        with self.assertRaises(RespParsingError):
+            parser.parse_commands()
+
+    def test_buffer_limit(self):
+        """
+        Test that exceeding the query buffer limit raises a protocol error.
+        """
+        parser = RespStreamParser(max_buffer_size=16)
+        with self.assertRaises(RespProtocolError):
+            parser.feed(b"*1\r\n$100\r\n" + b"x" * 20)
+
+    def test_buffer_limit_counts_partial_array(self):
+        """
+        Test that the parsed elements of a partial array count against the limit.
+        """
+        parser = RespStreamParser(max_buffer_size=32)
+        parser.feed(b"*3\r\n$3\r\nSET\r\n$3\r\nkey\r\n")
+        self.assertEqual(parser.parse_commands(), [])
+        self.assertEqual(len(parser), 0)
+        with self.assertRaises(RespProtocolError):
+            parser.feed(b"$10\r\n" + b"x" * 10)
+        parser.feed(b"*1\r\n$4\r\nPING\r\n")
+        self.assertEqual(parser.parse_commands(), [[b"PING"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -80,6 +80,79 @@ class TestRedisLikeServer(unittest.TestCase):
         rpush_response = self.send_command(b"*4\r\n$5\r\nRPUSH\r\n$5\r\nlist1\r\n$1\r\nC\r\n$1\r\nD\r\n")
         self.assertEqual(rpush_response, ":4\r\n")
 
+    def test_pipelined_commands(self):
+        """Test that every pipelined command in a single write gets a reply."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect((self.HOST, self.PORT))
+            client_socket.sendall(b"*1\r\n$4\r\nPING\r\n" * 16)
+            expected = b"$4\r\nPONG\r\n" * 16
+            response = b""
+            while len(response) < len(expected):
+                response += client_socket.recv(1024)
+            self.assertEqual(response, expected)
+
+    def test_request_split_across_writes(self):
+        """Test that a request split across several writes is reassembled."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect((self.HOST, self.PORT))
+            client_socket.sendall(b"*2\r\n$4\r\nECHO\r\n$5\r\nhel")
+            time.sleep(0.1)
+            client_socket.sendall(b"lo\r\n")
+            self.assertEqual(client_socket.recv(1024), b"$5\r\nhello\r\n")
+
+    def test_blpop_waits_for_a_push(self):
+        """Test that BLPOP blocks until another client pushes an element."""
+        replies = []
+        waiter = threading.Thread(target=lambda: replies.append(self.send_command(
+            b"*3\r\n$5\r\nBLPOP\r\n$5\r\ntasks\r\n$1\r\n5\r\n")))
+        waiter.start()
+        time.sleep(0.1)
+
+        self.assertEqual(self.send_command(b"*3\r\n$5\r\nLPUSH\r\n$5\r\ntasks\r\n$1\r\nt\r\n"),
+                         ":1\r\n")
+        waiter.join(timeout=5)
+        self.assertEqual(replies, ["*2\r\n$5\r\ntasks\r\n$1\r\nt\r\n"])
+
+    def test_blpop_client_disconnecting_is_not_served(self):
+        """Test that a client closing its connection while blocked gets no element."""
+        with socket.create_connection((self.HOST, self.PORT)) as blocked:
+            blocked.sendall(b"*3\r\n$5\r\nBLPOP\r\n$4\r\ngone\r\n$1\r\n0\r\n")
+            time.sleep(0.1)
+        time.sleep(0.3)  # Let the server notice the disconnection
+
+        self.assertEqual(self.send_command(b"*3\r\n$5\r\nRPUSH\r\n$4\r\ngone\r\n$3\r\njob\r\n"),
+                         ":1\r\n")
+        self.assertEqual(self.send_command(b"*2\r\n$4\r\nLLEN\r\n$4\r\ngone\r\n"), ":1\r\n")
+
+    def test_blocked_client_pipeline(self):
+        """Test that requests pipelined after a blocking command run once it is served."""
+        with socket.create_connection((self.HOST, self.PORT)) as blocked:
+            blocked.sendall(b"*1\r\n$4\r\nPING\r\n"
+                            b"*3\r\n$5\r\nBLPOP\r\n$5\r\nqueue\r\n$1\r\n0\r\n"
+                            b"*2\r\n$4\r\nECHO\r\n$5\r\nafter\r\n")
+            self.assertEqual(blocked.recv(1024), b"$4\r\nPONG\r\n")
+            self.send_command(b"*3\r\n$5\r\nRPUSH\r\n$5\r\nqueue\r\n$1\r\nx\r\n")
+
+            expected = b"*2\r\n$5\r\nqueue\r\n$1\r\nx\r\n$5\r\nafter\r\n"
+            response = b""
+            while len(response) < len(expected):
+                response += blocked.recv(1024)
+            self.assertEqual(response, expected)
+
+    def test_publish_reaches_subscribers(self):
+        """Test that a subscribed client gets messages published by another one."""
+        with socket.create_connection((self.HOST, self.PORT)) as subscriber:
+            subscriber.sendall(b"*2\r\n$10\r\nPSUBSCRIBE\r\n$6\r\nnews.*\r\n")
+            self.assertEqual(subscriber.recv(1024),
+                             b"*3\r\n$10\r\npsubscribe\r\n$6\r\nnews.*\r\n:1\r\n")
+
+            response = self.send_command(
+                b"*3\r\n$7\r\nPUBLISH\r\n$9\r\nnews.tech\r\n$2\r\nhi\r\n")
+            self.assertEqual(response, ":1\r\n")
+            self.assertEqual(subscriber.recv(1024),
+                             b"*4\r\n$8\r\npmessage\r\n$6\r\nnews.*\r\n"
+                             b"$9\r\nnews.tech\r\n$2\r\nhi\r\n")
+
     def test_save_command(self):
         """Test SAVE command."""
         response = self.send_command(b"*1\r\n$4\r\nSAVE\r\n")
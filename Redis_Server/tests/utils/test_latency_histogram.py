@@ -0,0 +1,64 @@
+"""
+Unit tests for the HDR-style latency histogram.
+"""
+
+import unittest
+
+from src.utils.latency_histogram import (
+    EXACT_VALUES,
+    LatencyHistogram,
+    bucket_bounds,
+    bucket_index,
+)
+
+
+class TestBuckets(unittest.TestCase):
+    """Unit tests for bucket_index and bucket_bounds."""
+
+    def test_small_values_are_exact(self):
+        """Test that every small value has a bucket of its own."""
+        for value in range(EXACT_VALUES):
+            self.assertEqual(bucket_bounds(bucket_index(value)), (value, value))
+
+    def test_bounds_contain_the_value(self):
+        """Test that buckets are contiguous and within 12.5% of their values."""
+        previous_high = -1
+        for index in range(bucket_index(10 ** 6) + 1):
+            low, high = bucket_bounds(index)
+            self.assertEqual(low, previous_high + 1)
+            self.assertLessEqual(high - low, low / 8)
+            self.assertEqual(bucket_index(low), index)
+            self.assertEqual(bucket_index(high), index)
+            previous_high = high
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Unit tests for LatencyHistogram."""
+
+    def test_percentiles(self):
+        """Test that percentiles are the highest value of their bucket."""
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.percentile(50), 0)
+        for value in range(1, 101):
+            histogram.record(value)
+
+        self.assertEqual(histogram.total, 100)
+        self.assertEqual(histogram.percentile(10), 10)
+        self.assertEqual(histogram.percentile(50), 51)
+        self.assertEqual(histogram.percentile(99), 103)
+        self.assertEqual(histogram.percentile(100), 103)
+
+    def test_cumulative_counts(self):
+        """Test the counts below each power of two."""
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.cumulative_counts(), [(1, 0)])
+        for value in (0, 1, 3, 3, 40):
+            histogram.record(value)
+
+        self.assertEqual(histogram.cumulative_counts(), [
+            (1, 1), (2, 2), (4, 4), (8, 4), (16, 4), (32, 4), (64, 5),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
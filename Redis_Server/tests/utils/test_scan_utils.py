@@ -0,0 +1,87 @@
+"""
+Unit tests for the SCAN building blocks: glob-style patterns and snapshot cursors.
+"""
+
+import unittest
+
+from src.exceptions.redis_exceptions import CommandProcessingException
+from src.utils.scan_utils import ScanCursors, compile_glob, parse_cursor
+
+
+class TestCompileGlob(unittest.TestCase):
+    """Unit tests for compile_glob."""
+
+    def test_patterns(self):
+        """Test the wildcards, character classes and escapes."""
+        cases = [
+            ("h?llo", "hello", True), ("h?llo", "hllo", False),
+            ("h*llo", "heeeello", True), ("h*llo", "hllo", True),
+            ("h[ae]llo", "hallo", True), ("h[ae]llo", "hillo", False),
+            ("h[^e]llo", "hallo", True), ("h[^e]llo", "hello", False),
+            ("h[a-b]llo", "hbllo", True), ("h[b-a]llo", "hallo", True),
+            ("h\\*llo", "h*llo", True), ("h\\*llo", "hello", False),
+            ("user:*", "user:1\nx", True), ("a.b", "axb", False),
+            ("*", "", True), ("abc", "abcd", False),
+        ]
+        for pattern, string, expected in cases:
+            with self.subTest(pattern=pattern, string=string):
+                self.assertEqual(bool(compile_glob(pattern)(string)), expected)
+
+    def test_patterns_are_cached(self):
+        """Test that a pattern is compiled once."""
+        self.assertIs(compile_glob("user:*"), compile_glob("user:*"))
+
+
+class TestScanCursors(unittest.TestCase):
+    """Unit tests for the ScanCursors registry."""
+
+    def walk(self, cursors, owner, elements, count):
+        """Iterate over elements until the cursor comes back to 0."""
+        cursor, seen = 0, []
+        while True:
+            cursor, batch = cursors.scan(owner, cursor, count, lambda: list(elements))
+            seen += batch
+            if not cursor:
+                return seen
+
+    def test_full_iteration(self):
+        """Test that an iteration returns every element once."""
+        elements = list(range(105))
+        self.assertEqual(self.walk(ScanCursors(), "key", elements, 10), elements)
+
+    def test_snapshot_is_taken_once(self):
+        """Test that later calls do not take another snapshot."""
+        cursors = ScanCursors()
+        calls = []
+
+        def take_snapshot():
+            calls.append(None)
+            return list(range(30))
+
+        cursor, _ = cursors.scan("key", 0, 10, take_snapshot)
+        cursors.scan("key", cursor, 10, take_snapshot)
+        self.assertEqual(len(calls), 1)
+
+    def test_evicted_or_foreign_cursor_is_refused(self):
+        """Test that cursors whose snapshot is gone or not theirs are refused."""
+        cursors = ScanCursors(capacity=1)
+        cursor, _ = cursors.scan("a", 0, 10, lambda: list(range(30)))
+        next_cursor, _ = cursors.scan("b", 0, 10, lambda: list(range(30)))
+
+        with self.assertRaises(CommandProcessingException):
+            cursors.scan("a", cursor, 10, lambda: list(range(30)))
+        with self.assertRaises(CommandProcessingException):
+            cursors.scan("c", next_cursor, 10, lambda: list(range(30)))
+        self.assertEqual(cursors.scan("b", next_cursor, 10, lambda: [])[1], list(range(10, 20)))
+
+    def test_parse_cursor(self):
+        """Test that cursors must be unsigned integers."""
+        self.assertEqual(parse_cursor("42"), 42)
+        for value in ("-1", "abc", "", "1.5", "²"):
+            with self.subTest(value=value):
+                with self.assertRaises(CommandProcessingException):
+                    parse_cursor(value)
+
+
+if __name__ == "__main__":
+    unittest.main()